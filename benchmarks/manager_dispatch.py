@@ -0,0 +1,112 @@
+"""Service layer dispatch benchmark: messages per second per manager scope.
+
+Runs a read method of a service layer manager through the request handling
+of `RabbitRPCServer` (manager lookup, call and reply serialization), once
+building the manager for every message and once reusing the instance of the
+worker:
+
+    * ``request``: `ManagerScope.REQUEST`, the manager is built per message.
+    * ``worker``: `ManagerScope.WORKER`, the manager of the worker is reused.
+
+The broker is not involved, so the difference is the cost of building the
+manager. Requires the database and RabbitMQ configured in
+`project_config.toml`, as the managers connect to them.
+
+Usage:
+    python -m benchmarks.manager_dispatch --messages 500
+    python -m benchmarks.manager_dispatch --service volume --messages 500
+"""
+
+import time
+import argparse
+import importlib
+from typing import Any, Dict, Tuple, Optional
+from unittest.mock import patch
+
+from intakevms.libs.messaging.codecs import get_default_codec
+from intakevms.libs.messaging.managers import ManagerScope, ManagerProvider
+from intakevms.libs.messaging.rpc.dispatch import execute_request
+
+# Service layer: (manager class path, read method, data for the method).
+SERVICES: Dict[str, Tuple[str, str, Optional[Dict[str, Any]]]] = {
+    'virtual_machines': (
+        'intakevms.modules.virtual_machines.service_layer.services'
+        '.VMServiceLayerManager',
+        'get_all_vms',
+        None,
+    ),
+    'volume': (
+        'intakevms.modules.volume.service_layer.services'
+        '.VolumeServiceLayerManager',
+        'get_all_volumes',
+        {'storage_id': None},
+    ),
+    'image': (
+        'intakevms.modules.image.service_layer.services'
+        '.ImageServiceLayerManager',
+        'get_all_images',
+        {'storage_id': None},
+    ),
+    'storage': (
+        'intakevms.modules.storage.service_layer.services'
+        '.StorageServiceLayerManager',
+        'get_all_storages',
+        None,
+    ),
+}
+
+
+def _import(path: str) -> type:
+    """Import a class by its dotted path."""
+    module_name, _, class_name = path.rpartition('.')
+    return getattr(importlib.import_module(module_name), class_name)  # type: ignore[no-any-return]
+
+
+def _messages_per_second(
+    manager: type,
+    scope: ManagerScope,
+    method_name: str,
+    data: Optional[Dict[str, Any]],
+    messages: int,
+) -> float:
+    """Dispatch the messages and return the achieved rate."""
+    codec = get_default_codec()
+    with patch.object(manager, 'rpc_scope', scope):
+        managers = ManagerProvider(manager)
+    reply = codec.decode(
+        execute_request(managers, method_name, dict(data or {}), {}, codec)
+    )
+    if 'err' in reply:
+        msg = f'{method_name} failed: {reply["err"]}'
+        raise SystemExit(msg)
+    started = time.perf_counter()
+    for _ in range(messages):
+        # Service layer methods pop their arguments, so copy them per call.
+        execute_request(managers, method_name, dict(data or {}), {}, codec)
+    return messages / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Run both scopes for the selected service layers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument(
+        '--service', choices=sorted(SERVICES), action='append', default=None
+    )
+    args = parser.parse_args()
+
+    for service in args.service or sorted(SERVICES):
+        path, method_name, data = SERVICES[service]
+        manager = _import(path)
+        for scope in (ManagerScope.REQUEST, ManagerScope.WORKER):
+            rate = _messages_per_second(
+                manager, scope, method_name, data, args.messages
+            )
+            print(  # noqa: T201 benchmark output
+                f'{service + "." + method_name:<40} '
+                f'scope={scope.value:<8} {rate:10.1f} msg/s'
+            )
+
+
+if __name__ == '__main__':
+    main()
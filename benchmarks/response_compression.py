@@ -0,0 +1,151 @@
+"""Response compression benchmark: bytes sent for typical responses.
+
+Serves a page of virtual machines, a page of events and the dashboard node
+info in-process behind `CompressionMiddleware`, and the bundled SPA with
+`AssetFiles`, then reports for each response the bytes sent without and
+with compression, and the CPU time spent compressing per request.
+
+Brotli is reported only when the `brotli` package is installed. Does not
+need RabbitMQ or the database.
+
+Usage:
+    python -m benchmarks.response_compression --vms 500 --iterations 20
+"""
+
+import time
+import argparse
+from typing import Any, Dict, List, Tuple
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from intakevms.common.compression import (
+    AssetFiles,
+    CompressionMiddleware,
+    supported_encodings,
+)
+from benchmarks.response_validation import _vm
+
+DIST = Path(__file__).parent.parent / 'intakevms' / 'dist'
+
+
+def _event(index: int) -> Dict[str, Any]:
+    """Build a reply item shaped like `schemas.Event`."""
+    return {
+        'id': index,
+        'module': 'vms',
+        'object_id': '3d8f7a4c-2b1e-4c3a-9f5d-6e7a8b9c0d1e',
+        'user_id': '0b9f3c1e-5a52-4d6c-9a0e-3f3b1d8e2c71',
+        'event': 'VmStarted',
+        'timestamp': '2026-10-17T10:45:21',
+        'information': 'Status: available. message: ',
+    }
+
+
+def _node_info() -> Dict[str, Any]:
+    """Build a reply shaped like the dashboard `schemas.NodeInfo`."""
+    return {
+        'cpu': {'count': 32, 'percentage': 12.5},
+        'memory': {
+            'value': 135_000_000_000,
+            'used': 42_000_000_000,
+            'available': 93_000_000_000,
+            'percentage': 31.1,
+        },
+        'storage': {
+            'size': 4_000_000_000_000,
+            'used': 1_200_000_000_000,
+            'free': 2_800_000_000_000,
+            'percentage': 30.0,
+            'cls': 'local',
+        },
+        'iops': {'input': 1200, 'output': 800, 'date': 1760000000},
+        'io_latency': {'wait': 0.4, 'date': 1760000000},
+        'bandwidth_data': {'read': 120.5, 'write': 80.2, 'date': 1760000000},
+        'disk_data': {'read': 120.5, 'write': 80.2, 'date': 1760000000},
+    }
+
+
+def _app(vms: int) -> FastAPI:
+    """Build an application serving the typical responses."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+    vm_page = {'items': [_vm(index) for index in range(vms)]}
+    event_page = {'items': [_event(index) for index in range(100)]}
+    node_info = _node_info()
+
+    @app.get('/vms/')
+    def get_vms() -> Dict[str, Any]:
+        return vm_page
+
+    @app.get('/event/')
+    def get_events() -> Dict[str, Any]:
+        return event_page
+
+    @app.get('/dashboard/')
+    def get_node_info() -> Dict[str, Any]:
+        return node_info
+
+    app.mount('/assets', AssetFiles(directory=DIST / 'assets'))
+    return app
+
+
+def _measure(
+    client: TestClient, url: str, encoding: str, iterations: int
+) -> Tuple[int, float]:
+    """Get the bytes sent for a response, and the CPU time per request.
+
+    Args:
+        client (TestClient): The client of the application.
+        url (str): The URL of the response.
+        encoding (str): The accepted encoding, `identity` for none.
+        iterations (int): The number of requests measured.
+
+    Returns:
+        Tuple[int, float]: The bytes sent and the CPU seconds per request.
+    """
+    headers = {'Accept-Encoding': encoding}
+    # The client decodes the body, the header tells the bytes sent.
+    response = client.get(url, headers=headers)
+    sent = int(response.headers['content-length'])
+    started = time.process_time()
+    for _ in range(iterations):
+        client.get(url, headers=headers)
+    return sent, (time.process_time() - started) / iterations
+
+
+def main() -> None:
+    """Measure every response and print a summary line per encoding."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vms', type=int, default=500)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    client = TestClient(_app(args.vms))
+    urls: List[str] = ['/vms/', '/event/', '/dashboard/']
+    urls.extend(
+        f'/assets/{path.name}'
+        for path in sorted((DIST / 'assets').iterdir())
+        if path.suffix in {'.js', '.css'}
+    )
+    totals = dict.fromkeys(('identity', *supported_encodings()), 0)
+    for url in urls:
+        for encoding in totals:
+            sent, cpu = _measure(client, url, encoding, args.iterations)
+            totals[encoding] += sent
+            print(  # noqa: T201 benchmark output
+                f'{url:<32} {encoding:<9} '
+                f'size={sent / 1024:9.1f} KiB  '
+                f'cpu={cpu * 1000:7.2f} ms/request'
+            )
+    for encoding, total in totals.items():
+        saved = 1 - total / totals['identity']
+        print(  # noqa: T201 benchmark output
+            f'total {encoding:<9} size={total / 1024:9.1f} KiB  '
+            f'saved={saved:6.1%}'
+        )
+
+
+if __name__ == '__main__':
+    main()
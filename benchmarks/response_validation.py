@@ -0,0 +1,137 @@
+"""Response validation benchmark: CPU time per request of the VM endpoints.
+
+Serves the list and detail endpoints of virtual machines in-process, with
+the replies of the service layer already in memory, and reports the CPU
+time spent per request on each path:
+
+    * ``double``: objects validated one by one by the CRUD, then validated
+      again and encoded by FastAPI against the `response_model`.
+    * ``rendered``: objects validated in a single `TypeAdapter` pass, then
+      serialized to bytes by `render`, bypassing the `response_model`.
+
+CPU time includes the event loop thread of the test client. Does not need
+RabbitMQ or the database.
+
+Usage:
+    python -m benchmarks.response_validation --vms 500 --iterations 50
+"""
+
+import time
+import uuid
+import argparse
+from typing import Any, Dict, List, Callable
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.rendering import RenderedJSONResponse, render
+from intakevms.libs.validation.validators import Validator
+from intakevms.modules.virtual_machines.entrypoints import schemas
+
+
+def _vm(index: int) -> Dict[str, Any]:
+    """Build a reply item shaped like `schemas.VirtualMachineInfo`."""
+    return {
+        'id': str(uuid.uuid4()),
+        'name': f'vm-{index}',
+        'power_state': 'running',
+        'status': 'AVAILABLE',
+        'description': 'Benchmark virtual machine',
+        'information': None,
+        'cpu': {'cores': 2, 'threads': 2, 'sockets': 1, 'vcpu': 4},
+        'ram': {'size': 4096},
+        'os': {'os_type': 'Linux', 'boot_device': 'hd'},
+        'graphic_interface': {'connect_type': 'vnc', 'url': 'ws://host'},
+        'disks': [
+            {
+                'id': disk,
+                'name': f'vm-{index}-disk-{disk}',
+                'emulation': 'virtio',
+                'format': 'qcow2',
+                'qos': {},
+                'boot_order': disk,
+                'order': disk,
+                'path': f'/opt/storages/vm-{index}-disk-{disk}.qcow2',
+                'size': 21474836480,
+            }
+            for disk in range(2)
+        ],
+        'virtual_interfaces': [
+            {
+                'id': 1,
+                'mode': 'bridge',
+                'interface': 'br0',
+                'mac': f'52:54:00:00:{index // 256:02x}:{index % 256:02x}',
+            }
+        ],
+    }
+
+
+def _app(vms: List[Dict[str, Any]]) -> FastAPI:
+    """Build an application serving the VMs on both paths."""
+    app = FastAPI()
+    reply: Dict[str, Any] = {'items': vms, 'next_cursor': None}
+
+    @app.get('/double/', response_model=KeysetPage[schemas.VirtualMachineInfo])
+    def double_list() -> KeysetPage[schemas.VirtualMachineInfo]:
+        items = Validator._validate_each(  # noqa: SLF001 former behaviour
+            reply['items'],
+            schemas.VirtualMachineInfo,
+            skip_corrupted_object=True,
+        )
+        return KeysetPage[schemas.VirtualMachineInfo](
+            items=items, next_cursor=None
+        )
+
+    @app.get('/rendered/')
+    def rendered_list() -> RenderedJSONResponse:
+        items = Validator.validate_objects(
+            reply['items'], schemas.VirtualMachineInfo
+        )
+        return render(
+            KeysetPage[schemas.VirtualMachineInfo](
+                items=items, next_cursor=None
+            )
+        )
+
+    @app.get('/double/vm/', response_model=schemas.VirtualMachineInfo)
+    def double_detail() -> schemas.VirtualMachineInfo:
+        return schemas.VirtualMachineInfo(**vms[0])
+
+    @app.get('/rendered/vm/')
+    def rendered_detail() -> RenderedJSONResponse:
+        return render(schemas.VirtualMachineInfo.model_validate(vms[0]))
+
+    return app
+
+
+def _cpu_per_call(func: Callable[[], Any], iterations: int) -> float:
+    """Return the CPU seconds spent by the process per call."""
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) / iterations
+
+
+def main() -> None:
+    """Measure every endpoint and print a summary line per path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vms', type=int, default=500)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    client = TestClient(_app([_vm(index) for index in range(args.vms)]))
+    for endpoint in ('list', 'detail'):
+        for path in ('double', 'rendered'):
+            url = f'/{path}/' if endpoint == 'list' else f'/{path}/vm/'
+            body = client.get(url).content
+            cpu = _cpu_per_call(lambda: client.get(url), args.iterations)  # noqa: B023 evaluated in the loop
+            print(  # noqa: T201 benchmark output
+                f'{endpoint:<8} {path:<10} size={len(body) / 1024:8.1f} KiB  '
+                f'cpu={cpu * 1000:8.2f} ms/request'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""RPC client latency benchmark: per-request connection vs. pooled client.
+
+Starts an echo `RabbitRPCServer` on a temporary queue and measures the p50 and
+p99 latency of a round-trip call, as issued by an HTTP request handler:
+
+    * ``per-request``: a new `RabbitRPCClient` (connection, channel and
+      callback queue) is created for every call, as `VMCrud()` did before the
+      pooled client existed.
+    * ``pooled``: a `PooledRabbitRPCClient` sharing the process-wide pool.
+
+With `--transport inproc`, an echo `InProcRPCServer` is measured instead:
+
+    * ``inproc``: an `InProcRPCClient`, without broker.
+
+The RabbitMQ transport requires a running RabbitMQ configured in
+`project_config.toml`.
+
+Usage:
+    python -m benchmarks.rpc_client_latency --iterations 2000 --concurrency 8
+    python -m benchmarks.rpc_client_latency --transport inproc
+"""
+
+import uuid
+import argparse
+import threading
+from typing import Dict
+
+from benchmarks.utils import report, measure
+from intakevms.libs.messaging.rpc.inproc_rpc import (
+    InProcRPCClient,
+    InProcRPCServer,
+)
+from intakevms.libs.messaging.rpc.rabbit_rpc import (
+    RabbitRPCClient,
+    RabbitRPCServer,
+)
+from intakevms.libs.messaging.rpc.rabbit_pool import (
+    RabbitConnectionPool,
+    PooledRabbitRPCClient,
+)
+
+
+class EchoManager:
+    """Manager returning its input, so only the transport is measured."""
+
+    def echo(self, data: Dict) -> Dict:
+        """Return the received data unchanged.
+
+        Args:
+            data (Dict): Any payload.
+
+        Returns:
+            Dict: The same payload.
+        """
+        return data
+
+
+def _serve(queue_name: str) -> None:
+    """Run the echo server on the given queue."""
+    RabbitRPCServer(queue_name, EchoManager).start()
+
+
+def _run_inproc(iterations: int, concurrency: int) -> None:
+    """Measure the in-process transport."""
+    queue_name = f'benchmark_rpc_{uuid.uuid4().hex[:8]}'
+    server = InProcRPCServer(queue_name, EchoManager)
+    threading.Thread(target=server.start, daemon=True).start()
+    client = InProcRPCClient(queue_name)
+    payload = {'vm_id': str(uuid.uuid4())}
+
+    def inproc() -> None:
+        client.call('echo', data_for_method=payload)
+
+    samples = measure(inproc, iterations, concurrency)
+    report(f'inproc (concurrency={concurrency})', samples)
+    server.stop()
+
+
+def main() -> None:
+    """Run the scenarios of the transport and print the latency summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument(
+        '--transport', choices=('rabbitmq', 'inproc'), default='rabbitmq'
+    )
+    args = parser.parse_args()
+
+    if args.transport == 'inproc':
+        _run_inproc(args.iterations, args.concurrency)
+        return
+
+    queue_name = f'benchmark_rpc_{uuid.uuid4().hex[:8]}'
+    threading.Thread(target=_serve, args=(queue_name,), daemon=True).start()
+    payload = {'vm_id': str(uuid.uuid4())}
+
+    def per_request() -> None:
+        client = RabbitRPCClient(queue_name)
+        client.call('echo', data_for_method=payload)
+        client.connection.close()
+
+    def pooled() -> None:
+        PooledRabbitRPCClient(queue_name).call('echo', data_for_method=payload)
+
+    pooled()  # warm up the pool connections
+    for name, func in (('per-request', per_request), ('pooled', pooled)):
+        samples = measure(func, args.iterations, args.concurrency)
+        report(f'{name} (concurrency={args.concurrency})', samples)
+    print(RabbitConnectionPool.instance().stats())  # noqa: T201 benchmark output
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""RPC codec benchmark: payload size and encode/decode throughput.
+
+Encodes a `get_all_vms`-like reply (a list of serialized virtual machines)
+with every available codec and reports the payload size and the encode and
+decode rates:
+
+    * ``json-indent``: `serialize_json` with `indent=4`, the former wire
+      format.
+    * ``json``: the compact `JsonCodec`.
+    * ``msgpack``: the `MsgpackCodec`, if `msgpack` is installed.
+
+Does not need RabbitMQ or the database.
+
+Usage:
+    python -m benchmarks.rpc_codec_payload --vms 200 --iterations 200
+"""
+
+import time
+import uuid
+import argparse
+import datetime
+from typing import Any, Dict, List, Tuple, Callable
+
+from intakevms.libs.messaging import codecs
+from intakevms.libs.data_handlers.json.serializer import (
+    serialize_json,
+    deserialize_json,
+)
+
+
+def _vm(index: int) -> Dict[str, Any]:
+    """Build a reply item shaped like `DataSerializer.vm_to_web`."""
+    return {
+        'id': str(uuid.uuid4()),
+        'name': f'vm-{index}',
+        'description': 'Benchmark virtual machine',
+        'power_state': 'running',
+        'status': 'AVAILABLE',
+        'os_type': 'linux',
+        'os_variant': 'ubuntu22.04',
+        'cpu': {'vcpus': 4, 'max_vcpus': 8, 'cpu_mode': 'host-passthrough'},
+        'ram': {'size': 4096, 'max_size': 8192},
+        'boot': 'hd',
+        'graphic_interface': {'connect_type': 'vnc', 'port': 5900 + index},
+        'created_at': datetime.datetime.now().isoformat(),
+        'volumes': [
+            {
+                'id': str(uuid.uuid4()),
+                'name': f'vm-{index}-disk-{disk}',
+                'size': 21474836480,
+                'path': f'/opt/virtman/storages/vm-{index}-disk-{disk}.qcow2',
+                'type': 'qcow2',
+            }
+            for disk in range(2)
+        ],
+        'interfaces': [
+            {
+                'mac': f'52:54:00:00:{index // 256:02x}:{index % 256:02x}',
+                'interface_type': 'bridge',
+                'source': 'br0',
+                'model': 'virtio',
+            }
+        ],
+    }
+
+
+def _rate(func: Callable[[], Any], iterations: int) -> float:
+    """Return the number of calls per second."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Measure every codec and print a summary line per codec."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vms', type=int, default=200)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    reply = {'data': [_vm(index) for index in range(args.vms)]}
+    formats: List[Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]]
+    formats = [
+        (
+            'json-indent',
+            lambda data: serialize_json(data).encode(),
+            lambda body: deserialize_json(body.decode('utf-8')),
+        ),
+    ]
+    for name in ('json', 'msgpack'):
+        try:
+            codec = codecs.get_codec(
+                codecs.JsonCodec.content_type
+                if name == 'json'
+                else codecs.MsgpackCodec.content_type
+            )
+        except ValueError:
+            print(f'{name:<12} not installed')  # noqa: T201 benchmark output
+            continue
+        formats.append((name, codec.encode, codec.decode))
+
+    for name, encode, decode in formats:
+        body = encode(reply)
+        encode_rate = _rate(lambda: encode(reply), args.iterations)  # noqa: B023 evaluated in the loop
+        decode_rate = _rate(lambda: decode(body), args.iterations)  # noqa: B023 evaluated in the loop
+        print(  # noqa: T201 benchmark output
+            f'{name:<12} size={len(body) / 1024:9.1f} KiB  '
+            f'encode={encode_rate:8.1f}/s  decode={decode_rate:8.1f}/s'
+        )
+
+
+if __name__ == '__main__':
+    main()
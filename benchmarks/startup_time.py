@@ -0,0 +1,122 @@
+"""Startup benchmark: cold start of a web application worker.
+
+Measures, in fresh interpreters, what a uvicorn worker pays on every
+(re)start:
+
+    * ``import``: the modules imported by `intakevms.main`, from
+      `python -X importtime`, the slowest ones listed by cumulative time.
+    * ``cold start``: wall time from spawning the interpreter to the first
+      request served, the Swagger UI page, which needs neither RabbitMQ
+      nor the database.
+
+The cold start is compared to `COLD_START_TARGET_SECONDS`; with `--check`,
+the script exits with an error when the median exceeds it.
+
+Usage:
+    python -m benchmarks.startup_time --iterations 5 --top 15
+    python -m benchmarks.startup_time --check
+"""
+
+import sys
+import time
+import argparse
+import subprocess
+from typing import List, Tuple
+
+from benchmarks.utils import report, percentile
+
+# Median time from spawning a worker to serving its first request.
+COLD_START_TARGET_SECONDS = 2.0
+
+FIRST_REQUEST = (
+    'from fastapi.testclient import TestClient\n'
+    'from intakevms.main import app\n'
+    "TestClient(app).get('/swagger').raise_for_status()\n"
+)
+
+
+def _import_times(module: str) -> List[Tuple[int, int, str]]:
+    """Import a module in a fresh interpreter and collect the import times.
+
+    Args:
+        module (str): The module to import.
+
+    Returns:
+        List[Tuple[int, int, str]]: The cumulative and self microseconds,
+            and the name, of every imported module.
+
+    Raises:
+        RuntimeError: If the module cannot be imported.
+    """
+    result = subprocess.run(  # noqa: S603 fixed command
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        msg = f'Cannot import {module}:\n{result.stderr[-2000:]}'
+        raise RuntimeError(msg)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        times.append((int(cumulative_us), int(self_us), name.strip()))
+    return times
+
+
+def _cold_start() -> float:
+    """Spawn an interpreter serving a first request, and time it.
+
+    Returns:
+        float: The wall time in seconds.
+
+    Raises:
+        RuntimeError: If the request fails.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(  # noqa: S603 fixed command
+        [sys.executable, '-c', FIRST_REQUEST],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    duration = time.perf_counter() - started
+    if result.returncode:
+        msg = f'First request failed:\n{result.stderr[-2000:]}'
+        raise RuntimeError(msg)
+    return duration
+
+
+def main() -> None:
+    """Measure the imports and the cold start, and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    times = _import_times('intakevms.main')
+    total = max(cumulative for cumulative, _, _ in times)
+    for cumulative, self_us, name in sorted(times, reverse=True)[: args.top]:
+        print(  # noqa: T201 benchmark output
+            f'{name:<60} cumulative={cumulative / 1000:8.1f} ms  '
+            f'self={self_us / 1000:7.1f} ms'
+        )
+    print(f'import intakevms.main: {total / 1000:.1f} ms')  # noqa: T201 benchmark output
+
+    samples = [_cold_start() for _ in range(args.iterations)]
+    report('cold start to first request', samples)
+    median = percentile(samples, 50)
+    verdict = 'within' if median <= COLD_START_TARGET_SECONDS else 'over'
+    print(  # noqa: T201 benchmark output
+        f'median {median:.2f} s, {verdict} the target of '
+        f'{COLD_START_TARGET_SECONDS:.2f} s'
+    )
+    if args.check and median > COLD_START_TARGET_SECONDS:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Shared helpers for the benchmark scripts.
+
+Functions:
+    percentile: Returns the given percentile of a list of samples.
+    measure: Runs a callable repeatedly and collects latency samples.
+    report: Prints a one-line latency summary for a list of samples.
+"""
+
+import math
+import time
+from typing import Any, List, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Return the given percentile of the samples (nearest-rank method).
+
+    Args:
+        samples (Sequence[float]): The measured samples.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile value, or 0.0 for an empty sample list.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def measure(
+    func: Callable[[], Any],
+    iterations: int,
+    concurrency: int = 1,
+) -> List[float]:
+    """Run the callable repeatedly and collect per-call latencies.
+
+    Args:
+        func (Callable[[], Any]): The callable to measure.
+        iterations (int): Total number of calls.
+        concurrency (int): Number of threads issuing calls in parallel.
+
+    Returns:
+        List[float]: Latency of every call in seconds.
+    """
+
+    def timed(_: int) -> float:
+        started = time.perf_counter()
+        func()
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(timed, range(iterations)))
+
+
+def report(name: str, samples: Sequence[float]) -> None:
+    """Print a one-line latency summary for the samples.
+
+    Args:
+        name (str): Name of the measured scenario.
+        samples (Sequence[float]): Latency samples in seconds.
+    """
+    print(  # noqa: T201 benchmark output
+        f'{name:<40} n={len(samples):<6} '
+        f'p50={percentile(samples, 50) * 1000:8.2f} ms  '
+        f'p99={percentile(samples, 99) * 1000:8.2f} ms'
+    )
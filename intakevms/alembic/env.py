@@ -15,6 +15,8 @@ from intakevms.modules.virtual_network.adapters.orm import (
 )
 from intakevms.modules.block_device.adapters.orm import Base as BlockDeviceBase
 from intakevms.modules.template.adapters.orm import Base as TemplateBase
+from intakevms.modules.jobs.adapters.orm import Base as JobBase
+from intakevms.common.versions import Base as VersionBase
 from alembic import context
 
 # this is the Alembic Config object, which provides
@@ -44,6 +46,8 @@ target_metadata = [
     VirtualNetworkBase.metadata,
     BlockDeviceBase.metadata,
     TemplateBase.metadata,
+    JobBase.metadata,
+    VersionBase.metadata,
 ]
 
 # other values from the config, defined by the needs of env.py,
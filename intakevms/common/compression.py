@@ -0,0 +1,333 @@
+"""Negotiated compression of responses, and caching of the static assets.
+
+API responses are compressed by `CompressionMiddleware` when the client
+accepts it and the body is worth it: at least `minimum_size` bytes of a
+compressible media type. Brotli is preferred when the `brotli` package is
+installed, gzip otherwise. Streamed responses, such as Server-Sent Events
+and downloads, are sent as they are.
+
+The bundled SPA is served by `AssetFiles`. Assets are compressed once, at
+the highest levels, on their first request and kept in memory, and
+content-hashed assets, e.g. `index-e9ab38a5.js`, are cached by browsers
+for a year since a new build changes their names. Other files are
+revalidated with their ETag.
+
+Usage example:
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    app.mount('/assets', AssetFiles(directory=project_dir / 'dist/assets'))
+
+Classes:
+    CompressionMiddleware: Compresses the complete responses of an app.
+    AssetFiles: Static files served compressed, with long-lived caching.
+
+Functions:
+    supported_encodings: Gets the encodings this process can produce.
+    negotiate: Picks the encoding of a response from Accept-Encoding.
+    compress: Compresses a body.
+"""
+
+import re
+import gzip
+import functools
+from typing import Dict, Tuple, Optional
+from pathlib import Path
+
+from starlette.types import Send, Scope, ASGIApp, Message, Receive
+from starlette.responses import Response, FileResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Smallest body worth compressing, smaller ones fit in a packet anyway.
+MINIMUM_SIZE = 1024
+
+# Levels of the responses compressed per request, and of the assets
+# compressed once.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ASSET_GZIP_LEVEL = 9
+ASSET_BROTLI_QUALITY = 11
+
+COMPRESSIBLE_TYPES = (
+    'application/json',
+    'application/javascript',
+    'image/svg+xml',
+    'text/',
+)
+COMPRESSIBLE_SUFFIXES = frozenset(
+    {'.js', '.css', '.html', '.json', '.svg', '.ttf', '.ico', '.map'}
+)
+
+# Names of content-hashed assets, e.g. `index-9b5df8b2.css`.
+HASHED_NAME = re.compile(r'-[0-9a-f]{8,}\.\w+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Get the encodings this process can produce, preferred first.
+
+    Returns:
+        Tuple[str, ...]: `br` if brotli is installed, and `gzip`.
+    """
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def _qualities(accept_encoding: str) -> Dict[str, float]:
+    """Parse the quality of each encoding of an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): The header, e.g. `gzip;q=0.8, br`.
+
+    Returns:
+        Dict[str, float]: The quality of each listed encoding.
+    """
+    qualities = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        if not name:
+            continue
+        quality = 1.0
+        key, _, value = params.strip().partition('=')
+        if key.strip() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the encoding of a response from the Accept-Encoding header.
+
+    Args:
+        accept_encoding (Optional[str]): The header of the request.
+
+    Returns:
+        Optional[str]: The accepted encoding of highest quality, brotli on
+            ties, None if the client accepts none of them.
+    """
+    if not accept_encoding:
+        return None
+    qualities = _qualities(accept_encoding)
+    wildcard = qualities.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, *, best: bool = False) -> bytes:
+    """Compress a body.
+
+    Args:
+        body (bytes): The body.
+        encoding (str): `br` or `gzip`.
+        best (bool): Whether to use the highest level, for bodies
+            compressed once and served many times.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == 'br':
+        quality = ASSET_BROTLI_QUALITY if best else BROTLI_QUALITY
+        compressed: bytes = brotli.compress(body, quality=quality)
+        return compressed
+    level = ASSET_GZIP_LEVEL if best else GZIP_LEVEL
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressionMiddleware:
+    """Compresses the complete responses of an app.
+
+    Only responses sent in a single body message are compressed, so that
+    streams are delivered as soon as they are written.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE) -> None:
+        """Wrap an app.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+            minimum_size (int): Smallest body to compress, in bytes.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handle a request, compressing its response if accepted.
+
+        Args:
+            scope (Scope): The scope of the request.
+            receive (Receive): Receives the messages of the request.
+            send (Send): Sends the messages of the response.
+        """
+        encoding = (
+            negotiate(Headers(scope=scope).get('accept-encoding'))
+            if scope['type'] == 'http'
+            else None
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message['type'] == 'http.response.start':
+                start = message
+                return
+            if start is not None:
+                response_start, start = start, None
+                message = self._compressed(response_start, message, encoding)
+                await send(response_start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressed(
+        self, start: Message, message: Message, encoding: str
+    ) -> Message:
+        """Compress the first body message of a response, if worth it.
+
+        Args:
+            start (Message): The start message of the response, whose
+                headers are updated.
+            message (Message): The first body message.
+            encoding (str): The negotiated encoding.
+
+        Returns:
+            Message: The body message to send.
+        """
+        body = message.get('body', b'')
+        headers = MutableHeaders(raw=start['headers'])
+        if message.get('more_body', False) or not self._worth(headers, body):
+            return message
+        compressed = compress(body, encoding)
+        if len(compressed) >= len(body):
+            return message
+        headers['Content-Encoding'] = encoding
+        headers['Content-Length'] = str(len(compressed))
+        headers.add_vary_header('Accept-Encoding')
+        return {**message, 'body': compressed}
+
+    def _worth(self, headers: MutableHeaders, body: bytes) -> bool:
+        """Tell whether a complete response is worth compressing.
+
+        Args:
+            headers (MutableHeaders): The headers of the response.
+            body (bytes): The body of the response.
+
+        Returns:
+            bool: True for uncompressed bodies of a compressible type, of at
+                least the minimum size.
+        """
+        return (
+            len(body) >= self.minimum_size
+            and 'content-encoding' not in headers
+            and headers.get('content-type', '').startswith(COMPRESSIBLE_TYPES)
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _compressed_asset(
+    path: str,
+    mtime: float,  # noqa: ARG001 part of the cache key
+    size: int,  # noqa: ARG001 part of the cache key
+    encoding: str,
+) -> bytes:
+    """Read and compress an asset, once per version of the file.
+
+    Args:
+        path (str): The path of the asset.
+        mtime (float): The modification time of the file, part of the key.
+        size (int): The size of the file, part of the key.
+        encoding (str): `br` or `gzip`.
+
+    Returns:
+        bytes: The compressed asset.
+    """
+    return compress(Path(path).read_bytes(), encoding, best=True)
+
+
+class AssetFiles(StaticFiles):
+    """Static files served compressed, with long-lived caching of hashed ones.
+
+    Compressed variants have ETags of their own, derived from the one of the
+    file, and are answered with `304 Not Modified` when revalidated.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Get the response of a file, compressed if accepted.
+
+        Args:
+            path (str): The path of the file, relative to the directory.
+            scope (Scope): The scope of the request.
+
+        Returns:
+            Response: The response.
+        """
+        response = await super().get_response(path, scope)
+        if response.status_code not in {200, 304}:
+            return response
+        response.headers['Cache-Control'] = (
+            IMMUTABLE if HASHED_NAME.search(path) else REVALIDATE
+        )
+        if Path(path).suffix not in COMPRESSIBLE_SUFFIXES:
+            return response
+        response.headers['Vary'] = 'Accept-Encoding'
+        request_headers = Headers(scope=scope)
+        encoding = negotiate(request_headers.get('accept-encoding'))
+        # Files found are FileResponse, revalidated ones NotModifiedResponse.
+        if encoding is None or not isinstance(response, FileResponse):
+            return response
+        return await self._compressed_response(
+            response, encoding, request_headers
+        )
+
+    @staticmethod
+    async def _compressed_response(
+        response: FileResponse,
+        encoding: str,
+        request_headers: Headers,
+    ) -> Response:
+        """Build the compressed variant of a file response.
+
+        Args:
+            response (FileResponse): The response of the file.
+            encoding (str): The negotiated encoding.
+            request_headers (Headers): The headers of the request.
+
+        Returns:
+            Response: The compressed file, or `304 Not Modified`.
+        """
+        stat = response.stat_result or Path(response.path).stat()
+        etag = response.headers.get('etag', '').rstrip('"') + f'-{encoding}"'
+        headers = {
+            'Cache-Control': response.headers['cache-control'],
+            'ETag': etag,
+            'Last-Modified': response.headers.get('last-modified', ''),
+            'Content-Encoding': encoding,
+            'Vary': 'Accept-Encoding',
+        }
+        if etag in request_headers.get('if-none-match', ''):
+            return Response(status_code=304, headers=headers)
+        body = await run_in_threadpool(
+            _compressed_asset,
+            str(response.path),
+            stat.st_mtime,
+            stat.st_size,
+            encoding,
+        )
+        return Response(body, media_type=response.media_type, headers=headers)
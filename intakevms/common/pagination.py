@@ -0,0 +1,458 @@
+"""Keyset pagination of the list endpoints.
+
+List endpoints return one page of rows at a time, selected in the database
+rather than by slicing the whole list: rows are ordered by a sort column and
+the primary key, and the next page starts after the last row of the current
+one. The position is sent to clients as an opaque `next_cursor`, so the cost
+of a page does not depend on the number of rows before it.
+
+The page request travels from the API through the `*Crud` classes and the
+RPC layer to the repositories as a plain dictionary, see
+`PageRequest.to_dict`.
+
+Usage example:
+    # API
+    storages_page = page_request('id')
+
+    @router.get('/', response_model=KeysetPage[schemas.Storage])
+    async def get_storages(
+        page: PageRequest = Depends(storages_page),
+        crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
+    ) -> KeysetPage[schemas.Storage]:
+        return KeysetPage[schemas.Storage](
+            **await crud.get_storages_page(page)
+        )
+
+    # Service layer
+    page = PageRequest.from_dict(data)
+    with self.uow:
+        storages, next_cursor = self.uow.storages.get_page(page)
+
+Classes:
+    PageRequest: Size, position and ordering of a requested page.
+
+Functions:
+    encode_cursor: Encodes the position after a row.
+    decode_cursor: Decodes the position of a cursor.
+    page_request: Builds the FastAPI dependency of a list endpoint.
+    paginate_query: Selects a page of rows.
+    apaginate_query: Selects a page of rows in an async session.
+    page_dict: Builds the page returned by the service layers.
+"""
+
+import json
+import base64
+import binascii
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Mapping,
+    Callable,
+    Optional,
+    Sequence,
+)
+from dataclasses import asdict, dataclass
+
+from fastapi import Query, HTTPException, status
+from sqlalchemy import Select, tuple_, literal
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+DIRECTIONS = ('asc', 'desc')
+
+
+def encode_cursor(order_by: str, direction: str, values: Sequence) -> str:
+    """Encode the position after a row.
+
+    Args:
+        order_by (str): The sort column of the page.
+        direction (str): The direction of the sort, `asc` or `desc`.
+        values (Sequence): The sort key of the row: the value of the sort
+            column, then the primary key.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    position = {'o': order_by, 'd': direction, 'v': list(values)}
+    raw = json.dumps(position, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, List]:
+    """Decode the position of a cursor.
+
+    Args:
+        cursor (str): A cursor built by `encode_cursor`.
+
+    Returns:
+        Tuple[str, str, List]: The sort column, the direction and the sort
+            key of the last row of the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        position = json.loads(raw)
+        return str(position['o']), str(position['d']), list(position['v'])
+    except (binascii.Error, ValueError, KeyError, TypeError) as err:
+        msg = f'Invalid page cursor: {cursor}'
+        raise ValueError(msg) from err
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Size, position and ordering of a requested page.
+
+    Attributes:
+        limit (int): Maximum number of rows of the page.
+        cursor (Optional[str]): Position to start after, `None` for the first
+            page.
+        order_by (Optional[str]): The sort column, `None` for the default
+            one of the repository.
+        direction (str): The direction of the sort, `asc` or `desc`.
+    """
+
+    limit: int = DEFAULT_LIMIT
+    cursor: Optional[str] = None
+    order_by: Optional[str] = None
+    direction: str = 'asc'
+
+    def __post_init__(self) -> None:
+        """Validate the request.
+
+        Raises:
+            ValueError: If the limit, the direction or the cursor are
+                invalid, or the cursor was built for another ordering.
+        """
+        if not 1 <= self.limit <= MAX_LIMIT:
+            msg = f'Page limit must be between 1 and {MAX_LIMIT}'
+            raise ValueError(msg)
+        if self.direction not in DIRECTIONS:
+            msg = f'Page direction must be one of {DIRECTIONS}'
+            raise ValueError(msg)
+        if self.cursor is not None:
+            order_by, direction, _ = decode_cursor(self.cursor)
+            if direction != self.direction or order_by != (
+                self.order_by or order_by
+            ):
+                msg = 'Page cursor does not match the requested ordering'
+                raise ValueError(msg)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'PageRequest':
+        """Build the request from the data of an RPC request.
+
+        Args:
+            data (Mapping): The data for the method, other keys are ignored.
+
+        Returns:
+            PageRequest: The page request.
+        """
+        return cls(
+            limit=int(data.get('limit', DEFAULT_LIMIT)),
+            cursor=data.get('cursor'),
+            order_by=data.get('order_by'),
+            direction=data.get('direction', 'asc'),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the data of the request to send over RPC.
+
+        Returns:
+            Dict[str, Any]: The fields of the request.
+        """
+        return asdict(self)
+
+
+def page_request(
+    *order_by: str,
+    direction: str = 'asc',
+) -> Callable[..., PageRequest]:
+    """Build the FastAPI dependency parsing the page of a list endpoint.
+
+    Args:
+        *order_by (str): The sort columns clients may choose from, the first
+            one is the default.
+        direction (str): The default direction of the sort.
+
+    Returns:
+        Callable[..., PageRequest]: The dependency, responding with 422 to
+            invalid parameters.
+    """
+    pattern = f'^({"|".join(order_by)})$'
+
+    def dependency(
+        limit: int = Query(
+            default=DEFAULT_LIMIT,
+            ge=1,
+            le=MAX_LIMIT,
+            description='Maximum number of items of the page.',
+        ),
+        cursor: Optional[str] = Query(
+            default=None,
+            description='The `next_cursor` of the previous page.',
+        ),
+        sort: Optional[str] = Query(
+            default=None,
+            pattern=pattern,
+            description=(
+                f'Sort column: {", ".join(order_by)}. Defaults to the one '
+                f'of the cursor, or to {order_by[0]}.'
+            ),
+        ),
+        order: Optional[str] = Query(
+            default=None,
+            pattern='^(asc|desc)$',
+            description=(
+                f'Sort direction. Defaults to the one of the cursor, or to '
+                f'{direction}.'
+            ),
+        ),
+    ) -> PageRequest:
+        try:
+            if cursor is not None:
+                cursor_sort, cursor_order, _ = decode_cursor(cursor)
+                sort = sort or cursor_sort
+                order = order or cursor_order
+            return PageRequest(
+                limit=limit,
+                cursor=cursor,
+                order_by=sort or order_by[0],
+                direction=order or direction,
+            )
+        except ValueError as err:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(err),
+            ) from err
+
+    return dependency
+
+
+def _load_value(column: Any, value: Any) -> Any:  # noqa: ANN401 any column type
+    """Convert a value of a cursor back to the type of its column.
+
+    Args:
+        column (Any): The column.
+        value (Any): The value decoded from JSON.
+
+    Returns:
+        Any: The value to compare the column with.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    if hasattr(python_type, 'fromisoformat'):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def _sort_keys(order_by: str, columns: Mapping[str, Any]) -> List[Any]:
+    """Get the columns of the sort key of a page.
+
+    Args:
+        order_by (str): The sort column.
+        columns (Mapping[str, Any]): The sort columns by name, including the
+            primary key as `id`.
+
+    Returns:
+        List[Any]: The sort column, then the primary key.
+
+    Raises:
+        ValueError: If the sort column is not one of `columns`.
+    """
+    if order_by not in columns:
+        msg = f'Cannot order by {order_by}, expected one of {list(columns)}'
+        raise ValueError(msg)
+    if order_by == 'id':
+        return [columns['id']]
+    return [columns[order_by], columns['id']]
+
+
+def _after_cursor(
+    stmt: Select,
+    keys: Sequence[Any],
+    cursor: str,
+    *,
+    descending: bool,
+) -> Select:
+    """Filter the rows following the position of a cursor.
+
+    Args:
+        stmt (Select): The statement selecting the rows.
+        keys (Sequence[Any]): The sort key columns.
+        cursor (str): The cursor of the previous page.
+        descending (bool): Whether the rows are sorted in descending order.
+
+    Returns:
+        Select: The statement selecting the rows after the cursor.
+    """
+    _, _, values = decode_cursor(cursor)
+    bound = tuple_(
+        *(
+            literal(_load_value(key, value), key.type)
+            for key, value in zip(keys, values, strict=True)
+        )
+    )
+    position = tuple_(*keys)
+    return stmt.where(position < bound if descending else position > bound)
+
+
+def _page_statement(
+    stmt: Select,
+    page: PageRequest,
+    columns: Mapping[str, Any],
+    default_order: str,
+    projection: Optional[Sequence],
+) -> Tuple[Select, List[Any]]:
+    """Build the statement selecting a page of rows, and one row more.
+
+    Args:
+        stmt (Select): Statement selecting the entities.
+        page (PageRequest): The requested page.
+        columns (Mapping[str, Any]): The sort columns by name.
+        default_order (str): The sort column if the request has none.
+        projection (Optional[Sequence]): The columns to load, if any.
+
+    Returns:
+        Tuple[Select, List[Any]]: The statement, and its sort key columns.
+    """
+    keys = _sort_keys(page.order_by or default_order, columns)
+    descending = page.direction == 'desc'
+    if page.cursor is not None:
+        stmt = _after_cursor(stmt, keys, page.cursor, descending=descending)
+    if projection is not None:
+        stmt = stmt.options(
+            load_only(*projection, *keys, raiseload=True), raiseload('*')
+        )
+    stmt = stmt.order_by(
+        *(key.desc() if descending else key.asc() for key in keys)
+    ).limit(page.limit + 1)
+    return stmt, keys
+
+
+def _page_result(
+    rows: List[Any],
+    page: PageRequest,
+    keys: Sequence[Any],
+    default_order: str,
+) -> Tuple[List[Any], Optional[str]]:
+    """Cut the rows selected by `_page_statement` into a page.
+
+    Args:
+        rows (List[Any]): The selected rows.
+        page (PageRequest): The requested page.
+        keys (Sequence[Any]): The sort key columns.
+        default_order (str): The sort column if the request has none.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The rows of the page, and the
+            cursor of the next page, `None` on the last page.
+    """
+    if len(rows) <= page.limit:
+        return rows, None
+    rows = rows[: page.limit]
+    last = rows[-1]
+    next_cursor = encode_cursor(
+        page.order_by or default_order,
+        page.direction,
+        [getattr(last, key.key) for key in keys],
+    )
+    return rows, next_cursor
+
+
+def paginate_query(  # noqa: PLR0913 the projection is an optional keyword
+    session: Session,
+    stmt: Select,
+    page: PageRequest,
+    columns: Mapping[str, Any],
+    default_order: str,
+    *,
+    projection: Optional[Sequence] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """Select a page of rows.
+
+    The rows are ordered by the sort column, then by the primary key, so
+    the order is total even when sort values repeat. Sort columns must not
+    be nullable.
+
+    With a projection, only the given columns and the sort columns of the
+    entities are selected, relationships are not loaded, and accessing
+    anything else raises instead of emitting a query per row.
+
+    Args:
+        session (Session): The database session.
+        stmt (Select): Statement selecting the entities, with their filters
+            and loader options.
+        page (PageRequest): The requested page.
+        columns (Mapping[str, Any]): The sort columns by name, including the
+            primary key as `id`.
+        default_order (str): The sort column if the request has none.
+        projection (Optional[Sequence]): The columns to load, None to load
+            the entities according to the loader options of `stmt`.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The entities of the page, and the
+            cursor of the next page, `None` on the last page.
+
+    Raises:
+        ValueError: If the sort column is not one of `columns`.
+    """
+    stmt, keys = _page_statement(stmt, page, columns, default_order, projection)
+    rows = list(session.scalars(stmt).unique().all())
+    return _page_result(rows, page, keys, default_order)
+
+
+async def apaginate_query(  # noqa: PLR0913 the projection is an optional keyword
+    session: AsyncSession,
+    stmt: Select,
+    page: PageRequest,
+    columns: Mapping[str, Any],
+    default_order: str,
+    *,
+    projection: Optional[Sequence] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """Select a page of rows in an async session, see `paginate_query`.
+
+    Args:
+        session (AsyncSession): The database session.
+        stmt (Select): Statement selecting the entities, with their filters
+            and loader options.
+        page (PageRequest): The requested page.
+        columns (Mapping[str, Any]): The sort columns by name, including the
+            primary key as `id`.
+        default_order (str): The sort column if the request has none.
+        projection (Optional[Sequence]): The columns to load, None to load
+            the entities according to the loader options of `stmt`.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The entities of the page, and the
+            cursor of the next page, `None` on the last page.
+
+    Raises:
+        ValueError: If the sort column is not one of `columns`.
+    """
+    stmt, keys = _page_statement(stmt, page, columns, default_order, projection)
+    rows = list((await session.scalars(stmt)).unique().all())
+    return _page_result(rows, page, keys, default_order)
+
+
+def page_dict(items: List, next_cursor: Optional[str]) -> Dict[str, Any]:
+    """Build the page returned by the service layers.
+
+    Args:
+        items (List): The serialized items of the page.
+        next_cursor (Optional[str]): The cursor of the next page.
+
+    Returns:
+        Dict[str, Any]: The page, see `KeysetPage`.
+    """
+    return {'items': items, 'next_cursor': next_cursor}
@@ -0,0 +1,103 @@
+"""Summary projections of the list endpoints.
+
+Full representations of entities include their relationships, e.g. the
+disks and interfaces of a virtual machine, which are loaded, serialized and
+validated for every item of a page. Clients that only display a few
+columns, such as the grids of the dashboard, request the summary view
+instead: repositories then select only the summary columns of the entity,
+without loading any relationship, and service layers serialize the loaded
+columns as they are.
+
+Usage example:
+    # API
+    view: View = Query(default=View.FULL, description=VIEW_DESCRIPTION)
+
+    # Service layer
+    summary = is_summary(data)
+    vms, next_cursor = self.uow.virtual_machines.get_page(
+        page, summary=summary
+    )
+    items = [
+        to_summary(vm) if summary else DataSerializer.vm_to_web(vm)
+        for vm in vms
+    ]
+
+Classes:
+    View: Representation of the items of a list endpoint.
+
+Functions:
+    is_summary: Tells whether an RPC request asks for the summary view.
+    to_summary: Serializes the loaded columns of an entity.
+"""
+
+import enum
+import uuid
+import datetime
+from typing import Any, Dict, Mapping
+
+from sqlalchemy import inspect
+
+VIEW_DESCRIPTION = (
+    'Representation of the items: `summary` for the main columns only, '
+    '`full` for the entities with their relationships.'
+)
+
+
+class View(str, enum.Enum):
+    """Representation of the items of a list endpoint."""
+
+    SUMMARY = 'summary'
+    FULL = 'full'
+
+
+def is_summary(data: Mapping) -> bool:
+    """Tell whether the data of an RPC request asks for the summary view.
+
+    Args:
+        data (Mapping): The data for the method, with the optional `view`.
+
+    Returns:
+        bool: True for the summary view, False for the full one.
+
+    Raises:
+        ValueError: If the view is unknown.
+    """
+    return View(data.get('view', View.FULL)) is View.SUMMARY
+
+
+def _to_json(value: Any) -> Any:  # noqa: ANN401 any column value
+    """Convert a column value to a JSON-compatible value.
+
+    Args:
+        value (Any): The value of the column.
+
+    Returns:
+        Any: The value, with UUIDs, dates and enums as strings.
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def to_summary(entity: Any) -> Dict[str, Any]:  # noqa: ANN401 any ORM entity
+    """Serialize the loaded columns of an entity.
+
+    Relationships and columns left out of the projection are not part of
+    the result, and are never loaded.
+
+    Args:
+        entity (Any): The ORM entity, loaded with a summary projection.
+
+    Returns:
+        Dict[str, Any]: The loaded columns by name.
+    """
+    state = inspect(entity)
+    return {
+        name: _to_json(value)
+        for name, value in state.dict.items()
+        if name in state.mapper.column_attrs
+    }
@@ -0,0 +1,97 @@
+"""Responses rendered from validated models, without FastAPI validation.
+
+FastAPI validates what an endpoint returns against its `response_model`:
+the returned models are dumped to dictionaries, validated again, then
+encoded by `jsonable_encoder` and `json.dumps`. The CRUD classes already
+validate the replies of the service layers, so for large pages this second
+validation doubled the CPU time of the web workers.
+
+Endpoints on the fast path return `RenderedJSONResponse` instead: the
+validated model is serialized to JSON bytes in a single pydantic-core pass,
+and FastAPI sends the response as is. `response_model` is still declared on
+the route, for the OpenAPI schema.
+
+Usage example:
+    @router.get(
+        '/',
+        response_model=KeysetPage[schemas.Storage],
+        dependencies=[Depends(storages_etag)],
+    )
+    async def get_storages(response: Response) -> RenderedJSONResponse:
+        result = await crud.get_storages_page(page)
+        return render(KeysetPage[schemas.Storage](**result), response)
+
+Classes:
+    RenderedJSONResponse: Response whose content is JSON bytes already.
+
+Functions:
+    type_adapter: Gets the cached adapter of a type.
+    render: Renders a validated model as a JSON response.
+"""
+
+import functools
+from typing import Any, Optional
+
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+
+class RenderedJSONResponse(Response):
+    """Response whose content is JSON bytes already."""
+
+    media_type = 'application/json'
+
+    def render(self, content: bytes) -> bytes:
+        """Send the content as is.
+
+        Args:
+            content (bytes): The JSON document.
+
+        Returns:
+            bytes: The body of the response.
+        """
+        return content
+
+
+@functools.lru_cache(maxsize=None)
+def type_adapter(annotation: Any) -> TypeAdapter:  # noqa: ANN401 any type
+    """Get the cached adapter of a type.
+
+    Building an adapter compiles its validator and serializer, which costs
+    more than validating a page, so adapters are built once per type.
+
+    Args:
+        annotation (Any): The type, e.g. `List[schemas.Storage]`.
+
+    Returns:
+        TypeAdapter: The adapter of the type.
+    """
+    return TypeAdapter(annotation)
+
+
+def render(
+    content: BaseModel,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+) -> RenderedJSONResponse:
+    """Render a validated model as a JSON response.
+
+    FastAPI drops the headers that dependencies set on the injected response
+    when an endpoint returns a response of its own, so they are copied.
+
+    Args:
+        content (BaseModel): The validated model.
+        response (Optional[Response]): The response injected in the
+            endpoint, whose headers are kept, e.g. the ETag.
+        status_code (int): The status code of the response.
+
+    Returns:
+        RenderedJSONResponse: The response.
+    """
+    rendered = RenderedJSONResponse(
+        type_adapter(type(content)).dump_json(content, by_alias=True),
+        status_code=status_code,
+    )
+    if response is not None:
+        rendered.raw_headers.extend(response.raw_headers)
+    return rendered
@@ -5,6 +5,7 @@ common CRUD operations for working with data.
 
 Classes:
     - AbstractRepository: Base repository interface with CRUD methods.
+    - AbstractAsyncRepository: The same interface, with coroutine methods.
 """
 
 import abc
@@ -77,3 +78,68 @@ class AbstractRepository(abc.ABC, Generic[T]):
             entity (T): The entity with updated data.
         """
         ...
+
+
+class AbstractAsyncRepository(abc.ABC, Generic[T]):
+    """Abstract base repository with CRUD coroutine methods.
+
+    The contract of `AbstractRepository`, for repositories used from an
+    event loop.
+    """
+
+    @abc.abstractmethod
+    async def add(self, entity: T) -> None:
+        """Adds a new entity to the repository.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def get(self, entity_id: UUID) -> Optional[T]:
+        """Retrieves an entity by its ID.
+
+        Args:
+            entity_id (UUID): The ID of the entity.
+
+        Returns:
+            Optional[T]: The retrieved entity or None if not found.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def get_all(self) -> List[T]:
+        """Retrieves all entities from the repository.
+
+        Returns:
+            List[T]: A list of all stored entities.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def delete(self, entity: T) -> None:
+        """Deletes the given entity from the repository.
+
+        Args:
+            entity (T): The entity instance to delete.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def delete_by_id(self, entity_id: UUID) -> None:
+        """Deletes an entity by its unique ID.
+
+        Args:
+            entity_id (UUID): The ID of the entity to delete.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def update(self, entity: T) -> None:
+        """Updates an existing entity in the repository.
+
+        Args:
+            entity (T): The entity with updated data.
+        """
+        ...
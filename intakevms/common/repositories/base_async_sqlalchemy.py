@@ -0,0 +1,212 @@
+"""Base repository implementation using SQLAlchemy asyncio.
+
+This module provides a concrete implementation of the AbstractAsyncRepository
+interface using an SQLAlchemy `AsyncSession`, so that an event loop can
+overlap the queries of many requests without a thread per request.
+
+Relationships are never loaded implicitly in an async session: accessing
+one that was not loaded raises. Queries needing relationships load them
+with loader options, e.g. `selectinload`.
+
+Classes:
+    - BaseAsyncSqlAlchemyRepository: A repository class using SQLAlchemy
+        asyncio.
+"""
+
+from uuid import UUID
+from typing import (
+    Any,
+    List,
+    Type,
+    Tuple,
+    Generic,
+    TypeVar,
+    ClassVar,
+    Optional,
+    Sequence,
+)
+
+from sqlalchemy import func, delete, select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from intakevms.common.pagination import PageRequest, apaginate_query
+from intakevms.common.repositories.abstract import AbstractAsyncRepository
+from intakevms.common.repositories.exceptions import EntityNotFoundError
+
+T = TypeVar('T', bound=DeclarativeBase)
+
+
+class BaseAsyncSqlAlchemyRepository(AbstractAsyncRepository[T], Generic[T]):
+    """Base repository implementation using SQLAlchemy asyncio.
+
+    The async counterpart of `BaseSqlAlchemyRepository`, with the same
+    methods as coroutines.
+
+    Attributes:
+        sortable (Tuple[str, ...]): Columns pages may be ordered by, they
+            must not be nullable. The primary key `id` breaks ties.
+        default_order (str): Column pages are ordered by if the request
+            has none.
+        summary_columns (Tuple[str, ...]): Columns of the summary view of
+            the entities, besides the primary key.
+    """
+
+    sortable: ClassVar[Tuple[str, ...]] = ('id',)
+    default_order: ClassVar[str] = 'id'
+    summary_columns: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, session: AsyncSession, model_cls: Type[T]) -> None:
+        """Initializes the repository with a database session and model class.
+
+        The connection is checked by the unit of work, see
+        `BaseAsyncSqlAlchemyUnitOfWork`.
+
+        Args:
+            session (AsyncSession): The SQLAlchemy session for database
+                operations.
+            model_cls (Type[T]): The model class associated with this
+                repository.
+        """
+        self.session = session
+        self.model_cls = model_cls
+
+    async def add(self, entity: T) -> None:
+        """Adds a new entity, or marks a tracked one for update.
+
+        Args:
+            entity (T): The entity to add or update.
+        """
+        self.session.add(entity)
+        await self.session.flush()  # To populate entity.id immediately
+
+    async def get(self, entity_id: UUID) -> Optional[T]:
+        """Retrieves an entity by its ID.
+
+        Args:
+            entity_id (UUID): The ID of the entity.
+
+        Returns:
+            Optional[T]: The retrieved entity or None if not found.
+        """
+        return await self.session.get(self.model_cls, entity_id)
+
+    async def get_or_fail(self, entity_id: UUID) -> T:
+        """Retrieves an entity by its ID or raises an exception if not found.
+
+        Args:
+            entity_id (UUID): The ID of the entity.
+
+        Returns:
+            T: The retrieved entity.
+
+        Raises:
+            EntityNotFoundError: If the entity does not exist.
+        """
+        entity = await self.session.get(self.model_cls, entity_id)
+        if entity is None:
+            msg = f'{self.model_cls.__name__} with ID {entity_id} not found.'
+            raise EntityNotFoundError(msg)
+        return entity
+
+    async def get_all(self) -> List[T]:
+        """Retrieves all entities from the database.
+
+        Returns:
+            List[T]: A list of all stored entities.
+        """
+        stmt = select(self.model_cls)
+        return list((await self.session.scalars(stmt)).all())
+
+    async def get_page(
+        self,
+        page: PageRequest,
+        *criteria: Any,  # noqa: ANN401 any SQL expression
+        options: Sequence = (),
+        summary: bool = False,
+    ) -> Tuple[List[T], Optional[str]]:
+        """Retrieves a page of entities, in the order of `sortable` columns.
+
+        Args:
+            page (PageRequest): The requested page.
+            *criteria (Any): Filters of the entities.
+            options (Sequence): Loader options of the query, ignored for the
+                summary view.
+            summary (bool): Whether to load only the `summary_columns` of
+                the entities.
+
+        Returns:
+            Tuple[List[T], Optional[str]]: The entities of the page, and the
+                cursor of the next page, None on the last page.
+        """
+        stmt = select(self.model_cls).where(*criteria)
+        if not summary:
+            stmt = stmt.options(*options)
+        columns = {
+            name: getattr(self.model_cls, name)
+            for name in {*self.sortable, 'id'}
+        }
+        projection = (
+            [getattr(self.model_cls, name) for name in self.summary_columns]
+            if summary
+            else None
+        )
+        return await apaginate_query(
+            self.session,
+            stmt,
+            page,
+            columns,
+            self.default_order,
+            projection=projection,
+        )
+
+    async def delete(self, entity: T) -> None:
+        """Deletes the given entity, on commit.
+
+        Args:
+            entity (T): The entity instance to delete.
+        """
+        entity = await self.session.merge(entity)
+        await self.session.delete(entity)
+
+    async def delete_by_id(self, entity_id: UUID) -> None:
+        """Deletes an entity from the database by its ID.
+
+        Performs a direct `DELETE`, without loading the entity.
+
+        Args:
+            entity_id (UUID): The ID of the entity to delete.
+
+        Raises:
+            EntityNotFoundError: If no entity with the given ID exists.
+        """
+        result = await self.session.execute(
+            delete(self.model_cls).where(
+                self.model_cls.id == entity_id  # type: ignore[attr-defined]
+            )
+        )
+        if result.rowcount == 0:
+            message = (
+                f'{self.model_cls.__name__} with ID {entity_id} not found.'
+            )
+            raise EntityNotFoundError(message)
+
+    async def update(self, entity: T) -> None:
+        """Updates an existing entity, or inserts it if it does not exist.
+
+        Merges the entity into the session, see
+        `BaseSqlAlchemyRepository.update`.
+
+        Args:
+            entity (T): The entity to update.
+        """
+        await self.session.merge(entity)
+
+    async def count(self) -> int:
+        """Returns the number of entities in the table.
+
+        Returns:
+            int: Total count of entities.
+        """
+        stmt = select(func.count()).select_from(self.model_cls)
+        return await self.session.scalar(stmt) or 0
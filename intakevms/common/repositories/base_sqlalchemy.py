@@ -8,12 +8,23 @@ Classes:
 """
 
 from uuid import UUID
-from typing import List, Type, Generic, TypeVar, Optional
+from typing import (
+    Any,
+    List,
+    Type,
+    Tuple,
+    Generic,
+    TypeVar,
+    ClassVar,
+    Optional,
+    Sequence,
+)
 
 from sqlalchemy import func, select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, DeclarativeBase
 
+from intakevms.common.pagination import PageRequest, paginate_query
 from intakevms.abstracts.exceptions import DBCannotBeConnectedError
 from intakevms.common.repositories.abstract import AbstractRepository
 from intakevms.common.repositories.exceptions import EntityNotFoundError
@@ -26,8 +37,20 @@ class BaseSqlAlchemyRepository(AbstractRepository[T], Generic[T]):
 
     This class provides CRUD operations for managing database entities
     using SQLAlchemy ORM.
+
+    Attributes:
+        sortable (Tuple[str, ...]): Columns pages may be ordered by, they
+            must not be nullable. The primary key `id` breaks ties.
+        default_order (str): Column pages are ordered by if the request
+            has none.
+        summary_columns (Tuple[str, ...]): Columns of the summary view of
+            the entities, besides the primary key.
     """
 
+    sortable: ClassVar[Tuple[str, ...]] = ('id',)
+    default_order: ClassVar[str] = 'id'
+    summary_columns: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, session: Session, model_cls: Type[T]) -> None:
         """Initializes the repository with a database session and model class.
 
@@ -121,6 +144,48 @@ class BaseSqlAlchemyRepository(AbstractRepository[T], Generic[T]):
         stmt = select(self.model_cls)
         return list(self.session.scalars(stmt).all())
 
+    def get_page(
+        self,
+        page: PageRequest,
+        *criteria: Any,  # noqa: ANN401 any SQL expression
+        options: Sequence = (),
+        summary: bool = False,
+    ) -> Tuple[List[T], Optional[str]]:
+        """Retrieves a page of entities, in the order of `sortable` columns.
+
+        Args:
+            page (PageRequest): The requested page.
+            *criteria (Any): Filters of the entities.
+            options (Sequence): Loader options of the query, ignored for the
+                summary view.
+            summary (bool): Whether to load only the `summary_columns` of
+                the entities.
+
+        Returns:
+            Tuple[List[T], Optional[str]]: The entities of the page, and the
+                cursor of the next page, None on the last page.
+        """
+        stmt = select(self.model_cls).where(*criteria)
+        if not summary:
+            stmt = stmt.options(*options)
+        columns = {
+            name: getattr(self.model_cls, name)
+            for name in {*self.sortable, 'id'}
+        }
+        projection = (
+            [getattr(self.model_cls, name) for name in self.summary_columns]
+            if summary
+            else None
+        )
+        return paginate_query(
+            self.session,
+            stmt,
+            page,
+            columns,
+            self.default_order,
+            projection=projection,
+        )
+
     def delete(self, entity: T) -> None:
         """Deletes the given entity from the database.
 
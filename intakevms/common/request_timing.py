@@ -0,0 +1,205 @@
+"""Timing of the requests of the web application.
+
+`TimingMiddleware` measures every HTTP request into the metrics of the
+worker process, labelled by method and route template, e.g. `/vms/{vm_id}`
+rather than the raw path, so that the number of series stays bounded:
+
+    * `intakevms_http_request_duration_seconds`: time from receiving the
+      request to sending the end of the response, by status too.
+    * `intakevms_http_response_bytes`: size of the response bodies sent,
+      after compression.
+
+Requests slower than the threshold are logged as a structured warning
+with the RPC calls they issued, so that hot routes and the services behind
+them show up without attaching a profiler. Server-Sent Event streams stay
+open by design and are never reported as slow.
+
+Usage example:
+    app.add_middleware(TimingMiddleware, slow_threshold=1.0)
+
+Classes:
+    TimingMiddleware: Measures the requests of an app.
+
+Functions:
+    route_template: Gets the template of the route matched by a request.
+"""
+
+import time
+from typing import Any, Dict, List, Tuple
+
+from starlette.types import Send, Scope, ASGIApp, Message, Receive
+from starlette.datastructures import Headers
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.messaging import metrics
+from intakevms.libs.metrics.registry import REGISTRY, SIZE_BUCKETS
+
+LOG = get_logger(__name__)
+
+# Requests taking longer are logged with their RPC breakdown, in seconds.
+SLOW_REQUEST_SECONDS = 1.0
+
+# Route label of requests matching no route, e.g. answered with 404.
+UNMATCHED = 'unmatched'
+
+REQUEST_DURATION = REGISTRY.histogram(
+    'intakevms_http_request_duration_seconds',
+    'Latency of the HTTP requests.',
+    ('method', 'route', 'status'),
+)
+RESPONSE_BYTES = REGISTRY.histogram(
+    'intakevms_http_response_bytes',
+    'Size of the HTTP response bodies sent.',
+    ('method', 'route'),
+    SIZE_BUCKETS,
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Get the template of the route matched by a request.
+
+    API routes record themselves in the scope. Other routes, such as the
+    documentation and the mounted assets, are found by their endpoint.
+
+    Args:
+        scope (Scope): The scope of the handled request.
+
+    Returns:
+        str: The path template of the route, `unmatched` if none matched.
+    """
+    route = scope.get('route')
+    if route is None and scope.get('endpoint') is not None:
+        routes = getattr(
+            getattr(scope.get('app'), 'router', None), 'routes', []
+        )
+        # Mounts, e.g. of the assets, are the endpoint of their requests.
+        route = next(
+            (
+                candidate
+                for candidate in routes
+                if scope['endpoint']
+                in (
+                    getattr(candidate, 'endpoint', None),
+                    getattr(candidate, 'app', None),
+                )
+            ),
+            None,
+        )
+    return str(route.path_format) if route is not None else UNMATCHED
+
+
+def _rpc_breakdown(
+    calls: List[Tuple[str, str, float]],
+) -> Dict[str, Dict[str, float]]:
+    """Sum the RPC calls of a request by queue and method.
+
+    Args:
+        calls (List[Tuple[str, str, float]]): The queue, method and duration
+            of every call.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The number of calls and their total
+            seconds, by `<queue>.<method>`, slowest first.
+    """
+    breakdown: Dict[str, Dict[str, float]] = {}
+    for queue_name, method, duration in calls:
+        totals = breakdown.setdefault(
+            f'{queue_name}.{method}', {'calls': 0, 'seconds': 0.0}
+        )
+        totals['calls'] += 1
+        totals['seconds'] += duration
+    for totals in breakdown.values():
+        totals['seconds'] = round(totals['seconds'], 4)
+    return dict(sorted(breakdown.items(), key=lambda item: -item[1]['seconds']))
+
+
+class TimingMiddleware:
+    """Measures the requests of an app, and logs the slow ones."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_threshold: float = SLOW_REQUEST_SECONDS,
+    ) -> None:
+        """Wrap an app.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+            slow_threshold (float): Seconds from which a request is logged
+                as slow.
+        """
+        self.app = app
+        self.slow_threshold = slow_threshold
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handle a request, measuring it.
+
+        Args:
+            scope (Scope): The scope of the request.
+            receive (Receive): Receives the messages of the request.
+            send (Send): Sends the messages of the response.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        # Unless a response starts, the error middleware answers 500.
+        response: Dict[str, Any] = {'status': 500, 'size': 0, 'stream': False}
+
+        async def send_timed(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message.get('headers', []))
+                response['status'] = message['status']
+                response['stream'] = headers.get('content-type', '').startswith(
+                    'text/event-stream'
+                )
+            elif message['type'] == 'http.response.body':
+                response['size'] += len(message.get('body', b''))
+            await send(message)
+
+        with metrics.record_client_calls() as calls:
+            try:
+                await self.app(scope, receive, send_timed)
+            finally:
+                self._observe(
+                    scope, time.perf_counter() - started, response, calls
+                )
+
+    def _observe(
+        self,
+        scope: Scope,
+        duration: float,
+        response: Dict[str, Any],
+        calls: List[Tuple[str, str, float]],
+    ) -> None:
+        """Record a request, and log it if slow.
+
+        Args:
+            scope (Scope): The scope of the handled request.
+            duration (float): Seconds spent handling the request.
+            response (Dict[str, Any]): The status, size and whether the
+                response is an event stream.
+            calls (List[Tuple[str, str, float]]): The RPC calls issued.
+        """
+        method = scope['method']
+        route = route_template(scope)
+        REQUEST_DURATION.observe(
+            duration, method, route, str(response['status'])
+        )
+        RESPONSE_BYTES.observe(response['size'], method, route)
+        if duration < self.slow_threshold or response['stream']:
+            return
+        log_dict = {
+            'method': method,
+            'route': route,
+            'url': scope['path'],
+            'status': response['status'],
+            'duration_seconds': round(duration, 4),
+            'response_bytes': response['size'],
+            'rpc_seconds': round(sum(call[2] for call in calls), 4),
+            'rpc_calls': _rpc_breakdown(calls),
+        }
+        LOG.warning(log_dict, extra=log_dict)
@@ -6,9 +6,10 @@ API response structures across the application.
 Classes:
     BaseResponse: A generic schema for API responses, supporting customizable
         data, status, and error messages.
+    KeysetPage: A generic schema for a page of a list endpoint.
 """
 
-from typing import Generic, TypeVar, Optional
+from typing import List, Generic, TypeVar, Optional
 
 from pydantic import Field, BaseModel
 
@@ -40,4 +41,23 @@ class BaseResponse(BaseModel, Generic[T]):
         default=None,
         examples=['Template not found'],
         description='Error message (if any)',
-    )
\ No newline at end of file
+    )
+
+
+class KeysetPage(BaseModel, Generic[T]):
+    """Generic schema for a page of a list endpoint.
+
+    Attributes:
+        items (List[T]): The items of the page.
+        next_cursor (Optional[str]): Cursor to request the next page with,
+            None on the last page.
+    """
+
+    items: List[T] = Field(
+        default_factory=list,
+        description='Items of the page',
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description='Cursor of the next page (null on the last page)',
+    )
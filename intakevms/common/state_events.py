@@ -0,0 +1,332 @@
+"""State changes of resources, published as they are committed.
+
+Clients used to learn that a virtual machine started or that a volume became
+available only by polling. The status and power state columns of tracked
+models are now watched by Session events: every committed change of their
+values, creation or deletion of a tracked resource is published on the
+`CHANNEL` PostgreSQL notification channel, whichever service layer or
+monitoring task wrote it. The API process listens on the channel and
+streams the changes to its clients, see `state_stream`.
+
+Changes are published after the commit, so a client that reads a resource
+on receiving its change sees at least that state. Changes written by bulk
+UPDATE statements by primary key are published too: the previous values are
+selected in the same transaction before the update, and only actual
+transitions are published.
+
+Usage example:
+    # ORM
+    track_states('volumes', Volume, 'status')
+
+Classes:
+    StateChange: A committed change of the state of a resource.
+
+Functions:
+    track_states: Watches the state columns of a model.
+    publish: Publishes committed changes on the notification channel.
+    matches: Tells whether a change passes the filters of a subscriber.
+"""
+
+import json
+import dataclasses
+from typing import Any, Dict, List, Tuple, Iterable, Optional
+
+from sqlalchemy import Engine, text, event, select, inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import (
+    Session,
+    UOWTransaction,
+    ORMExecuteState,
+    SessionTransaction,
+)
+
+from intakevms.libs.log import get_logger
+
+LOG = get_logger(__name__)
+
+# PostgreSQL notification channel of the state changes.
+CHANNEL = 'intakevms_state'
+
+# Key of the pending changes in the info of a session.
+_PENDING = 'pending_state_changes'
+
+# Resource and state columns of every tracked model.
+_tracked: Dict[type, Tuple[str, Tuple[str, ...]]] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class StateChange:
+    """A committed change of the state of a resource.
+
+    Attributes:
+        resource (str): Type of the resource, e.g. `vms`.
+        id (str): ID of the resource.
+        event (str): `created`, `changed` or `deleted`.
+        state (Dict[str, Any]): The new values of the state columns, only
+            the changed ones for `changed`.
+        previous (Dict[str, Any]): The previous values of the changed state
+            columns, empty unless `changed`.
+    """
+
+    resource: str
+    id: str
+    event: str
+    state: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    previous: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """Serialize the change for the notification channel.
+
+        Returns:
+            str: The change as JSON.
+        """
+        return json.dumps(dataclasses.asdict(self), default=str)
+
+    @classmethod
+    def from_json(cls, payload: str) -> 'StateChange':
+        """Deserialize a change received on the notification channel.
+
+        Args:
+            payload (str): The change as JSON.
+
+        Returns:
+            StateChange: The change.
+        """
+        return cls(**json.loads(payload))
+
+
+def track_states(resource: str, model: type, *fields: str) -> None:
+    """Watch the state columns of a model.
+
+    Args:
+        resource (str): Type of the resources of the model, e.g. `vms`.
+        model (type): The ORM model.
+        *fields (str): The state columns, e.g. `status`.
+    """
+    _tracked[model] = (resource, fields)
+
+
+def _pending(session: Session) -> List[StateChange]:
+    """Get the changes made in the transaction of a session.
+
+    Args:
+        session (Session): The session.
+
+    Returns:
+        List[StateChange]: The changes, to append to.
+    """
+    pending: List[StateChange] = session.info.setdefault(_PENDING, [])
+    return pending
+
+
+def _value(value: Any) -> Any:  # noqa: ANN401 any column value
+    """Get the JSON value of a state column.
+
+    Args:
+        value (Any): The value of the column.
+
+    Returns:
+        Any: The value, enums by their value.
+    """
+    return getattr(value, 'value', value)
+
+
+def _flushed_change(
+    instance: Any,  # noqa: ANN401 any tracked entity
+    event_name: str,
+) -> Optional[StateChange]:
+    """Get the state change of a flushed entity.
+
+    Args:
+        instance (Any): The entity, with its attribute history.
+        event_name (str): `created`, `changed` or `deleted`.
+
+    Returns:
+        Optional[StateChange]: The change, None if the state columns of a
+            changed entity kept their values.
+    """
+    resource, fields = _tracked[type(instance)]
+    change_id = str(instance.id)
+    if event_name == 'deleted':
+        return StateChange(resource, change_id, event_name)
+    if event_name == 'created':
+        state = {name: _value(getattr(instance, name)) for name in fields}
+        return StateChange(resource, change_id, event_name, state)
+    attrs = inspect(instance).attrs
+    histories = {name: attrs[name].history for name in fields}
+    changed = [name for name, history in histories.items() if history.added]
+    if not changed:
+        return None
+    return StateChange(
+        resource,
+        change_id,
+        event_name,
+        {name: _value(histories[name].added[0]) for name in changed},
+        {
+            name: _value(next(iter(histories[name].deleted), None))
+            for name in changed
+        },
+    )
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_flushed(session: Session, _flush_context: UOWTransaction) -> None:
+    """Record the state changes of the flushed entities.
+
+    Args:
+        session (Session): The flushed session, whose entities still have
+            their attribute history.
+        _flush_context (UOWTransaction): Unused.
+    """
+    flushed = (
+        *((instance, 'created') for instance in session.new),
+        *((instance, 'deleted') for instance in session.deleted),
+        *((instance, 'changed') for instance in session.dirty),
+    )
+    pending = _pending(session)
+    for instance, event_name in flushed:
+        if type(instance) in _tracked:
+            change = _flushed_change(instance, event_name)
+            if change is not None:
+                pending.append(change)
+
+
+def _bulk_changes(
+    session: Session, model: type, updated: Dict[Any, Dict[str, Any]]
+) -> List[StateChange]:
+    """Get the state changes of a bulk UPDATE by primary key.
+
+    Args:
+        session (Session): The session executing the update.
+        model (type): The updated model.
+        updated (Dict[Any, Dict[str, Any]]): The new values by primary key.
+
+    Returns:
+        List[StateChange]: The changes, compared to the current values.
+    """
+    resource, fields = _tracked[model]
+    current = session.execute(
+        select(model.id, *(getattr(model, name) for name in fields)).where(  # type: ignore[attr-defined]
+            model.id.in_(list(updated))  # type: ignore[attr-defined]
+        )
+    ).mappings()
+    changes = []
+    for row in current:
+        values = updated[row['id']]
+        changed = [
+            name
+            for name in fields
+            if name in values and _value(values[name]) != _value(row[name])
+        ]
+        if changed:
+            changes.append(
+                StateChange(
+                    resource,
+                    str(row['id']),
+                    'changed',
+                    {name: _value(values[name]) for name in changed},
+                    {name: _value(row[name]) for name in changed},
+                )
+            )
+    return changes
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk(state: ORMExecuteState) -> None:
+    """Record the state changes of a bulk UPDATE by primary key.
+
+    Args:
+        state (ORMExecuteState): The executed statement.
+    """
+    if not state.is_update or state.bind_mapper is None:
+        return
+    model = state.bind_mapper.class_
+    rows = state.parameters
+    if model not in _tracked or not isinstance(rows, list):
+        return
+    _, fields = _tracked[model]
+    updated = {
+        row['id']: row for row in rows if 'id' in row and row.keys() & fields
+    }
+    if updated:
+        _pending(state.session).extend(
+            _bulk_changes(state.session, model, updated)
+        )
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_committed(session: Session) -> None:
+    """Publish the state changes of a commit.
+
+    Failures are logged rather than raised, the commit being done already.
+
+    Args:
+        session (Session): The committed session.
+    """
+    changes = session.info.pop(_PENDING, None)
+    if not changes:
+        return
+    bind = session.get_bind()
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    try:
+        publish(engine, changes)
+    except SQLAlchemyError:
+        LOG.exception('Cannot publish %d state changes.', len(changes))
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _forget_rolled_back(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """Forget the changes of a transaction that was not committed.
+
+    Args:
+        session (Session): The session.
+        transaction (SessionTransaction): The ended transaction.
+    """
+    if transaction.parent is None:
+        session.info.pop(_PENDING, None)
+
+
+def publish(engine: Engine, changes: Iterable[StateChange]) -> None:
+    """Publish committed changes on the notification channel.
+
+    Only PostgreSQL databases have a notification channel, changes to other
+    databases are not published.
+
+    Args:
+        engine (Engine): The engine of the database.
+        changes (Iterable[StateChange]): The changes, in commit order.
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.connect().execution_options(
+        isolation_level='AUTOCOMMIT'
+    ) as connection:
+        for change in changes:
+            connection.execute(
+                text('SELECT pg_notify(:channel, :payload)'),
+                {'channel': CHANNEL, 'payload': change.to_json()},
+            )
+
+
+def matches(
+    change: StateChange,
+    resources: Optional[Iterable[str]] = None,
+    ids: Optional[Iterable[str]] = None,
+) -> bool:
+    """Tell whether a change passes the filters of a subscriber.
+
+    Args:
+        change (StateChange): The change.
+        resources (Optional[Iterable[str]]): Types of resources to keep,
+            None for all.
+        ids (Optional[Iterable[str]]): IDs of resources to keep, None for
+            all.
+
+    Returns:
+        bool: True if the change passes both filters.
+    """
+    return (resources is None or change.resource in resources) and (
+        ids is None or change.id in ids
+    )
@@ -0,0 +1,284 @@
+"""Streams of the state changes of resources, for Server-Sent Events.
+
+The API process holds a single connection listening on the notification
+channel of `state_events`, whatever the number of clients: a background
+thread receives the changes and hands each one to the event loops of the
+subscribers whose filters it passes.
+
+A subscriber that cannot keep up, or that may have missed changes while the
+listening connection was lost, receives a `resync` event instead of the
+changes: it should read the resources again, then keep following the stream.
+
+Usage example:
+    @router.get('/stream/')
+    async def stream(request: Request) -> StreamingResponse:
+        subscription = STATE_BROKER.subscribe(resources=['vms'])
+        return StreamingResponse(
+            sse_events(STATE_BROKER, subscription, request),
+            media_type='text/event-stream',
+        )
+
+Classes:
+    Subscription: Queue of the changes of a subscriber.
+    StateBroker: Fans the changes of the notification channel out.
+
+Functions:
+    sse_events: Formats the changes of a subscription as Server-Sent Events.
+
+Attributes:
+    STATE_BROKER (StateBroker): The broker of the API process.
+"""
+
+import json
+import time
+import select
+import asyncio
+import threading
+from typing import Any, Set, Callable, Iterable, Optional, AsyncIterator
+
+from starlette.requests import Request
+
+from intakevms.libs.log import get_logger
+from intakevms.common.state_events import CHANNEL, StateChange, matches
+
+LOG = get_logger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1000
+KEEPALIVE_SECONDS = 15.0
+RECONNECT_SECONDS = 1.0
+# Seconds between checks of the stop flag by the listening thread.
+POLL_SECONDS = 1.0
+
+
+class Subscription:
+    """Queue of the changes of a subscriber.
+
+    Changes are queued on the event loop of the subscriber. `None` in the
+    queue asks the subscriber to read the resources again.
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): The loop of the subscriber.
+        resources (Optional[Set[str]]): Types of resources to keep, None
+            for all.
+        ids (Optional[Set[str]]): IDs of resources to keep, None for all.
+        queue (asyncio.Queue): The changes not sent yet.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        resources: Optional[Iterable[str]] = None,
+        ids: Optional[Iterable[str]] = None,
+        max_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        """Initialize an empty subscription.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The loop of the subscriber.
+            resources (Optional[Iterable[str]]): Types of resources to keep.
+            ids (Optional[Iterable[str]]): IDs of resources to keep.
+            max_size (int): Maximum number of queued changes.
+        """
+        self.loop = loop
+        self.resources = set(resources) if resources else None
+        self.ids = set(ids) if ids else None
+        self.queue: asyncio.Queue[Optional[StateChange]] = asyncio.Queue(
+            max_size
+        )
+
+    def offer(self, change: Optional[StateChange]) -> None:
+        """Queue a change, on the loop of the subscriber.
+
+        A full queue is replaced by a request to read the resources again.
+
+        Args:
+            change (Optional[StateChange]): The change, None to resync.
+        """
+        if change is not None and not self.queue.full():
+            self.queue.put_nowait(change)
+            return
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class StateBroker:
+    """Fans the changes of the notification channel out to subscribers.
+
+    The listening thread starts with the first subscription, and keeps
+    running for the life of the process.
+    """
+
+    def __init__(self, get_dsn: Optional[Callable[[], str]] = None) -> None:
+        """Initialize a broker without subscribers.
+
+        Args:
+            get_dsn (Optional[Callable[[], str]]): Gets the URI of the
+                database, the one of the configuration by default.
+        """
+        self._get_dsn = get_dsn
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def subscribe(
+        self,
+        resources: Optional[Iterable[str]] = None,
+        ids: Optional[Iterable[str]] = None,
+    ) -> Subscription:
+        """Subscribe the running event loop to changes.
+
+        Args:
+            resources (Optional[Iterable[str]]): Types of resources to keep,
+                None for all.
+            ids (Optional[Iterable[str]]): IDs of resources to keep, None for
+                all.
+
+        Returns:
+            Subscription: The subscription, to unsubscribe once done.
+        """
+        subscription = Subscription(asyncio.get_running_loop(), resources, ids)
+        with self._lock:
+            self._subscriptions.add(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._listen, name='state-broker', daemon=True
+                )
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering changes to a subscription.
+
+        Args:
+            subscription (Subscription): The subscription.
+        """
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def dispatch(self, change: Optional[StateChange]) -> None:
+        """Deliver a change to the subscriptions whose filters it passes.
+
+        Args:
+            change (Optional[StateChange]): The change, None to ask every
+                subscriber to resync.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if change is None or matches(
+                change, subscription.resources, subscription.ids
+            ):
+                subscription.loop.call_soon_threadsafe(
+                    subscription.offer, change
+                )
+
+    def close(self) -> None:
+        """Stop the listening thread."""
+        self._stopped.set()
+
+    def _listen(self) -> None:
+        """Receive the notifications of the channel until closed.
+
+        After a lost connection, subscribers are asked to resync since
+        notifications sent meanwhile are lost.
+        """
+        import psycopg2
+
+        connected_once = False
+        while not self._stopped.is_set():
+            try:
+                connection = psycopg2.connect(self._dsn())
+            except psycopg2.Error:
+                LOG.exception('Cannot connect to listen to state changes.')
+                time.sleep(RECONNECT_SECONDS)
+                continue
+            if connected_once:
+                self.dispatch(None)
+            connected_once = True
+            try:
+                self._receive(connection)
+            except psycopg2.Error:
+                LOG.exception('Lost the connection to state changes.')
+            finally:
+                connection.close()
+
+    def _receive(
+        self,
+        connection: Any,  # noqa: ANN401 psycopg2 connection, imported lazily
+    ) -> None:
+        """Dispatch the notifications received on a connection.
+
+        Args:
+            connection (psycopg2.extensions.connection): The connection.
+        """
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN {CHANNEL}')
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([connection], [], [], POLL_SECONDS)
+            if not readable:
+                continue
+            connection.poll()
+            while connection.notifies:
+                notify = connection.notifies.pop(0)
+                try:
+                    change = StateChange.from_json(notify.payload)
+                except (ValueError, TypeError):
+                    LOG.warning('Invalid state change: %s.', notify.payload)
+                    continue
+                self.dispatch(change)
+
+    def _dsn(self) -> str:
+        """Get the URI of the database to listen on.
+
+        Returns:
+            str: The URI.
+        """
+        if self._get_dsn is not None:
+            return self._get_dsn()
+        from intakevms.config import get_postgres_uri
+
+        return get_postgres_uri()
+
+
+async def sse_events(
+    broker: StateBroker,
+    subscription: Subscription,
+    request: Request,
+    keepalive: float = KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Format the changes of a subscription as Server-Sent Events.
+
+    Comments are sent when no change happens for `keepalive` seconds, so
+    that proxies keep the connection open and disconnected clients are
+    noticed. The subscription ends with the stream.
+
+    Args:
+        broker (StateBroker): The broker of the subscription.
+        subscription (Subscription): The subscription.
+        request (Request): The streaming request.
+        keepalive (float): Seconds between keep-alive comments.
+
+    Yields:
+        str: The events, `created`, `changed`, `deleted` or `resync`.
+    """
+    try:
+        while not await request.is_disconnected():
+            try:
+                change = await asyncio.wait_for(
+                    subscription.queue.get(), keepalive
+                )
+            except TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            if change is None:
+                yield f'event: resync\ndata: {json.dumps({})}\n\n'
+                continue
+            yield f'event: {change.event}\ndata: {change.to_json()}\n\n'
+    finally:
+        broker.unsubscribe(subscription)
+
+
+STATE_BROKER = StateBroker()
@@ -0,0 +1,82 @@
+"""Unit tests for the asyncio unit of work and repository bases.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_async_uow.py
+"""
+
+import asyncio
+from uuid import UUID, uuid4
+from pathlib import Path
+
+import pytest
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, DeclarativeBase, mapped_column
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from intakevms.common.pagination import PageRequest
+from intakevms.common.repositories.exceptions import EntityNotFoundError
+from intakevms.common.uow.base_async_sqlalchemy import (
+    BaseAsyncSqlAlchemyUnitOfWork,
+)
+from intakevms.common.repositories.base_async_sqlalchemy import (
+    BaseAsyncSqlAlchemyRepository,
+)
+
+
+class Base(DeclarativeBase):
+    """Base class of the test models."""
+
+
+class Item(Base):
+    """Named item."""
+
+    __tablename__ = 'items'
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    name: Mapped[str] = mapped_column(String(10))
+
+
+class ItemUnitOfWork(BaseAsyncSqlAlchemyUnitOfWork):
+    """Unit of work of the items."""
+
+    def _init_repositories(self) -> None:
+        self.items = BaseAsyncSqlAlchemyRepository(self.session, Item)
+
+
+async def _scenario(url: str) -> None:
+    """Add, page, fail and delete items through units of work."""
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with ItemUnitOfWork(factory) as uow:
+        for name in ('a', 'b', 'c'):
+            await uow.items.add(Item(name=name))
+        await uow.commit()
+    with pytest.raises(RuntimeError):
+        async with ItemUnitOfWork(factory) as uow:
+            await uow.items.add(Item(name='rolled'))
+            raise RuntimeError
+
+    async with ItemUnitOfWork(factory) as uow:
+        items, cursor = await uow.items.get_page(PageRequest(limit=2))
+        assert len(items) == 2  # noqa: PLR2004 page limit
+        assert cursor is not None
+        assert await uow.items.count() == 3  # noqa: PLR2004 committed items
+        await uow.items.delete_by_id(items[0].id)
+        with pytest.raises(EntityNotFoundError):
+            await uow.items.delete_by_id(uuid4())
+        await uow.commit()
+
+    async with ItemUnitOfWork(factory) as uow:
+        assert sorted(item.name for item in await uow.items.get_all()) == (
+            sorted({'a', 'b', 'c'} - {items[0].name})
+        )
+    await engine.dispose()
+
+
+def test_async_unit_of_work(tmp_path: Path) -> None:
+    """Units of work commit, roll back on errors, and page entities."""
+    asyncio.run(_scenario(f'sqlite+aiosqlite:///{tmp_path / "items.db"}'))
@@ -0,0 +1,88 @@
+"""Unit tests for the compression of responses and the static assets.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_compression.py
+"""
+
+from typing import Iterator
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from intakevms.common.compression import (
+    IMMUTABLE,
+    REVALIDATE,
+    AssetFiles,
+    CompressionMiddleware,
+    negotiate,
+)
+
+
+def _events() -> Iterator[str]:
+    """Events of a stream."""
+    yield 'data: x\n\n' * 50
+
+
+def _compressed_app() -> FastAPI:
+    """Build an application compressing its responses."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get('/small/')
+    def small() -> dict:
+        return {'id': 1}
+
+    @app.get('/large/')
+    def large() -> list:
+        return [{'id': index, 'status': 'available'} for index in range(50)]
+
+    @app.get('/stream/')
+    def stream() -> StreamingResponse:
+        return StreamingResponse(_events(), media_type='text/event-stream')
+
+    return app
+
+
+def test_only_complete_large_responses_are_compressed() -> None:
+    """Small responses and streams are sent as they are."""
+    client = TestClient(_compressed_app())
+    headers = {'Accept-Encoding': 'gzip'}
+
+    large = client.get('/large/', headers=headers)
+    small = client.get('/small/', headers=headers)
+    stream = client.get('/stream/', headers=headers)
+
+    assert large.headers['Content-Encoding'] == 'gzip'
+    assert large.headers['Vary'] == 'Accept-Encoding'
+    assert len(large.json()) == 50  # noqa: PLR2004 items
+    assert 'Content-Encoding' not in small.headers
+    assert 'Content-Encoding' not in stream.headers
+    assert negotiate('gzip;q=0, identity') is None
+
+
+def test_assets_are_compressed_and_cached(tmp_path: Path) -> None:
+    """Hashed assets are immutable, compressed variants are revalidated."""
+    (tmp_path / 'index-9b5df8b2.js').write_text('let a = 1;\n' * 200)
+    (tmp_path / 'Geist-Bold.ttf').write_bytes(b'\0' * 2000)
+    app = FastAPI()
+    app.mount('/assets', AssetFiles(directory=tmp_path))
+    client = TestClient(app)
+    headers = {'Accept-Encoding': 'gzip'}
+
+    script = client.get('/assets/index-9b5df8b2.js', headers=headers)
+    font = client.get('/assets/Geist-Bold.ttf', headers=headers)
+    revalidated = client.get(
+        '/assets/Geist-Bold.ttf',
+        headers={**headers, 'If-None-Match': font.headers['ETag']},
+    )
+
+    assert script.headers['Cache-Control'] == IMMUTABLE
+    assert script.headers['Content-Encoding'] == 'gzip'
+    assert script.content == b'let a = 1;\n' * 200
+    assert int(script.headers['Content-Length']) < len(script.content)
+    assert font.headers['Cache-Control'] == REVALIDATE
+    assert font.headers['ETag'].endswith('-gzip"')
+    assert revalidated.status_code == 304  # noqa: PLR2004 not modified
@@ -0,0 +1,125 @@
+"""Unit tests for the keyset pagination of the list endpoints.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_pagination.py
+"""
+
+from typing import List, Iterator
+
+import pytest
+from sqlalchemy import String, select, create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Mapped, Session, DeclarativeBase, mapped_column
+
+from intakevms.common.pagination import (
+    PageRequest,
+    decode_cursor,
+    encode_cursor,
+    paginate_query,
+)
+from intakevms.common.projections import View, is_summary, to_summary
+
+ROWS = 7
+LIMIT = 3
+
+
+class Base(DeclarativeBase):
+    """Base class of the test models."""
+
+
+class Item(Base):
+    """Item with repeated names."""
+
+    __tablename__ = 'items'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(10))
+    description: Mapped[str] = mapped_column(String(20), default='')
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Session of an in-memory database of items."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Item(id=index, name=f'item-{index % 3}') for index in range(ROWS)
+        )
+        session.commit()
+        yield session
+
+
+def _walk(session: Session, page: PageRequest) -> List[int]:
+    """Collect the IDs of all the pages following the first one."""
+    ids: List[int] = []
+    columns = {'id': Item.id, 'name': Item.name}
+    while True:
+        items, cursor = paginate_query(
+            session, select(Item), page, columns, 'id'
+        )
+        assert len(items) <= LIMIT
+        ids.extend(item.id for item in items)
+        if cursor is None:
+            return ids
+        page = PageRequest(
+            limit=page.limit,
+            cursor=cursor,
+            order_by=page.order_by,
+            direction=page.direction,
+        )
+
+
+@pytest.mark.parametrize('direction', ['asc', 'desc'])
+@pytest.mark.parametrize('order_by', ['id', 'name'])
+def test_pages_cover_all_rows_once(
+    session: Session, order_by: str, direction: str
+) -> None:
+    """Following the cursors returns every row once, in order."""
+    page = PageRequest(limit=LIMIT, order_by=order_by, direction=direction)
+
+    ids = _walk(session, page)
+
+    expected = sorted(
+        session.scalars(select(Item)),
+        key=lambda item: (getattr(item, order_by), item.id),
+        reverse=direction == 'desc',
+    )
+    assert ids == [item.id for item in expected]
+
+
+def test_invalid_requests_are_rejected() -> None:
+    """Malformed cursors and cursors of another ordering raise."""
+    cursor = encode_cursor('name', 'asc', ['item-1', 4])
+
+    assert decode_cursor(cursor) == ('name', 'asc', ['item-1', 4])
+    with pytest.raises(ValueError, match='Invalid page cursor'):
+        PageRequest(cursor='not a cursor')
+    with pytest.raises(ValueError, match='does not match'):
+        PageRequest(cursor=cursor, order_by='id')
+    with pytest.raises(ValueError, match='limit'):
+        PageRequest(limit=0)
+
+
+def test_summary_projection_loads_only_its_columns(session: Session) -> None:
+    """The summary view selects the projected and sort columns only."""
+    session.expunge_all()
+    page = PageRequest(limit=LIMIT, order_by='id')
+
+    items, _ = paginate_query(
+        session,
+        select(Item),
+        page,
+        {'id': Item.id},
+        'id',
+        projection=[Item.name],
+    )
+
+    assert is_summary({'view': View.SUMMARY.value})
+    assert not is_summary({})
+    assert [to_summary(item) for item in items] == [
+        {'id': index, 'name': f'item-{index % 3}'} for index in range(LIMIT)
+    ]
+    with pytest.raises(InvalidRequestError):
+        _ = items[0].description
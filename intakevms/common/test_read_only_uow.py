@@ -0,0 +1,75 @@
+"""Unit tests for the read-only mode of the units of work.
+
+The read-only transactions of PostgreSQL are stood in for by SQLite
+connections with the `query_only` pragma set, which fail writes the same way.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_read_only_uow.py
+"""
+
+from uuid import UUID, uuid4
+from typing import Any
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import String, exc as sa_exc, event, create_engine
+from sqlalchemy.orm import Mapped, DeclarativeBase, sessionmaker, mapped_column
+
+from intakevms.common.uow.base_sqlalchemy import BaseSqlAlchemyUnitOfWork
+from intakevms.common.repositories.base_sqlalchemy import (
+    BaseSqlAlchemyRepository,
+)
+
+
+class Base(DeclarativeBase):
+    """Base class of the test models."""
+
+
+class Item(Base):
+    """Named item."""
+
+    __tablename__ = 'items'
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    name: Mapped[str] = mapped_column(String(10))
+
+
+class ItemUnitOfWork(BaseSqlAlchemyUnitOfWork):
+    """Unit of work of the items."""
+
+    def _init_repositories(self) -> None:
+        self.items = BaseSqlAlchemyRepository(self.session, Item)
+
+
+def _set_query_only(connection: Any, _: Any) -> None:  # noqa: ANN401 DBAPI connection and record
+    """Make the writes of a new SQLite connection fail."""
+    connection.execute('PRAGMA query_only = ON')
+
+
+def test_read_only_unit_of_work_rejects_writes(tmp_path: Path) -> None:
+    """A unit of work created by `read_only` reads, but fails writes."""
+    url = f'sqlite:///{tmp_path / "items.db"}'
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    read_only_engine = create_engine(url)
+    event.listen(read_only_engine, 'connect', _set_query_only)
+    with ItemUnitOfWork(sessionmaker(engine)) as uow:
+        uow.items.add(Item(name='kept'))
+        uow.commit()
+
+    with patch(
+        'intakevms.common.uow.read_only.get_read_only_session_factory',
+        return_value=sessionmaker(read_only_engine),
+    ):
+        read_only_uow = ItemUnitOfWork.read_only()
+    with read_only_uow as uow:
+        assert [item.name for item in uow.items.get_all()] == ['kept']
+        with pytest.raises(sa_exc.OperationalError, match='readonly'):
+            uow.items.add(Item(name='rejected'))
+
+    with ItemUnitOfWork(sessionmaker(engine)) as uow:
+        assert uow.items.count() == 1
+    read_only_engine.dispose()
+    engine.dispose()
@@ -0,0 +1,60 @@
+"""Unit tests for the responses rendered from validated models.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_rendering.py
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import Depends, FastAPI, Response
+from pydantic import BaseModel
+from fastapi.testclient import TestClient
+
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.rendering import RenderedJSONResponse, render
+from intakevms.libs.validation.validators import Validator
+
+
+class Item(BaseModel):
+    """Validated item."""
+
+    id: int
+    status: str
+    size: Optional[int] = None
+
+
+def test_rendered_page_matches_the_response_model() -> None:
+    """Pages render like FastAPI would, with the headers of dependencies."""
+    app = FastAPI()
+    reply: List[Dict[str, Any]] = [
+        {'id': 1, 'status': 'ready', 'size': 10},
+        {'id': 'two'},
+    ]
+
+    def set_etag(response: Response) -> None:
+        response.headers['ETag'] = 'W/"items-1"'
+
+    @app.get('/validated/', response_model=KeysetPage[Item])
+    def validated() -> KeysetPage[Item]:
+        items = Validator.validate_objects(reply, Item)
+        return KeysetPage[Item].model_validate({'items': items})
+
+    @app.get('/rendered/', dependencies=[Depends(set_etag)])
+    def rendered(response: Response) -> RenderedJSONResponse:
+        items = Validator.validate_objects(reply, Item)
+        page = KeysetPage[Item].model_validate({'items': items})
+        return render(page, response)
+
+    client = TestClient(app)
+    expected = client.get('/validated/')
+    response = client.get('/rendered/')
+
+    assert response.json() == expected.json()
+    assert response.json()['items'][1] == {
+        'id': 'two',
+        'status': 'corrupted object',
+        'size': None,
+    }
+    assert response.headers['ETag'] == 'W/"items-1"'
+    assert response.headers['Content-Type'] == 'application/json'
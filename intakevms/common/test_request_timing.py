@@ -0,0 +1,55 @@
+"""Unit tests for the timing of the requests.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_request_timing.py
+"""
+
+import time
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from intakevms.common import request_timing
+from intakevms.libs.messaging import metrics
+from intakevms.libs.metrics.registry import REGISTRY
+
+
+def test_slow_request_is_logged_with_its_rpc_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requests are measured by route, slow ones logged with their calls."""
+    logged: List[Dict[str, Any]] = []
+    monkeypatch.setattr(
+        request_timing.LOG,
+        'warning',
+        lambda _log_dict, extra: logged.append(extra),
+    )
+    app = FastAPI()
+    app.add_middleware(request_timing.TimingMiddleware, slow_threshold=0)
+
+    @app.get('/timed/{item_id}')
+    def get_item(item_id: int) -> Dict[str, int]:
+        for _ in range(2):
+            metrics.observe_client_call(
+                'items_queue', 'get_item', time.perf_counter(), b'{}', b'{}'
+            )
+        return {'id': item_id}
+
+    client = TestClient(app)
+    client.get('/timed/1')
+    client.get('/missing')
+
+    assert [record['route'] for record in logged] == [
+        '/timed/{item_id}',
+        request_timing.UNMATCHED,
+    ]
+    assert logged[0]['status'] == 200  # noqa: PLR2004 status
+    assert logged[0]['rpc_calls']['items_queue.get_item']['calls'] == 2  # noqa: PLR2004 calls
+    assert logged[1]['rpc_calls'] == {}
+    assert (
+        'intakevms_http_request_duration_seconds_count'
+        '{method="GET",route="/timed/{item_id}",status="200"} 1'
+    ) in REGISTRY.render()
@@ -0,0 +1,145 @@
+"""Unit tests for the state changes and their streams.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_state_events.py
+"""
+
+import asyncio
+from typing import List, Iterable, Iterator, Optional
+
+import pytest
+from sqlalchemy import Engine, String, update, create_engine
+from sqlalchemy.orm import Mapped, DeclarativeBase, sessionmaker, mapped_column
+
+from intakevms.common import state_events
+from intakevms.common.state_events import StateChange
+from intakevms.common.state_stream import StateBroker, Subscription
+
+
+class Base(DeclarativeBase):
+    """Base class of the test models."""
+
+
+class Machine(Base):
+    """Tracked machine."""
+
+    __tablename__ = 'machines'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(10))
+    status: Mapped[str] = mapped_column(String(10))
+
+
+state_events.track_states('machines', Machine, 'status')
+
+
+@pytest.fixture
+def published(monkeypatch: pytest.MonkeyPatch) -> List[StateChange]:
+    """Changes published by the commits."""
+    changes: List[StateChange] = []
+
+    def publish(_engine: Engine, committed: Iterable[StateChange]) -> None:
+        changes.extend(committed)
+
+    monkeypatch.setattr(state_events, 'publish', publish)
+    return changes
+
+
+@pytest.fixture
+def factory() -> Iterator[sessionmaker]:
+    """Session factory of an in-memory database."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+def test_committed_transitions_are_published(
+    factory: sessionmaker, published: List[StateChange]
+) -> None:
+    """Commits publish transitions, rollbacks and other columns do not."""
+    with factory() as session:
+        session.add(Machine(id=1, name='first', status='stopped'))
+        session.commit()
+        session.get(Machine, 1).status = 'running'
+        session.flush()
+        session.rollback()
+        session.get(Machine, 1).name = 'second'
+        session.commit()
+        session.get(Machine, 1).status = 'running'
+        session.commit()
+        session.delete(session.get(Machine, 1))
+        session.commit()
+
+    assert published == [
+        StateChange('machines', '1', 'created', {'status': 'stopped'}),
+        StateChange(
+            'machines',
+            '1',
+            'changed',
+            {'status': 'running'},
+            {'status': 'stopped'},
+        ),
+        StateChange('machines', '1', 'deleted'),
+    ]
+
+
+def test_bulk_updates_publish_actual_transitions(
+    factory: sessionmaker, published: List[StateChange]
+) -> None:
+    """A bulk UPDATE by primary key publishes the rows it transitioned."""
+    with factory() as session:
+        session.add_all(
+            [
+                Machine(id=1, name='first', status='stopped'),
+                Machine(id=2, name='second', status='running'),
+            ]
+        )
+        session.commit()
+    published.clear()
+
+    with factory() as session:
+        session.execute(
+            update(Machine),
+            [{'id': 1, 'status': 'running'}, {'id': 2, 'status': 'running'}],
+        )
+        session.commit()
+
+    assert published == [
+        StateChange(
+            'machines',
+            '1',
+            'changed',
+            {'status': 'running'},
+            {'status': 'stopped'},
+        )
+    ]
+
+
+def test_broker_filters_and_resyncs_slow_subscribers() -> None:
+    """Subscribers get matching changes, or a resync once overflowing."""
+
+    async def receive() -> List[List[Optional[StateChange]]]:
+        broker = StateBroker()
+        loop = asyncio.get_running_loop()
+        followers = [
+            Subscription(loop, resources=['machines'], ids=['1']),
+            Subscription(loop, resources=['disks']),
+            Subscription(loop, max_size=1),
+        ]
+        broker._subscriptions.update(followers)  # noqa: SLF001 no thread
+        broker.dispatch(StateChange('machines', '1', 'deleted'))
+        broker.dispatch(StateChange('machines', '2', 'deleted'))
+        await asyncio.sleep(0)
+        received = []
+        for follower in followers:
+            queue = follower.queue
+            received.append([queue.get_nowait() for _ in range(queue.qsize())])
+        return received
+
+    assert asyncio.run(receive()) == [
+        [StateChange('machines', '1', 'deleted')],
+        [],
+        [None],
+    ]
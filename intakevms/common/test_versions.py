@@ -0,0 +1,111 @@
+"""Unit tests for the version counters and the conditional GETs.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/common/test_versions.py
+"""
+
+from typing import List, Iterator
+from pathlib import Path
+
+import pytest
+from fastapi import Depends, FastAPI, status
+from sqlalchemy import Engine, String, update, create_engine
+from sqlalchemy.orm import Mapped, DeclarativeBase, sessionmaker, mapped_column
+from fastapi.testclient import TestClient
+
+from intakevms.common import versions
+from intakevms.common.versions import EntityVersion, read_etag
+
+
+class Base(DeclarativeBase):
+    """Base class of the test models."""
+
+
+class Item(Base):
+    """Tracked item."""
+
+    __tablename__ = 'items'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(10))
+
+
+versions.track_versions('items', Item)
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """Engine of a database file, shared by separate connections."""
+    engine = create_engine(f'sqlite:///{tmp_path / "versions.db"}')
+    Base.metadata.create_all(engine)
+    versions.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def factory(engine: Engine) -> sessionmaker:
+    """Session factory of the database."""
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _version(factory: sessionmaker) -> int:
+    """Get the version of the items, 0 if they never changed."""
+    with factory() as session:
+        row = session.get(EntityVersion, 'items')
+        return 0 if row is None else int(row.version)
+
+
+def test_committed_changes_bump_the_version(factory: sessionmaker) -> None:
+    """Commits bump the version, rollbacks and no-op writes do not."""
+    with factory() as session:
+        session.add(Item(id=1, name='first'))
+        session.commit()
+    assert _version(factory) == 1
+
+    with factory() as session:
+        session.get(Item, 1).name = 'second'
+        session.flush()
+        session.rollback()
+    assert _version(factory) == 1
+
+    with factory() as session:
+        session.get(Item, 1).name = 'first'
+        session.commit()
+    assert _version(factory) == 1
+
+    with factory() as session:
+        session.execute(update(Item).values(name='bulk'))
+        session.commit()
+    assert _version(factory) == 2  # noqa: PLR2004 the update is a second change
+
+
+def test_not_modified_skips_the_endpoint(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A matching If-None-Match is answered without calling the endpoint."""
+    calls: List[int] = []
+    app = FastAPI()
+    items_etag = versions.etag_dependency('items', lambda: factory)
+
+    @app.get('/items/', dependencies=[Depends(items_etag)])
+    def get_items() -> List[int]:
+        calls.append(1)
+        return []
+
+    client = TestClient(app)
+    with factory() as session:
+        session.add(Item(id=1, name='first'))
+        session.commit()
+
+    assert 'ETag' not in client.get('/items/').headers
+    monkeypatch.setattr(versions, 'SETTLE_SECONDS', 0)
+    etag = client.get('/items/').headers['ETag']
+    assert etag == read_etag(factory, 'items') == 'W/"items-1"'
+
+    response = client.get('/items/', headers={'If-None-Match': etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers['ETag'] == etag
+    assert len(calls) == 2  # noqa: PLR2004 the two requests without a match
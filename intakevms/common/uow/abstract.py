@@ -7,6 +7,7 @@ or rolling back operations as a single unit.
 Classes:
     - AbstractUnitOfWork: Base class defining the contract for Unit of Work
         implementations.
+    - AbstractAsyncUnitOfWork: The same contract, for an async context.
 """
 
 import abc
@@ -70,3 +71,59 @@ class AbstractUnitOfWork(abc.ABC):
     def rollback(self) -> None:
         """Rolls back the transaction, discarding all uncommitted changes."""
         ...
+
+
+class AbstractAsyncUnitOfWork(abc.ABC):
+    """Abstract base class for Unit of Work used from an event loop.
+
+    The contract of `AbstractUnitOfWork`, entered with `async with` and
+    committed or rolled back with coroutines.
+    """
+
+    @abc.abstractmethod
+    async def __aenter__(self) -> Self:
+        """Enters the context and initializes resources.
+
+        Returns:
+            Self: The instance of the Unit of Work.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exits the context, ensuring proper cleanup.
+
+        If an exception occurs, the transaction should be rolled back.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): The type of exception
+                raised, if any.
+            exc_val (Optional[BaseException]): The exception instance, if any.
+            exc_tb (Optional[TracebackType]): The traceback of the exception,
+                if any.
+        """
+        ...
+
+    @abc.abstractmethod
+    def _init_repositories(self) -> None:
+        """Initializes repository instances.
+
+        This method should be implemented in subclasses to set up repositories
+        for data persistence.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def commit(self) -> None:
+        """Commits the transaction, persisting all changes."""
+        ...
+
+    @abc.abstractmethod
+    async def rollback(self) -> None:
+        """Rolls back the transaction, discarding all uncommitted changes."""
+        ...
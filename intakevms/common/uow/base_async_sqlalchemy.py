@@ -0,0 +1,115 @@
+"""Base SQLAlchemy asyncio Unit of Work implementation.
+
+This module provides an abstract base class for Unit of Work implementations
+using SQLAlchemy asyncio. It manages async database sessions, so that the
+queries of many requests are overlapped by a single event loop.
+
+Usage example:
+    class VolumeAsyncUnitOfWork(BaseAsyncSqlAlchemyUnitOfWork):
+        def __init__(self, session_factory=DEFAULT_ASYNC_SESSION_FACTORY):
+            super().__init__(session_factory)
+
+        def _init_repositories(self) -> None:
+            self.volumes = AsyncVolumeRepository(self.session, Volume)
+
+    async with VolumeAsyncUnitOfWork() as uow:
+        volume = await uow.volumes.get_or_fail(volume_id)
+
+Classes:
+    - BaseAsyncSqlAlchemyUnitOfWork: Base class for SQLAlchemy asyncio Unit
+        of Work.
+"""
+
+import abc
+from types import TracebackType
+from typing import TYPE_CHECKING, Type, Optional
+
+from sqlalchemy.exc import OperationalError
+from typing_extensions import Self
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from intakevms.common.uow.abstract import AbstractAsyncUnitOfWork
+from intakevms.abstracts.exceptions import DBCannotBeConnectedError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class BaseAsyncSqlAlchemyUnitOfWork(AbstractAsyncUnitOfWork):
+    """Abstract base class for SQLAlchemy asyncio Unit of Work.
+
+    The async counterpart of `BaseSqlAlchemyUnitOfWork`: the transaction is
+    rolled back if the context exits with an exception, and the session is
+    closed in any case.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker) -> None:
+        """Initializes the Unit of Work with a session factory.
+
+        Args:
+            session_factory (async_sessionmaker): The SQLAlchemy session
+                factory for creating async database sessions.
+        """
+        self.session_factory = session_factory
+        self.session: AsyncSession
+
+    async def __aenter__(self) -> Self:
+        """Begins a new database session and initializes repositories.
+
+        Returns:
+            Self: The instance of the Unit of Work.
+
+        Raises:
+            DBCannotBeConnectedError: If the connection to the database fails.
+        """
+        self.session = self.session_factory()
+        try:
+            await self.session.connection()
+        except OperationalError:
+            await self.session.close()
+            message = "Can't connect to Database"
+            raise DBCannotBeConnectedError(message)
+        self._init_repositories()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Handles transaction completion and cleanup.
+
+        If an exception occurs, the transaction is rolled back; otherwise,
+        resources are closed.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): The type of exception
+                raised, if any.
+            exc_val (Optional[BaseException]): The exception instance, if any.
+            exc_tb (Optional[TracebackType]): The traceback of the exception,
+                if any.
+        """
+        if exc_type:
+            await self.rollback()
+        await self.session.close()
+
+    @abc.abstractmethod
+    def _init_repositories(self) -> None:
+        """Initializes repositories for data access.
+
+        This method should be implemented in subclasses to set up specific
+        repository instances.
+        """
+        ...
+
+    async def commit(self) -> None:
+        """Commits the current transaction, persisting changes to the db."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Rolls back the current transaction.
+
+        Discards all uncommitted changes.
+        """
+        await self.session.rollback()
@@ -16,12 +16,13 @@ from sqlalchemy.orm import sessionmaker
 from typing_extensions import Self
 
 from intakevms.common.uow.abstract import AbstractUnitOfWork
+from intakevms.common.uow.read_only import ReadOnlyUnitOfWorkMixin
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 
-class BaseSqlAlchemyUnitOfWork(AbstractUnitOfWork):
+class BaseSqlAlchemyUnitOfWork(ReadOnlyUnitOfWorkMixin, AbstractUnitOfWork):
     """Abstract base class for SQLAlchemy-based Unit of Work.
 
     This class provides transaction management using SQLAlchemy, ensuring
@@ -35,7 +36,7 @@ class BaseSqlAlchemyUnitOfWork(AbstractUnitOfWork):
             session_factory (sessionmaker): The SQLAlchemy session factory for
                 creating database sessions.
         """
-        self.session_factory = session_factory
+        super().__init__(session_factory)
         self.session: Session
 
     def __enter__(self) -> Self:
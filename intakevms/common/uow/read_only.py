@@ -0,0 +1,44 @@
+"""Read-only mode of the SQLAlchemy units of work.
+
+Pure reads do not need the `REPEATABLE READ` snapshot of the writers: held
+under concurrency, such snapshots hold back vacuum and conflict with the
+monitoring writes. Units of work built on a session factory get a
+`read_only` constructor from `ReadOnlyUnitOfWorkMixin`, whose transactions
+are `READ COMMITTED` and `READ ONLY`, see `get_read_only_session_factory`.
+
+Classes:
+    - ReadOnlyUnitOfWorkMixin: Adds the read-only mode to a unit of work.
+"""
+
+from sqlalchemy.orm import sessionmaker
+from typing_extensions import Self
+
+from intakevms.config import get_read_only_session_factory
+
+
+class ReadOnlyUnitOfWorkMixin:
+    """Adds the read-only mode to a unit of work built on a session factory.
+
+    Attributes:
+        session_factory (sessionmaker): The SQLAlchemy session factory.
+    """
+
+    def __init__(self, session_factory: sessionmaker) -> None:
+        """Initializes the Unit of Work with a session factory.
+
+        Args:
+            session_factory (sessionmaker): The SQLAlchemy session factory for
+                creating database sessions.
+        """
+        self.session_factory = session_factory
+
+    @classmethod
+    def read_only(cls) -> Self:
+        """Create a unit of work of read-only transactions.
+
+        Writes made through it fail when flushed.
+
+        Returns:
+            Self: The read-only unit of work.
+        """
+        return cls(get_read_only_session_factory())
@@ -0,0 +1,301 @@
+"""Version counters of the collections of entities, and conditional GETs.
+
+The web UI polls the list and detail endpoints of a few collections every
+few seconds, and most polls return what the previous one did. Each tracked
+collection has a monotonic version in the `entity_versions` table, bumped
+after every committed transaction that created, modified or deleted one of
+its entities, whether by a request or by a monitoring loop. Endpoints send
+the version as a weak ETag and answer `304 Not Modified` to clients that
+already have it, reading a single row instead of calling the service layer.
+
+Versions are bumped after the commit, in a transaction of their own, so a
+version never describes data that is not visible yet: a response may carry
+an older version than its data, which only costs the client one more full
+response. Read caches of the service layers may still serve data older
+than a version for `SETTLE_SECONDS` after the bump, so no ETag is sent
+until then.
+
+Usage example:
+    # ORM
+    track_versions('storages', Storage, StorageExtraSpecs)
+
+    # API
+    storages_etag = etag_dependency('storages')
+
+    @router.get('/', dependencies=[Depends(storages_etag)])
+    async def get_storages() -> ...:
+        ...
+
+Classes:
+    EntityVersion: Version of a collection of entities.
+
+Functions:
+    track_versions: Maps models to the collection they are a part of.
+    bump_versions: Increments the versions of collections.
+    read_etag: Gets the ETag of the current version of a collection.
+    etag_dependency: Builds the FastAPI dependency of conditional GETs.
+"""
+
+import time
+import functools
+from typing import Set, Dict, Callable, Iterable, Optional, Awaitable
+
+from fastapi import Request, Response, HTTPException, status
+from sqlalchemy import (
+    Float,
+    Engine,
+    String,
+    BigInteger,
+    event,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    UOWTransaction,
+    DeclarativeBase,
+    ORMExecuteState,
+    SessionTransaction,
+    sessionmaker,
+    mapped_column,
+)
+from starlette.concurrency import run_in_threadpool
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.caching import DEFAULT_TTL
+
+LOG = get_logger(__name__)
+
+# Seconds a version is withheld after a bump, while read caches may still
+# serve data loaded before it.
+SETTLE_SECONDS = DEFAULT_TTL
+
+# Key of the changed collections in the info of a session.
+_CHANGED = 'changed_collections'
+
+# Collection of every tracked model.
+_collections: Dict[type, str] = {}
+
+
+class Base(DeclarativeBase):
+    """Base class of the version models."""
+
+
+class EntityVersion(Base):
+    """Version of a collection of entities.
+
+    Attributes:
+        entity (str): Name of the collection, e.g. `vms`.
+        version (int): Number of committed transactions that changed the
+            collection.
+        changed_at (float): UNIX time of the last bump.
+    """
+
+    __tablename__ = 'entity_versions'
+
+    entity: Mapped[str] = mapped_column(String(30), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    changed_at: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+def track_versions(collection: str, *models: type) -> None:
+    """Map models to the collection they are a part of.
+
+    Changes to any of the models bump the version of the collection, so
+    models shown in the representation of an entity, such as the disks of a
+    virtual machine, are tracked along with it.
+
+    Args:
+        collection (str): Name of the collection.
+        *models (type): The ORM models of the collection.
+    """
+    for model in models:
+        _collections[model] = collection
+
+
+def _changed(session: Session) -> Set[str]:
+    """Get the collections changed in the transaction of a session.
+
+    Args:
+        session (Session): The session.
+
+    Returns:
+        Set[str]: The changed collections, to add to.
+    """
+    changed: Set[str] = session.info.setdefault(_CHANGED, set())
+    return changed
+
+
+@event.listens_for(Session, 'before_flush')
+def _collect_flushed(
+    session: Session,
+    _flush_context: UOWTransaction,
+    _instances: Optional[Iterable],
+) -> None:
+    """Record the collections of the entities about to be flushed.
+
+    Args:
+        session (Session): The flushed session.
+        _flush_context (UOWTransaction): Unused.
+        _instances (Optional[Iterable]): Unused.
+    """
+    changed = _changed(session)
+    for instance in (*session.new, *session.deleted):
+        if type(instance) in _collections:
+            changed.add(_collections[type(instance)])
+    for instance in session.dirty:
+        if type(instance) in _collections and session.is_modified(instance):
+            changed.add(_collections[type(instance)])
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk(state: ORMExecuteState) -> None:
+    """Record the collection of a bulk UPDATE or DELETE statement.
+
+    Args:
+        state (ORMExecuteState): The executed statement.
+    """
+    if not (state.is_update or state.is_delete) or state.bind_mapper is None:
+        return
+    collection = _collections.get(state.bind_mapper.class_)
+    if collection is not None:
+        _changed(state.session).add(collection)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_committed(session: Session) -> None:
+    """Bump the versions of the collections changed by a commit.
+
+    Failures are logged rather than raised, the commit being done already.
+
+    Args:
+        session (Session): The committed session.
+    """
+    changed = session.info.pop(_CHANGED, None)
+    if not changed:
+        return
+    bind = session.get_bind()
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    try:
+        bump_versions(engine, changed)
+    except SQLAlchemyError:
+        LOG.exception('Cannot bump the versions of %s.', sorted(changed))
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _forget_rolled_back(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """Forget the changes of a transaction that was not committed.
+
+    Args:
+        session (Session): The session.
+        transaction (SessionTransaction): The ended transaction.
+    """
+    if transaction.parent is None:
+        session.info.pop(_CHANGED, None)
+
+
+def bump_versions(engine: Engine, collections: Iterable[str]) -> None:
+    """Increment the versions of collections.
+
+    Each increment is a statement of its own, outside of any transaction of
+    the caller, so concurrent bumps never conflict.
+
+    Args:
+        engine (Engine): The engine of the database.
+        collections (Iterable[str]): The changed collections.
+    """
+    with engine.connect().execution_options(
+        isolation_level='AUTOCOMMIT'
+    ) as connection:
+        for collection in sorted(collections):
+            now = time.time()
+            bump = (
+                update(EntityVersion)
+                .where(EntityVersion.entity == collection)
+                .values(version=EntityVersion.version + 1, changed_at=now)
+            )
+            if connection.execute(bump).rowcount:
+                continue
+            try:
+                connection.execute(
+                    insert(EntityVersion).values(
+                        entity=collection, version=1, changed_at=now
+                    )
+                )
+            except IntegrityError:
+                connection.execute(bump)
+
+
+def read_etag(session_factory: sessionmaker, collection: str) -> Optional[str]:
+    """Get the ETag of the current version of a collection.
+
+    Args:
+        session_factory (sessionmaker): Factory of database sessions.
+        collection (str): Name of the collection.
+
+    Returns:
+        Optional[str]: The weak ETag, `None` while the version is settling.
+    """
+    with session_factory() as session:
+        row = session.execute(
+            select(EntityVersion.version, EntityVersion.changed_at).where(
+                EntityVersion.entity == collection
+            )
+        ).one_or_none()
+    version, changed_at = row if row is not None else (0, 0.0)
+    if time.time() - changed_at < SETTLE_SECONDS:
+        return None
+    return f'W/"{collection}-{version}"'
+
+
+@functools.lru_cache(maxsize=1)
+def _default_session_factory() -> sessionmaker:
+    """Get the session factory of the API process, created on first use.
+
+    Returns:
+        sessionmaker: Factory of sessions on the shared engine.
+    """
+    from intakevms.config import get_default_session_factory
+
+    return get_default_session_factory()
+
+
+def etag_dependency(
+    collection: str,
+    session_factory: Optional[Callable[[], sessionmaker]] = None,
+) -> Callable[[Request, Response], Awaitable[None]]:
+    """Build the FastAPI dependency of conditional GETs on a collection.
+
+    The dependency sets the ETag of the response, and responds with 304
+    when the `If-None-Match` header of the request has it, before the
+    endpoint calls the service layer.
+
+    Args:
+        collection (str): Name of the collection the endpoint reads.
+        session_factory (Optional[Callable[[], sessionmaker]]): Gets the
+            factory of database sessions, the one of the API by default.
+
+    Returns:
+        Callable[[Request, Response], Awaitable[None]]: The dependency.
+    """
+    get_factory = session_factory or _default_session_factory
+
+    async def dependency(request: Request, response: Response) -> None:
+        etag = await run_in_threadpool(read_etag, get_factory(), collection)
+        if etag is None:
+            return
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if_none_match = request.headers.get('If-None-Match', '')
+        tags = {tag.strip() for tag in if_none_match.split(',')}
+        if etag in tags or '*' in tags:
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        response.headers.update(headers)
+
+    return dependency
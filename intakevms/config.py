@@ -4,24 +4,39 @@ This module handles the loading of configuration from a TOML file and provides
 utility functions to generate PostgreSQL database URIs and SQLAlchemy session
 factories.
 
+The TOML file is parsed on the first access to `data`, `database` or
+`DB_CONTAINER`, and the engines of the session factories are resolved on
+their first session, so that importing a module pays for neither. Session
+factories share the engines of the process, see `intakevms.libs.engines`.
+
 Constants:
     PROJECT_ROOT (Path): Root directory of the project.
     toml_path (Path): Path to the TOML configuration file.
+    data (Dict): The parsed configuration, loaded on first access.
 
 Functions:
     get_postgres_uri() -> str: Generates a PostgreSQL URI from configuration
         settings.
+    get_replica_uri() -> Optional[str]: Generates the URI of the replica of
+        the database, if one is configured.
     get_default_session_factory() -> sessionmaker: creates and returns a
-        SQLAlchemy session factory with the given parameters.
+        SQLAlchemy session factory on the shared engine of the process.
+    get_read_only_session_factory() -> sessionmaker: returns the SQLAlchemy
+        session factory of read-only transactions.
+    get_default_async_session_factory() -> async_sessionmaker: creates and
+        returns a SQLAlchemy asyncio session factory on the shared async
+        engine of the process.
 """
 
 import pathlib
 import tempfile
-from typing import Dict, Type
+import functools
+from typing import Any, Dict, Type, Callable, Optional
 
 import toml
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from intakevms.rpc_queues import RPCQueueNames
 from intakevms.abstracts.exceptions import ConfigParameterNotSpecifiedError
@@ -34,11 +49,44 @@ toml_path = pathlib.Path(__file__).parent.parent / 'project_config.toml'
 
 RPC_QUEUES: Type[RPCQueueNames] = RPCQueueNames
 
-with pathlib.Path.open(toml_path, 'r') as config_toml:
-    data = toml.load(config_toml)
+# Declared only: resolved by `__getattr__` on first access.
+data: Dict[str, Any]
+database: Dict
+DB_CONTAINER: str
+
+
+@functools.cache
+def _load_data() -> Dict[str, Any]:
+    """Parse the TOML configuration file, once per process.
+
+    Returns:
+        Dict[str, Any]: The configuration.
+    """
+    with pathlib.Path.open(toml_path, 'r') as config_toml:
+        return dict(toml.load(config_toml))
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 type of each attribute
+    """Resolve the configuration attributes on first access.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Any: The configuration, or one of its sections.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    if name == 'data':
+        return _load_data()
+    if name == 'database':
+        return _load_data().get('database', {})
+    if name == 'DB_CONTAINER':
+        return _load_data()['docker']['db_container']
+    msg = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(msg)
 
-database: Dict = data.get('database', {})
-DB_CONTAINER: str = data['docker']['db_container']
 
 def get_postgres_uri() -> str:
     """Generates a PostgreSQL URI from configuration settings.
@@ -46,6 +94,7 @@ def get_postgres_uri() -> str:
     Returns:
         str: PostgreSQL URI for connecting to the database.
     """
+    database = _load_data().get('database', {})
     try:
         port: int = database['port']
         host: str = database['host']
@@ -58,38 +107,189 @@ def get_postgres_uri() -> str:
     return f'postgresql://{user}:{password}@{host}:{port}/{db_name}'
 
 
+def get_replica_uri() -> Optional[str]:
+    """Generates the PostgreSQL URI of the replica of the database.
+
+    The `[database.replica]` section gives the `host` of the replica, and
+    optionally its `port`, `user`, `password` and `db_name`, those of the
+    primary database by default.
+
+    Returns:
+        Optional[str]: URI of the replica, None if no replica is configured.
+    """
+    database = _load_data().get('database', {})
+    replica = database.get('replica', {})
+    if not replica.get('host'):
+        return None
+    settings = {
+        key: replica.get(key, database.get(key))
+        for key in ('user', 'password', 'host', 'port', 'db_name')
+    }
+    return (
+        f'postgresql://{settings["user"]}:{settings["password"]}'
+        f'@{settings["host"]}:{settings["port"]}/{settings["db_name"]}'
+    )
+
+
+class LazySessionFactory(sessionmaker):
+    """Session factory resolving its engine on every session.
+
+    Module configurations create their factory at import, the engine, its
+    pool and the DBAPI module are only set up once a session is needed. The
+    engine is resolved again for every session, so that a forked process
+    gets the engine of its own registry.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], Engine],
+        **kw: Any,  # noqa: ANN401 options of sessionmaker
+    ) -> None:
+        """Initialize the factory.
+
+        Args:
+            engine_factory (Callable[[], Engine]): Gets the engine.
+            **kw (Any): Options of the sessions, see `sessionmaker`.
+        """
+        super().__init__(**kw)
+        self._engine_factory = engine_factory
+
+    def __call__(self, **local_kw: Any) -> Session:  # noqa: ANN401 options of sessionmaker
+        """Create a session bound to the engine.
+
+        Args:
+            **local_kw (Any): Options overriding the ones of the factory.
+
+        Returns:
+            Session: The new session.
+        """
+        local_kw.setdefault('bind', self._engine_factory())
+        session: Session = super().__call__(**local_kw)
+        return session
+
+
+class LazyAsyncSessionFactory(async_sessionmaker):
+    """Asyncio session factory resolving its engine on every session.
+
+    The asyncio counterpart of `LazySessionFactory`.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], AsyncEngine],
+        **kw: Any,  # noqa: ANN401 options of async_sessionmaker
+    ) -> None:
+        """Initialize the factory.
+
+        Args:
+            engine_factory (Callable[[], AsyncEngine]): Gets the engine.
+            **kw (Any): Options of the sessions, see `async_sessionmaker`.
+        """
+        super().__init__(**kw)
+        self._engine_factory = engine_factory
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:  # noqa: ANN401 options of async_sessionmaker
+        """Create a session bound to the engine.
+
+        Args:
+            **local_kw (Any): Options overriding the ones of the factory.
+
+        Returns:
+            AsyncSession: The new session.
+        """
+        local_kw.setdefault('bind', self._engine_factory())
+        session: AsyncSession = super().__call__(**local_kw)
+        return session
+
+
+def _shared_engine(isolation_level: str) -> Engine:
+    """Get the engine of the process for an isolation level.
+
+    Args:
+        isolation_level (str): Isolation level of the transactions.
+
+    Returns:
+        Engine: The engine shared by the modules of the process.
+    """
+    from intakevms.libs.engines import EngineRegistry
+
+    return EngineRegistry.instance().get(isolation_level)
+
+
 def get_default_session_factory(
-    pool_size: int = 10,
-    max_overflow: int = 10,
-    pool_timeout: int = 60,
-    pool_recycle: int = 1800,  # refresh connections every 30 minutes
-    *,
-    pool_pre_ping: bool = True,
+    isolation_level: str = 'REPEATABLE READ',
 ) -> sessionmaker:
-    """Creates and returns SQLAlchemy session factory with the given parameters.
+    """Creates and returns SQLAlchemy session factory on the shared engine.
+
+    All the factories of a process with the same isolation level share one
+    engine and its connection pool, sized by `[database.pool]`.
 
     Args:
-        pool_size (int): The size of the connection pool.
-        max_overflow (int): The maximum number of connections to allow
-            beyond pool_size.
-        pool_timeout (int): The number of seconds to wait before giving up
-            on acquiring a connection.
-        pool_recycle (int): The number of seconds after which to recycle
-            connections.
-        pool_pre_ping (bool): Whether to check connections before using them.
+        isolation_level (str): Isolation level of the transactions.
 
     Returns:
         sessionmaker: A SQLAlchemy session factory.
     """
-    return sessionmaker(
+    return LazySessionFactory(
+        functools.partial(_shared_engine, isolation_level),
+        expire_on_commit=False,
+    )
+
+
+def _shared_async_engine(isolation_level: str) -> AsyncEngine:
+    """Get the asyncio engine of the process for an isolation level.
+
+    Args:
+        isolation_level (str): Isolation level of the transactions.
+
+    Returns:
+        AsyncEngine: The asyncio engine shared by the modules of the process.
+    """
+    from intakevms.libs.engines import EngineRegistry
+
+    return EngineRegistry.instance().get_async(isolation_level)
+
+
+def _read_only_engine() -> Engine:
+    """Get the engine of read-only transactions of the process.
+
+    Returns:
+        Engine: The engine shared by the modules of the process.
+    """
+    from intakevms.libs.engines import EngineRegistry
+
+    return EngineRegistry.instance().get_read_only()
+
+
+@functools.cache
+def get_read_only_session_factory() -> sessionmaker:
+    """Returns the SQLAlchemy session factory of read-only transactions.
+
+    Transactions are `READ COMMITTED` and `READ ONLY`, on the replica of the
+    database if one is configured. Writes fail, and reads may lag behind the
+    writes of the primary database by the replication delay.
+
+    Returns:
+        sessionmaker: A SQLAlchemy session factory.
+    """
+    return LazySessionFactory(_read_only_engine, expire_on_commit=False)
+
+
+def get_default_async_session_factory(
+    isolation_level: str = 'REPEATABLE READ',
+) -> async_sessionmaker:
+    """Creates and returns SQLAlchemy asyncio session factory.
+
+    The sessions use the asyncio driver of the configured database, on an
+    engine shared by the process, see `get_default_session_factory`.
+
+    Args:
+        isolation_level (str): Isolation level of the transactions.
+
+    Returns:
+        async_sessionmaker: A SQLAlchemy asyncio session factory.
+    """
+    return LazyAsyncSessionFactory(
+        functools.partial(_shared_async_engine, isolation_level),
         expire_on_commit=False,
-        bind=create_engine(
-            get_postgres_uri(),
-            isolation_level='REPEATABLE READ',
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-            pool_timeout=pool_timeout,
-            pool_pre_ping=pool_pre_ping,
-            pool_recycle=pool_recycle,
-        ),
     )
@@ -1,6 +1,6 @@
 # noqa: D100
 from uuid import uuid4
-from typing import Dict, Generator
+from typing import Dict, Callable, Generator
 from pathlib import Path
 
 import pytest
@@ -20,6 +20,7 @@ from intakevms.libs.testing.utils import (
     generate_test_entity_name,
 )
 from intakevms.libs.auth.jwt_utils import oauth2schema, get_current_user
+from intakevms.libs.query_counting import assert_query_budget
 from intakevms.libs.testing.config import storage_settings
 from intakevms.modules.volume.entrypoints.schemas import CreateVolume
 from intakevms.modules.storage.entrypoints.schemas import (
@@ -90,6 +91,20 @@ def configure_pagination() -> None:
     add_pagination(app)
 
 
+@pytest.fixture
+def query_budget() -> Callable:
+    """Fails a code path issuing more SQL statements than declared.
+
+    Only the statements of the test process are counted, e.g. of service
+    layer managers called directly, not of the RPC servers behind the app.
+
+    Usage:
+        with query_budget(3, max_repeats=1):
+            manager.get_all_vms()
+    """
+    return assert_query_budget
+
+
 # def delete_storage_from_fs() -> None:
 #     devices = get_block_devices_info()
 #     for device in devices:
@@ -0,0 +1,303 @@
+"""Read caching of service layer managers.
+
+Read methods of the service layers are called repeatedly with the same
+arguments, by the dashboard and by the other services, and every call
+queries the database and serializes the whole object graph again. This
+module provides decorators caching the results of such methods for a short
+time:
+
+    * `cached_read` serves the results of a read method from a bounded TTL
+      cache shared by all the instances of the manager in the process, and
+      coalesces identical concurrent calls into a single execution.
+    * `invalidates` clears the caches of the given entities once a write
+      method of the same manager returns, successfully or not.
+
+Results loaded while a write was in progress are not cached, so a write is
+visible to the calls issued after it returns. Writes made by other
+processes, or by managers of other entities, are only visible once the
+entries expire: the TTL bounds the staleness and should stay short.
+
+Callers get their own copy of a cached result and may modify it.
+
+Usage example:
+    class StorageServiceLayerManager(BackgroundTasks):
+        @cached_read('storages')
+        def get_storage(self, data: Dict) -> Dict:
+            ...
+
+        @invalidates('storages')
+        def delete_storage(self, data: Dict) -> Dict:
+            ...
+
+Classes:
+    ReadCache: Bounded TTL cache coalescing concurrent loads.
+
+Functions:
+    cached_read: Decorator caching the results of a read method.
+    invalidates: Decorator invalidating the caches after a write method.
+    invalidate: Clears the caches of entities of a manager.
+"""
+
+import copy
+import json
+import time
+import functools
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    TypeVar,
+    Callable,
+    Hashable,
+    Optional,
+    ParamSpec,
+    cast,
+)
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from intakevms.libs.metrics.registry import REGISTRY
+
+DEFAULT_TTL = 2.0
+DEFAULT_MAX_SIZE = 128
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+CACHE_REQUESTS = REGISTRY.counter(
+    'intakevms_read_cache_requests_total',
+    'Calls of cached read methods, by result: hit, miss or coalesced.',
+    ('method', 'result'),
+)
+
+# Caches of every (manager, entity), see `_owner`.
+_caches: Dict[Tuple[str, str], List['ReadCache']] = {}
+_caches_lock = threading.Lock()
+
+
+class ReadCache:
+    """Bounded TTL cache coalescing concurrent loads.
+
+    A missing key is loaded by the first caller, the leader; callers asking
+    for the same key in the meantime wait for the result of the leader
+    instead of loading it again. Failed loads are not cached.
+
+    Attributes:
+        name (str): Name of the cache, for the metrics.
+        ttl (float): Seconds an entry is served for.
+        max_size (int): Maximum number of entries, the least recently used
+            entries are evicted first.
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            name (str): Name of the cache, for the metrics.
+            ttl (float): Seconds an entry is served for.
+            max_size (int): Maximum number of entries.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._loading: Dict[Hashable, Future] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:  # noqa: ANN401 any cached result
+        """Get the value of a key, loading it if it is missing or expired.
+
+        Args:
+            key (Hashable): The key.
+            load (Callable[[], Any]): Loads the value of the key.
+
+        Returns:
+            Any: The cached or loaded value, shared with the other callers.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                CACHE_REQUESTS.inc(self.name, 'hit')
+                return entry[1]
+            future = self._loading.get(key)
+            leader = future is None
+            if future is None:
+                future = self._loading[key] = Future()
+            generation = self._generation
+        CACHE_REQUESTS.inc(self.name, 'miss' if leader else 'coalesced')
+        if not leader:
+            return future.result()
+        return self._load(key, load, future, generation)
+
+    def _load(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        future: Future,
+        generation: int,
+    ) -> Any:  # noqa: ANN401 any cached result
+        """Load the value of a key as the leader.
+
+        Args:
+            key (Hashable): The key.
+            load (Callable[[], Any]): Loads the value of the key.
+            future (Future): Future the other callers wait on.
+            generation (int): Generation of the cache when the load started.
+
+        Returns:
+            Any: The loaded value.
+        """
+        try:
+            value = load()
+        except BaseException as err:
+            self._finish(key, future)
+            future.set_exception(err)
+            raise
+        self._finish(key, future, value, generation)
+        future.set_result(value)
+        return value
+
+    def _finish(
+        self,
+        key: Hashable,
+        future: Future,
+        value: Optional[Any] = None,  # noqa: ANN401 any cached result
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a loaded value unless the cache was invalidated meanwhile.
+
+        Args:
+            key (Hashable): The key.
+            future (Future): Future of the load.
+            value (Optional[Any]): The loaded value.
+            generation (Optional[int]): Generation of the cache when the
+                load started, `None` if the load failed.
+        """
+        with self._lock:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+            if generation is None or generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry and forget the loads in progress."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._loading.clear()
+
+
+def _owner(method: Callable) -> str:
+    """Get the manager a method is defined in.
+
+    Args:
+        method (Callable): The method.
+
+    Returns:
+        str: Qualified name of the class of the method.
+    """
+    return f'{method.__module__}.{method.__qualname__.rpartition(".")[0]}'
+
+
+def _make_key(args: Tuple, kwargs: Dict) -> str:
+    """Build the cache key of the arguments of a call.
+
+    Args:
+        args (Tuple): Positional arguments, without `self`.
+        kwargs (Dict): Keyword arguments.
+
+    Returns:
+        str: The key.
+    """
+    return json.dumps([args, kwargs], sort_keys=True, default=str)
+
+
+def cached_read(
+    entity: str,
+    *,
+    ttl: float = DEFAULT_TTL,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator caching the results of a read method of a manager.
+
+    The arguments of the method must be JSON-serializable, they make the
+    key of the cache.
+
+    Args:
+        entity (str): The entity read by the method, the cache is cleared by
+            the methods of the manager decorated with `invalidates(entity)`.
+        ttl (float): Seconds a result is served for.
+        max_size (int): Maximum number of cached results.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: The decorator, keeping
+            the signature of the method.
+    """
+
+    def decorator(method: Callable[P, R]) -> Callable[P, R]:
+        cache = ReadCache(method.__qualname__, ttl, max_size)
+        with _caches_lock:
+            _caches.setdefault((_owner(method), entity), []).append(cache)
+
+        @functools.wraps(method)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = _make_key(args[1:], kwargs)
+            result = cache.get(key, functools.partial(method, *args, **kwargs))
+            return cast(R, copy.deepcopy(result))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(
+    *entities: str,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator invalidating the caches of entities after a write method.
+
+    Args:
+        *entities (str): The entities written by the method.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: The decorator, keeping
+            the signature of the method.
+    """
+
+    def decorator(method: Callable[P, R]) -> Callable[P, R]:
+        owner = _owner(method)
+
+        @functools.wraps(method)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return method(*args, **kwargs)
+            finally:
+                invalidate(owner, *entities)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(owner: str, *entities: str) -> None:
+    """Clear the caches of entities of a manager.
+
+    Args:
+        owner (str): Qualified name of the class of the manager.
+        *entities (str): The entities to invalidate.
+    """
+    with _caches_lock:
+        caches = [
+            cache
+            for entity in entities
+            for cache in _caches.get((owner, entity), [])
+        ]
+    for cache in caches:
+        cache.invalidate()
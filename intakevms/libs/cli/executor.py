@@ -4,12 +4,15 @@ Functions:
     __terminate_process: Attempts to gracefully terminate a subprocess and
         forcefully kills it if necessary.
     __prepare_env: Prepares the environment variables for command execution.
+    __read_pipe: Reads a pipe of a subprocess line by line.
+    __communicate: Waits for a subprocess, optionally forwarding its output.
     execute: Executes a shell command with optional root privileges,
         timeout, and error handling.
 """
 
 import os
-from typing import Dict, List
+import threading
+from typing import IO, Dict, List, Tuple, Callable, Optional
 from subprocess import PIPE, Popen, TimeoutExpired
 
 from intakevms.libs.log import get_logger
@@ -65,9 +68,73 @@ def __prepare_env(env_params: Dict[str, str]) -> Dict[str, str]:
     return env_vars
 
 
+def __read_pipe(
+    pipe: IO[str],
+    lines: List[str],
+    on_output: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Reads a pipe of a subprocess line by line until it is closed.
+
+    Pipes are opened in text mode, so carriage returns end lines too, as
+    progress indicators rewriting their line write them.
+
+    Args:
+        pipe (IO[str]): The pipe.
+        lines (List[str]): The lines read, to append to.
+        on_output (Optional[Callable[[str], None]]): Called with each line.
+    """
+    for line in iter(pipe.readline, ''):
+        lines.append(line)
+        if on_output is not None:
+            on_output(line)
+
+
+def __communicate(
+    proc: Popen,
+    timeout: Optional[float],
+    on_output: Optional[Callable[[str], None]],
+) -> Tuple[str, str]:
+    """Waits for a subprocess, optionally forwarding its output as written.
+
+    Without `on_output`, the output is read once the subprocess ends.
+    Otherwise both pipes are read by threads, so that a full stderr pipe
+    cannot block the subprocess.
+
+    Args:
+        proc (Popen): The subprocess, with piped stdout and stderr.
+        timeout (Optional[float]): Seconds to wait for the subprocess.
+        on_output (Optional[Callable[[str], None]]): Called with each line
+            of stdout.
+
+    Returns:
+        Tuple[str, str]: The standard output and error of the subprocess.
+
+    Raises:
+        TimeoutExpired: If the subprocess runs longer than the timeout.
+    """
+    if on_output is None:
+        stdout_data, stderr_data = proc.communicate(timeout=timeout)
+        return stdout_data, stderr_data
+    stdout: List[str] = []
+    stderr: List[str] = []
+    readers = [
+        threading.Thread(
+            target=__read_pipe, args=(proc.stdout, stdout, on_output)
+        ),
+        threading.Thread(target=__read_pipe, args=(proc.stderr, stderr)),
+    ]
+    for reader in readers:
+        reader.start()
+    proc.wait(timeout=timeout)
+    for reader in readers:
+        reader.join()
+    return ''.join(stdout), ''.join(stderr)
+
+
 def execute(
     *args: str,
     params: ExecuteParams = ExecuteParams(),
+    on_output: Optional[Callable[[str], None]] = None,
 ) -> ExecutionResult:
     """Executes a shell command and returns its stdout, stderr, and exit code.
 
@@ -76,6 +143,9 @@ def execute(
             must be passed as a separate string.
         params (ExecuteParams): A Pydantic model containing command execution
             parameters such as `shell`, `timeout`, `env`, etc.
+        on_output (Optional[Callable[[str], None]]): Called with the standard
+            output as it is written, e.g. to follow the progress of a long
+            command. By default, the output is read once the command ends.
 
     Returns:
         ExecutionResult: A model containing:
@@ -113,7 +183,9 @@ def execute(
             env=__prepare_env(params.env) if params.env else None,
         ) as proc:
             try:
-                stdout, stderr = proc.communicate(timeout=params.timeout)
+                stdout, stderr = __communicate(
+                    proc, params.timeout, on_output
+                )
                 returncode = proc.returncode
                 LOG.info(
                     f"Command '{cmd_str}' completed with return code: "
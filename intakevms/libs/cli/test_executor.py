@@ -10,7 +10,7 @@ Run the tests using pytest:
     pytest intakevms/libs/cli/test_executor.py
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 from subprocess import TimeoutExpired
 from unittest.mock import MagicMock, patch
 
@@ -97,3 +97,22 @@ def test_execute_invalid_command() -> None:
         OSError
     ):
         execute('invalid_command')
+
+
+def test_execute_streams_output() -> None:
+    """Test execution of a command whose output is followed as written.
+
+    Verifies that the handler receives each line, carriage returns included,
+        and that the result still holds the whole output.
+    """
+    lines: List[str] = []
+
+    result = execute(
+        r"printf '(10.00/100%%)\r(100.00/100%%)\r'; echo done >&2",
+        params=ExecuteParams(shell=True),  # noqa: S604 fixed test command
+        on_output=lines.append,
+    )
+
+    assert lines == ['(10.00/100%)\n', '(100.00/100%)\n']
+    assert result.stdout == '(10.00/100%)\n(100.00/100%)'
+    assert result.stderr == 'done'
@@ -0,0 +1,408 @@
+"""Process-wide registry of SQLAlchemy engines.
+
+Every module of a process shares the same engine, and so the same pool of
+database connections, instead of holding a pool of its own. Engines are
+created on first use, one per database URL and isolation level, and are
+keyed by process ID, so forked workers never share the connections of
+their parent.
+
+Pools are sized by the `[database.pool]` section of the configuration:
+
+    [database.pool]
+    size = 10
+    max_overflow = 10
+    timeout = 60
+    recycle = 1800
+
+The pools are measured in the metrics registry:
+
+    * `intakevms_db_pool_checked_out`, `..._overflow`, `..._idle`: current
+      connections of the pools of the process, in use, beyond the pool
+      size and idle.
+    * `intakevms_db_pool_wait_seconds`: time to get a connection, opening
+      it included, by engine.
+    * `intakevms_db_pool_timeouts_total`: requests that gave up waiting.
+
+Read-only transactions, of the pure reads, are `READ COMMITTED` and
+`READ ONLY`: they neither keep a snapshot open for their whole duration nor
+conflict with the writers. Their engine uses the replica of the
+`[database.replica]` section when one is configured, and otherwise shares
+the pool of the default engine, the characteristics of the transactions
+being set on checkout and reset on return.
+
+Async engines, for the asyncio units of work, are kept apart from the
+sync ones, with pools of the same size. Their connections belong to the
+event loop that opened them, so a process serves them from a single loop.
+
+Usage example:
+    engine = EngineRegistry.instance().get()
+    session_factory = sessionmaker(bind=engine)
+
+    read_only_engine = EngineRegistry.instance().get_read_only()
+
+    async_engine = EngineRegistry.instance().get_async()
+    async_session_factory = async_sessionmaker(bind=async_engine)
+
+Classes:
+    PoolSettings: Sizing of the connection pools.
+    EngineRegistry: Engines of the current process.
+
+Functions:
+    get_pool_settings: Retrieves the sizing of the connection pools.
+    async_url: Converts a database URL to its asyncio driver.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Dict, List, Tuple, ClassVar, Optional
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    Engine,
+    QueuePool,
+    AsyncAdaptedQueuePool,
+    exc as sa_exc,
+    create_engine,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from intakevms import config
+from intakevms.libs.log import get_logger
+from intakevms.libs.metrics.registry import REGISTRY
+
+LOG = get_logger(__name__)
+
+DEFAULT_ISOLATION_LEVEL = 'REPEATABLE READ'
+READ_ONLY_ISOLATION_LEVEL = 'READ COMMITTED'
+
+# asyncio drivers of the sync drivers of the configuration
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+POOL_WAIT = REGISTRY.histogram(
+    'intakevms_db_pool_wait_seconds',
+    'Time to get a database connection from the pool.',
+    ('engine',),
+)
+POOL_TIMEOUTS = REGISTRY.counter(
+    'intakevms_db_pool_timeouts_total',
+    'Requests of a database connection that gave up waiting.',
+    ('engine',),
+)
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Sizing of the connection pools.
+
+    Attributes:
+        size (int): Connections kept open per engine.
+        max_overflow (int): Connections allowed beyond `size` under load.
+        timeout (float): Seconds to wait for a connection before giving up.
+        recycle (int): Seconds after which connections are reopened.
+        pre_ping (bool): Whether to check connections before using them.
+    """
+
+    size: int = 10
+    max_overflow: int = 10
+    timeout: float = 60
+    recycle: int = 1800
+    pre_ping: bool = True
+
+
+def get_pool_settings() -> PoolSettings:
+    """Get the sizing of the connection pools.
+
+    This function reads the `[database.pool]` section of the configuration,
+    falling back to the defaults of `PoolSettings` for missing keys.
+
+    Returns:
+        PoolSettings: The sizing of the pools.
+    """
+    pool = config.data.get('database', {}).get('pool', {})
+    defaults = PoolSettings()
+    return PoolSettings(
+        size=int(pool.get('size', defaults.size)),
+        max_overflow=int(pool.get('max_overflow', defaults.max_overflow)),
+        timeout=float(pool.get('timeout', defaults.timeout)),
+        recycle=int(pool.get('recycle', defaults.recycle)),
+        pre_ping=bool(pool.get('pre_ping', defaults.pre_ping)),
+    )
+
+
+def async_url(url: str) -> str:
+    """Convert a database URL to its asyncio driver.
+
+    Args:
+        url (str): URL of the database, with a sync or async driver.
+
+    Returns:
+        str: The URL with the asyncio driver of its dialect.
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+class _MeteredQueuePool(QueuePool):
+    """Queue pool measuring the time to get a connection.
+
+    Attributes:
+        label (str): The engine label of the metrics.
+    """
+
+    label = 'default'
+
+    def recreate(self) -> QueuePool:
+        """Create a new pool with the same settings, e.g. on dispose.
+
+        Returns:
+            QueuePool: The new pool.
+        """
+        pool = super().recreate()
+        if isinstance(pool, _MeteredQueuePool):
+            pool.label = self.label
+        return pool
+
+    def _do_get(self) -> Any:  # noqa: ANN401 connection record of QueuePool
+        """Get a connection, recording the wait.
+
+        Returns:
+            Any: The connection record.
+        """
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            POOL_TIMEOUTS.inc(self.label)
+            raise
+        finally:
+            POOL_WAIT.observe(time.perf_counter() - started, self.label)
+
+
+class _MeteredAsyncQueuePool(_MeteredQueuePool, AsyncAdaptedQueuePool):
+    """Queue pool of asyncio engines measuring the time to get a connection."""
+
+
+class EngineRegistry:
+    """Engines of the current process.
+
+    Attributes:
+        settings (PoolSettings): The sizing of the pools.
+    """
+
+    _instances: ClassVar[Dict[int, 'EngineRegistry']] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, settings: PoolSettings) -> None:
+        """Initialize the registry without creating engines.
+
+        Args:
+            settings (PoolSettings): The sizing of the pools.
+        """
+        self.settings = settings
+        self._engines: Dict[Tuple[str, str], Engine] = {}
+        self._async_engines: Dict[Tuple[str, str], AsyncEngine] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> 'EngineRegistry':
+        """Get the registry of the current process, creating it on first use.
+
+        Returns:
+            EngineRegistry: The registry of the current process.
+        """
+        pid = os.getpid()
+        with cls._instances_lock:
+            if pid not in cls._instances:
+                cls._instances[pid] = cls(get_pool_settings())
+                cls._instances[pid].register_metrics()
+            return cls._instances[pid]
+
+    def get(
+        self,
+        isolation_level: str = DEFAULT_ISOLATION_LEVEL,
+        url: Optional[str] = None,
+    ) -> Engine:
+        """Get the engine of a database, creating it on first use.
+
+        Args:
+            isolation_level (str): Isolation level of the transactions.
+            url (Optional[str]): URL of the database, the one of the
+                configuration by default.
+
+        Returns:
+            Engine: The engine shared by the process.
+        """
+        url = url or config.get_postgres_uri()
+        key = (url, isolation_level)
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+        with self._lock:
+            if key not in self._engines:
+                self._engines[key] = self._create(url, isolation_level)
+            return self._engines[key]
+
+    def get_read_only(self, url: Optional[str] = None) -> Engine:
+        """Get the engine of read-only transactions, creating it on first use.
+
+        Args:
+            url (Optional[str]): URL of the database, the replica of the
+                configuration by default, or else its primary database.
+
+        Returns:
+            Engine: The engine shared by the process, on the pool of the
+                default engine of the database.
+        """
+        url = url or config.get_replica_uri() or config.get_postgres_uri()
+        key = (url, 'READ ONLY')
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+        default_engine = self.get(DEFAULT_ISOLATION_LEVEL, url)
+        with self._lock:
+            if key not in self._engines:
+                self._engines[key] = default_engine.execution_options(
+                    isolation_level=READ_ONLY_ISOLATION_LEVEL,
+                    postgresql_readonly=True,
+                )
+            return self._engines[key]
+
+    def get_async(
+        self,
+        isolation_level: str = DEFAULT_ISOLATION_LEVEL,
+        url: Optional[str] = None,
+    ) -> AsyncEngine:
+        """Get the asyncio engine of a database, creating it on first use.
+
+        Args:
+            isolation_level (str): Isolation level of the transactions.
+            url (Optional[str]): URL of the database, the one of the
+                configuration by default, converted to its asyncio driver.
+
+        Returns:
+            AsyncEngine: The asyncio engine shared by the process.
+        """
+        url = async_url(url or config.get_postgres_uri())
+        key = (url, isolation_level)
+        engine = self._async_engines.get(key)
+        if engine is not None:
+            return engine
+        with self._lock:
+            if key not in self._async_engines:
+                self._async_engines[key] = create_async_engine(
+                    url, **self._engine_options(isolation_level, is_async=True)
+                )
+                self._label(
+                    self._async_engines[key].sync_engine,
+                    isolation_level,
+                    'async',
+                )
+            return self._async_engines[key]
+
+    def _engine_options(
+        self, isolation_level: str, *, is_async: bool = False
+    ) -> Dict[str, Any]:
+        """Get the options of an engine.
+
+        Args:
+            isolation_level (str): Isolation level of the transactions.
+            is_async (bool): Whether the engine is an asyncio one.
+
+        Returns:
+            Dict[str, Any]: The keyword arguments of `create_engine`.
+        """
+        return {
+            'isolation_level': isolation_level,
+            'poolclass': _MeteredAsyncQueuePool
+            if is_async
+            else _MeteredQueuePool,
+            'pool_size': self.settings.size,
+            'max_overflow': self.settings.max_overflow,
+            'pool_timeout': self.settings.timeout,
+            'pool_recycle': self.settings.recycle,
+            'pool_pre_ping': self.settings.pre_ping,
+        }
+
+    def _label(
+        self, engine: Engine, isolation_level: str, kind: str = ''
+    ) -> None:
+        """Label the pool metrics of an engine, and log its creation.
+
+        Args:
+            engine (Engine): The new engine, the sync one of an asyncio
+                engine.
+            isolation_level (str): Isolation level of the transactions.
+            kind (str): Prefix of the label, e.g. `async`.
+        """
+        label = '_'.join(filter(None, (kind, isolation_level.lower())))
+        if isinstance(engine.pool, _MeteredQueuePool):
+            engine.pool.label = label.replace(' ', '_')
+        LOG.info(
+            f'Database engine created in process {os.getpid()}: '
+            f'{engine.url!r}, {isolation_level}, pool of '
+            f'{self.settings.size}+{self.settings.max_overflow}'
+        )
+
+    def _create(self, url: str, isolation_level: str) -> Engine:
+        """Create an engine.
+
+        Args:
+            url (str): URL of the database.
+            isolation_level (str): Isolation level of the transactions.
+
+        Returns:
+            Engine: The new engine.
+        """
+        engine = create_engine(url, **self._engine_options(isolation_level))
+        self._label(engine, isolation_level)
+        return engine
+
+    def _pools(self) -> List[QueuePool]:
+        """Get the pools of the engines.
+
+        Returns:
+            List[QueuePool]: The pools.
+        """
+        with self._lock:
+            engines = [
+                *self._engines.values(),
+                *(
+                    engine.sync_engine
+                    for engine in self._async_engines.values()
+                ),
+            ]
+        # Engines with other execution options share the pool of their base
+        pools = {
+            id(engine.pool): engine.pool
+            for engine in engines
+            if isinstance(engine.pool, QueuePool)
+        }
+        return list(pools.values())
+
+    def register_metrics(self) -> None:
+        """Expose the connections of the pools in the metrics registry."""
+        REGISTRY.callback(
+            'intakevms_db_pool_checked_out',
+            'Database connections in use.',
+            'gauge',
+            lambda: sum(pool.checkedout() for pool in self._pools()),
+        )
+        REGISTRY.callback(
+            'intakevms_db_pool_overflow',
+            'Database connections open beyond the pool size.',
+            'gauge',
+            lambda: sum(max(pool.overflow(), 0) for pool in self._pools()),
+        )
+        REGISTRY.callback(
+            'intakevms_db_pool_idle',
+            'Database connections open and idle in the pool.',
+            'gauge',
+            lambda: sum(pool.checkedin() for pool in self._pools()),
+        )
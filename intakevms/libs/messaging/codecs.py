@@ -0,0 +1,244 @@
+"""Wire formats of RPC messages.
+
+This module provides the codecs encoding RPC requests and replies. The codec
+of a message is advertised through the AMQP `content_type` property: servers
+decode a request with the codec it was sent with and reply with the same
+codec, and messages without `content_type` (sent by older services) are
+decoded as JSON. A client sends its requests with the codec configured in
+`[messaging] codec`.
+
+UUIDs, datetimes and dates can be passed as is: they are encoded as strings,
+so receivers get the same values as if callers had stringified them.
+
+Usage example:
+    codec = get_default_codec()
+    body = codec.encode({'vm_id': uuid.uuid4()})
+    data = get_codec(codec.content_type).decode(body)
+
+Classes:
+    BaseCodec: Base class of the codecs.
+    JsonCodec: Compact JSON codec.
+    MsgpackCodec: MessagePack codec, available if `msgpack` is installed.
+
+Functions:
+    get_codec: Returns the codec of a content type.
+    get_default_codec: Returns the codec configured for outgoing requests.
+"""
+
+import abc
+import json
+import uuid
+import datetime
+from typing import Any, Dict, Type, ClassVar, Optional
+
+from intakevms.libs.messaging.config import get_rpc_codec_name
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+def _encode_default(value: Any) -> str:  # noqa: ANN401 any value the encoder does not know
+    """Encode the values unknown to the underlying encoders.
+
+    Args:
+        value (Any): The value to encode.
+
+    Returns:
+        str: The string representation of the value.
+
+    Raises:
+        TypeError: If the value is not supported.
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    msg = f'Object of type {type(value).__name__} is not serializable'
+    raise TypeError(msg)
+
+
+class BaseCodec(metaclass=abc.ABCMeta):
+    """Base class of the codecs.
+
+    Attributes:
+        name (str): Name of the codec in the configuration.
+        content_type (str): AMQP content type of the encoded messages.
+    """
+
+    name: ClassVar[str]
+    content_type: ClassVar[str]
+
+    @abc.abstractmethod
+    def encode(self, data: Any) -> bytes:  # noqa: ANN401 messages can contain various data types
+        """Encode a message.
+
+        Args:
+            data (Any): The message to encode.
+
+        Returns:
+            bytes: The encoded message.
+
+        Raises:
+            TypeError: If the message cannot be encoded.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def decode(self, body: bytes) -> Any:  # noqa: ANN401 messages can contain various data types
+        """Decode a message.
+
+        Args:
+            body (bytes): The encoded message.
+
+        Returns:
+            Any: The decoded message.
+
+        Raises:
+            ValueError: If the message cannot be decoded.
+        """
+        raise NotImplementedError
+
+
+class JsonCodec(BaseCodec):
+    """Compact JSON codec, without indentation and whitespace."""
+
+    name = 'json'
+    content_type = 'application/json'
+
+    def encode(self, data: Any) -> bytes:  # noqa: ANN401 messages can contain various data types
+        """Encode a message as compact JSON.
+
+        Args:
+            data (Any): The message to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON.
+
+        Raises:
+            TypeError: If the message cannot be encoded.
+        """
+        try:
+            return json.dumps(
+                data,
+                separators=(',', ':'),
+                ensure_ascii=False,
+                default=_encode_default,
+            ).encode('utf-8')
+        except (TypeError, ValueError) as err:
+            msg = f'Error serializing data to JSON: {err}'
+            raise TypeError(msg)
+
+    def decode(self, body: bytes) -> Any:  # noqa: ANN401 messages can contain various data types
+        """Decode a JSON message.
+
+        Args:
+            body (bytes): The UTF-8 encoded JSON.
+
+        Returns:
+            Any: The decoded message.
+
+        Raises:
+            ValueError: If the message is not valid JSON.
+        """
+        try:
+            return json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as err:
+            msg = f'Error deserializing JSON string: {err}'
+            raise ValueError(msg)
+
+
+class MsgpackCodec(BaseCodec):
+    """MessagePack codec."""
+
+    name = 'msgpack'
+    content_type = 'application/msgpack'
+
+    def encode(self, data: Any) -> bytes:  # noqa: ANN401 messages can contain various data types
+        """Encode a message as MessagePack.
+
+        Args:
+            data (Any): The message to encode.
+
+        Returns:
+            bytes: The encoded message.
+
+        Raises:
+            TypeError: If the message cannot be encoded.
+        """
+        try:
+            body: bytes = msgpack.packb(
+                data, default=_encode_default, use_bin_type=True
+            )
+        except (TypeError, ValueError, OverflowError) as err:
+            msg = f'Error serializing data to MessagePack: {err}'
+            raise TypeError(msg)
+        return body
+
+    def decode(self, body: bytes) -> Any:  # noqa: ANN401 messages can contain various data types
+        """Decode a MessagePack message.
+
+        Args:
+            body (bytes): The encoded message.
+
+        Returns:
+            Any: The decoded message.
+
+        Raises:
+            ValueError: If the message is not valid MessagePack.
+        """
+        try:
+            return msgpack.unpackb(body, raw=False)
+        except (ValueError, msgpack.UnpackException) as err:
+            msg = f'Error deserializing MessagePack message: {err}'
+            raise ValueError(msg)
+
+
+_CODEC_CLASSES: Dict[str, Type[BaseCodec]] = {'json': JsonCodec}
+if msgpack is not None:
+    _CODEC_CLASSES['msgpack'] = MsgpackCodec
+
+_CODECS: Dict[str, BaseCodec] = {
+    codec_class.content_type: codec_class()
+    for codec_class in _CODEC_CLASSES.values()
+}
+
+
+def get_codec(content_type: Optional[str]) -> BaseCodec:
+    """Get the codec of a content type.
+
+    Args:
+        content_type (Optional[str]): The AMQP content type of a message.
+            Messages without content type are decoded as JSON.
+
+    Returns:
+        BaseCodec: The codec of the content type.
+
+    Raises:
+        ValueError: If the content type is not supported.
+    """
+    if not content_type:
+        return _CODECS[JsonCodec.content_type]
+    try:
+        return _CODECS[content_type]
+    except KeyError:
+        msg = f'Unsupported RPC content type: {content_type}'
+        raise ValueError(msg)
+
+
+def get_default_codec() -> BaseCodec:
+    """Get the codec configured for outgoing requests.
+
+    Returns:
+        BaseCodec: The configured codec.
+
+    Raises:
+        ValueError: If the configured codec is unknown or not installed.
+    """
+    name = get_rpc_codec_name()
+    try:
+        return get_codec(_CODEC_CLASSES[name].content_type)
+    except KeyError:
+        msg = f'RPC codec {name} is unknown or its package is not installed'
+        raise ValueError(msg)
@@ -7,12 +7,22 @@ Functions:
     get_rabbitmq_url: Returns the RabbitMQ connection URL.
     get_messaging_type_and_transport: Retrieves the messaging type and transport
     method.
+    get_rpc_codec_name: Retrieves the name of the codec of RPC requests.
+    get_rpc_pool_settings: Retrieves the settings of the pooled RPC client.
+    rpc_clients_are_reusable: Tells whether RPC clients may be kept idle.
+    get_rpc_server_settings: Retrieves the settings of the RPC server of
+    a queue.
 """
 
-from typing import Tuple
+from typing import Tuple, Literal
+from dataclasses import dataclass
 
 from intakevms import config
 
+# Maximum number of replies waiting in a callback queue, older replies are
+# dropped by the broker beyond it.
+CALLBACK_QUEUE_MAX_LENGTH = 200
+
 
 def get_rabbitmq_url() -> str:
     """Get the RabbitMQ connection URL.
@@ -42,3 +52,133 @@ def get_messaging_type_and_transport() -> Tuple[str, str]:
     """
     messaging = config.data.get('messaging', {})
     return messaging.get('type', ''), messaging.get('transport', '')
+
+
+def get_rpc_codec_name() -> str:
+    """Get the name of the codec encoding outgoing RPC requests.
+
+    Returns:
+        str: The codec name, `json` unless configured otherwise.
+    """
+    return str(config.data.get('messaging', {}).get('codec', 'json'))
+
+
+
+@dataclass(frozen=True)
+class RpcPoolSettings:
+    """Settings of the process-wide pooled RPC client.
+
+    Attributes:
+        enabled (bool): Whether `MessagingClient` uses the pooled client.
+        size (int): Number of long-lived broker connections per process.
+        max_inflight (int): Maximum number of concurrent calls multiplexed
+            over a single connection, at most `CALLBACK_QUEUE_MAX_LENGTH`
+            as their replies share its callback queue.
+        acquire_timeout (float): Seconds to wait for a free call slot before
+            giving up.
+    """
+
+    enabled: bool = True
+    size: int = 2
+    max_inflight: int = 64
+    acquire_timeout: float = 10.0
+
+
+def get_rpc_pool_settings() -> RpcPoolSettings:
+    """Get the settings of the pooled RPC client.
+
+    This function reads the `[messaging.pool]` section of the configuration,
+    falling back to the defaults of `RpcPoolSettings` for missing keys.
+
+    Returns:
+        RpcPoolSettings: The pooled RPC client settings.
+
+    Raises:
+        ValueError: If more concurrent calls per connection are configured
+            than replies fit in its callback queue.
+    """
+    pool = config.data.get('messaging', {}).get('pool', {})
+    defaults = RpcPoolSettings()
+    max_inflight = int(pool.get('max_inflight', defaults.max_inflight))
+    if max_inflight > CALLBACK_QUEUE_MAX_LENGTH:
+        msg = (
+            f'messaging.pool.max_inflight is {max_inflight}, at most '
+            f'{CALLBACK_QUEUE_MAX_LENGTH} replies fit in a callback queue'
+        )
+        raise ValueError(msg)
+    return RpcPoolSettings(
+        enabled=bool(pool.get('enabled', defaults.enabled)),
+        size=int(pool.get('size', defaults.size)),
+        max_inflight=max_inflight,
+        acquire_timeout=float(
+            pool.get('acquire_timeout', defaults.acquire_timeout)
+        ),
+    )
+
+
+def rpc_clients_are_reusable() -> bool:
+    """Tell whether the RPC clients of the process may be kept idle.
+
+    Without the pool, every RabbitMQ client owns a blocking connection whose
+    heartbeats are only sent while a call is in progress, so the broker drops
+    connections left idle between requests.
+
+    Returns:
+        bool: False for RabbitMQ clients not sharing the pool, True otherwise.
+    """
+    _, transport = get_messaging_type_and_transport()
+    return transport != 'rabbitmq' or get_rpc_pool_settings().enabled
+
+
+@dataclass(frozen=True)
+class RpcServerSettings:
+    """Settings of the RPC server consuming a queue.
+
+    Attributes:
+        mode (str): How messages are handled: `inline` on the consuming
+            thread, or dispatched to a pool of `thread` or `process`
+            workers.
+        workers (int): Size of the worker pool.
+        prefetch (int): Maximum number of unacknowledged messages delivered
+            to the server.
+        batch_workers (int): Maximum number of calls of a batch request run
+            concurrently when the client asks for a parallel batch.
+    """
+
+    mode: Literal['inline', 'thread', 'process'] = 'inline'
+    workers: int = 1
+    prefetch: int = 1
+    batch_workers: int = 4
+
+
+def get_rpc_server_settings(queue_name: str) -> RpcServerSettings:
+    """Get the settings of the RPC server consuming the given queue.
+
+    This function reads the `[messaging.server]` section of the
+    configuration and applies the overrides of
+    `[messaging.server.queues.<queue_name>]` on top of it.
+
+    Args:
+        queue_name (str): Name of the queue consumed by the server.
+
+    Returns:
+        RpcServerSettings: The RPC server settings.
+
+    Raises:
+        ValueError: If the configured mode is unknown.
+    """
+    server = dict(config.data.get('messaging', {}).get('server', {}))
+    server.update(server.pop('queues', {}).get(queue_name, {}))
+    defaults = RpcServerSettings()
+    mode = server.get('mode', defaults.mode)
+    if mode not in ('inline', 'thread', 'process'):
+        msg = f'Unknown RPC server mode for {queue_name}: {mode}'
+        raise ValueError(msg)
+    return RpcServerSettings(
+        mode=mode,
+        workers=int(server.get('workers', defaults.workers)),
+        prefetch=int(server.get('prefetch', defaults.prefetch)),
+        batch_workers=int(
+            server.get('batch_workers', defaults.batch_workers)
+        ),
+    )
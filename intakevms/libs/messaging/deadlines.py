@@ -0,0 +1,172 @@
+"""Deadlines of RPC requests.
+
+A caller waiting for a reply gives up once its time limit is exceeded, but
+the request stays in the queue of the server. To avoid handling requests
+nobody waits for anymore, clients send the absolute deadline of every call
+in the `x-deadline` header, in seconds since epoch, and servers drop the
+requests whose deadline has already passed. Casts have no deadline.
+
+While a request is handled, its deadline is the deadline of the current
+context: handlers can check the remaining budget, and the RPC calls they
+issue are bounded by it, so a nested call never outlives its caller.
+
+Usage example:
+    # In a manager method handling a request.
+    for volume in volumes:
+        check_deadline()
+        ...
+
+    if (remaining_time() or math.inf) < 30:
+        ...
+
+Functions:
+    get_deadline: Returns the deadline of the request being handled.
+    remaining_time: Returns the time left to handle the current request.
+    check_deadline: Raises if the deadline of the request has passed.
+    deadline_scope: Sets the deadline of the current context.
+    call_deadline: Returns the deadline of an outgoing call.
+    time_left: Returns the time left until a deadline.
+    is_expired: Returns whether a deadline has passed.
+    deadline_header: Returns the header carrying a deadline.
+    from_headers: Returns the deadline of a request.
+"""
+
+import time
+from typing import Dict, Mapping, Iterator, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from intakevms.libs.messaging.exceptions import RpcDeadlineExceededException
+
+# Header carrying the deadline of a request, in seconds since epoch.
+DEADLINE_HEADER = 'x-deadline'
+
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    'rpc_deadline', default=None
+)
+
+
+def get_deadline() -> Optional[float]:
+    """Get the deadline of the request being handled.
+
+    Returns:
+        Optional[float]: The deadline in seconds since epoch, `None` outside
+            of a request or for requests without deadline.
+    """
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Get the time left to handle the current request.
+
+    Returns:
+        Optional[float]: Seconds until the deadline, negative once it has
+            passed, `None` if the request has no deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def check_deadline() -> None:
+    """Stop handling a request whose caller no longer waits for the reply.
+
+    Raises:
+        RpcDeadlineExceededException: If the deadline has passed.
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        message = f'deadline exceeded {-remaining:.3f}s ago'
+        raise RpcDeadlineExceededException(message)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """Set the deadline of the current context.
+
+    Context variables are not inherited by the threads of an executor, so
+    the scope is set by the thread handling the request.
+
+    Args:
+        deadline (Optional[float]): The deadline in seconds since epoch,
+            `None` for no deadline.
+
+    Yields:
+        None: The deadline is set until the block is left.
+    """
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def call_deadline(time_limit: float) -> float:
+    """Get the deadline of an outgoing call.
+
+    Args:
+        time_limit (float): The time limit of the call, in seconds.
+
+    Returns:
+        float: The earliest of the time limit and the deadline of the
+            request being handled.
+
+    Raises:
+        RpcDeadlineExceededException: If the deadline of the request being
+            handled has already passed.
+    """
+    check_deadline()
+    deadline = time.time() + time_limit
+    current = _deadline.get()
+    return deadline if current is None else min(deadline, current)
+
+
+def time_left(deadline: float) -> float:
+    """Get the time left until a deadline.
+
+    Args:
+        deadline (float): The deadline in seconds since epoch.
+
+    Returns:
+        float: Seconds until the deadline, zero once it has passed.
+    """
+    return max(deadline - time.time(), 0.0)
+
+
+def is_expired(deadline: Optional[float]) -> bool:
+    """Check whether a deadline has passed.
+
+    Args:
+        deadline (Optional[float]): The deadline in seconds since epoch.
+
+    Returns:
+        bool: True if the deadline is set and has passed.
+    """
+    return deadline is not None and deadline <= time.time()
+
+
+def deadline_header(deadline: float) -> Dict[str, float]:
+    """Get the header carrying the deadline of a request.
+
+    Args:
+        deadline (float): The deadline in seconds since epoch.
+
+    Returns:
+        Dict[str, float]: The headers to set on the request.
+    """
+    return {DEADLINE_HEADER: deadline}
+
+
+def from_headers(headers: Optional[Mapping]) -> Optional[float]:
+    """Get the deadline of a request.
+
+    Args:
+        headers (Optional[Mapping]): The headers of the request.
+
+    Returns:
+        Optional[float]: The deadline in seconds since epoch, `None` for
+            casts and requests of clients not sending deadlines.
+    """
+    deadline = (headers or {}).get(DEADLINE_HEADER)
+    return None if deadline is None else float(deadline)
@@ -6,6 +6,8 @@ system, particularly in the context of RPC communication.
 Classes:
     RpcCallException: Exception raised when an RPC call fails.
     RpcCallTimeoutException: Exception raised when an RPC call times out.
+    RpcDeadlineExceededException: Exception raised when the deadline of a
+        request has passed.
     RpcClientInitializedException: Exception raised during RPC client
         initialization.
     RpcServerInitializedException: Exception raised during RPC server
@@ -41,6 +43,14 @@ class RpcCallTimeoutException(RpcException):
         super().__init__(message, *args)
 
 
+class RpcDeadlineExceededException(RpcCallTimeoutException):
+    """Exception raised when the deadline of a request has passed."""
+
+    def __init__(self, message: str, *args: Any) -> None:  # noqa: ANN401 # TODO need to parameterize the arguments correctly, in accordance with static typing
+        """Initialize the RpcDeadlineExceededException."""
+        super().__init__(message, *args)
+
+
 class RpcClientInitializedException(RpcException):
     """Exception raised during RPC client initialization."""
 
@@ -0,0 +1,108 @@
+"""Lifecycle of the managers executing RPC requests.
+
+An RPC server executes every request on a manager. Building a manager can be
+expensive (units of work, RPC clients, event store), so a manager declares
+how long its instances live through the `rpc_scope` class attribute:
+
+    * `ManagerScope.REQUEST`: a new instance for every request. This is the
+      default for managers that do not declare a scope.
+    * `ManagerScope.WORKER`: one instance per worker thread or process of the
+      server, reused for all the requests the worker handles.
+    * `ManagerScope.SINGLETON`: one instance shared by all the workers of the
+      server. Its methods must be safe to run concurrently.
+
+Reused managers must not keep the state of a request on the instance between
+calls: such state lives in local variables or in a unit of work that is
+entered by the method itself (`with self.uow:`). Requests carrying
+`data_for_manager` always get a new instance, as their manager is built for
+that data.
+
+Managers keep the RPC clients they build, so instances are only reused when
+those clients share the connections of the pool (see
+`rpc_clients_are_reusable`). Otherwise every request gets a new instance,
+whatever the declared scope.
+
+Classes:
+    ManagerScope: Lifetime of the manager instances.
+    ManagerProvider: Provides manager instances according to their scope.
+"""
+
+import enum
+import threading
+from typing import Any, Dict, Callable, Optional
+
+from intakevms.libs.messaging.config import rpc_clients_are_reusable
+
+
+class ManagerScope(str, enum.Enum):
+    """Lifetime of the manager instances of an RPC server."""
+
+    REQUEST = 'request'
+    WORKER = 'worker'
+    SINGLETON = 'singleton'
+
+
+class ManagerProvider:
+    """Provides manager instances according to their scope.
+
+    Attributes:
+        manager (Callable): The manager class, or a factory building managers.
+        scope (ManagerScope): Lifetime of the provided instances.
+    """
+
+    def __init__(self, manager: Callable) -> None:
+        """Initialize the provider of the given manager.
+
+        Args:
+            manager (Callable): The manager class, or a factory building
+                managers.
+        """
+        self.manager = manager
+        self.scope = ManagerScope(
+            getattr(manager, 'rpc_scope', ManagerScope.REQUEST)
+        )
+        if not rpc_clients_are_reusable():
+            self.scope = ManagerScope.REQUEST
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instance: Optional[Any] = None
+
+    def get(self, data_for_manager: Optional[Dict] = None) -> Any:  # noqa: ANN401 any manager
+        """Get a manager instance for a request.
+
+        Args:
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+
+        Returns:
+            Any: The manager instance.
+        """
+        if data_for_manager:
+            return self.manager(data_for_manager)
+        if self.scope is ManagerScope.WORKER:
+            return self._get_worker_instance()
+        if self.scope is ManagerScope.SINGLETON:
+            return self._get_singleton_instance()
+        return self.manager()
+
+    def _get_worker_instance(self) -> Any:  # noqa: ANN401 any manager
+        """Get the manager instance of the current thread.
+
+        Returns:
+            Any: The manager instance.
+        """
+        instance = getattr(self._local, 'instance', None)
+        if instance is None:
+            instance = self._local.instance = self.manager()
+        return instance
+
+    def _get_singleton_instance(self) -> Any:  # noqa: ANN401 any manager
+        """Get the manager instance shared by all threads.
+
+        Returns:
+            Any: The manager instance.
+        """
+        with self._lock:
+            if self._instance is None:
+                self._instance = self.manager()
+            return self._instance
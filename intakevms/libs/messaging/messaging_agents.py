@@ -12,15 +12,30 @@ Classes:
 """
 
 import abc
-from typing import Any, Dict, Type, Callable, Optional
+from typing import Any, Dict, List, Type, Callable, Optional, Sequence
 
 from intakevms.libs.messaging import exceptions
-from intakevms.libs.messaging.config import get_messaging_type_and_transport
-from intakevms.libs.messaging.rpc.base import BaseRPCClient, BaseRPCServer
+from intakevms.libs.metrics.config import get_metrics_settings
+from intakevms.libs.messaging.config import (
+    get_rpc_pool_settings,
+    get_messaging_type_and_transport,
+)
+from intakevms.libs.metrics.exporter import start_metrics_server
+from intakevms.libs.messaging.rpc.base import (
+    RpcCall,
+    RpcResult,
+    BaseRPCClient,
+    BaseRPCServer,
+)
+from intakevms.libs.messaging.rpc.inproc_rpc import (
+    InProcRPCClient,
+    InProcRPCServer,
+)
 from intakevms.libs.messaging.rpc.rabbit_rpc import (
     RabbitRPCClient,
     RabbitRPCServer,
 )
+from intakevms.libs.messaging.rpc.rabbit_pool import PooledRabbitRPCClient
 
 
 class BaseAgentMessagingFabric(metaclass=abc.ABCMeta):
@@ -44,11 +59,18 @@ class ClientMessagingFabric(BaseAgentMessagingFabric):
     """Class for selecting a client."""
 
     @staticmethod
-    def get_rpc_agent(transport: str) -> Type[BaseRPCClient]:
+    def get_rpc_agent(
+        transport: str,
+        *,
+        pooled: bool = False,
+    ) -> Type[BaseRPCClient]:
         """Get the client class based on the transport method.
 
         Args:
-            transport (str): The transport method (e.g., 'rabbitmq').
+            transport (str): The transport method (e.g., 'rabbitmq' or
+                'inproc').
+            pooled (bool): Whether to return the client sharing the
+                process-wide connection pool.
 
         Returns:
             Type: The RPC client class.
@@ -58,8 +80,15 @@ class ClientMessagingFabric(BaseAgentMessagingFabric):
         """
         rpc_client_classes: Dict[str, Type[BaseRPCClient]] = {
             'rabbitmq': RabbitRPCClient,
+            'inproc': InProcRPCClient,
+        }
+        pooled_rpc_client_classes: Dict[str, Type[BaseRPCClient]] = {
+            'rabbitmq': PooledRabbitRPCClient,
+            'inproc': InProcRPCClient,
         }
         try:
+            if pooled:
+                return pooled_rpc_client_classes[transport]
             return rpc_client_classes[transport]
         except KeyError as err:
             raise exceptions.RpcServerInitializedException(str(err))
@@ -83,6 +112,7 @@ class ServerMessagingFabric(BaseAgentMessagingFabric):
         """
         rpc_server_classes: Dict[str, Type[BaseRPCServer]] = {
             'rabbitmq': RabbitRPCServer,
+            'inproc': InProcRPCServer,
         }
         try:
             return rpc_server_classes[transport]
@@ -99,11 +129,11 @@ class MessagingServer:
     Attributes:
         queue_name (str): Name of the server's message queue.
         manager (Type): Manager class to handle server-side operations.
+        messaging_type (str): Configured messaging type, e.g. `rpc`.
+        transport (str): Configured transport, e.g. `rabbitmq`.
         server (BaseRPCServer): Instance of the server class.
     """
 
-    messaging_type, transport = get_messaging_type_and_transport()
-
     def __init__(self, *, queue_name: str, manager: Callable) -> None:
         """Initialize the messaging server with the specified queue and manager.
 
@@ -117,6 +147,7 @@ class MessagingServer:
         """
         self.queue_name = queue_name
         self.manager = manager
+        self.messaging_type, self.transport = get_messaging_type_and_transport()
         if self.messaging_type == 'rpc':
             server_class = ServerMessagingFabric.get_rpc_agent(self.transport)
             self.server = server_class(self.queue_name, self.manager)
@@ -125,7 +156,14 @@ class MessagingServer:
             raise AttributeError(msg)
 
     def start(self) -> None:
-        """Start the server to listen for incoming messages."""
+        """Start the server to listen for incoming messages.
+
+        The metrics of the process are served on the port configured for
+        the queue in `[metrics.queues.<queue_name>]`, if any.
+        """
+        metrics_settings = get_metrics_settings(self.queue_name)
+        if metrics_settings.enabled and metrics_settings.port:
+            start_metrics_server(metrics_settings.host, metrics_settings.port)
         self.server.start()
 
 
@@ -134,16 +172,22 @@ class MessagingClient:
 
     This class initializes client based on the specified messaging
     type and transport, allowing method calls and asynchronous casts.
+    Each of them also has a coroutine counterpart (`acall`, `acast`) for
+    callers running in an event loop. `call_many` and `acall_many` send
+    several calls in a single request.
+    Unless disabled in the `[messaging.pool]` config section, the client
+    shares the long-lived connections of the process-wide pool.
 
     Attributes:
         queue_name (str): Name of the client's message queue.
         callback_queue_name (str): Name of the client's callback queue for RPC
             responses.
+        messaging_type (str): Configured messaging type, e.g. `rpc`.
+        transport (str): Configured transport, e.g. `rabbitmq`.
+        pool_settings (RpcPoolSettings): Configured connection pool.
         client (BaseRPCClient): Instance of the RPC client class.
     """
 
-    messaging_type, transport = get_messaging_type_and_transport()
-
     def __init__(
         self,
         *,
@@ -155,12 +199,16 @@ class MessagingClient:
         Args:
             queue_name (str): Name of the client's message queue.
             callback_queue_name (str): Optional name of the client's callback
-                queue for responses.
+                queue for responses. Only supported with the pool disabled.
         """
         self.queue_name = queue_name
         self.callback_queue_name = callback_queue_name
+        self.messaging_type, self.transport = get_messaging_type_and_transport()
+        self.pool_settings = get_rpc_pool_settings()
         if self.messaging_type == 'rpc':
-            client_class = ClientMessagingFabric.get_rpc_agent(self.transport)
+            client_class = ClientMessagingFabric.get_rpc_agent(
+                self.transport, pooled=self.pool_settings.enabled
+            )
             self.client = client_class(
                 self.queue_name,
                 self.callback_queue_name,
@@ -214,3 +262,97 @@ class MessagingClient:
             data_for_manager=data_for_manager,
             **kwargs,
         )
+
+    async def acall(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        **kwargs: Any,  # noqa: ANN401 if income specific args like timeout for Rabbit
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Call a method on the RPC server and await a response.
+
+        Args:
+            method_name (str): Name of the method to call on the server.
+            data_for_method (Optional[Dict]): Data to pass to the method.
+            data_for_manager (Optional[Dict]): Additional data for the manager.
+            **kwargs: Additional arguments for specific configurations
+                (e.g., timeout).
+
+        Returns:
+            Any: Response from the server.
+        """
+        return await self.client.acall(
+            method_name=method_name,
+            data_for_method=data_for_method,
+            data_for_manager=data_for_manager,
+            **kwargs,
+        )
+
+    async def acast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        **kwargs: Any,  # noqa: ANN401 if income specific args like timeout for Rabbit
+    ) -> None:
+        """Send a method to the RPC server from a coroutine without waiting.
+
+        Args:
+            method_name (str): Name of the method to invoke on the server.
+            data_for_method (Optional[Dict]): Data to pass to the method.
+            data_for_manager (Optional[Dict]): Additional data for the manager.
+            **kwargs: Additional arguments for specific configurations (e.g.,
+                timeout).
+        """
+        await self.client.acast(
+            method_name=method_name,
+            data_for_method=data_for_method,
+            data_for_manager=data_for_manager,
+            **kwargs,
+        )
+
+    def call_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        **kwargs: Any,  # noqa: ANN401 if income specific args like timeout for Rabbit
+    ) -> List[RpcResult]:
+        """Send several calls in one request and wait for their results.
+
+        Every call succeeds or fails on its own: use `RpcResult.result()` to
+        get the result of a call or raise its error.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently.
+            **kwargs: Additional arguments for specific configurations
+                (e.g., timeout).
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        return self.client.call_many(calls, parallel=parallel, **kwargs)
+
+    async def acall_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        **kwargs: Any,  # noqa: ANN401 if income specific args like timeout for Rabbit
+    ) -> List[RpcResult]:
+        """Send several calls in one request and await their results.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently.
+            **kwargs: Additional arguments for specific configurations
+                (e.g., timeout).
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        return await self.client.acall_many(calls, parallel=parallel, **kwargs)
@@ -0,0 +1,246 @@
+"""Metrics of the RPC clients and servers.
+
+RPC calls are measured on both sides, labelled by queue and method (`batch`
+for batch requests):
+
+    * `intakevms_rpc_client_duration_seconds`: end-to-end latency of calls,
+      as seen by the caller, timeouts included.
+    * `intakevms_rpc_client_request_bytes`, `..._reply_bytes`: payload sizes
+      sent and received by the caller.
+    * `intakevms_rpc_server_queue_wait_seconds`: time between the publishing
+      of a request and its consumption by the server, i.e. time spent in the
+      broker queue. Requests of clients not setting the `x-published-at`
+      header are not measured.
+    * `intakevms_rpc_server_handler_seconds`: time spent handling requests,
+      manager construction, database and domain calls included. In the
+      process mode, the wait for a free process is included too.
+    * `intakevms_rpc_server_request_bytes`, `..._reply_bytes`: payload sizes
+      received and sent by the server.
+    * `intakevms_rpc_server_expired_total`: requests dropped unhandled
+      because their deadline had passed, see `deadlines`.
+    * `intakevms_rpc_server_late_replies_total`: requests handled, but
+      replied to after their deadline.
+
+Replies received by a client after it stopped waiting are counted by
+`intakevms_rpc_client_dropped_replies_total`.
+
+Calls issued while `record_client_calls` is active are also collected,
+e.g. by the web application for the RPC breakdown of a slow request.
+
+Usage example:
+    headers = published_at_header()
+    ...
+    observe_queue_wait(queue_name, method, props.headers)
+
+Functions:
+    request_method: Returns the method label of a request.
+    published_at_header: Returns the header carrying the publishing time.
+    observe_client_call: Records a call issued by a client.
+    observe_queue_wait: Records the time a request spent in the queue.
+    observe_server_request: Records a request handled by a server.
+    observe_expired: Records a request dropped because of its deadline.
+    observe_dropped_reply: Records a reply nobody waited for.
+    record_client_calls: Collects the calls issued in the current context.
+"""
+
+import time
+import contextlib
+from typing import Dict, List, Tuple, Mapping, Iterator, Optional
+from contextvars import ContextVar
+
+from intakevms.libs.messaging import deadlines
+from intakevms.libs.metrics.registry import REGISTRY, SIZE_BUCKETS
+
+# Header carrying the time a request was published, in seconds since epoch.
+PUBLISHED_AT_HEADER = 'x-published-at'
+
+LABELS = ('queue', 'method')
+
+# Calls of the current context, as (queue, method, seconds), if recorded.
+_RECORDED_CALLS: ContextVar[Optional[List[Tuple[str, str, float]]]] = (
+    ContextVar('recorded_rpc_calls', default=None)
+)
+
+CLIENT_DURATION = REGISTRY.histogram(
+    'intakevms_rpc_client_duration_seconds',
+    'End-to-end latency of RPC calls.',
+    LABELS,
+)
+CLIENT_REQUEST_BYTES = REGISTRY.histogram(
+    'intakevms_rpc_client_request_bytes',
+    'Size of the RPC requests sent by clients.',
+    LABELS,
+    SIZE_BUCKETS,
+)
+CLIENT_REPLY_BYTES = REGISTRY.histogram(
+    'intakevms_rpc_client_reply_bytes',
+    'Size of the RPC replies received by clients.',
+    LABELS,
+    SIZE_BUCKETS,
+)
+SERVER_QUEUE_WAIT = REGISTRY.histogram(
+    'intakevms_rpc_server_queue_wait_seconds',
+    'Time RPC requests waited in the queue before being consumed.',
+    LABELS,
+)
+SERVER_HANDLER = REGISTRY.histogram(
+    'intakevms_rpc_server_handler_seconds',
+    'Time spent handling RPC requests.',
+    LABELS,
+)
+SERVER_REQUEST_BYTES = REGISTRY.histogram(
+    'intakevms_rpc_server_request_bytes',
+    'Size of the RPC requests received by servers.',
+    LABELS,
+    SIZE_BUCKETS,
+)
+SERVER_REPLY_BYTES = REGISTRY.histogram(
+    'intakevms_rpc_server_reply_bytes',
+    'Size of the RPC replies sent by servers.',
+    LABELS,
+    SIZE_BUCKETS,
+)
+SERVER_EXPIRED = REGISTRY.counter(
+    'intakevms_rpc_server_expired_total',
+    'RPC requests dropped unhandled because their deadline had passed.',
+    LABELS,
+)
+SERVER_LATE_REPLIES = REGISTRY.counter(
+    'intakevms_rpc_server_late_replies_total',
+    'RPC requests replied to after their deadline.',
+    LABELS,
+)
+CLIENT_DROPPED_REPLIES = REGISTRY.counter(
+    'intakevms_rpc_client_dropped_replies_total',
+    'RPC replies received after the caller stopped waiting.',
+)
+
+
+def request_method(request: Mapping) -> str:
+    """Get the method label of a request.
+
+    Args:
+        request (Mapping): The body of the request.
+
+    Returns:
+        str: The called method, `batch` for batch requests.
+    """
+    if 'batch' in request:
+        return 'batch'
+    return str(request.get('method_name'))
+
+
+def published_at_header() -> Dict[str, float]:
+    """Get the header carrying the publishing time of a request.
+
+    Returns:
+        Dict[str, float]: The headers to set on the request.
+    """
+    return {PUBLISHED_AT_HEADER: time.time()}
+
+
+def observe_client_call(
+    queue_name: str,
+    method: str,
+    started: float,
+    request: bytes,
+    reply: Optional[bytes],
+) -> None:
+    """Record a call issued by a client.
+
+    Args:
+        queue_name (str): The queue the request was sent to.
+        method (str): The method label of the request.
+        started (float): `time.perf_counter()` before sending the request.
+        request (bytes): The serialized request.
+        reply (Optional[bytes]): The serialized reply, `None` if the call
+            failed without reply.
+    """
+    duration = time.perf_counter() - started
+    CLIENT_DURATION.observe(duration, queue_name, method)
+    recorded = _RECORDED_CALLS.get()
+    if recorded is not None:
+        recorded.append((queue_name, method, duration))
+    CLIENT_REQUEST_BYTES.observe(len(request), queue_name, method)
+    if reply is not None:
+        CLIENT_REPLY_BYTES.observe(len(reply), queue_name, method)
+
+
+def observe_queue_wait(
+    queue_name: str,
+    method: str,
+    headers: Optional[Mapping],
+) -> None:
+    """Record the time a request spent in the queue.
+
+    Args:
+        queue_name (str): The queue the request was consumed from.
+        method (str): The method label of the request.
+        headers (Optional[Mapping]): The headers of the request.
+    """
+    published_at = (headers or {}).get(PUBLISHED_AT_HEADER)
+    if published_at is None:
+        return
+    SERVER_QUEUE_WAIT.observe(
+        max(time.time() - float(published_at), 0.0), queue_name, method
+    )
+
+
+def observe_server_request(  # noqa: PLR0913 leading arguments are bound by the servers
+    queue_name: str,
+    method: str,
+    started: float,
+    request: bytes,
+    reply: bytes,
+    *,
+    deadline: Optional[float] = None,
+) -> None:
+    """Record a request handled by a server.
+
+    Args:
+        queue_name (str): The queue the request was consumed from.
+        method (str): The method label of the request.
+        started (float): `time.perf_counter()` before handling the request.
+        request (bytes): The serialized request.
+        reply (bytes): The serialized reply.
+        deadline (Optional[float]): The deadline of the request.
+    """
+    SERVER_HANDLER.observe(time.perf_counter() - started, queue_name, method)
+    SERVER_REQUEST_BYTES.observe(len(request), queue_name, method)
+    SERVER_REPLY_BYTES.observe(len(reply), queue_name, method)
+    if deadlines.is_expired(deadline):
+        SERVER_LATE_REPLIES.inc(queue_name, method)
+
+
+def observe_expired(queue_name: str, method: str) -> None:
+    """Record a request dropped because its deadline had passed.
+
+    Args:
+        queue_name (str): The queue the request was consumed from.
+        method (str): The method label of the request.
+    """
+    SERVER_EXPIRED.inc(queue_name, method)
+
+
+def observe_dropped_reply() -> None:
+    """Record a reply received after the caller stopped waiting."""
+    CLIENT_DROPPED_REPLIES.inc()
+
+
+@contextlib.contextmanager
+def record_client_calls() -> Iterator[List[Tuple[str, str, float]]]:
+    """Collect the calls issued by clients in the current context.
+
+    The context is inherited by the threads running sync code, e.g. with
+    `run_in_threadpool`, so calls issued there are collected too.
+
+    Yields:
+        List[Tuple[str, str, float]]: The queue, method and duration in
+            seconds of every call, filled as calls complete.
+    """
+    calls: List[Tuple[str, str, float]] = []
+    token = _RECORDED_CALLS.set(calls)
+    try:
+        yield calls
+    finally:
+        _RECORDED_CALLS.reset(token)
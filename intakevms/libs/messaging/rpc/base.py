@@ -3,13 +3,145 @@
 This module contains basic classes (interfaces) to create specific
 implementations of RPC entity classes
 
+A batch request carries several calls in one message, so fanning out over
+N objects costs one round-trip instead of N:
+
+    request: {'batch': [{'method_name': ..., 'data_for_method': ...,
+              'data_for_manager': ..., 'time_limit': ...}, ...],
+              'parallel': bool}
+    reply:   {'data': [{'data': ...} or {'err': ...}, ...]}
+
+Every call of the batch succeeds or fails on its own, within its own time
+limit if it has one, and the results are returned in the order of the
+calls. The time limit of the whole request is sized with
+`batch_time_limit`, so that a slow call does not fail the other ones.
+
 Classes:
+    RpcCall: A call of a batch request.
+    RpcResult: The result of a call of a batch request.
     BaseRPCClient: Base class for implementing an RPC client.
     BaseRPCServer: Base class for implementing an RPC server.
+
+Functions:
+    batch_time_limit: Returns the time limit of a batch request.
+    build_batch_request: Builds the body of a batch request.
+    parse_batch_reply: Parses the data of the reply to a batch request.
 """
 
+import math
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, NamedTuple
+
+from intakevms.libs.messaging.exceptions import RpcCallException
+
+# Seconds kept from the deadline of a batch request by the server, to reply
+# with the results of the finished calls before the caller stops waiting.
+BATCH_REPLY_MARGIN = 1
+
+
+class RpcCall(NamedTuple):
+    """A call of a batch request.
+
+    Attributes:
+        method_name (str): The name of the method to call on the server.
+        data_for_method (Optional[Dict]): The data for the method.
+        data_for_manager (Optional[Dict]): The data for initializing the
+            manager.
+        time_limit (Optional[float]): Seconds the call may run once
+            started, `None` to be bounded by the request only.
+    """
+
+    method_name: str
+    data_for_method: Optional[Dict] = None
+    data_for_manager: Optional[Dict] = None
+    time_limit: Optional[float] = None
+
+
+class RpcResult(NamedTuple):
+    """The result of a call of a batch request.
+
+    Attributes:
+        data (Any): The result of the method, `None` if the call failed.
+        err (Optional[str]): The error of the call, `None` if it succeeded.
+    """
+
+    data: Any = None
+    err: Optional[str] = None
+
+    def result(self) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Get the result of the call.
+
+        Returns:
+            Any: The result of the method.
+
+        Raises:
+            RpcCallException: If the call failed on the server.
+        """
+        if self.err:
+            raise RpcCallException(self.err)
+        return self.data
+
+
+def batch_time_limit(calls: Sequence[RpcCall], workers: int) -> int:
+    """Get the time limit of a batch request of calls with time limits.
+
+    The server runs at most `workers` calls at a time, so the calls may run
+    in as many waves, each as long as the longest time limit, and the
+    server replies `BATCH_REPLY_MARGIN` seconds before the deadline of the
+    request.
+
+    Args:
+        calls (Sequence[RpcCall]): The calls of the batch.
+        workers (int): Maximum number of calls run concurrently by the
+            server, its `batch_workers` setting.
+
+    Returns:
+        int: The time limit of the request, in seconds.
+    """
+    longest = max((call.time_limit or 0 for call in calls), default=0)
+    waves = math.ceil(len(calls) / max(workers, 1))
+    return math.ceil(longest * waves) + BATCH_REPLY_MARGIN
+
+
+def build_batch_request(
+    calls: Sequence[RpcCall],
+    *,
+    parallel: bool = False,
+) -> Dict:
+    """Build the body of a batch request.
+
+    Args:
+        calls (Sequence[RpcCall]): The calls of the batch.
+        parallel (bool): Whether the server may run the calls concurrently.
+
+    Returns:
+        Dict: The body of the request.
+    """
+    return {
+        'batch': [call._asdict() for call in calls],
+        'parallel': parallel,
+    }
+
+
+def parse_batch_reply(data: Any) -> List[RpcResult]:  # noqa: ANN401 decoded reply
+    """Parse the data of the reply to a batch request.
+
+    Args:
+        data (Any): The `data` part of the reply.
+
+    Returns:
+        List[RpcResult]: The results, in the order of the calls.
+
+    Raises:
+        RpcCallException: If the reply is not the reply to a batch request,
+            e.g. when the server does not support them.
+    """
+    if not isinstance(data, list):
+        msg = 'Unexpected reply to an RPC batch request'
+        raise RpcCallException(msg)
+    return [
+        RpcResult(data=item.get('data'), err=item.get('err')) for item in data
+    ]
 
 
 class BaseRPCClient(metaclass=ABCMeta):
@@ -45,6 +177,46 @@ class BaseRPCClient(metaclass=ABCMeta):
         """Sends a request to the RPC server without waiting for a response."""
         ...
 
+    @abstractmethod
+    async def acall(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Sends a request to the RPC server and awaits the response."""
+        ...
+
+    @abstractmethod
+    async def acast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+    ) -> None:
+        """Sends a request to the RPC server from a coroutine."""
+        ...
+
+    @abstractmethod
+    def call_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+    ) -> List[RpcResult]:
+        """Sends several calls in one request and waits for their results."""
+        ...
+
+    @abstractmethod
+    async def acall_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+    ) -> List[RpcResult]:
+        """Sends several calls in one request and awaits their results."""
+        ...
+
 
 class BaseRPCServer(metaclass=ABCMeta):
     """Base class for implementing an RPC server."""
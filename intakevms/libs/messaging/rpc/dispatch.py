@@ -0,0 +1,467 @@
+"""Execution of RPC requests by the managers of a server.
+
+This module is shared by the RPC servers of all transports: it executes
+single and batch requests on a manager and serializes the replies, and it
+creates the worker pool configured for the queue of a server.
+
+Every call of a batch may carry its own `time_limit`, counted from the time
+it starts: a call exceeding it is replied as an error, without waiting for
+it, while the results of the other calls are kept. The calls of parallel
+batches are run by a pool of threads shared by the batches of the process.
+
+Functions:
+    execute_request: Executes a manager method and serializes the reply.
+    execute_calls: Executes calls, each within its own time limit.
+    execute_batch: Executes the calls of a batch request.
+    handle_request: Executes a single or a batch request.
+    execute_in_process: Executes a request in a process worker.
+    create_executor: Creates the worker pool configured for a queue.
+"""
+
+import time
+import threading
+import multiprocessing
+from typing import Dict, List, Callable, Optional, cast
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    Executor,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    wait,
+)
+
+from intakevms.libs.messaging import deadlines
+from intakevms.libs.query_counting import count_queries, observe_queries
+from intakevms.libs.messaging.codecs import BaseCodec, get_codec
+from intakevms.libs.messaging.config import RpcServerSettings
+from intakevms.libs.messaging.managers import ManagerProvider
+from intakevms.libs.messaging.rpc.base import BATCH_REPLY_MARGIN
+
+# Longest wait for the calls of a parallel batch between deadline checks.
+_BATCH_POLL_SECONDS = 1.0
+
+# Managers of a process worker, set once by `_init_process_worker`.
+_process_managers: Optional[ManagerProvider] = None
+
+# Pools running the calls of parallel batches, by size.
+_batch_executors: Dict[int, ThreadPoolExecutor] = {}
+_batch_executors_lock = threading.Lock()
+
+
+def _execute_call(
+    managers: ManagerProvider,
+    method_name: str,
+    data_for_method: Optional[Dict],
+    data_for_manager: Optional[Dict],
+) -> Dict:
+    """Execute a manager method.
+
+    The SQL statements issued by the method are logged and measured, see
+    `query_counting`.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose method will
+            be executed.
+        method_name (str): The name of the method to execute.
+        data_for_method (Optional[Dict]): The data for the method.
+        data_for_manager (Optional[Dict]): The data for the manager.
+
+    Returns:
+        Dict: Reply with either `data` or `err`.
+    """
+    with count_queries() as stats:
+        try:
+            inited_manager = managers.get(data_for_manager)
+            managers_method = getattr(inited_manager, method_name)
+            result = (
+                managers_method(data_for_method)
+                if data_for_method
+                else managers_method()
+            )
+        except Exception as err:  # noqa: BLE001 because it's catching all exceptions
+            return {'err': str(err)}
+        finally:
+            observe_queries(method_name, stats)
+    return {'data': result}
+
+
+def _encode_reply(reply: Dict, codec: BaseCodec) -> bytes:
+    """Serialize a reply, replacing it with an error if it cannot be encoded.
+
+    Args:
+        reply (Dict): The reply to the client.
+        codec (BaseCodec): Codec of the reply.
+
+    Returns:
+        bytes: Serialized reply.
+    """
+    try:
+        return codec.encode(reply)
+    except TypeError as err:
+        return codec.encode({'err': str(err)})
+
+
+def execute_request(
+    managers: ManagerProvider,
+    method_name: str,
+    data_for_method: Optional[Dict],
+    data_for_manager: Optional[Dict],
+    codec: BaseCodec,
+) -> bytes:
+    """Execute a manager method and serialize the reply to the client.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose method will
+            be executed.
+        method_name (str): The name of the method to execute.
+        data_for_method (Optional[Dict]): The data for the method.
+        data_for_manager (Optional[Dict]): The data for the manager.
+        codec (BaseCodec): Codec of the reply.
+
+    Returns:
+        bytes: Serialized reply with either `data` or `err`.
+    """
+    return _encode_reply(
+        _execute_call(managers, method_name, data_for_method, data_for_manager),
+        codec,
+    )
+
+
+def _get_batch_executor(workers: int) -> ThreadPoolExecutor:
+    """Get the pool running the calls of parallel batches.
+
+    Args:
+        workers (int): Maximum number of calls run concurrently.
+
+    Returns:
+        ThreadPoolExecutor: The pool of this size, created on first use.
+    """
+    with _batch_executors_lock:
+        executor = _batch_executors.get(workers)
+        if executor is None:
+            executor = _batch_executors[workers] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='rpc-batch'
+            )
+        return executor
+
+
+def _call_deadline(call: Dict, deadline: Optional[float]) -> Optional[float]:
+    """Get the deadline of a call of a batch starting now.
+
+    Args:
+        call (Dict): The call, see `build_batch_request`.
+        deadline (Optional[float]): The deadline of the batch.
+
+    Returns:
+        Optional[float]: The earliest of the time limit of the call and the
+            deadline of the batch.
+    """
+    time_limit = call.get('time_limit')
+    if time_limit is None:
+        return deadline
+    call_deadline = time.time() + float(time_limit)
+    return call_deadline if deadline is None else min(call_deadline, deadline)
+
+
+def _execute_batch_call(
+    managers: ManagerProvider,
+    call: Dict,
+    deadline: Optional[float],
+) -> Dict:
+    """Execute a call of a batch within its deadline.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose method
+            will be executed.
+        call (Dict): The call, see `build_batch_request`.
+        deadline (Optional[float]): The deadline of the call.
+
+    Returns:
+        Dict: Reply with either `data` or `err`.
+    """
+    with deadlines.deadline_scope(deadline):
+        return _execute_call(
+            managers,
+            call.get('method_name', ''),
+            call.get('data_for_method'),
+            call.get('data_for_manager'),
+        )
+
+
+def _timed_out(call: Dict) -> Dict:
+    """Get the reply of a call of a batch that exceeded its deadline.
+
+    Args:
+        call (Dict): The call, see `build_batch_request`.
+
+    Returns:
+        Dict: Reply with the `err` of the call.
+    """
+    return {
+        'err': f"Call of {call.get('method_name', '')} exceeded its deadline"
+    }
+
+
+def _finished_reply(
+    future: Future,
+    call: Dict,
+    deadline: Optional[float],
+) -> Optional[Dict]:
+    """Get the reply of a call of a parallel batch, once it is known.
+
+    Args:
+        future (Future): The running or queued call.
+        call (Dict): The call, see `build_batch_request`.
+        deadline (Optional[float]): The deadline of the call.
+
+    Returns:
+        Optional[Dict]: The reply of the call if it finished, an error if
+            it exceeded its deadline, `None` while it runs.
+    """
+    if future.done():
+        return cast(Dict, future.result())
+    if deadlines.is_expired(deadline):
+        future.cancel()
+        return _timed_out(call)
+    return None
+
+
+def _execute_parallel(
+    managers: ManagerProvider,
+    calls: List[Dict],
+    workers: int,
+    deadline: Optional[float],
+) -> List[Dict]:
+    """Execute calls concurrently, each within its own deadline.
+
+    Calls exceeding their deadline are abandoned: their thread is not
+    interrupted, but the batch does not wait for them, and calls not
+    started yet are cancelled once the deadline of the batch has passed.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose methods
+            will be executed.
+        calls (List[Dict]): The calls, see `build_batch_request`.
+        workers (int): Maximum number of calls run concurrently.
+        deadline (Optional[float]): The deadline of the batch.
+
+    Returns:
+        List[Dict]: Reply of every call, in the order of the calls.
+    """
+    call_deadlines: Dict[int, Optional[float]] = {}
+
+    def execute(index: int) -> Dict:
+        call_deadlines[index] = _call_deadline(calls[index], deadline)
+        return _execute_batch_call(
+            managers, calls[index], call_deadlines[index]
+        )
+
+    executor = _get_batch_executor(workers)
+    pending = {
+        index: executor.submit(execute, index) for index in range(len(calls))
+    }
+    results: Dict[int, Dict] = {}
+    while pending:
+        for index, future in list(pending.items()):
+            reply = _finished_reply(
+                future, calls[index], call_deadlines.get(index, deadline)
+            )
+            if reply is not None:
+                results[index] = reply
+                del pending[index]
+        wait(
+            pending.values(),
+            timeout=_BATCH_POLL_SECONDS,
+            return_when=FIRST_COMPLETED,
+        )
+    return [results[index] for index in range(len(calls))]
+
+
+def execute_calls(
+    managers: ManagerProvider,
+    calls: List[Dict],
+    *,
+    parallel: bool = False,
+    workers: int = 1,
+    deadline: Optional[float] = None,
+) -> List[Dict]:
+    """Execute calls, each within its own time limit.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose methods
+            will be executed.
+        calls (List[Dict]): The calls, see `build_batch_request`.
+        parallel (bool): Whether to run the calls concurrently.
+        workers (int): Maximum number of calls run concurrently.
+        deadline (Optional[float]): The deadline of all the calls: calls
+            not finished by then are replied as errors.
+
+    Returns:
+        List[Dict]: Reply with either `data` or `err` of every call, in the
+            order of the calls.
+    """
+    if parallel and workers > 1 and len(calls) > 1:
+        return _execute_parallel(managers, calls, workers, deadline)
+    return [
+        _timed_out(call)
+        if deadlines.is_expired(deadline)
+        else _execute_batch_call(managers, call, _call_deadline(call, deadline))
+        for call in calls
+    ]
+
+
+def execute_batch(
+    managers: ManagerProvider,
+    calls: List[Dict],
+    codec: BaseCodec,
+    *,
+    parallel: bool = False,
+    workers: int = 1,
+) -> bytes:
+    """Execute the calls of a batch request and serialize their results.
+
+    Parallel batches are run by the pool of threads of the batches of the
+    process, so they never wait for the workers of the server handling the
+    request. The batch is replied `BATCH_REPLY_MARGIN` seconds before the
+    deadline of the request, with the results of the finished calls.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose methods
+            will be executed.
+        calls (List[Dict]): The calls, see `build_batch_request`.
+        codec (BaseCodec): Codec of the reply.
+        parallel (bool): Whether to run the calls concurrently.
+        workers (int): Maximum number of calls run concurrently.
+
+    Returns:
+        bytes: Serialized reply whose `data` holds the `data` or `err` of
+            every call, in the order of the calls.
+    """
+    deadline = deadlines.get_deadline()
+    results = execute_calls(
+        managers,
+        calls,
+        parallel=parallel,
+        workers=workers,
+        deadline=None if deadline is None else deadline - BATCH_REPLY_MARGIN,
+    )
+    return _encode_reply({'data': results}, codec)
+
+
+def handle_request(
+    managers: ManagerProvider,
+    request: Dict,
+    codec: BaseCodec,
+    batch_workers: int = 1,
+    deadline: Optional[float] = None,
+) -> bytes:
+    """Execute a single or a batch request and serialize the reply.
+
+    The request is handled within the scope of its deadline, see
+    `deadlines`. A request that expired while waiting for a worker is not
+    executed.
+
+    Args:
+        managers (ManagerProvider): Provider of the manager whose methods
+            will be executed.
+        request (Dict): The deserialized request.
+        codec (BaseCodec): Codec of the reply.
+        batch_workers (int): Maximum number of calls of a parallel batch
+            run concurrently.
+        deadline (Optional[float]): The deadline of the request.
+
+    Returns:
+        bytes: Serialized reply.
+    """
+    if deadlines.is_expired(deadline):
+        return _encode_reply(
+            {'err': 'Deadline exceeded before the request was handled'},
+            codec,
+        )
+    with deadlines.deadline_scope(deadline):
+        if 'batch' in request:
+            return execute_batch(
+                managers,
+                request['batch'],
+                codec,
+                parallel=bool(request.get('parallel')),
+                workers=batch_workers,
+            )
+        return execute_request(
+            managers,
+            request.get('method_name', ''),
+            request.get('data_for_method', {}),
+            request.get('data_for_manager', {}),
+            codec,
+        )
+
+
+def _init_process_worker(manager: Callable) -> None:
+    """Set up the managers of a process worker of the RPC server.
+
+    Args:
+        manager (Callable): The manager class whose methods will be executed.
+    """
+    global _process_managers  # noqa: PLW0603 set once per worker process
+    _process_managers = ManagerProvider(manager)
+
+
+def execute_in_process(
+    request: Dict,
+    content_type: str,
+    batch_workers: int,
+    deadline: Optional[float] = None,
+) -> bytes:
+    """Execute a request with the manager of the process worker.
+
+    Args:
+        request (Dict): The deserialized request.
+        content_type (str): Content type of the reply.
+        batch_workers (int): Maximum number of calls of a parallel batch
+            run concurrently.
+        deadline (Optional[float]): The deadline of the request.
+
+    Returns:
+        bytes: Serialized reply.
+    """
+    return handle_request(
+        cast(ManagerProvider, _process_managers),
+        request,
+        get_codec(content_type),
+        batch_workers,
+        deadline,
+    )
+
+
+def create_executor(
+    queue_name: str,
+    manager: Callable,
+    settings: RpcServerSettings,
+) -> Optional[Executor]:
+    """Create the worker pool configured for the queue of a server.
+
+    Process workers are spawned rather than forked, so they do not
+    inherit the connections and database engines of the server.
+
+    Args:
+        queue_name (str): Name of the queue consumed by the server.
+        manager (Callable): The manager class whose methods will be executed.
+        settings (RpcServerSettings): Settings of the server of the queue.
+
+    Returns:
+        Optional[Executor]: The worker pool, `None` in the inline mode.
+    """
+    if settings.mode == 'thread':
+        return ThreadPoolExecutor(
+            max_workers=settings.workers,
+            thread_name_prefix=f'rpc-{queue_name}',
+        )
+    if settings.mode == 'process':
+        return ProcessPoolExecutor(
+            max_workers=settings.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_process_worker,
+            initargs=(manager,),
+        )
+    return None
@@ -0,0 +1,747 @@
+"""In-process RPC client and server implementation module.
+
+This module provides an RPC transport for single-node deployments and tests,
+where the clients and servers of a queue run in the same process. Messages
+are exchanged through the process-wide `InProcBroker` instead of RabbitMQ,
+so a call costs no network round-trip and needs no broker.
+
+The semantics of the RabbitMQ transport are kept: requests and replies are
+encoded with the configured codec, so the manager gets its own copy of the
+data and callers get the same types as over the network; requests of a
+queue are delivered by priority (higher first) and in order of arrival;
+`call` raises `RpcCallTimeoutException` once the time limit is exceeded, and
+a request whose caller gave up waiting is not executed anymore. Requests are
+handled within the scope of their deadline, see `deadlines`.
+
+Select it with `transport = 'inproc'` in the `[messaging]` section. The
+servers must be created in the process using the clients, before them: the
+services started as separate processes cannot be reached, so a client of a
+queue without an in-process server fails on creation instead of timing out
+on every call.
+
+Usage example:
+    server = InProcRPCServer('queue_name', Manager)
+    threading.Thread(target=server.start, daemon=True).start()
+
+    rpc_client = InProcRPCClient('queue_name')
+    result = rpc_client.call('manager_method_name', data_for_method)
+
+    server.stop()
+
+Classes:
+    InProcMessage: A message of the in-process transport.
+    InProcBroker: Process-wide queues of the in-process transport.
+    InProcRPCClient: RPC client of the in-process transport.
+    InProcRPCServer: RPC server of the in-process transport.
+"""
+
+import queue
+import asyncio
+import itertools
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Counter,
+    Callable,
+    ClassVar,
+    Optional,
+    Sequence,
+    cast,
+)
+from functools import partial
+from dataclasses import dataclass
+from concurrent.futures import (
+    Future,
+    Executor,
+    TimeoutError as FutureTimeoutError,
+)
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.messaging import deadlines
+from intakevms.libs.messaging.codecs import (
+    BaseCodec,
+    get_codec,
+    get_default_codec,
+)
+from intakevms.libs.messaging.config import get_rpc_server_settings
+from intakevms.libs.messaging.managers import ManagerProvider
+from intakevms.libs.messaging.rpc.base import (
+    RpcCall,
+    RpcResult,
+    BaseRPCClient,
+    BaseRPCServer,
+    parse_batch_reply,
+    build_batch_request,
+)
+from intakevms.libs.messaging.exceptions import (
+    RpcCallException,
+    RpcCallTimeoutException,
+    RpcClientInitializedException,
+    RpcDeserializeMessageException,
+)
+from intakevms.libs.messaging.rpc.dispatch import (
+    handle_request,
+    create_executor,
+    execute_in_process,
+)
+
+LOG = get_logger(__name__)
+
+# Body and content type of a reply.
+Reply = Tuple[bytes, Optional[str]]
+
+# Interval at which a consuming server checks whether it was stopped.
+STOP_CHECK_INTERVAL = 0.5
+
+
+@dataclass(frozen=True)
+class InProcMessage:
+    """A message of the in-process transport.
+
+    Attributes:
+        body (bytes): The encoded request.
+        content_type (str): Content type of the request.
+        reply (Optional[Future]): Future receiving the reply, `None` for
+            messages sent by `cast`.
+        deadline (Optional[float]): Deadline of the request, in seconds
+            since epoch, `None` for messages sent by `cast`.
+    """
+
+    body: bytes
+    content_type: str
+    reply: Optional[Future] = None
+    deadline: Optional[float] = None
+
+
+class InProcBroker:
+    """Process-wide queues of the in-process transport.
+
+    Every queue is a priority queue: messages with a higher priority are
+    delivered first, messages with the same priority in order of arrival.
+    The broker also counts the servers of every queue.
+    """
+
+    _instance: ClassVar[Optional['InProcBroker']] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize the broker without queues."""
+        self._queues: Dict[str, queue.PriorityQueue] = {}
+        self._consumers: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    @classmethod
+    def instance(cls) -> 'InProcBroker':
+        """Get the broker of the current process.
+
+        Returns:
+            InProcBroker: The broker.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def queue(self, queue_name: str) -> queue.PriorityQueue:
+        """Get a queue, declaring it on first use.
+
+        Args:
+            queue_name (str): The name of the queue.
+
+        Returns:
+            queue.PriorityQueue: The queue.
+        """
+        with self._lock:
+            return self._queues.setdefault(queue_name, queue.PriorityQueue())
+
+    def add_consumer(self, queue_name: str) -> None:
+        """Register a server of a queue.
+
+        Args:
+            queue_name (str): The name of the queue.
+        """
+        with self._lock:
+            self._consumers[queue_name] += 1
+
+    def remove_consumer(self, queue_name: str) -> None:
+        """Unregister a server of a queue.
+
+        Args:
+            queue_name (str): The name of the queue.
+        """
+        with self._lock:
+            self._consumers[queue_name] -= 1
+            if self._consumers[queue_name] <= 0:
+                del self._consumers[queue_name]
+
+    def has_consumer(self, queue_name: str) -> bool:
+        """Check whether a queue has a server in this process.
+
+        Args:
+            queue_name (str): The name of the queue.
+
+        Returns:
+            bool: True if a server of the queue was created and not stopped.
+        """
+        with self._lock:
+            return self._consumers[queue_name] > 0
+
+    def publish(
+        self,
+        queue_name: str,
+        message: InProcMessage,
+        priority: int,
+    ) -> None:
+        """Put a message on a queue.
+
+        Args:
+            queue_name (str): The name of the queue.
+            message (InProcMessage): The message.
+            priority (int): The priority of the message.
+        """
+        self.queue(queue_name).put((-priority, next(self._counter), message))
+
+
+class InProcRPCClient(BaseRPCClient):
+    """RPC client of the in-process transport.
+
+    Attributes:
+        queue_name (str): Name of the queue to send messages to.
+        broker (InProcBroker): The broker of the current process.
+        codec (BaseCodec): Codec of the requests.
+    """
+
+    def __init__(self, queue_name: str, callback_queue_name: str = ''):
+        """Initialize the client for a specific queue.
+
+        Args:
+            queue_name (str): The name of the queue to send messages to.
+            callback_queue_name (str): Unused, replies are set on a future.
+                Kept for interface compatibility with `RabbitRPCClient`.
+
+        Raises:
+            RpcClientInitializedException: If no server of the queue runs in
+                this process.
+        """
+        self.queue_name = queue_name
+        self.callback_queue_name = callback_queue_name
+        self.broker = InProcBroker.instance()
+        if not self.broker.has_consumer(queue_name):
+            msg = (
+                f'No in-process server of {queue_name}: the inproc '
+                f'transport needs the servers in the process of the clients'
+            )
+            raise RpcClientInitializedException(msg)
+        self.codec = get_default_codec()
+
+    def _encode(self, request: Dict) -> bytes:
+        """Serialize the body of a request.
+
+        Args:
+            request (Dict): The body of the request.
+
+        Returns:
+            bytes: The serialized request.
+
+        Raises:
+            RpcCallException: If the request cannot be serialized.
+        """
+        try:
+            return self.codec.encode(request)
+        except TypeError as err:
+            msg = f'Error serializing RPC request: {err}'
+            raise RpcCallException(msg)
+
+    def _publish(
+        self,
+        request: Dict,
+        priority: int,
+        *,
+        deadline: Optional[float] = None,
+    ) -> Optional[Future]:
+        """Put a request on the queue of the client.
+
+        Args:
+            request (Dict): The body of the request.
+            priority (int): The priority of the message.
+            deadline (Optional[float]): Deadline of the request, `None` if no
+                reply is expected.
+
+        Returns:
+            Optional[Future]: Future receiving the reply, `None` if no reply
+                is expected.
+        """
+        future: Optional[Future] = None if deadline is None else Future()
+        self.broker.publish(
+            self.queue_name,
+            InProcMessage(
+                self._encode(request),
+                self.codec.content_type,
+                future,
+                deadline,
+            ),
+            priority,
+        )
+        return future
+
+    def on_response(
+        self,
+        body: bytes,
+        content_type: Optional[str] = None,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Process the reply of the RPC server.
+
+        Args:
+            body (bytes): The body of the reply.
+            content_type (Optional[str]): Content type of the reply.
+
+        Returns:
+            Any: The `data` part of the reply.
+
+        Raises:
+            RpcDeserializeMessageException: If the reply cannot be parsed.
+            RpcCallException: If the RPC server returned an error.
+        """
+        try:
+            response = get_codec(content_type).decode(body)
+        except ValueError as err:
+            raise RpcDeserializeMessageException(str(err))
+        if response.get('err'):
+            raise RpcCallException(str(response['err']))
+        return response.get('data', {})
+
+    def _request(
+        self,
+        request: Dict,
+        priority: int,
+        time_limit: float,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request and wait for the reply.
+
+        Args:
+            request (Dict): The body of the request.
+            priority (int): The priority of the message.
+            time_limit (float): The time limit for waiting for the reply.
+
+        Returns:
+            Any: The `data` part of the reply.
+
+        Raises:
+            RpcCallTimeoutException: If the reply is not received within the
+                time limit.
+        """
+        deadline = deadlines.call_deadline(time_limit)
+        future = self._publish(request, priority, deadline=deadline)
+        try:
+            reply: Reply = future.result(  # type: ignore[union-attr]
+                timeout=deadlines.time_left(deadline)
+            )
+        except FutureTimeoutError:
+            future.cancel()  # type: ignore[union-attr]
+            message = f'No reply from {self.queue_name} in {time_limit}s'
+            raise RpcCallTimeoutException(message)
+        return self.on_response(*reply)
+
+    async def _arequest(
+        self,
+        request: Dict,
+        priority: int,
+        time_limit: float,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request and await the reply.
+
+        Args:
+            request (Dict): The body of the request.
+            priority (int): The priority of the message.
+            time_limit (float): The time limit for waiting for the reply.
+
+        Returns:
+            Any: The `data` part of the reply.
+
+        Raises:
+            RpcCallTimeoutException: If the reply is not received within the
+                time limit.
+        """
+        deadline = deadlines.call_deadline(time_limit)
+        future = self._publish(request, priority, deadline=deadline)
+        try:
+            reply: Reply = await asyncio.wait_for(
+                asyncio.wrap_future(future),  # type: ignore[arg-type]
+                deadlines.time_left(deadline),
+            )
+        except asyncio.TimeoutError:
+            message = f'No reply from {self.queue_name} in {time_limit}s'
+            raise RpcCallTimeoutException(message)
+        return self.on_response(*reply)
+
+    def call(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request to the RPC server and wait for a response.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for a response.
+                Defaults to 100.
+
+        Returns:
+            Any: The result of the method call on the RPC server.
+        """
+        return self._request(
+            {
+                'method_name': method_name,
+                'data_for_method': data_for_method,
+                'data_for_manager': data_for_manager,
+            },
+            priority,
+            time_limit,
+        )
+
+    def cast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 10,
+    ) -> None:
+        """Send a request to the RPC server without waiting for a response.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 10.
+        """
+        self._publish(
+            {
+                'method_name': method_name,
+                'data_for_method': data_for_method,
+                'data_for_manager': data_for_manager,
+            },
+            priority,
+        )
+
+    def call_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> List[RpcResult]:
+        """Send several calls in one request and wait for their results.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently. Defaults to False.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for the results
+                of all the calls. Defaults to 100.
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        if not calls:
+            return []
+        return parse_batch_reply(
+            self._request(
+                build_batch_request(calls, parallel=parallel),
+                priority,
+                time_limit,
+            )
+        )
+
+    async def acall(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request to the RPC server and await the response.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for a response.
+                Defaults to 100.
+
+        Returns:
+            Any: The result of the method call on the RPC server.
+        """
+        return await self._arequest(
+            {
+                'method_name': method_name,
+                'data_for_method': data_for_method,
+                'data_for_manager': data_for_manager,
+            },
+            priority,
+            time_limit,
+        )
+
+    async def acast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 10,
+    ) -> None:
+        """Send a request to the RPC server from a coroutine without waiting.
+
+        Putting a message on a queue does not block, so this is `cast`.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 10.
+        """
+        self.cast(
+            method_name,
+            data_for_method,
+            data_for_manager,
+            priority=priority,
+        )
+
+    async def acall_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> List[RpcResult]:
+        """Send several calls in one request and await their results.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently. Defaults to False.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for the results
+                of all the calls. Defaults to 100.
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        if not calls:
+            return []
+        return parse_batch_reply(
+            await self._arequest(
+                build_batch_request(calls, parallel=parallel),
+                priority,
+                time_limit,
+            )
+        )
+
+
+class InProcRPCServer(BaseRPCServer):
+    """RPC server of the in-process transport.
+
+    Like `RabbitRPCServer`, requests are handled inline on the consuming
+    thread or by the worker pool configured for the queue in
+    `[messaging.server]`, and at most `prefetch` requests are handled at
+    the same time.
+
+    Attributes:
+        queue_name (str): Name of the queue to consume.
+        manager: The manager class whose methods will be executed.
+        managers (ManagerProvider): Provider of the manager instances.
+        settings (RpcServerSettings): Settings of the server of the queue.
+        executor (Optional[Executor]): Pool handling the requests, `None` in
+            the inline mode.
+    """
+
+    def __init__(self, queue_name: str, manager: Callable):
+        """Initialize the RPC server of a queue.
+
+        The server is registered on creation, so clients of the queue can
+        be created before it is started.
+
+        Args:
+            queue_name (str): The name of the queue to consume.
+            manager (Type): The manager class whose methods will be executed.
+        """
+        self.queue_name = queue_name
+        self.manager = manager
+        self.managers = ManagerProvider(manager)
+        self.settings = get_rpc_server_settings(queue_name)
+        self.executor = create_executor(queue_name, manager, self.settings)
+        self._broker = InProcBroker.instance()
+        self._queue = self._broker.queue(queue_name)
+        self._slots = threading.BoundedSemaphore(self.settings.prefetch)
+        self._stopped = threading.Event()
+        self._broker.add_consumer(queue_name)
+
+    def start(self) -> None:
+        """Consume the queue until the server is stopped."""
+        LOG.info(
+            f'Consuming {self.queue_name} in-process in '
+            f'{self.settings.mode} mode (workers: {self.settings.workers}, '
+            f'prefetch: {self.settings.prefetch}, '
+            f'manager scope: {self.managers.scope.value})'
+        )
+        try:
+            while not self._stopped.is_set():
+                if not self._slots.acquire(timeout=STOP_CHECK_INTERVAL):
+                    continue
+                try:
+                    _, _, message = self._queue.get(timeout=STOP_CHECK_INTERVAL)
+                except queue.Empty:
+                    self._slots.release()
+                    continue
+                self.on_request(message)
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stop(self) -> None:
+        """Stop consuming the queue and unregister the server."""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._broker.remove_consumer(self.queue_name)
+
+    def on_request(self, message: InProcMessage) -> None:
+        """Process a request of the queue.
+
+        The request is skipped if its caller no longer waits for the reply
+        or its deadline has passed.
+
+        Args:
+            message (InProcMessage): The request.
+        """
+        if message.reply and (
+            deadlines.is_expired(message.deadline)
+            or not message.reply.set_running_or_notify_cancel()
+        ):
+            self._slots.release()
+            return
+        try:
+            codec = get_codec(message.content_type)
+            request = codec.decode(message.body)
+        except ValueError as err:
+            self._slots.release()
+            LOG.error(f'Error deserializing RPC message: {err}')
+            if message.reply:
+                message.reply.set_exception(
+                    RpcDeserializeMessageException(str(err))
+                )
+            return
+        if self.executor is None:
+            self._reply(
+                message,
+                codec,
+                handle_request(
+                    self.managers,
+                    request,
+                    codec,
+                    self.settings.batch_workers,
+                    message.deadline,
+                ),
+            )
+            return
+        future = self._submit(request, codec, message.deadline)
+        future.add_done_callback(partial(self._on_handled, message, codec))
+
+    def _submit(
+        self,
+        request: Dict,
+        codec: BaseCodec,
+        deadline: Optional[float],
+    ) -> Future:
+        """Submit a request to the worker pool.
+
+        Args:
+            request (Dict): The deserialized request.
+            codec (BaseCodec): Codec of the reply.
+            deadline (Optional[float]): The deadline of the request.
+
+        Returns:
+            Future: The serialized reply.
+        """
+        executor = cast(Executor, self.executor)
+        batch_workers = self.settings.batch_workers
+        if self.settings.mode == 'process':
+            return executor.submit(
+                execute_in_process,
+                request,
+                codec.content_type,
+                batch_workers,
+                deadline,
+            )
+        return executor.submit(
+            handle_request,
+            self.managers,
+            request,
+            codec,
+            batch_workers,
+            deadline,
+        )
+
+    def _on_handled(
+        self,
+        message: InProcMessage,
+        codec: BaseCodec,
+        future: Future,
+    ) -> None:
+        """Reply to a request handled by the worker pool.
+
+        Args:
+            message (InProcMessage): The request.
+            codec (BaseCodec): Codec of the reply.
+            future (Future): The handled request.
+        """
+        try:
+            reply: bytes = future.result()
+        except Exception as err:  # noqa: BLE001 e.g. a broken process pool
+            reply = codec.encode({'err': str(err)})
+        self._reply(message, codec, reply)
+
+    def _reply(
+        self,
+        message: InProcMessage,
+        codec: BaseCodec,
+        reply: bytes,
+    ) -> None:
+        """Send the reply to the caller and free the slot of the request.
+
+        Args:
+            message (InProcMessage): The request.
+            codec (BaseCodec): Codec of the reply.
+            reply (bytes): The serialized reply.
+        """
+        self._slots.release()
+        if message.reply:
+            message.reply.set_result((reply, codec.content_type))
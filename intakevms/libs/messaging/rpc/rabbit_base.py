@@ -12,6 +12,7 @@ Classes:
         RabbitRPCServer.
 """
 
+import functools
 from abc import abstractmethod
 from typing import Any, Dict, Callable, Optional
 
@@ -21,6 +22,16 @@ from intakevms.libs.messaging import config
 from intakevms.libs.messaging.rpc.base import BaseRPCClient, BaseRPCServer
 
 
+@functools.cache
+def _connection_params() -> pika.URLParameters:
+    """Build the connection parameters of the process, on first use.
+
+    Returns:
+        pika.URLParameters: The parameters shared by the clients and servers.
+    """
+    return pika.URLParameters(config.get_rabbitmq_url())
+
+
 class BaseRabbitRPC:
     """The base class for creating a Rabbit RPC client and server.
 
@@ -35,14 +46,17 @@ class BaseRabbitRPC:
             RabbitMQ.
     """
 
-    params = pika.URLParameters(config.get_rabbitmq_url())
-
     def __init__(self) -> None:
         """Initialize the RabbitMQ connection and channel."""
         self.params.blocked_connection_timeout = 10.0  # type: ignore
         self.connection = pika.BlockingConnection(self.params)
         self.channel = self.connection.channel()
 
+    @property
+    def params(self) -> pika.URLParameters:
+        """Get the connection parameters, built on first use."""
+        return _connection_params()
+
 
 class BaseRabbitRPCClient(BaseRabbitRPC, BaseRPCClient):
     """The base class for creating concrete implementation of RabbitRPCClient.
@@ -72,7 +86,10 @@ class BaseRabbitRPCClient(BaseRabbitRPC, BaseRPCClient):
         result = self.channel.queue_declare(
             queue=self.callback_queue_name,
             exclusive=True,
-            arguments={'x-max-priority': 10, 'x-max-length': 200},  # type: ignore
+            arguments={  # type: ignore
+                'x-max-priority': 10,
+                'x-max-length': config.CALLBACK_QUEUE_MAX_LENGTH,
+            },
         )
         self.callback_queue = result.method.queue
         self.channel.basic_consume(
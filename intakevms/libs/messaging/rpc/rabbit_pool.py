@@ -0,0 +1,1131 @@
+"""Pooled RabbitMQ RPC client module.
+
+This module provides a process-wide pool of long-lived RabbitMQ connections
+that is shared by all RPC clients of a worker process. Each connection is
+owned by a dedicated I/O thread and has a single reusable callback queue, so
+any number of threads can publish requests over the same channel and the
+replies are routed back to the callers by their correlation ID.
+
+Compared to `RabbitRPCClient`, which opens a new connection, channel and
+exclusive callback queue on every instantiation, the pooled client pays the
+connection setup cost once per process.
+
+Usage example:
+    rpc_client = PooledRabbitRPCClient('queue_name')
+    result = rpc_client.call('manager_method_name', data_for_method)
+    result = await rpc_client.acall('manager_method_name', data_for_method)
+
+    stats = RabbitConnectionPool.instance().stats()
+
+Classes:
+    PoolStats: Snapshot of the pool size and wait-time metrics.
+    RabbitChannelWorker: Connection thread with a shared callback queue.
+    RabbitConnectionPool: Process-wide pool of channel workers.
+    PooledRabbitRPCClient: RPC client multiplexing calls over the pool.
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    ClassVar,
+    Iterator,
+    Optional,
+    Sequence,
+    AsyncIterator,
+)
+from functools import partial
+from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+import pika
+from pika.spec import Basic
+from pika.exceptions import AMQPError
+from pika.adapters.blocking_connection import BlockingChannel
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.messaging import config, metrics, deadlines
+from intakevms.libs.messaging.codecs import get_codec, get_default_codec
+from intakevms.libs.metrics.registry import REGISTRY
+from intakevms.libs.messaging.rpc.base import (
+    RpcCall,
+    RpcResult,
+    BaseRPCClient,
+    parse_batch_reply,
+    build_batch_request,
+)
+from intakevms.libs.messaging.exceptions import (
+    RpcCallException,
+    RpcCallTimeoutException,
+    RpcClientInitializedException,
+    RpcDeserializeMessageException,
+)
+
+LOG = get_logger(__name__)
+
+# Body and content type of a reply.
+Reply = Tuple[bytes, Optional[str]]
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of the pool size and wait-time metrics.
+
+    Attributes:
+        size (int): Configured number of connections.
+        alive (int): Number of connections currently open.
+        in_use (int): Number of calls currently holding a slot.
+        capacity (int): Maximum number of concurrent calls.
+        acquired (int): Total number of slots acquired since start.
+        waited (int): Number of acquisitions that had to wait for a slot.
+        timeouts (int): Number of acquisitions that gave up waiting.
+        wait_seconds_total (float): Total time spent waiting for slots.
+        wait_seconds_max (float): Longest single wait for a slot.
+    """
+
+    size: int
+    alive: int
+    in_use: int
+    capacity: int
+    acquired: int
+    waited: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class RabbitChannelWorker(threading.Thread):
+    """Connection thread with a shared callback queue.
+
+    The worker owns a `pika.BlockingConnection`, which is not thread-safe, and
+    is the only thread that touches it. Other threads hand over publishes via
+    `add_callback_threadsafe` and wait on a future that is resolved when the
+    reply with the matching correlation ID arrives.
+
+    Attributes:
+        params (pika.URLParameters): Connection parameters.
+        callback_queue (str): Name of the exclusive callback queue.
+    """
+
+    process_interval: ClassVar[float] = 1.0
+    start_timeout: ClassVar[float] = 10.0
+
+    def __init__(self, params: pika.URLParameters, name: str) -> None:
+        """Initialize the worker without connecting.
+
+        Args:
+            params (pika.URLParameters): Connection parameters.
+            name (str): Name of the worker thread.
+        """
+        super().__init__(name=name, daemon=True)
+        self.params = params
+        self.callback_queue = ''
+        self._connection: Optional[pika.BlockingConnection] = None
+        self._channel: Optional[BlockingChannel] = None
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._error: Optional[Exception] = None
+
+    @property
+    def inflight(self) -> int:
+        """Number of calls waiting for a reply on this connection."""
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the thread and wait until the connection is established.
+
+        Raises:
+            RpcClientInitializedException: If the connection cannot be
+                established in time.
+        """
+        super().start()
+        if not self._ready.wait(self.start_timeout):
+            msg = f'{self.name}: connection was not established in time'
+            raise RpcClientInitializedException(msg)
+        if self._error is not None:
+            msg = f'{self.name}: {self._error}'
+            raise RpcClientInitializedException(msg)
+
+    def run(self) -> None:
+        """Connect and process broker events until the worker is stopped."""
+        try:
+            self._connect()
+        except AMQPError as err:
+            self._error = err
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            while not self._stopped.is_set():
+                self._connection.process_data_events(  # type: ignore[union-attr]
+                    time_limit=self.process_interval  # type: ignore[arg-type]
+                )
+        except AMQPError as err:
+            LOG.error(f'{self.name}: connection lost: {err!s}')
+            self._error = err
+        finally:
+            self._stopped.set()
+            self._fail_pending(f'{self.name}: connection closed')
+            self._close_connection()
+
+    def _connect(self) -> None:
+        """Open the connection, the channel and the callback queue."""
+        self._connection = pika.BlockingConnection(self.params)
+        self._channel = self._connection.channel()
+        result = self._channel.queue_declare(
+            queue='',
+            exclusive=True,
+            arguments={  # type: ignore
+                'x-max-priority': 10,
+                'x-max-length': config.CALLBACK_QUEUE_MAX_LENGTH,
+            },
+        )
+        self.callback_queue = str(result.method.queue)
+        self._channel.basic_consume(
+            queue=self.callback_queue,
+            on_message_callback=self._on_response,
+            auto_ack=True,
+        )
+
+    def _on_response(
+        self,
+        channel: BlockingChannel,  # noqa: ARG002 need for rabbitmq basic_consume
+        method: Basic.Deliver,  # noqa: ARG002 need for rabbitmq basic_consume
+        props: pika.BasicProperties,
+        body: bytes,
+    ) -> None:
+        """Resolve the future of the call the reply belongs to.
+
+        Replies for calls that already timed out are dropped.
+
+        Args:
+            channel: The channel on which the message was received.
+            method: Delivery method.
+            props: Message properties.
+            body: The body of the message.
+        """
+        with self._pending_lock:
+            future = self._pending.pop(str(props.correlation_id), None)
+        if future is not None and future.set_running_or_notify_cancel():
+            future.set_result((body, props.content_type))
+        else:
+            metrics.observe_dropped_reply()
+
+    def _fail_pending(self, message: str) -> None:
+        """Fail every call still waiting for a reply.
+
+        Args:
+            message (str): Error message passed to the waiting callers.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RpcCallException(message))
+
+    def _close_connection(self) -> None:
+        """Close the connection, ignoring errors of an already broken one."""
+        if self._connection is not None and self._connection.is_open:
+            try:
+                self._connection.close()
+            except AMQPError as err:
+                LOG.warning(f'{self.name}: error while closing: {err!s}')
+
+    def _schedule(self, callback: partial) -> None:
+        """Run the callback on the connection thread.
+
+        Args:
+            callback (partial): Callable to run on the connection thread.
+
+        Raises:
+            RpcCallException: If the connection is not usable.
+        """
+        if self._stopped.is_set() or self._connection is None:
+            msg = f'{self.name}: connection is not available'
+            raise RpcCallException(msg)
+        try:
+            self._connection.add_callback_threadsafe(callback)
+        except AMQPError as err:
+            msg = f'{self.name}: {err!s}'
+            raise RpcCallException(msg)
+
+    def publish(
+        self,
+        routing_key: str,
+        body: bytes,
+        properties: pika.BasicProperties,
+    ) -> None:
+        """Publish a message without waiting for a reply.
+
+        Args:
+            routing_key (str): Name of the destination queue.
+            body (bytes): The message body.
+            properties (pika.BasicProperties): Message properties.
+        """
+        self._schedule(
+            partial(  # type: ignore[misc]
+                self._channel.basic_publish,  # type: ignore[union-attr]
+                exchange='',
+                routing_key=routing_key,
+                properties=properties,
+                body=body,
+            )
+        )
+
+    def submit(
+        self,
+        routing_key: str,
+        body: bytes,
+        *,
+        priority: int,
+        content_type: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[str, Future]:
+        """Publish a message and return the future of its correlated reply.
+
+        The caller must `discard` the correlation ID once it stops waiting.
+
+        Args:
+            routing_key (str): Name of the destination queue.
+            body (bytes): The message body.
+            priority (int): The priority of the message.
+            content_type (Optional[str]): Content type of the message.
+            deadline (Optional[float]): Deadline of the request, in seconds
+                since epoch.
+
+        Returns:
+            Tuple[str, Future]: The correlation ID and the future resolved
+            with the body and the content type of the reply.
+        """
+        corr_id = str(uuid.uuid4())
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending[corr_id] = future
+        headers = metrics.published_at_header()
+        if deadline is not None:
+            headers.update(deadlines.deadline_header(deadline))
+        try:
+            self.publish(
+                routing_key,
+                body,
+                pika.BasicProperties(
+                    reply_to=self.callback_queue,
+                    correlation_id=corr_id,
+                    priority=priority,
+                    content_type=content_type,
+                    headers=headers,
+                ),
+            )
+        except RpcCallException:
+            self.discard(corr_id)
+            raise
+        return corr_id, future
+
+    def discard(self, corr_id: str) -> None:
+        """Stop waiting for the reply with the given correlation ID.
+
+        Args:
+            corr_id (str): The correlation ID of the call.
+        """
+        with self._pending_lock:
+            self._pending.pop(corr_id, None)
+
+    def request(  # noqa: PLR0913 properties of the published message
+        self,
+        routing_key: str,
+        body: bytes,
+        *,
+        priority: int,
+        time_limit: float,
+        content_type: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Reply:
+        """Publish a message and wait for the correlated reply.
+
+        Args:
+            routing_key (str): Name of the destination queue.
+            body (bytes): The message body.
+            priority (int): The priority of the message.
+            time_limit (float): Seconds to wait for the reply.
+            content_type (Optional[str]): Content type of the message.
+            deadline (Optional[float]): Deadline of the request, in seconds
+                since epoch.
+
+        Returns:
+            Reply: The body and the content type of the reply.
+
+        Raises:
+            RpcCallTimeoutException: If no reply arrives within the limit.
+        """
+        corr_id, future = self.submit(
+            routing_key,
+            body,
+            priority=priority,
+            content_type=content_type,
+            deadline=deadline,
+        )
+        try:
+            reply: Reply = future.result(timeout=time_limit)
+        except FutureTimeoutError:
+            message = f'connection timeout expired: {time_limit}'
+            raise RpcCallTimeoutException(message)
+        finally:
+            self.discard(corr_id)
+        return reply
+
+    async def arequest(  # noqa: PLR0913 properties of the published message
+        self,
+        routing_key: str,
+        body: bytes,
+        *,
+        priority: int,
+        time_limit: float,
+        content_type: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Reply:
+        """Publish a message and await the correlated reply.
+
+        Awaiting the reply does not occupy a thread: the future resolved by
+        the connection thread is bridged into the running event loop.
+
+        Args:
+            routing_key (str): Name of the destination queue.
+            body (bytes): The message body.
+            priority (int): The priority of the message.
+            time_limit (float): Seconds to wait for the reply.
+            content_type (Optional[str]): Content type of the message.
+            deadline (Optional[float]): Deadline of the request, in seconds
+                since epoch.
+
+        Returns:
+            Reply: The body and the content type of the reply.
+
+        Raises:
+            RpcCallTimeoutException: If no reply arrives within the limit.
+        """
+        corr_id, future = self.submit(
+            routing_key,
+            body,
+            priority=priority,
+            content_type=content_type,
+            deadline=deadline,
+        )
+        try:
+            reply: Reply = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=time_limit
+            )
+        except asyncio.TimeoutError:
+            message = f'connection timeout expired: {time_limit}'
+            raise RpcCallTimeoutException(message)
+        finally:
+            self.discard(corr_id)
+        return reply
+
+    def stop(self) -> None:
+        """Stop processing events and close the connection."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout=self.process_interval * 2)
+
+
+class RabbitConnectionPool:
+    """Process-wide pool of channel workers.
+
+    The pool limits the number of concurrent calls to
+    `size * max_inflight` and spreads them over the least loaded connection.
+    Dead connections are replaced transparently on the next acquisition.
+
+    Attributes:
+        settings (RpcPoolSettings): The pool settings.
+        params (pika.URLParameters): Connection parameters.
+    """
+
+    _instances: ClassVar[Dict[int, 'RabbitConnectionPool']] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, settings: config.RpcPoolSettings) -> None:
+        """Initialize the pool without opening connections.
+
+        Args:
+            settings (RpcPoolSettings): The pool settings.
+        """
+        self.settings = settings
+        self.params = pika.URLParameters(config.get_rabbitmq_url())
+        self._workers: List[Optional[RabbitChannelWorker]] = [
+            None
+        ] * settings.size
+        self._workers_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(
+            settings.size * settings.max_inflight
+        )
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._acquired = 0
+        self._waited = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @classmethod
+    def instance(cls) -> 'RabbitConnectionPool':
+        """Get the pool of the current process, creating it on first use.
+
+        Pools are keyed by process ID, so forked workers never share the
+        connections of their parent.
+
+        Returns:
+            RabbitConnectionPool: The pool of the current process.
+        """
+        pid = os.getpid()
+        with cls._instances_lock:
+            if pid not in cls._instances:
+                cls._instances[pid] = cls(config.get_rpc_pool_settings())
+                cls._instances[pid].register_metrics()
+            return cls._instances[pid]
+
+    def _get_worker(self) -> RabbitChannelWorker:
+        """Get the least loaded live worker, (re)connecting when needed.
+
+        Returns:
+            RabbitChannelWorker: The selected worker.
+        """
+        with self._workers_lock:
+            for index, worker in enumerate(self._workers):
+                if worker is None or not worker.is_alive():
+                    self._workers[index] = self._new_worker(index)
+            return min(
+                (w for w in self._workers if w is not None),
+                key=lambda w: w.inflight,
+            )
+
+    def _new_worker(self, index: int) -> RabbitChannelWorker:
+        """Create and start a worker.
+
+        Args:
+            index (int): Position of the worker in the pool.
+
+        Returns:
+            RabbitChannelWorker: The started worker.
+        """
+        worker = RabbitChannelWorker(
+            self.params, name=f'rpc-pool-{os.getpid()}-{index}'
+        )
+        worker.start()
+        LOG.info(
+            f'{worker.name} connected, callback queue: '
+            f'{worker.callback_queue}'
+        )
+        return worker
+
+    @contextmanager
+    def acquire(self) -> Iterator[RabbitChannelWorker]:
+        """Acquire a call slot on the least loaded connection.
+
+        Yields:
+            RabbitChannelWorker: The worker to issue the call on.
+
+        Raises:
+            RpcCallTimeoutException: If no slot is freed within the
+                configured acquire timeout.
+        """
+        started = time.monotonic()
+        waited = not self._slots.acquire(blocking=False)
+        acquired = not waited or self._slots.acquire(
+            timeout=self.settings.acquire_timeout
+        )
+        self._check_acquired(started, waited=waited, acquired=acquired)
+        try:
+            yield self._get_worker()
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def aacquire(self) -> AsyncIterator[RabbitChannelWorker]:
+        """Acquire a call slot from a coroutine.
+
+        A thread is only borrowed when the pool is exhausted and the caller
+        has to wait for a slot; the common path never leaves the event loop.
+
+        Yields:
+            RabbitChannelWorker: The worker to issue the call on.
+
+        Raises:
+            RpcCallTimeoutException: If no slot is freed within the
+                configured acquire timeout.
+        """
+        started = time.monotonic()
+        waited = not self._slots.acquire(blocking=False)
+        acquired = not waited or await self._await_slot()
+        self._check_acquired(started, waited=waited, acquired=acquired)
+        try:
+            yield await self._aget_worker()
+        finally:
+            self._release()
+
+    async def _await_slot(self) -> bool:
+        """Wait for a free call slot in a thread.
+
+        The waiting thread cannot be interrupted, so if the awaiting task is
+        cancelled, the slot it may still get is given back to the pool.
+
+        Returns:
+            bool: Whether a slot was acquired within the acquire timeout.
+        """
+        waiting = asyncio.ensure_future(
+            asyncio.to_thread(
+                self._slots.acquire, timeout=self.settings.acquire_timeout
+            )
+        )
+        try:
+            return await asyncio.shield(waiting)
+        except asyncio.CancelledError:
+            waiting.add_done_callback(self._release_abandoned_slot)
+            raise
+
+    def _release_abandoned_slot(self, waiting: 'asyncio.Future[bool]') -> None:
+        """Release a slot acquired for a cancelled caller.
+
+        Args:
+            waiting (asyncio.Future[bool]): The finished wait for the slot.
+        """
+        if (
+            not waiting.cancelled()
+            and waiting.exception() is None
+            and waiting.result()
+        ):
+            self._slots.release()
+
+    async def _aget_worker(self) -> RabbitChannelWorker:
+        """Get the least loaded live worker without blocking the loop.
+
+        Returns:
+            RabbitChannelWorker: The selected worker.
+        """
+        with self._workers_lock:
+            live = [w for w in self._workers if w is not None and w.is_alive()]
+            if len(live) == len(self._workers):
+                return min(live, key=lambda w: w.inflight)
+        return await asyncio.to_thread(self._get_worker)
+
+    def _check_acquired(
+        self,
+        started: float,
+        *,
+        waited: bool,
+        acquired: bool,
+    ) -> None:
+        """Record the acquisition attempt and fail if no slot was acquired.
+
+        Args:
+            started (float): Monotonic time the attempt started at.
+            waited (bool): Whether the slot was not immediately available.
+            acquired (bool): Whether the slot was acquired in time.
+
+        Raises:
+            RpcCallTimeoutException: If no slot was acquired.
+        """
+        self._record_wait(
+            time.monotonic() - started, waited=waited, acquired=acquired
+        )
+        if not acquired:
+            message = (
+                f'no free RPC slot within {self.settings.acquire_timeout}s'
+            )
+            raise RpcCallTimeoutException(message)
+
+    def _release(self) -> None:
+        """Release a call slot."""
+        with self._stats_lock:
+            self._in_use -= 1
+        self._slots.release()
+
+    def _record_wait(
+        self,
+        wait: float,
+        *,
+        waited: bool,
+        acquired: bool,
+    ) -> None:
+        """Update the wait-time metrics after an acquisition attempt.
+
+        Args:
+            wait (float): Seconds spent waiting for the slot.
+            waited (bool): Whether the slot was not immediately available.
+            acquired (bool): Whether the slot was acquired in time.
+        """
+        with self._stats_lock:
+            self._in_use += int(acquired)
+            self._acquired += int(acquired)
+            self._timeouts += int(not acquired)
+            self._waited += int(waited)
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+    def stats(self) -> PoolStats:
+        """Get a snapshot of the pool metrics.
+
+        Returns:
+            PoolStats: The current pool size and wait-time metrics.
+        """
+        with self._workers_lock:
+            alive = sum(
+                1 for w in self._workers if w is not None and w.is_alive()
+            )
+        with self._stats_lock:
+            return PoolStats(
+                size=self.settings.size,
+                alive=alive,
+                in_use=self._in_use,
+                capacity=self.settings.size * self.settings.max_inflight,
+                acquired=self._acquired,
+                waited=self._waited,
+                timeouts=self._timeouts,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+            )
+
+    def register_metrics(self) -> None:
+        """Expose the statistics of the pool in the metrics registry."""
+        for name, metric_type, documentation, field in (
+            ('size', 'gauge', 'Configured number of connections.', 'size'),
+            ('alive', 'gauge', 'Number of open connections.', 'alive'),
+            ('in_use', 'gauge', 'Calls holding a slot.', 'in_use'),
+            ('capacity', 'gauge', 'Maximum concurrent calls.', 'capacity'),
+            ('acquired_total', 'counter', 'Slots acquired.', 'acquired'),
+            ('waited_total', 'counter', 'Acquisitions that waited.', 'waited'),
+            (
+                'timeouts_total',
+                'counter',
+                'Acquisitions that gave up waiting.',
+                'timeouts',
+            ),
+            (
+                'wait_seconds_total',
+                'counter',
+                'Time spent waiting for slots.',
+                'wait_seconds_total',
+            ),
+            (
+                'wait_seconds_max',
+                'gauge',
+                'Longest wait for a slot.',
+                'wait_seconds_max',
+            ),
+        ):
+            REGISTRY.callback(
+                f'intakevms_rpc_pool_{name}',
+                documentation,
+                metric_type,
+                partial(self._stat, field),
+            )
+
+    def _stat(self, field: str) -> float:
+        """Get a field of the statistics of the pool.
+
+        Args:
+            field (str): Name of the `PoolStats` field.
+
+        Returns:
+            float: The value of the field.
+        """
+        return float(getattr(self.stats(), field))
+
+    def close(self) -> None:
+        """Stop all workers and close their connections."""
+        with self._workers_lock:
+            for worker in self._workers:
+                if worker is not None:
+                    worker.stop()
+            self._workers = [None] * self.settings.size
+
+
+class PooledRabbitRPCClient(BaseRPCClient):
+    """RPC client multiplexing calls over the process-wide pool.
+
+    The client itself is cheap to create: it holds no connection and can be
+    instantiated per HTTP request like `RabbitRPCClient`.
+
+    Attributes:
+        queue_name (str): Name of the queue to send messages to.
+        pool (RabbitConnectionPool): The pool of the current process.
+        codec (BaseCodec): Codec of the requests.
+    """
+
+    def __init__(self, queue_name: str, callback_queue_name: str = ''):
+        """Initialize the client for a specific queue.
+
+        Args:
+            queue_name (str): The name of the queue to send messages to.
+            callback_queue_name (str): Must be empty: replies are received
+                on the callback queues of the pool. Kept for interface
+                compatibility with `RabbitRPCClient`.
+
+        Raises:
+            RpcClientInitializedException: If a callback queue is named.
+        """
+        if callback_queue_name:
+            msg = (
+                f'Pooled RPC clients cannot use the callback queue '
+                f'{callback_queue_name}, disable the pool to name it'
+            )
+            raise RpcClientInitializedException(msg)
+        self.queue_name = queue_name
+        self.callback_queue_name = callback_queue_name
+        self.pool = RabbitConnectionPool.instance()
+        self.codec = get_default_codec()
+
+    def _serialize_request(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict],
+        data_for_manager: Optional[Dict],
+    ) -> bytes:
+        """Serialize the RPC request body.
+
+        Args:
+            method_name (str): The name of the method to call.
+            data_for_method (Optional[Dict]): The data for the method.
+            data_for_manager (Optional[Dict]): The data for the manager.
+
+        Returns:
+            bytes: The serialized request.
+
+        Raises:
+            RpcCallException: If the request cannot be serialized.
+        """
+        return self._encode(
+            {
+                'method_name': method_name,
+                'data_for_method': data_for_method,
+                'data_for_manager': data_for_manager,
+            }
+        )
+
+    def _encode(self, request: Dict) -> bytes:
+        """Serialize the body of a request.
+
+        Args:
+            request (Dict): The body of the request.
+
+        Returns:
+            bytes: The serialized request.
+
+        Raises:
+            RpcCallException: If the request cannot be serialized.
+        """
+        try:
+            return self.codec.encode(request)
+        except TypeError as err:
+            msg = f'Error serializing RPC request: {err}'
+            raise RpcCallException(msg)
+
+    def _request(
+        self,
+        method: str,
+        body: bytes,
+        *,
+        priority: int,
+        time_limit: float,
+    ) -> Reply:
+        """Send a request over a pooled connection and wait for the reply.
+
+        Args:
+            method (str): The method label of the request, for the metrics.
+            body (bytes): The serialized request.
+            priority (int): The priority of the message.
+            time_limit (float): The time limit for waiting for the reply.
+
+        Returns:
+            Reply: The body and the content type of the reply.
+        """
+        deadline = deadlines.call_deadline(time_limit)
+        started = time.perf_counter()
+        reply: Optional[Reply] = None
+        try:
+            with self.pool.acquire() as worker:
+                reply = worker.request(
+                    self.queue_name,
+                    body,
+                    priority=priority,
+                    time_limit=deadlines.time_left(deadline),
+                    content_type=self.codec.content_type,
+                    deadline=deadline,
+                )
+        finally:
+            metrics.observe_client_call(
+                self.queue_name,
+                method,
+                started,
+                body,
+                reply[0] if reply else None,
+            )
+        return reply
+
+    async def _arequest(
+        self,
+        method: str,
+        body: bytes,
+        *,
+        priority: int,
+        time_limit: float,
+    ) -> Reply:
+        """Send a request over a pooled connection and await the reply.
+
+        Args:
+            method (str): The method label of the request, for the metrics.
+            body (bytes): The serialized request.
+            priority (int): The priority of the message.
+            time_limit (float): The time limit for waiting for the reply.
+
+        Returns:
+            Reply: The body and the content type of the reply.
+        """
+        deadline = deadlines.call_deadline(time_limit)
+        started = time.perf_counter()
+        reply: Optional[Reply] = None
+        try:
+            async with self.pool.aacquire() as worker:
+                reply = await worker.arequest(
+                    self.queue_name,
+                    body,
+                    priority=priority,
+                    time_limit=deadlines.time_left(deadline),
+                    content_type=self.codec.content_type,
+                    deadline=deadline,
+                )
+        finally:
+            metrics.observe_client_call(
+                self.queue_name,
+                method,
+                started,
+                body,
+                reply[0] if reply else None,
+            )
+        return reply
+
+    def on_response(
+        self,
+        body: bytes,
+        content_type: Optional[str] = None,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Process the reply of the RPC server.
+
+        Args:
+            body (bytes): The body of the reply.
+            content_type (Optional[str]): Content type of the reply.
+
+        Returns:
+            Any: The `data` part of the reply.
+
+        Raises:
+            RpcDeserializeMessageException: If the reply cannot be parsed.
+            RpcCallException: If the RPC server returned an error.
+        """
+        try:
+            response = get_codec(content_type).decode(body)
+        except ValueError as err:
+            raise RpcDeserializeMessageException(str(err))
+        if response.get('err'):
+            raise RpcCallException(str(response['err']))
+        return response.get('data', {})
+
+    def call(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request to the RPC server and wait for a response.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for a response.
+                Defaults to 100.
+
+        Returns:
+            Any: The result of the method call on the RPC server.
+        """
+        body = self._serialize_request(
+            method_name, data_for_method, data_for_manager
+        )
+        reply = self._request(
+            method_name, body, priority=priority, time_limit=time_limit
+        )
+        return self.on_response(*reply)
+
+    def call_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> List[RpcResult]:
+        """Send several calls in one request and wait for their results.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently. Defaults to False.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for the results
+                of all the calls. Defaults to 100.
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        if not calls:
+            return []
+        body = self._encode(build_batch_request(calls, parallel=parallel))
+        reply = self._request(
+            'batch', body, priority=priority, time_limit=time_limit
+        )
+        return parse_batch_reply(self.on_response(*reply))
+
+    def cast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 10,
+    ) -> None:
+        """Send a request to the RPC server without waiting for a response.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 10.
+        """
+        body = self._serialize_request(
+            method_name, data_for_method, data_for_manager
+        )
+        with self.pool.acquire() as worker:
+            worker.publish(
+                self.queue_name,
+                body,
+                pika.BasicProperties(
+                    correlation_id=str(uuid.uuid4()),
+                    priority=priority,
+                    content_type=self.codec.content_type,
+                    headers=metrics.published_at_header(),
+                ),
+            )
+
+    async def acall(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request to the RPC server and await the response.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for a response.
+                Defaults to 100.
+
+        Returns:
+            Any: The result of the method call on the RPC server.
+        """
+        body = self._serialize_request(
+            method_name, data_for_method, data_for_manager
+        )
+        reply = await self._arequest(
+            method_name, body, priority=priority, time_limit=time_limit
+        )
+        return self.on_response(*reply)
+
+    async def acast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 10,
+    ) -> None:
+        """Send a request to the RPC server from a coroutine without waiting.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 10.
+        """
+        body = self._serialize_request(
+            method_name, data_for_method, data_for_manager
+        )
+        async with self.pool.aacquire() as worker:
+            worker.publish(
+                self.queue_name,
+                body,
+                pika.BasicProperties(
+                    correlation_id=str(uuid.uuid4()),
+                    priority=priority,
+                    content_type=self.codec.content_type,
+                    headers=metrics.published_at_header(),
+                ),
+            )
+
+    async def acall_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        priority: int = 1,
+        time_limit: float = 100,
+    ) -> List[RpcResult]:
+        """Send several calls in one request and await their results.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently. Defaults to False.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (float): The time limit for waiting for the results
+                of all the calls. Defaults to 100.
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        if not calls:
+            return []
+        body = self._encode(build_batch_request(calls, parallel=parallel))
+        reply = await self._arequest(
+            'batch', body, priority=priority, time_limit=time_limit
+        )
+        return parse_batch_reply(self.on_response(*reply))
@@ -21,41 +21,90 @@ Usage example:
 
         rpc_server = rpc.RabbitRPCServer('queue_name_2', manager)
 
+    3.
+        # With `mode = 'thread'` or `mode = 'process'` configured for the
+        # queue in `[messaging.server.queues.<queue_name>]`, requests are
+        # handled concurrently by a pool of workers, while acks and replies
+        # are still sent from the connection thread.
+        rpc_server = rpc.RabbitRPCServer('queue_name_3', Manager)
+
+    4.
+        # Several calls in one message, run concurrently by the server if
+        # `parallel` is set. Every call gets its own result or error.
+        results = rpc_client.call_many(
+            [RpcCall('method_name', data_for_manager=data) for data in items],
+            parallel=True,
+        )
+        values = [result.result() for result in results]
+
+    5.
+        # Requests carry the deadline of the call: the server drops them
+        # once the caller gave up, and calls issued while handling a
+        # request are bounded by its deadline, see `deadlines`.
+        rpc_client.call('do_setup', data_for_manager=data, time_limit=180)
+
 Classes:
     RabbitRPCClient: Concrete implementation for rabbit rpc client.
     RabbitRPCServer: Concrete implementation for rabbit rpc server.
 """
 
+import time
 import uuid
+import asyncio
 from typing import (
     Any,
     Dict,
+    List,
     TypeVar,
     Callable,
     Optional,
+    Sequence,
     cast,
 )
+from functools import partial
+from concurrent.futures import (
+    Future,
+)
 
 import pika
 from pika.spec import Basic
+from pika.exceptions import AMQPError
 from pika.adapters.blocking_connection import BlockingChannel
 
+from intakevms.libs.log import get_logger
+from intakevms.libs.messaging import metrics, deadlines
+from intakevms.libs.messaging.codecs import (
+    BaseCodec,
+    get_codec,
+    get_default_codec,
+)
+from intakevms.libs.messaging.config import get_rpc_server_settings
+from intakevms.libs.messaging.managers import ManagerProvider
+from intakevms.libs.messaging.rpc.base import (
+    RpcCall,
+    RpcResult,
+    parse_batch_reply,
+    build_batch_request,
+)
 from intakevms.libs.messaging.exceptions import (
     RpcCallException,
     RpcCallTimeoutException,
     RpcDeserializeMessageException,
 )
+from intakevms.libs.messaging.rpc.dispatch import (
+    handle_request,
+    create_executor,
+    execute_in_process,
+)
 from intakevms.libs.messaging.rpc.rabbit_base import (
     BaseRabbitRPCClient,
     BaseRabbitRPCServer,
 )
-from intakevms.libs.data_handlers.json.serializer import (
-    serialize_json,
-    deserialize_json,
-)
 
 T = TypeVar('T')
 
+LOG = get_logger(__name__)
+
 
 class RabbitRPCClient(BaseRabbitRPCClient):
     """Concrete implementation for rabbit rpc client.
@@ -64,6 +113,8 @@ class RabbitRPCClient(BaseRabbitRPCClient):
 
     Attributes:
         queue_name (str): Name of the queue to send messages to.
+        reply_body (Optional[bytes]): Body of the last reply.
+        codec (BaseCodec): Codec of the requests.
     """
 
     def __init__(self, queue_name: str, callback_queue_name: str = ''):
@@ -77,6 +128,8 @@ class RabbitRPCClient(BaseRabbitRPCClient):
         """
         super().__init__(queue_name, callback_queue_name)
         self.corr_id: Optional[str]
+        self.reply_body: Optional[bytes] = None
+        self.codec = get_default_codec()
 
     def on_response(
         self,
@@ -96,11 +149,14 @@ class RabbitRPCClient(BaseRabbitRPCClient):
             props: Message properties.
             body: The body of the message.
         """
-        if self.corr_id == props.correlation_id:
-            try:
-                self.response = deserialize_json(body.decode('utf-8'))
-            except ValueError as err:
-                raise RpcDeserializeMessageException(str(err))
+        if self.corr_id != props.correlation_id:
+            metrics.observe_dropped_reply()
+            return
+        self.reply_body = body
+        try:
+            self.response = get_codec(props.content_type).decode(body)
+        except ValueError as err:
+            raise RpcDeserializeMessageException(str(err))
 
     def call(
         self,
@@ -132,19 +188,85 @@ class RabbitRPCClient(BaseRabbitRPCClient):
                 time limit.
             RpcCallException: If the RPC server returns an error.
         """
+        return self._call(
+            {
+                'method_name': method_name,
+                'data_for_method': data_for_method,
+                'data_for_manager': data_for_manager,
+            },
+            priority=priority,
+            time_limit=time_limit,
+        )
+
+    def call_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        priority: int = 1,
+        time_limit: int = 100,
+    ) -> List[RpcResult]:
+        """Send several calls in one request and wait for their results.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently. Defaults to False.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (int): The time limit for waiting for the results of
+                all the calls. Defaults to 100.
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+
+        Raises:
+            RpcCallTimeoutException: If the response is not received within the
+                time limit.
+            RpcCallException: If the batch request fails as a whole.
+        """
+        if not calls:
+            return []
+        return parse_batch_reply(
+            self._call(
+                build_batch_request(calls, parallel=parallel),
+                priority=priority,
+                time_limit=time_limit,
+            )
+        )
+
+    def _call(
+        self,
+        request: Dict,
+        *,
+        priority: int,
+        time_limit: int,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Send a request to the RPC server and wait for a response.
+
+        Args:
+            request (Dict): The body of the request.
+            priority (int): The priority of the message.
+            time_limit (int): The time limit for waiting for a response.
+
+        Returns:
+            Any: The `data` part of the response.
+
+        Raises:
+            RpcCallTimeoutException: If the response is not received within the
+                time limit, or the deadline of the request being handled has
+                passed.
+            RpcCallException: If the RPC server returns an error.
+        """
+        deadline = deadlines.call_deadline(time_limit)
         self.response = {}
+        self.reply_body = None
         self.corr_id = str(uuid.uuid4())
         try:
-            serialized_data = serialize_json(
-                {
-                    'method_name': method_name,
-                    'data_for_method': data_for_method,
-                    'data_for_manager': data_for_manager,
-                }
-            ).encode()
+            serialized_data = self.codec.encode(request)
         except TypeError as err:
             msg = f'Error serializing RPC request: {err}'
             raise RpcCallException(msg)
+        started = time.perf_counter()
         self.channel.basic_publish(
             exchange='',
             routing_key=self.queue_name,
@@ -152,11 +274,25 @@ class RabbitRPCClient(BaseRabbitRPCClient):
                 reply_to=self.callback_queue,
                 correlation_id=self.corr_id,
                 priority=priority,
+                content_type=self.codec.content_type,
+                headers={
+                    **metrics.published_at_header(),
+                    **deadlines.deadline_header(deadline),
+                },
             ),
             body=serialized_data,
         )
         # Wait for a response from the RPC server
-        self.connection.process_data_events(time_limit=time_limit)
+        self.connection.process_data_events(
+            time_limit=deadlines.time_left(deadline)  # type: ignore[arg-type]
+        )
+        metrics.observe_client_call(
+            self.queue_name,
+            metrics.request_method(request),
+            started,
+            serialized_data,
+            self.reply_body,
+        )
         if not self.response:
             message = (
                 f'connection timeout expired: '
@@ -188,13 +324,13 @@ class RabbitRPCClient(BaseRabbitRPCClient):
         """
         self.corr_id = str(uuid.uuid4())
         try:
-            serialized_data = serialize_json(
+            serialized_data = self.codec.encode(
                 {
                     'method_name': method_name,
                     'data_for_method': data_for_method,
                     'data_for_manager': data_for_manager,
                 }
-            ).encode()
+            )
         except TypeError as err:
             msg = f'Error serializing RPC request: {err}'
             raise RpcCallException(msg)
@@ -203,11 +339,108 @@ class RabbitRPCClient(BaseRabbitRPCClient):
             exchange='',
             routing_key=self.queue_name,
             properties=pika.BasicProperties(
-                correlation_id=self.corr_id, priority=priority
+                correlation_id=self.corr_id,
+                priority=priority,
+                content_type=self.codec.content_type,
+                headers=metrics.published_at_header(),
             ),
             body=serialized_data,
         )
 
+    async def acall(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 1,
+        time_limit: int = 100,
+    ) -> Any:  # noqa: ANN401 TODO need to specify response by pydantic
+        """Await `call` running in a worker thread.
+
+        The blocking connection of this client cannot be driven by the event
+        loop, so the thread is held for the whole call. Prefer
+        `PooledRabbitRPCClient` from coroutines.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (int): The time limit for waiting for a response.
+                Defaults to 100.
+
+        Returns:
+            Dict: The result of the method call on the RPC server.
+        """
+        return await asyncio.to_thread(
+            self.call,
+            method_name,
+            data_for_method,
+            data_for_manager,
+            priority=priority,
+            time_limit=time_limit,
+        )
+
+    async def acast(
+        self,
+        method_name: str,
+        data_for_method: Optional[Dict] = None,
+        data_for_manager: Optional[Dict] = None,
+        *,
+        priority: int = 10,
+    ) -> None:
+        """Await `cast` running in a worker thread.
+
+        Args:
+            method_name (str): The name of the method to be called on the
+                server.
+            data_for_method (Optional[Dict]): The data to be passed to the
+                method.
+            data_for_manager (Optional[Dict]): The data for initializing the
+                manager.
+            priority (int): The priority of the message. Defaults to 10.
+        """
+        await asyncio.to_thread(
+            self.cast,
+            method_name,
+            data_for_method,
+            data_for_manager,
+            priority=priority,
+        )
+
+    async def acall_many(
+        self,
+        calls: Sequence[RpcCall],
+        *,
+        parallel: bool = False,
+        priority: int = 1,
+        time_limit: int = 100,
+    ) -> List[RpcResult]:
+        """Await `call_many` running in a worker thread.
+
+        Args:
+            calls (Sequence[RpcCall]): The calls to run on the server.
+            parallel (bool): Whether the server may run the calls
+                concurrently. Defaults to False.
+            priority (int): The priority of the message. Defaults to 1.
+            time_limit (int): The time limit for waiting for the results of
+                all the calls. Defaults to 100.
+
+        Returns:
+            List[RpcResult]: The results, in the order of the calls.
+        """
+        return await asyncio.to_thread(
+            self.call_many,
+            calls,
+            parallel=parallel,
+            priority=priority,
+            time_limit=time_limit,
+        )
+
 
 class RabbitRPCServer(BaseRabbitRPCServer):
     """Concrete implementation for rabbit rpc server.
@@ -215,8 +448,20 @@ class RabbitRPCServer(BaseRabbitRPCServer):
     This class listens for incoming messages, initializes a manager, and
     executes the appropriate method on the manager.
 
+    Depending on the `[messaging.server]` settings of the queue, requests
+    are handled inline on the consuming thread or dispatched to a bounded
+    pool of threads or processes. Pooled requests are acknowledged and
+    replied to from the connection thread once they are handled.
+
+    Manager instances are provided according to the `rpc_scope` of the
+    manager, see `intakevms.libs.messaging.managers`.
+
     Attributes:
         manager: The manager class whose methods will be executed.
+        managers (ManagerProvider): Provider of the manager instances.
+        settings (RpcServerSettings): Settings of the server of the queue.
+        executor (Optional[Executor]): Pool handling the requests, `None` in
+            the inline mode.
     """
 
     def __init__(self, queue_name: str, manager: Callable):
@@ -227,14 +472,28 @@ class RabbitRPCServer(BaseRabbitRPCServer):
             manager (Type): The manager class whose methods will be executed.
         """
         super().__init__(queue_name, manager)
-        self.channel.basic_qos(prefetch_count=1)
+        self.queue_name = queue_name
+        self.managers = ManagerProvider(manager)
+        self.settings = get_rpc_server_settings(queue_name)
+        self.executor = create_executor(queue_name, manager, self.settings)
+        self.channel.basic_qos(prefetch_count=self.settings.prefetch)
         self.channel.basic_consume(
             queue=queue_name, on_message_callback=self.on_request
         )
 
     def start(self) -> None:
         """Starts server instance"""
-        self.channel.start_consuming()
+        LOG.info(
+            f'Consuming {self.queue_name} in {self.settings.mode} mode '
+            f'(workers: {self.settings.workers}, '
+            f'prefetch: {self.settings.prefetch}, '
+            f'manager scope: {self.managers.scope.value})'
+        )
+        try:
+            self.channel.start_consuming()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
 
     def on_request(
         self,
@@ -246,8 +505,10 @@ class RabbitRPCServer(BaseRabbitRPCServer):
         """Process incoming requests from the RPC client.
 
         This method deserializes the message, initializes the manager,
-        and executes the appropriate method. The result is sent back
-        to the client.
+        and executes the appropriate method, or every call of a batch
+        request. The result is sent back to the client, encoded with the
+        codec of the request. Requests whose deadline has passed are
+        acknowledged without being handled.
 
         Args:
             channel: The channel on which the message was received.
@@ -256,40 +517,141 @@ class RabbitRPCServer(BaseRabbitRPCServer):
             body: The body of the message.
         """
         try:
-            deserialized_body = deserialize_json(body.decode('utf-8'))
+            codec = get_codec(props.content_type)
+            deserialized_body = codec.decode(body)
         except ValueError as err:
             msg = f'Error deserializing RPC message: {err}'
             raise RpcDeserializeMessageException(msg)
-        method_name = deserialized_body.get('method_name', None)
-        data_for_method = deserialized_body.get('data_for_method', {})
-        data_for_manager = deserialized_body.get('data_for_manager', {})
-        request = {}
-        try:
-            inited_manager = (
-                self.manager(data_for_manager)
-                if data_for_manager
-                else self.manager()
+        delivery_tag = cast(int, method.delivery_tag)
+        batch_workers = self.settings.batch_workers
+        method_label = metrics.request_method(deserialized_body)
+        metrics.observe_queue_wait(self.queue_name, method_label, props.headers)
+        deadline = deadlines.from_headers(props.headers)
+        if deadlines.is_expired(deadline):
+            self._drop_expired(channel, delivery_tag, props, method_label)
+            return
+        observe = partial(
+            metrics.observe_server_request,
+            self.queue_name,
+            method_label,
+            time.perf_counter(),
+            body,
+            deadline=deadline,
+        )
+        if self.executor is None:
+            reply = handle_request(
+                self.managers, deserialized_body, codec, batch_workers, deadline
             )
-            managers_method = getattr(inited_manager, method_name)
-            result = (
-                managers_method(data_for_method)
-                if data_for_method
-                else managers_method()
+            observe(reply)
+            self._reply(channel, delivery_tag, props, reply, codec)
+            return
+        if self.settings.mode == 'process':
+            future = self.executor.submit(
+                execute_in_process,
+                deserialized_body,
+                codec.content_type,
+                batch_workers,
+                deadline,
             )
-            request.update({'data': result})
-        except Exception as err:  # noqa: BLE001 because it's catching all exceptions
-            request.update({'err': str(err)})
+        else:
+            future = self.executor.submit(
+                handle_request,
+                self.managers,
+                deserialized_body,
+                codec,
+                batch_workers,
+                deadline,
+            )
+        future.add_done_callback(
+            partial(
+                self._on_handled, channel, delivery_tag, props, codec, observe
+            )
+        )
+
+    def _drop_expired(
+        self,
+        channel: BlockingChannel,
+        delivery_tag: int,
+        props: pika.BasicProperties,
+        method_label: str,
+    ) -> None:
+        """Acknowledge a request whose caller no longer waits for the reply.
+
+        Args:
+            channel: The channel on which the request was received.
+            delivery_tag (int): Delivery tag of the request.
+            props: Properties of the request.
+            method_label (str): The method label of the request.
+        """
+        metrics.observe_expired(self.queue_name, method_label)
+        LOG.warning(
+            f'Dropped expired {method_label} request '
+            f'{props.correlation_id} from {self.queue_name}'
+        )
+        channel.basic_ack(delivery_tag=delivery_tag)
+
+    def _on_handled(  # noqa: PLR0913 arguments are bound by on_request
+        self,
+        channel: BlockingChannel,
+        delivery_tag: int,
+        props: pika.BasicProperties,
+        codec: BaseCodec,
+        observe: Callable[[bytes], None],
+        future: Future,
+    ) -> None:
+        """Hand the reply of a pooled request over to the connection thread.
+
+        Args:
+            channel: The channel on which the request was received.
+            delivery_tag (int): Delivery tag of the request.
+            props: Properties of the request.
+            codec (BaseCodec): Codec of the reply.
+            observe (Callable[[bytes], None]): Records the metrics of the
+                request, given the reply.
+            future (Future): The handled request.
+        """
         try:
-            serialized_request = serialize_json(request)
-        except TypeError as err:
-            serialized_request = serialize_json({'err': str(err)})
+            reply: bytes = future.result()
+        except Exception as err:  # noqa: BLE001 e.g. a broken process pool
+            reply = codec.encode({'err': str(err)})
+        observe(reply)
+        try:
+            self.connection.add_callback_threadsafe(
+                partial(self._reply, channel, delivery_tag, props, reply, codec)
+            )
+        except AMQPError as err:
+            LOG.error(
+                f'Reply to {props.correlation_id} was not sent, '
+                f'connection is not available: {err!s}'
+            )
+
+    @staticmethod
+    def _reply(
+        channel: BlockingChannel,
+        delivery_tag: int,
+        props: pika.BasicProperties,
+        reply: bytes,
+        codec: BaseCodec,
+    ) -> None:
+        """Send the reply to the client and acknowledge the request.
+
+        Must be called on the connection thread.
+
+        Args:
+            channel: The channel on which the request was received.
+            delivery_tag (int): Delivery tag of the request.
+            props: Properties of the request.
+            reply (bytes): The serialized reply.
+            codec (BaseCodec): Codec of the reply.
+        """
         if props.reply_to:
             channel.basic_publish(
                 exchange='',
                 routing_key=props.reply_to,
                 properties=pika.BasicProperties(
-                    correlation_id=props.correlation_id
+                    correlation_id=props.correlation_id,
+                    content_type=codec.content_type,
                 ),
-                body=serialized_request.encode(),
+                body=reply,
             )
-        channel.basic_ack(delivery_tag=cast(int, method.delivery_tag))
+        channel.basic_ack(delivery_tag=delivery_tag)
@@ -0,0 +1,105 @@
+"""Unit tests for the in-process RPC transport.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/messaging/rpc/test_inproc_rpc.py
+"""
+
+import uuid
+import asyncio
+import threading
+from typing import Dict, Iterator
+
+import pytest
+
+from intakevms.libs.messaging.rpc.base import RpcCall
+from intakevms.libs.messaging.exceptions import (
+    RpcCallException,
+    RpcCallTimeoutException,
+    RpcClientInitializedException,
+)
+from intakevms.libs.messaging.rpc.inproc_rpc import (
+    InProcRPCClient,
+    InProcRPCServer,
+)
+
+
+class Manager:
+    """Manager echoing its input."""
+
+    def echo(self, data: Dict) -> Dict:
+        """Return the received data, after consuming it."""
+        return {key: data.pop(key) for key in list(data)}
+
+    def fail(self) -> None:
+        """Raise an error."""
+        msg = 'boom'
+        raise RuntimeError(msg)
+
+
+@pytest.fixture
+def queue_name() -> Iterator[str]:
+    """Queue consumed by a server of `Manager` running in a thread."""
+    queue_name = f'test_inproc_{uuid.uuid4().hex}'
+    server = InProcRPCServer(queue_name, Manager)
+    thread = threading.Thread(target=server.start, daemon=True)
+    thread.start()
+    yield queue_name
+    server.stop()
+    thread.join()
+
+
+def test_call(queue_name: str) -> None:
+    """Data is encoded like over the network and not shared by reference."""
+    vm_id = uuid.uuid4()
+    data = {'vm_id': vm_id}
+
+    result = InProcRPCClient(queue_name).call('echo', data_for_method=data)
+
+    assert result == {'vm_id': str(vm_id)}
+    assert data == {'vm_id': vm_id}
+
+
+def test_call_error(queue_name: str) -> None:
+    """An exception of the manager is raised by the client."""
+    with pytest.raises(RpcCallException, match='boom'):
+        InProcRPCClient(queue_name).call('fail')
+
+
+def test_call_many(queue_name: str) -> None:
+    """Every call of a batch gets its own result."""
+    results = InProcRPCClient(queue_name).call_many(
+        [RpcCall('echo', {'n': 1}), RpcCall('fail')], parallel=True
+    )
+
+    assert results[0].result() == {'n': 1}
+    assert results[1].err == 'boom'
+
+
+def test_acall(queue_name: str) -> None:
+    """Concurrent coroutine calls get their own replies."""
+    client = InProcRPCClient(queue_name)
+
+    async def call_all() -> list:
+        return await asyncio.gather(
+            *(client.acall('echo', {'n': n}) for n in range(10))
+        )
+
+    assert asyncio.run(call_all()) == [{'n': n} for n in range(10)]
+
+
+def test_client_without_server() -> None:
+    """A client of a queue without in-process server fails on creation."""
+    with pytest.raises(RpcClientInitializedException):
+        InProcRPCClient(f'test_inproc_{uuid.uuid4().hex}')
+
+
+def test_call_timeout() -> None:
+    """A call to a queue nobody consumes yet times out."""
+    queue_name = f'test_inproc_{uuid.uuid4().hex}'
+    server = InProcRPCServer(queue_name, Manager)
+    client = InProcRPCClient(queue_name)
+
+    with pytest.raises(RpcCallTimeoutException):
+        client.call('echo', {'n': 1}, time_limit=0.05)
+    server.stop()
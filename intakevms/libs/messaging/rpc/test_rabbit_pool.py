@@ -0,0 +1,272 @@
+"""Unit tests for the pooled RabbitMQ RPC client.
+
+The broker is replaced by an in-memory fake connection that answers every
+request published with `reply_to` by echoing the `data_for_method` back, so
+the correlation of concurrent calls over shared connections can be verified
+without RabbitMQ.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/messaging/rpc/test_rabbit_pool.py
+"""
+
+import time
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Callable, Iterator, Optional
+from contextlib import ExitStack
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from intakevms import config
+from intakevms.libs.messaging.config import (
+    RpcPoolSettings,
+    get_rpc_pool_settings,
+)
+from intakevms.libs.messaging.exceptions import (
+    RpcCallException,
+    RpcCallTimeoutException,
+    RpcClientInitializedException,
+)
+from intakevms.libs.messaging.rpc.rabbit_pool import (
+    RabbitConnectionPool,
+    PooledRabbitRPCClient,
+)
+from intakevms.libs.data_handlers.json.serializer import (
+    serialize_json,
+    deserialize_json,
+)
+
+POOL_SIZE = 2
+CALLS = 100
+
+
+class FakeChannel:
+    """Channel echoing requests back to the declared callback queue."""
+
+    def __init__(self, *, reply: bool = True) -> None:
+        """Initialize the fake channel."""
+        self.reply = reply
+        self.on_response: Optional[Callable] = None
+        self.published: List[Any] = []
+        self.declared: List[Dict[str, Any]] = []
+
+    def queue_declare(self, **kwargs: Any) -> SimpleNamespace:  # noqa: ANN401 test fake
+        """Record and declare a callback queue."""
+        self.declared.append(kwargs)
+        return SimpleNamespace(method=SimpleNamespace(queue='amq.gen-test'))
+
+    def basic_consume(self, *, on_message_callback: Callable, **_: Any) -> None:  # noqa: ANN401 test fake
+        """Register the reply callback."""
+        self.on_response = on_message_callback
+
+    def basic_publish(self, *, properties: Any, body: bytes, **_: Any) -> None:  # noqa: ANN401 test fake
+        """Record the message and reply to calls."""
+        self.published.append(properties)
+        if self.reply and properties.reply_to and self.on_response:
+            request = deserialize_json(body.decode())
+            reply = serialize_json({'data': request['data_for_method']})
+            self.on_response(None, None, properties, reply.encode())
+
+
+class FakeConnection:
+    """Blocking connection running thread-safe callbacks when processed."""
+
+    reply = True
+
+    def __init__(self, _params: Any) -> None:  # noqa: ANN401 test fake
+        """Initialize the fake connection."""
+        self.is_open = True
+        self._channel = FakeChannel(reply=self.reply)
+        self._callbacks: List[Callable] = []
+        self._lock = threading.Lock()
+
+    def channel(self) -> FakeChannel:
+        """Return the single channel of the connection."""
+        return self._channel
+
+    def add_callback_threadsafe(self, callback: Callable) -> None:
+        """Queue a callback for the connection thread."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def process_data_events(self, time_limit: float) -> None:
+        """Run queued callbacks."""
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+        if not callbacks:
+            time.sleep(min(time_limit, 0.001))
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.is_open = False
+
+
+@pytest.fixture
+def pool() -> Iterator[RabbitConnectionPool]:
+    """Pool of two fake connections allowing two calls each."""
+    settings = RpcPoolSettings(
+        size=POOL_SIZE, max_inflight=2, acquire_timeout=0.2
+    )
+    with patch('pika.BlockingConnection', FakeConnection):
+        pool = RabbitConnectionPool(settings)
+        yield pool
+        pool.close()
+
+
+def _client(pool: RabbitConnectionPool) -> PooledRabbitRPCClient:
+    """Create a client bound to the given pool."""
+    client = PooledRabbitRPCClient('test_queue')
+    client.pool = pool
+    return client
+
+
+def test_concurrent_calls_are_correlated(pool: RabbitConnectionPool) -> None:
+    """Every concurrent caller receives the reply to its own request."""
+    client = _client(pool)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda i: client.call('echo', data_for_method={'i': i}),
+                range(CALLS),
+            )
+        )
+
+    assert results == [{'i': i} for i in range(CALLS)]
+    stats = pool.stats()
+    assert stats.alive == POOL_SIZE
+    assert stats.acquired == CALLS
+    assert stats.in_use == 0
+
+
+def test_concurrent_async_calls_are_correlated(
+    pool: RabbitConnectionPool,
+) -> None:
+    """Coroutines awaiting replies on shared connections are correlated."""
+    client = _client(pool)
+
+    async def run() -> List[Any]:
+        return await asyncio.gather(
+            *(
+                client.acall('echo', data_for_method={'i': i})
+                for i in range(CALLS)
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert results == [{'i': i} for i in range(CALLS)]
+    stats = pool.stats()
+    assert stats.acquired == CALLS
+    assert stats.in_use == 0
+
+
+def test_async_call_times_out_without_reply(
+    pool: RabbitConnectionPool,
+) -> None:
+    """An awaited call without a reply raises a timeout."""
+    with (
+        patch.object(FakeConnection, 'reply', new=False),
+        pytest.raises(RpcCallTimeoutException),
+    ):
+        asyncio.run(
+            _client(pool).acall('echo', data_for_method={}, time_limit=0.05)
+        )
+
+    assert pool.stats().in_use == 0
+
+
+def test_call_times_out_without_reply(pool: RabbitConnectionPool) -> None:
+    """A call without a reply raises a timeout and releases its slot."""
+    with (
+        patch.object(FakeConnection, 'reply', new=False),
+        pytest.raises(RpcCallTimeoutException),
+    ):
+        _client(pool).call('echo', data_for_method={}, time_limit=0.05)
+
+    assert pool.stats().in_use == 0
+
+
+def test_acquire_times_out_when_pool_is_exhausted(
+    pool: RabbitConnectionPool,
+) -> None:
+    """Callers wait for a free slot and give up after the acquire timeout."""
+    with (
+        pool.acquire(),
+        pool.acquire(),
+        pool.acquire(),
+        pool.acquire(),
+        pytest.raises(RpcCallTimeoutException),
+    ):
+        _client(pool).cast('echo', data_for_method={})
+
+    stats = pool.stats()
+    assert stats.waited == 1
+    assert stats.timeouts == 1
+    assert stats.wait_seconds_max >= pool.settings.acquire_timeout
+
+
+def test_cancelled_wait_gives_its_slot_back(
+    pool: RabbitConnectionPool,
+) -> None:
+    """A slot freed for a cancelled waiter is released to the pool."""
+    slots = POOL_SIZE * pool.settings.max_inflight
+
+    async def run() -> None:
+        with ExitStack() as held:
+            for _ in range(slots):
+                held.enter_context(pool.acquire())
+
+            async def wait() -> None:
+                async with pool.aacquire():
+                    pass
+
+            waiter = asyncio.create_task(wait())
+            await asyncio.sleep(0.05)
+            waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(pool.settings.acquire_timeout)
+
+    asyncio.run(run())
+
+    with ExitStack() as held:
+        for _ in range(slots):
+            held.enter_context(pool.acquire())
+    assert pool.stats().timeouts == 0
+
+
+def test_server_error_is_raised(pool: RabbitConnectionPool) -> None:
+    """An `err` reply of the server is raised as RpcCallException."""
+    with pytest.raises(RpcCallException):
+        _client(pool).on_response(b'{"err": "boom"}')
+
+
+def test_callback_queue_keeps_its_limits(pool: RabbitConnectionPool) -> None:
+    """The shared callback queue is bounded like unpooled ones."""
+    with pool.acquire() as worker:
+        channel = worker._channel  # noqa: SLF001 inspect the fake channel
+
+    [declared] = channel.declared  # type: ignore[union-attr]
+    assert declared['arguments'] == {'x-max-priority': 10, 'x-max-length': 200}
+
+
+def test_named_callback_queue_is_rejected() -> None:
+    """Pooled clients cannot honour a callback queue of their own."""
+    with pytest.raises(RpcClientInitializedException, match='my_replies'):
+        PooledRabbitRPCClient('test_queue', 'my_replies')
+
+
+def test_more_calls_than_queued_replies_are_rejected() -> None:
+    """Calls of a connection cannot outnumber the replies of its queue."""
+    pool_config = {'messaging': {'pool': {'max_inflight': 201}}}
+    with (
+        patch.object(config, 'data', pool_config),
+        pytest.raises(ValueError, match='max_inflight is 201'),
+    ):
+        get_rpc_pool_settings()
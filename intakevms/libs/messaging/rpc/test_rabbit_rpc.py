@@ -0,0 +1,325 @@
+"""Unit tests for the pooled modes of the RabbitMQ RPC server.
+
+The broker is replaced by an in-memory fake connection. Requests are fed to
+`RabbitRPCServer.on_request` directly and the callbacks the workers hand
+over to the connection thread are run by the test, acting as that thread.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/messaging/rpc/test_rabbit_rpc.py
+"""
+
+import time
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Callable, ClassVar, Iterator, Optional
+from unittest.mock import patch
+
+import pika
+import pytest
+
+from intakevms.libs.messaging import metrics, deadlines
+from intakevms.libs.messaging.config import RpcPoolSettings, RpcServerSettings
+from intakevms.libs.messaging.managers import ManagerScope, ManagerProvider
+from intakevms.libs.messaging.rpc.base import (
+    RpcCall,
+    batch_time_limit,
+    build_batch_request,
+)
+from intakevms.libs.messaging.rpc.rabbit_rpc import RabbitRPCServer
+from intakevms.libs.data_handlers.json.serializer import (
+    serialize_json,
+    deserialize_json,
+)
+
+WORKERS = 2
+TIMEOUT = 5
+REQUESTS = 20
+BUDGET = 60
+CALL_TIME_LIMIT = 0.1
+
+
+class Manager:
+    """Manager with a slow and a fast method."""
+
+    release = threading.Event()
+
+    def slow(self, data: Dict) -> Dict:
+        """Wait until released."""
+        self.release.wait(TIMEOUT)
+        return data
+
+    def fast(self, data: Dict) -> Dict:
+        """Return immediately."""
+        return data
+
+    def fail(self) -> None:
+        """Raise an error."""
+        msg = 'boom'
+        raise RuntimeError(msg)
+
+    def budget(self) -> Optional[float]:
+        """Return the time left to handle the request."""
+        return deadlines.remaining_time()
+
+
+class WorkerManager(Manager):
+    """Manager reused by the worker threads of the server."""
+
+    rpc_scope = ManagerScope.WORKER
+    instances: ClassVar[List['WorkerManager']] = []
+
+    def __init__(self) -> None:
+        """Register the instance."""
+        self.instances.append(self)
+
+
+class FakeChannel:
+    """Channel recording replies and acknowledgements."""
+
+    def __init__(self) -> None:
+        """Initialize the fake channel."""
+        self.replies: Dict[str, Any] = {}
+        self.acks: List[int] = []
+        self.threads: List[str] = []
+
+    def queue_declare(self, **_: Any) -> None:  # noqa: ANN401 test fake
+        """Declare a queue."""
+
+    def basic_qos(self, **_: Any) -> None:  # noqa: ANN401 test fake
+        """Set the prefetch count."""
+
+    def basic_consume(self, **_: Any) -> None:  # noqa: ANN401 test fake
+        """Register the request callback."""
+
+    def basic_publish(self, *, properties: Any, body: bytes, **_: Any) -> None:  # noqa: ANN401 test fake
+        """Record the reply."""
+        self.threads.append(threading.current_thread().name)
+        self.replies[properties.correlation_id] = deserialize_json(
+            body.decode()
+        )
+
+    def basic_ack(self, delivery_tag: int) -> None:
+        """Record the acknowledgement."""
+        self.threads.append(threading.current_thread().name)
+        self.acks.append(delivery_tag)
+
+
+class FakeConnection:
+    """Blocking connection queueing thread-safe callbacks."""
+
+    def __init__(self, _params: Any) -> None:  # noqa: ANN401 test fake
+        """Initialize the fake connection."""
+        self._channel = FakeChannel()
+        self.callbacks: List[Callable] = []
+        self._lock = threading.Lock()
+
+    def channel(self) -> FakeChannel:
+        """Return the single channel of the connection."""
+        return self._channel
+
+    def add_callback_threadsafe(self, callback: Callable) -> None:
+        """Queue a callback for the connection thread."""
+        with self._lock:
+            self.callbacks.append(callback)
+
+    def process(self, count: int) -> None:
+        """Run queued callbacks until `count` of them were run."""
+        deadline = time.monotonic() + TIMEOUT
+        while count and time.monotonic() < deadline:
+            with self._lock:
+                callbacks, self.callbacks = self.callbacks, []
+            for callback in callbacks:
+                callback()
+            count -= len(callbacks)
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def thread_mode() -> Iterator[None]:
+    """Servers handle requests in a pool of two threads."""
+    settings = RpcServerSettings(mode='thread', workers=WORKERS, prefetch=2)
+    with (
+        patch('pika.BlockingConnection', FakeConnection),
+        patch(
+            'intakevms.libs.messaging.rpc.rabbit_rpc.get_rpc_server_settings',
+            return_value=settings,
+        ),
+    ):
+        yield
+
+
+@pytest.fixture
+def server(thread_mode: None) -> Iterator[RabbitRPCServer]:  # noqa: ARG001 fixture dependency
+    """Server of `Manager` handling requests in a pool of two threads."""
+    server = RabbitRPCServer('test_queue', Manager)
+    yield server
+    Manager.release.set()
+    server.executor.shutdown()  # type: ignore[union-attr]
+    Manager.release.clear()
+
+
+def _request(
+    server: RabbitRPCServer,
+    tag: int,
+    method_name: str,
+    data: Dict,
+) -> None:
+    """Deliver a request to the server."""
+    _deliver(
+        server,
+        tag,
+        {
+            'method_name': method_name,
+            'data_for_method': data,
+            'data_for_manager': {},
+        },
+    )
+
+
+def _deliver(
+    server: RabbitRPCServer,
+    tag: int,
+    request: Dict,
+    headers: Optional[Dict] = None,
+) -> None:
+    """Deliver a request body to the server."""
+    body = serialize_json(request).encode()
+    server.on_request(
+        server.channel,
+        SimpleNamespace(delivery_tag=tag),  # type: ignore[arg-type]
+        pika.BasicProperties(
+            reply_to='reply', correlation_id=str(tag), headers=headers
+        ),
+        body,
+    )
+
+
+def test_slow_request_does_not_block_others(server: RabbitRPCServer) -> None:
+    """A fast request is replied while a slow one is still running."""
+    connection = server.connection
+    channel = server.channel
+    _request(server, 1, 'slow', {'n': 1})
+    _request(server, 2, 'fast', {'n': 2})
+
+    connection.process(1)  # type: ignore[attr-defined]
+    assert channel.acks == [2]  # type: ignore[attr-defined]
+
+    Manager.release.set()
+    connection.process(1)  # type: ignore[attr-defined]
+    assert channel.acks == [2, 1]  # type: ignore[attr-defined]
+    assert channel.replies == {  # type: ignore[attr-defined]
+        '1': {'data': {'n': 1}},
+        '2': {'data': {'n': 2}},
+    }
+    main = threading.current_thread().name
+    assert set(channel.threads) == {main}  # type: ignore[attr-defined]
+
+
+def test_error_is_replied(server: RabbitRPCServer) -> None:
+    """An exception of the manager is replied as `err`."""
+    _request(server, 1, 'fail', {})
+
+    server.connection.process(1)  # type: ignore[attr-defined]
+    assert server.channel.replies == {'1': {'err': 'boom'}}  # type: ignore[attr-defined]
+
+
+def test_batch_request(server: RabbitRPCServer) -> None:
+    """Every call of a batch is replied in order, errors included."""
+    calls = [
+        RpcCall('fast', {'n': 1}),
+        RpcCall('fail'),
+        RpcCall('fast', {'n': 2}),
+    ]
+    _deliver(server, 1, build_batch_request(calls, parallel=True))
+
+    server.connection.process(1)  # type: ignore[attr-defined]
+    assert server.channel.replies == {  # type: ignore[attr-defined]
+        '1': {
+            'data': [
+                {'data': {'n': 1}},
+                {'err': 'boom'},
+                {'data': {'n': 2}},
+            ]
+        }
+    }
+
+
+def test_batch_call_exceeding_its_time_limit(server: RabbitRPCServer) -> None:
+    """A hung call is replied as an error, the other results are kept."""
+    calls = [
+        RpcCall('slow', {'n': 1}, time_limit=CALL_TIME_LIMIT),
+        RpcCall('fast', {'n': 2}, time_limit=CALL_TIME_LIMIT),
+    ]
+    started = time.monotonic()
+    _deliver(server, 1, build_batch_request(calls, parallel=True))
+
+    server.connection.process(1)  # type: ignore[attr-defined]
+    assert time.monotonic() - started < TIMEOUT
+    assert server.channel.replies == {  # type: ignore[attr-defined]
+        '1': {
+            'data': [
+                {'err': 'Call of slow exceeded its deadline'},
+                {'data': {'n': 2}},
+            ]
+        }
+    }
+    assert batch_time_limit(calls * 3, workers=4) == 2  # noqa: PLR2004 two waves of 0.1s and the margin
+
+
+@pytest.mark.usefixtures('thread_mode')
+def test_worker_scoped_manager_is_reused() -> None:
+    """A worker-scoped manager is built at most once per worker thread."""
+    server = RabbitRPCServer('test_queue', WorkerManager)
+    for tag in range(REQUESTS):
+        _request(server, tag, 'fast', {'n': tag})
+
+    server.connection.process(REQUESTS)  # type: ignore[attr-defined]
+    server.executor.shutdown()  # type: ignore[union-attr]
+    assert len(server.channel.acks) == REQUESTS  # type: ignore[attr-defined]
+    assert 1 <= len(WorkerManager.instances) <= WORKERS
+
+
+def test_managers_are_not_reused_without_pool() -> None:
+    """Without the pool, a worker-scoped manager is built per request."""
+    with (
+        patch(
+            'intakevms.libs.messaging.config.get_messaging_type_and_transport',
+            return_value=('rpc', 'rabbitmq'),
+        ),
+        patch(
+            'intakevms.libs.messaging.config.get_rpc_pool_settings',
+            return_value=RpcPoolSettings(enabled=False),
+        ),
+    ):
+        managers = ManagerProvider(WorkerManager)
+
+    assert managers.scope is ManagerScope.REQUEST
+    assert managers.get() is not managers.get()
+
+
+def test_expired_request_is_dropped(server: RabbitRPCServer) -> None:
+    """A request whose caller gave up is acknowledged but not handled."""
+    request = {'method_name': 'fast', 'data_for_method': {'n': 1}}
+    expired = metrics.SERVER_EXPIRED
+    before = expired._values.get(('test_queue', 'fast'), 0)  # noqa: SLF001 test inspects the counter
+
+    _deliver(server, 1, request, deadlines.deadline_header(time.time() - 1))
+
+    assert server.channel.acks == [1]  # type: ignore[attr-defined]
+    assert server.channel.replies == {}  # type: ignore[attr-defined]
+    assert expired._values[('test_queue', 'fast')] == before + 1  # noqa: SLF001 test inspects the counter
+
+
+def test_handler_sees_deadline(server: RabbitRPCServer) -> None:
+    """The remaining budget of a request is available to its handler."""
+    request = {'method_name': 'budget'}
+    _deliver(
+        server, 1, request, deadlines.deadline_header(time.time() + BUDGET)
+    )
+    _deliver(server, 2, request)
+
+    server.connection.process(2)  # type: ignore[attr-defined]
+    replies = server.channel.replies  # type: ignore[attr-defined]
+    assert 0 < replies['1']['data'] <= BUDGET
+    assert replies['2'] == {'data': None}
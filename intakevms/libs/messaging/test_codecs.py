@@ -0,0 +1,47 @@
+"""Unit tests for the RPC codecs.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/messaging/test_codecs.py
+"""
+
+import uuid
+import datetime
+
+import pytest
+
+from intakevms.libs.messaging.codecs import JsonCodec, get_codec
+from intakevms.libs.data_handlers.json.serializer import serialize_json
+
+
+def test_uuid_and_datetime_are_decoded_as_strings() -> None:
+    """UUIDs and datetimes are received as their string representation."""
+    codec = JsonCodec()
+    vm_id = uuid.uuid4()
+    created_at = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+    body = codec.encode({'vm_id': vm_id, 'created_at': created_at})
+
+    assert codec.decode(body) == {
+        'vm_id': str(vm_id),
+        'created_at': '2024-01-02T03:04:05',
+    }
+
+
+def test_message_without_content_type_is_decoded_as_json() -> None:
+    """Messages of older services are decoded with the JSON codec."""
+    body = serialize_json({'data': ['vm']}).encode()
+
+    assert get_codec(None).decode(body) == {'data': ['vm']}
+
+
+def test_unknown_content_type() -> None:
+    """An unsupported content type is rejected."""
+    with pytest.raises(ValueError, match='Unsupported RPC content type'):
+        get_codec('application/xml')
+
+
+def test_unserializable_data() -> None:
+    """Data the codec cannot encode raises `TypeError`."""
+    with pytest.raises(TypeError):
+        JsonCodec().encode({'data': object()})
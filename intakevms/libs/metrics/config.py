@@ -0,0 +1,62 @@
+"""Configuration of the metrics exporter.
+
+This module reads the `[metrics]` section of the project configuration.
+Every service process serves its metrics on its own port, configured in
+`[metrics.queues.<queue_name>]` for the queue it consumes:
+
+    [metrics]
+    enabled = true
+    host = 'localhost'
+        [metrics.queues.vms_api_service_layer]
+        port = 9201
+
+The worker processes of the web application serve theirs on consecutive
+ports, from the one of `[metrics.queues.web_app]`.
+
+Classes:
+    MetricsSettings: Settings of the metrics exporter of a process.
+
+Functions:
+    get_metrics_settings: Retrieves the exporter settings of a queue.
+"""
+
+from dataclasses import dataclass
+
+from intakevms import config
+
+
+@dataclass(frozen=True)
+class MetricsSettings:
+    """Settings of the metrics exporter of a process.
+
+    Attributes:
+        enabled (bool): Whether metrics are exported.
+        host (str): Address the exporter listens on.
+        port (int): Port the exporter listens on, `0` to not export.
+    """
+
+    enabled: bool = False
+    host: str = 'localhost'
+    port: int = 0
+
+
+def get_metrics_settings(queue_name: str = '') -> MetricsSettings:
+    """Get the exporter settings of the process consuming a queue.
+
+    This function reads the `[metrics]` section of the configuration and
+    applies the overrides of `[metrics.queues.<queue_name>]` on top of it.
+
+    Args:
+        queue_name (str): Name of the queue consumed by the process.
+
+    Returns:
+        MetricsSettings: The exporter settings.
+    """
+    metrics = dict(config.data.get('metrics', {}))
+    metrics.update(metrics.pop('queues', {}).get(queue_name, {}))
+    defaults = MetricsSettings()
+    return MetricsSettings(
+        enabled=bool(metrics.get('enabled', defaults.enabled)),
+        host=str(metrics.get('host', defaults.host)),
+        port=int(metrics.get('port', defaults.port)),
+    )
@@ -0,0 +1,106 @@
+"""HTTP exporter of the metrics of a process.
+
+Serves `GET /metrics` with the metrics of the registry in the Prometheus
+text format, from a daemon thread of the process.
+
+The registry of a process only holds the metrics of that process. Servers
+running several worker processes, such as the web application under
+uvicorn, serve the metrics of each worker on its own port, taken from a
+range of consecutive ports, each scraped as a separate target.
+
+Functions:
+    start_metrics_server: Starts the exporter in a background thread.
+    start_worker_metrics_server: Starts the exporter of a worker process on
+        the first free port of a range.
+
+Constants:
+    CONTENT_TYPE: Content type of the exposition format.
+"""
+
+import threading
+from typing import Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.metrics.registry import REGISTRY, MetricsRegistry
+
+LOG = get_logger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def start_metrics_server(
+    host: str,
+    port: int,
+    registry: MetricsRegistry = REGISTRY,
+) -> ThreadingHTTPServer:
+    """Start serving the metrics in a background thread.
+
+    Args:
+        host (str): Address to listen on.
+        port (int): Port to listen on.
+        registry (MetricsRegistry): The registry to serve.
+
+    Returns:
+        ThreadingHTTPServer: The running server, `shutdown()` stops it.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Handler serving the registry on `/metrics`."""
+
+        def do_GET(self) -> None:  # noqa: N802 name required by http.server
+            """Serve the metrics."""
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002 signature of http.server
+            """Log scrapes at debug level only."""
+            LOG.debug(format % args)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name='metrics-exporter', daemon=True
+    ).start()
+    LOG.info(f'Serving metrics on http://{host}:{port}/metrics')
+    return server
+
+
+def start_worker_metrics_server(
+    host: str,
+    first_port: int,
+    workers: int,
+    registry: MetricsRegistry = REGISTRY,
+) -> Optional[ThreadingHTTPServer]:
+    """Start serving the metrics of a worker process on a free port.
+
+    The ports from `first_port` are tried in turn, one per worker, so that
+    a restarted worker takes the port its predecessor released.
+
+    Args:
+        host (str): Address to listen on.
+        first_port (int): First port of the range.
+        workers (int): Number of worker processes, i.e. of ports.
+        registry (MetricsRegistry): The registry to serve.
+
+    Returns:
+        Optional[ThreadingHTTPServer]: The running server, or None if every
+            port of the range is taken.
+    """
+    for port in range(first_port, first_port + workers):
+        try:
+            return start_metrics_server(host, port, registry)
+        except OSError:
+            continue
+    LOG.warning(
+        f'Metrics not served: ports {first_port} to '
+        f'{first_port + workers - 1} are taken.'
+    )
+    return None
@@ -0,0 +1,425 @@
+"""Process-wide metrics registry.
+
+This module provides a minimal registry of histograms and callback metrics,
+rendered in the Prometheus text exposition format, so a process can expose
+its metrics without the `prometheus_client` package. Metrics live in the
+process that records them: every service process serves its own.
+
+Usage example:
+    latency = REGISTRY.histogram(
+        'intakevms_rpc_client_duration_seconds',
+        'End-to-end latency of RPC calls.',
+        ('queue', 'method'),
+    )
+    latency.observe(0.012, 'vms_api_service_layer', 'get_all_vms')
+
+    REGISTRY.callback(
+        'intakevms_rpc_pool_in_use', 'Calls holding a slot.', 'gauge',
+        lambda: pool.stats().in_use,
+    )
+
+    body = REGISTRY.render()
+
+Classes:
+    Metric: Base class of the metrics.
+    Counter: Monotonic count of events, by label values.
+    Histogram: Distribution of observed values, by label values.
+    CallbackMetric: Gauge or counter whose value is read on rendering.
+    MetricsRegistry: Registry rendering all of its metrics.
+
+Constants:
+    DURATION_BUCKETS: Default buckets of histograms of durations, seconds.
+    SIZE_BUCKETS: Default buckets of histograms of payload sizes, bytes.
+    REGISTRY: The registry of the current process.
+"""
+
+import abc
+import math
+import bisect
+import threading
+from typing import Dict, List, Tuple, Callable, Iterator, Sequence
+
+DURATION_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+SIZE_BUCKETS: Tuple[float, ...] = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value or bucket bound.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The value in the exposition format.
+    """
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format the labels of a sample.
+
+    Args:
+        names (Sequence[str]): The label names.
+        values (Sequence[str]): The label values.
+
+    Returns:
+        str: The labels in braces, or an empty string without labels.
+    """
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values, strict=True):
+        escaped = (
+            str(value)
+            .replace('\\', '\\\\')
+            .replace('\n', '\\n')
+            .replace('"', '\\"')
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class Metric(metaclass=abc.ABCMeta):
+    """Base class of the metrics.
+
+    Attributes:
+        name (str): Name of the metric.
+        documentation (str): Help text of the metric.
+        metric_type (str): Prometheus type of the metric.
+    """
+
+    metric_type: str
+
+    def __init__(self, name: str, documentation: str) -> None:
+        """Initialize the metric.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Help text of the metric.
+        """
+        self.name = name
+        self.documentation = documentation
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Get the sample lines of the metric.
+
+        Yields:
+            str: A sample line in the exposition format.
+        """
+        ...
+
+    def render(self) -> str:
+        """Render the metric with its help and type lines.
+
+        Returns:
+            str: The metric in the exposition format.
+        """
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.metric_type}',
+            *self.samples(),
+        ]
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """Monotonic count of events, by label values.
+
+    Attributes:
+        labelnames (Tuple[str, ...]): Names of the labels.
+    """
+
+    metric_type = 'counter'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            name (str): Name of the metric, ending with `_total`.
+            documentation (str): Help text of the metric.
+            labelnames (Sequence[str]): Names of the labels.
+        """
+        super().__init__(name, documentation)
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increment the counter.
+
+        Args:
+            *labelvalues (str): The label values, in the order of
+                `labelnames`.
+            amount (float): The increment. Defaults to 1.
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+        if len(labelvalues) != len(self.labelnames):
+            msg = f'{self.name} expects labels {self.labelnames}'
+            raise ValueError(msg)
+        with self._lock:
+            self._values[labelvalues] = (
+                self._values.get(labelvalues, 0.0) + amount
+            )
+
+    def samples(self) -> Iterator[str]:
+        """Get the value of every label set.
+
+        Yields:
+            str: A sample line in the exposition format.
+        """
+        with self._lock:
+            values = dict(self._values)
+        for labelvalues, value in sorted(values.items()):
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f'{self.name}{labels} {_format_value(value)}'
+
+
+class Histogram(Metric):
+    """Distribution of observed values, by label values.
+
+    Attributes:
+        labelnames (Tuple[str, ...]): Names of the labels.
+        buckets (Tuple[float, ...]): Upper bounds of the buckets.
+    """
+
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Help text of the metric.
+            labelnames (Sequence[str]): Names of the labels.
+            buckets (Sequence[float]): Upper bounds of the buckets, `+Inf`
+                is added.
+        """
+        super().__init__(name, documentation)
+        self.labelnames = tuple(labelnames)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record an observed value.
+
+        Args:
+            value (float): The observed value.
+            *labelvalues (str): The label values, in the order of
+                `labelnames`.
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+        if len(labelvalues) != len(self.labelnames):
+            msg = f'{self.name} expects labels {self.labelnames}'
+            raise ValueError(msg)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            # Bucket counts (not cumulative), then the sum and the count.
+            series = self._series.setdefault(
+                labelvalues, [0.0] * (len(self.buckets) + 2)
+            )
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self) -> Iterator[str]:
+        """Get the bucket, sum and count lines of every label set.
+
+        Yields:
+            str: A sample line in the exposition format.
+        """
+        with self._lock:
+            series = {key: list(value) for key, value in self._series.items()}
+        bucket_labels = (*self.labelnames, 'le')
+        for labelvalues, values in sorted(series.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values, strict=False):
+                cumulative += count
+                labels = _format_labels(
+                    bucket_labels, (*labelvalues, _format_value(bound))
+                )
+                yield f'{self.name}_bucket{labels} {_format_value(cumulative)}'
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f'{self.name}_sum{labels} {_format_value(values[-2])}'
+            yield f'{self.name}_count{labels} {_format_value(values[-1])}'
+
+
+class CallbackMetric(Metric):
+    """Gauge or counter whose value is read on rendering.
+
+    Used for values another component already keeps track of, e.g. the
+    statistics of a connection pool.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        callback: Callable[[], float],
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Help text of the metric.
+            metric_type (str): `gauge` or `counter`.
+            callback (Callable[[], float]): Returns the current value.
+        """
+        super().__init__(name, documentation)
+        self.metric_type = metric_type
+        self.callback = callback
+
+    def samples(self) -> Iterator[str]:
+        """Get the current value.
+
+        Yields:
+            str: The sample line in the exposition format.
+        """
+        yield f'{self.name} {_format_value(self.callback())}'
+
+
+class MetricsRegistry:
+    """Registry rendering all of its metrics."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Counter:
+        """Get a counter, registering it on first use.
+
+        Args:
+            name (str): Name of the metric, ending with `_total`.
+            documentation (str): Help text of the metric.
+            labelnames (Sequence[str]): Names of the labels.
+
+        Returns:
+            Counter: The counter registered under the name.
+
+        Raises:
+            TypeError: If another metric is registered under the name.
+        """
+        with self._lock:
+            metric = self._metrics.setdefault(
+                name, Counter(name, documentation, labelnames)
+            )
+        if not isinstance(metric, Counter):
+            msg = f'Metric {name} is already registered as {metric.metric_type}'
+            raise TypeError(msg)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS,
+    ) -> Histogram:
+        """Get a histogram, registering it on first use.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Help text of the metric.
+            labelnames (Sequence[str]): Names of the labels.
+            buckets (Sequence[float]): Upper bounds of the buckets.
+
+        Returns:
+            Histogram: The histogram registered under the name.
+
+        Raises:
+            TypeError: If another metric is registered under the name.
+        """
+        with self._lock:
+            metric = self._metrics.setdefault(
+                name, Histogram(name, documentation, labelnames, buckets)
+            )
+        if not isinstance(metric, Histogram):
+            msg = f'Metric {name} is already registered as {metric.metric_type}'
+            raise TypeError(msg)
+        return metric
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        callback: Callable[[], float],
+    ) -> None:
+        """Register a metric whose value is read on rendering.
+
+        A metric registered again under the same name is replaced.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Help text of the metric.
+            metric_type (str): `gauge` or `counter`.
+            callback (Callable[[], float]): Returns the current value.
+        """
+        with self._lock:
+            self._metrics[name] = CallbackMetric(
+                name, documentation, metric_type, callback
+            )
+
+    def render(self) -> str:
+        """Render all the metrics in the Prometheus text format.
+
+        Returns:
+            str: The exposition of the metrics.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return ''.join(f'{metric.render()}\n' for metric in metrics)
+
+
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,80 @@
+"""Unit tests for the metrics registry and exporter.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/metrics/test_registry.py
+"""
+
+import urllib.request
+
+import pytest
+
+from intakevms.libs.metrics.exporter import (
+    start_metrics_server,
+    start_worker_metrics_server,
+)
+from intakevms.libs.metrics.registry import MetricsRegistry
+
+
+def test_histogram_exposition() -> None:
+    """Buckets are cumulative and every label set has a sum and a count."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        'rpc_seconds', 'RPC latency.', ('queue',), buckets=(0.1, 1)
+    )
+    histogram.observe(0.05, 'vms')
+    histogram.observe(0.5, 'vms')
+    histogram.observe(5, 'vms')
+
+    assert registry.render() == (
+        '# HELP rpc_seconds RPC latency.\n'
+        '# TYPE rpc_seconds histogram\n'
+        'rpc_seconds_bucket{queue="vms",le="0.1"} 1\n'
+        'rpc_seconds_bucket{queue="vms",le="1"} 2\n'
+        'rpc_seconds_bucket{queue="vms",le="+Inf"} 3\n'
+        'rpc_seconds_sum{queue="vms"} 5.55\n'
+        'rpc_seconds_count{queue="vms"} 3\n'
+    )
+
+
+def test_histogram_labels() -> None:
+    """Observations must provide every label."""
+    histogram = MetricsRegistry().histogram('rpc_seconds', 'RPC.', ('queue',))
+
+    with pytest.raises(ValueError, match='expects labels'):
+        histogram.observe(1)
+
+
+def test_exporter() -> None:
+    """The exporter serves the registry on `/metrics`."""
+    registry = MetricsRegistry()
+    registry.callback(
+        'pool_in_use', 'Calls holding a slot.', 'gauge', lambda: 3
+    )
+    server = start_metrics_server('127.0.0.1', 0, registry)
+    port = server.server_address[1]
+    try:
+        with urllib.request.urlopen(
+            f'http://127.0.0.1:{port}/metrics'
+        ) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+
+    assert 'pool_in_use 3' in body
+
+
+def test_worker_exporters_take_the_free_ports() -> None:
+    """A worker serves its metrics on the first free port of the range."""
+    taken = start_metrics_server('127.0.0.1', 0, MetricsRegistry())
+    port = taken.server_address[1]
+    worker = start_worker_metrics_server('127.0.0.1', port, 2)
+    try:
+        assert worker is not None
+        assert worker.server_address[1] == port + 1
+        assert start_worker_metrics_server('127.0.0.1', port, 1) is None
+    finally:
+        for server in (taken, worker):
+            if server is not None:
+                server.shutdown()
+                server.server_close()
@@ -0,0 +1,160 @@
+"""Change-only writes of the periodic monitoring tasks.
+
+The monitoring tasks of the service layers compare the state observed on
+the host with the state stored in the database every few seconds. Most
+cycles change nothing, so rewriting every row would make the write load
+grow with the size of the fleet. A `StateSnapshot` keeps the last known
+state of the monitored columns, taken from the rows the task reads anyway,
+and keeps only the observed rows differing from it, to be written in a
+single bulk `UPDATE`.
+
+The rows observed and written by each cycle are logged and counted in the
+metrics registry:
+
+    * `intakevms_monitoring_rows_observed_total`: rows compared, by
+      resource.
+    * `intakevms_monitoring_rows_written_total`: rows written, by resource.
+
+Usage example:
+    snapshot = StateSnapshot('volumes', ('size', 'used', 'status'))
+    snapshot.load(domain_volumes)
+    changed = snapshot.changes(observed_volumes)
+    if changed:
+        uow.volumes.bulk_update(changed)
+    snapshot.report(len(observed_volumes), len(changed))
+
+Classes:
+    StateSnapshot: Last known state of the monitored rows of a table.
+"""
+
+from typing import Any, Dict, List, Tuple, Mapping, Iterable, Sequence
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.metrics.registry import REGISTRY
+
+LOG = get_logger(__name__)
+
+ROWS_OBSERVED = REGISTRY.counter(
+    'intakevms_monitoring_rows_observed_total',
+    'Rows compared by the monitoring tasks.',
+    ('resource',),
+)
+ROWS_WRITTEN = REGISTRY.counter(
+    'intakevms_monitoring_rows_written_total',
+    'Rows written by the monitoring tasks.',
+    ('resource',),
+)
+
+# Value of the columns missing from the snapshot, equal to no value
+_UNKNOWN = object()
+
+
+class StateSnapshot:
+    """Last known state of the monitored rows of a table.
+
+    Rows are identified by the string of their `id`. Only the monitored
+    columns are kept, as a tuple per row.
+
+    Attributes:
+        resource (str): The monitored resource, label of the metrics.
+        columns (Tuple[str, ...]): The monitored columns.
+    """
+
+    def __init__(self, resource: str, columns: Sequence[str]) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            resource (str): The monitored resource, e.g. `volumes`.
+            columns (Sequence[str]): The monitored columns.
+        """
+        self.resource = resource
+        self.columns = tuple(columns)
+        self._states: Dict[str, Tuple] = {}
+
+    def load(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Replace the snapshot by the state of rows read from the database.
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): The rows, with their `id` and
+                any of the monitored columns.
+        """
+        self._states = {
+            str(row['id']): tuple(
+                row.get(column, _UNKNOWN) for column in self.columns
+            )
+            for row in rows
+        }
+
+    def differs(self, row_id: Any, values: Mapping[str, Any]) -> bool:  # noqa: ANN401 any primary key
+        """Check whether values differ from the known state of a row.
+
+        Values of unknown rows, and of columns not monitored, always differ.
+
+        Args:
+            row_id (Any): The ID of the row.
+            values (Mapping[str, Any]): The observed values, by column.
+
+        Returns:
+            bool: True if the values must be written.
+        """
+        state = self._states.get(str(row_id))
+        if state is None:
+            return True
+        known = dict(zip(self.columns, state, strict=True))
+        return any(
+            known.get(column, _UNKNOWN) != value
+            for column, value in values.items()
+        )
+
+    def changes(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the observed rows differing from their known state.
+
+        The snapshot is updated with the returned rows, assuming they are
+        written.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): The observed rows, with their
+                `id` and the observed columns.
+
+        Returns:
+            List[Dict[str, Any]]: The rows to write, in their given order.
+        """
+        changed = []
+        for row in rows:
+            values = {key: value for key, value in row.items() if key != 'id'}
+            if self.differs(row['id'], values):
+                changed.append(row)
+                self._remember(row)
+        return changed
+
+    def report(self, observed: int, written: int) -> None:
+        """Log and count the rows observed and written by a cycle.
+
+        Args:
+            observed (int): The rows compared.
+            written (int): The rows written.
+        """
+        ROWS_OBSERVED.inc(self.resource, amount=observed)
+        ROWS_WRITTEN.inc(self.resource, amount=written)
+        LOG.info(
+            f'Monitoring of {self.resource}: {written} of {observed} rows '
+            f'written.'
+        )
+
+    def _remember(self, row: Mapping[str, Any]) -> None:
+        """Update the known state of a row with its written values.
+
+        Args:
+            row (Mapping[str, Any]): The written row.
+        """
+        row_id = str(row['id'])
+        known = dict(
+            zip(
+                self.columns,
+                self._states.get(row_id, (_UNKNOWN,) * len(self.columns)),
+                strict=True,
+            )
+        )
+        self._states[row_id] = tuple(
+            row.get(column, known[column]) for column in self.columns
+        )
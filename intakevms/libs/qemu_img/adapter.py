@@ -8,25 +8,8 @@ Classes:
     QemuImgAdapter: Adapter class for managing qcow2/raw disk operations.
 """
 
-from typing import Dict
-from pathlib import Path
-
-from intakevms.libs.log import get_logger
-from intakevms.libs.cli.models import ExecutionResult
-from intakevms.libs.qemu_img.executor import QemuImgCommandExecutor
-from intakevms.libs.qemu_img.exceptions import QemuImgError
-from intakevms.libs.data_handlers.json.serializer import deserialize_json
-"""Adapter for interacting with qemu-img by executing shell commands.
-
-This module provides the `QemuImgAdapter` class, which encapsulates domain logic
-for disk image operations such as creation, conversion, validation, and info
-retrieval.
-
-Classes:
-    QemuImgAdapter: Adapter class for managing qcow2/raw disk operations.
-"""
-
-from typing import Dict
+import re
+from typing import Dict, Callable, Optional
 from pathlib import Path
 
 from intakevms.libs.log import get_logger
@@ -37,6 +20,9 @@ from intakevms.libs.data_handlers.json.serializer import deserialize_json
 
 LOG = get_logger(__name__)
 
+# Progress line written by `qemu-img convert -p`, e.g. `    (42.35/100%)`.
+PROGRESS_PATTERN = re.compile(r'\((\d+(?:\.\d+)?)/100%\)')
+
 
 class QemuImgAdapter:
     """Encapsulates domain logic for qemu-img operations.
@@ -51,6 +37,7 @@ class QemuImgAdapter:
     CHECK_SUBCOMMAND = 'check'
     CREATE_BACKING_SUBCOMMAND = 'create -f qcow2 -b'
     CONVERT_SUBCOMMAND = 'convert -O '
+    CONVERT_WITH_PROGRESS_SUBCOMMAND = 'convert -p -O '
 
     def __init__(self) -> None:
         """Initialize a QemuImgAdapter instance.
@@ -113,6 +100,7 @@ class QemuImgAdapter:
         source_path: Path,
         target_path: Path,
         fmt: str = 'qcow2',
+        on_progress: Optional[Callable[[float], None]] = None,
     ) -> None:
         """Creates a full copy of an image file.
 
@@ -120,6 +108,8 @@ class QemuImgAdapter:
             source_path (Path): Path to the source image.
             target_path (Path): Path to the target image.
             fmt (str): Output format, default is 'qcow2'.
+            on_progress (Optional[Callable[[float], None]]): Called with the
+                percentage copied, as reported by `qemu-img convert -p`.
 
         Raises:
             QemuImgError: If convert fails.
@@ -128,132 +118,42 @@ class QemuImgAdapter:
             f'Creating copy from {source_path} to '
             f'{target_path} with format {fmt}'
         )
-        result = self.executor.execute(
-            f'{self.CONVERT_SUBCOMMAND} {fmt} {source_path} {target_path}'
-        )
-        LOG.info(f'Result of conversion: {result}')
-        self._check_result(self.CONVERT_SUBCOMMAND, result)
-
-    def _check_result(
-        self,
-        subcommand: str,
-        result: ExecutionResult,
-    ) -> None:
-        """Check command result and raise an error if it failed.
-
-        Args:
-            subcommand (str): Subcommand being performed.
-            result (ExecutionResult): Result object of the executed command.
-
-        Raises:
-            QemuImgError: If the command failed.
-        """
-        LOG.info(
-            f'Checking result of subcommand "{subcommand}" with '
-            f'return code {result.returncode}'
-        )
-        if result.returncode != 0:
-            message: str = (
-                f'Operation "{subcommand}" failed with code '
-                f'{result.returncode}.'
-                f'\n\tstderr: {result.stderr}'
+        if on_progress is None:
+            subcommand = self.CONVERT_SUBCOMMAND
+            result = self.executor.execute(
+                f'{subcommand} {fmt} {source_path} {target_path}'
             )
-            LOG.error(message)
-            raise QemuImgError(message)
-        LOG.info('Command executed successfully.')
-LOG = get_logger(__name__)
-
-
-class QemuImgAdapter:
-    """Encapsulates domain logic for qemu-img operations.
-
-    This class provides methods for working with qcow2/raw files using qemu-img.
-
-    Attributes:
-        executor (QemuImgCommandExecutor): Command executor for qemu-img.
-    """
-
-    INFO_SUBCOMMAND = 'info --output=json'
-    CHECK_SUBCOMMAND = 'check'
-    CREATE_BACKING_SUBCOMMAND = 'create -f qcow2 -b'
-    CONVERT_SUBCOMMAND = 'convert -O '
-
-    def __init__(self) -> None:
-        """Initialize a QemuImgAdapter instance.
-
-        Sets up the internal command executor used for running qemu-img
-        operations.
-        """
-        self.executor = QemuImgCommandExecutor()
+        else:
+            subcommand = self.CONVERT_WITH_PROGRESS_SUBCOMMAND
+            result = self.executor.execute(
+                f'{subcommand} {fmt} {source_path} {target_path}',
+                on_output=self._progress_parser(on_progress),
+            )
+            # Only progress lines, not worth logging.
+            result.stdout = ''
+        LOG.info(f'Result of conversion: {result}')
+        self._check_result(subcommand, result)
 
-    def get_info(self, image_path: Path) -> Dict:
-        """Retrieves detailed information about a disk image.
+    @staticmethod
+    def _progress_parser(
+        on_progress: Callable[[float], None],
+    ) -> Callable[[str], None]:
+        """Build the output handler reporting the progress of a command.
 
         Args:
-            image_path (Path): Path to the image file.
+            on_progress (Callable[[float], None]): Called with the percentage
+                of each progress line.
 
         Returns:
-            Dict: Parsed output of `qemu-img info --output=json`
-
-        Raises:
-            QemuImgError: If command fails.
+            Callable[[str], None]: The handler of the output lines.
         """
-        result = self.executor.execute(f'{self.INFO_SUBCOMMAND} {image_path}')
-        self._check_result(self.INFO_SUBCOMMAND, result)
-        info: Dict = deserialize_json(result.stdout)
-        return info
 
-    def check_valid(self, image_path: Path) -> bool:
-        """Checks integrity of an image file.
+        def parse(line: str) -> None:
+            match = PROGRESS_PATTERN.search(line)
+            if match is not None:
+                on_progress(float(match.group(1)))
 
-        Args:
-            image_path (Path): Path to the image file.
-
-        Returns:
-            bool: True if valid, False if invalid.
-        """
-        result = self.executor.execute(f'{self.CHECK_SUBCOMMAND} {image_path}')
-        return result.returncode == 0
-
-    def create_backing_volume(
-        self,
-        backing_path: Path,
-        target_path: Path,
-    ) -> None:
-        """Creates a new qcow2 volume using a backing file.
-
-        Args:
-            backing_path (Path): Path to the backing qcow2 file.
-            target_path (Path): Path for the new image file.
-
-        Raises:
-            QemuImgError: If creation fails.
-        """
-        result = self.executor.execute(
-            f'{self.CREATE_BACKING_SUBCOMMAND} {backing_path} {target_path}'
-        )
-        self._check_result(self.CREATE_BACKING_SUBCOMMAND, result)
-
-    def create_copy(
-        self,
-        source_path: Path,
-        target_path: Path,
-        fmt: str = 'qcow2',
-    ) -> None:
-        """Creates a full copy of an image file.
-
-        Args:
-            source_path (Path): Path to the source image.
-            target_path (Path): Path to the target image.
-            fmt (str): Output format, default is 'qcow2'.
-
-        Raises:
-            QemuImgError: If convert fails.
-        """
-        result = self.executor.execute(
-            f'{self.CONVERT_SUBCOMMAND} {fmt} {source_path} {target_path}'
-        )
-        self._check_result(self.CONVERT_SUBCOMMAND, result)
+        return parse
 
     def _check_result(
         self,
@@ -269,10 +169,16 @@ class QemuImgAdapter:
         Raises:
             QemuImgError: If the command failed.
         """
+        LOG.info(
+            f'Checking result of subcommand "{subcommand}" with '
+            f'return code {result.returncode}'
+        )
         if result.returncode != 0:
             message: str = (
                 f'Operation "{subcommand}" failed with code '
                 f'{result.returncode}.'
                 f'\n\tstderr: {result.stderr}'
             )
+            LOG.error(message)
             raise QemuImgError(message)
+        LOG.info('Command executed successfully.')
@@ -9,7 +9,7 @@ Dependencies:
     - intakevms.libs.cli.executor (execute)
 """
 
-from typing import Optional
+from typing import Callable, Optional
 
 from intakevms.libs.log import get_logger
 from intakevms.libs.cli.models import ExecuteParams, ExecutionResult
@@ -49,12 +49,15 @@ class QemuImgCommandExecutor:
         self,
         subcommand: str,
         timeout: Optional[float] = None,
+        on_output: Optional[Callable[[str], None]] = None,
     ) -> ExecutionResult:
         """Executes the qemu-img command with optional timeout.
 
         Args:
             subcommand (str): Subcommand and arguments (e.g. 'info /path').
             timeout (Optional[float]): Timeout in seconds.
+            on_output (Optional[Callable[[str], None]]): Called with each
+                line of the output as it is written.
 
         Returns:
             ExecutionResult: The result of the command execution.
@@ -69,5 +72,6 @@ class QemuImgCommandExecutor:
                 shell=True,
                 root_helper='sudo -E',
             ),
+            on_output=on_output,
         )
         return result
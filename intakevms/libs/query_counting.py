@@ -0,0 +1,238 @@
+"""Counting of the SQL statements issued by a code path.
+
+Statements are counted by listeners of the SQLAlchemy `Engine` class, so
+every engine of the process is covered, asyncio engines included. The
+listeners do nothing unless `count_queries` is active in the current
+context, e.g. around the execution of an RPC request.
+
+The statements of the RPC requests handled by a server are logged and
+measured, labelled by method:
+
+    * `intakevms_rpc_server_sql_statements`: statements issued per
+      request.
+    * `intakevms_rpc_server_sql_seconds`: time spent executing them.
+
+Statements are compared by their SQL text, with parameters bound
+separately, so a query repeated per row of a previous query (an N+1
+pattern) shows as the same text issued many times. Requests repeating a
+statement at least `REPEATED_STATEMENT_THRESHOLD` times are logged as
+warnings.
+
+Tests declare the statements allowed to a code path with
+`assert_query_budget`, also provided as the `query_budget` fixture.
+
+Usage example:
+    with count_queries() as stats:
+        manager.get_all_vms()
+    observe_queries('get_all_vms', stats)
+
+    with assert_query_budget(3, max_repeats=1):
+        manager.get_all_vms()
+
+Classes:
+    QueryStats: Statements issued in a context.
+    QueryBudgetExceededError: Raised when a code path exceeds its budget.
+
+Functions:
+    count_queries: Counts the statements issued in the current context.
+    observe_queries: Logs and measures the statements of an RPC request.
+    assert_query_budget: Fails if a code path exceeds a query budget.
+"""
+
+import time
+import contextlib
+from typing import Any, List, Tuple, Counter, Iterator, Optional
+from contextvars import ContextVar
+from dataclasses import field, dataclass
+
+from sqlalchemy import Engine, event
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.metrics.registry import REGISTRY
+
+LOG = get_logger(__name__)
+
+# Repetitions of a statement in a request reported as an N+1 pattern
+REPEATED_STATEMENT_THRESHOLD = 10
+
+# Key of the start times of the statements in the info of a connection
+_STARTED_KEY = 'intakevms_query_started'
+
+SERVER_STATEMENTS = REGISTRY.histogram(
+    'intakevms_rpc_server_sql_statements',
+    'SQL statements issued per RPC request.',
+    ('method',),
+    (1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+SERVER_SQL_SECONDS = REGISTRY.histogram(
+    'intakevms_rpc_server_sql_seconds',
+    'Time spent executing the SQL statements of RPC requests.',
+    ('method',),
+)
+
+
+@dataclass
+class QueryStats:
+    """Statements issued in a context.
+
+    Attributes:
+        statements (int): Number of statements executed.
+        seconds (float): Time spent executing them.
+        texts (Counter[str]): Executions of every statement, by SQL text.
+    """
+
+    statements: int = 0
+    seconds: float = 0.0
+    texts: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Record an executed statement.
+
+        Args:
+            statement (str): The SQL text of the statement.
+            seconds (float): Time spent executing it.
+        """
+        self.statements += 1
+        self.seconds += seconds
+        self.texts[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Get the statements executed at least `threshold` times.
+
+        Args:
+            threshold (int): Minimum number of executions.
+
+        Returns:
+            List[Tuple[str, int]]: The statements and their executions, the
+                most executed first.
+        """
+        return [
+            (text, count)
+            for text, count in self.texts.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a code path issues more statements than declared."""
+
+
+# Statements of the current context, if counted.
+_CURRENT_STATS: ContextVar[Optional[QueryStats]] = ContextVar(
+    'current_query_stats', default=None
+)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(
+    conn: Any,  # noqa: ANN401 connection of any engine
+    *_: Any,  # noqa: ANN401 cursor, statement, parameters, context, executemany
+) -> None:
+    """Remember the start time of a counted statement."""
+    if _CURRENT_STATS.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(
+    conn: Any,  # noqa: ANN401 connection of any engine
+    _cursor: Any,  # noqa: ANN401 DBAPI cursor
+    statement: str,
+    *_: Any,  # noqa: ANN401 parameters, context, executemany
+) -> None:
+    """Record a statement if they are counted in the current context."""
+    stats = _CURRENT_STATS.get()
+    started = conn.info.get(_STARTED_KEY)
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+@contextlib.contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Count the statements issued in the current context.
+
+    The context is inherited by the threads running sync code, e.g. with
+    `run_in_threadpool`, so statements issued there are counted too.
+    Statements of other processes, e.g. of an RPC server called by the
+    code path, are not.
+
+    Yields:
+        QueryStats: The statements, filled as they are executed.
+    """
+    stats = QueryStats()
+    token = _CURRENT_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _CURRENT_STATS.reset(token)
+
+
+def observe_queries(method: str, stats: QueryStats) -> None:
+    """Log and measure the statements of an RPC request.
+
+    Args:
+        method (str): The method of the request.
+        stats (QueryStats): The statements issued by the request.
+    """
+    SERVER_STATEMENTS.observe(stats.statements, method)
+    SERVER_SQL_SECONDS.observe(stats.seconds, method)
+    LOG.debug(
+        f'RPC {method}: {stats.statements} SQL statements in '
+        f'{stats.seconds:.3f}s.'
+    )
+    for text, count in stats.repeated(REPEATED_STATEMENT_THRESHOLD):
+        LOG.warning(
+            f'RPC {method} executed {count} times the statement, '
+            f'possible N+1 queries: {" ".join(text.split())[:200]}'
+        )
+
+
+@contextlib.contextmanager
+def assert_query_budget(
+    max_statements: int,
+    *,
+    max_repeats: Optional[int] = None,
+) -> Iterator[QueryStats]:
+    """Fail if the code path of the context exceeds a query budget.
+
+    Args:
+        max_statements (int): Statements allowed to the code path.
+        max_repeats (Optional[int]): Executions allowed to every single
+            statement, e.g. 1 to forbid any query repeated per row.
+
+    Yields:
+        QueryStats: The statements issued in the context.
+
+    Raises:
+        QueryBudgetExceededError: If the code path exceeds the budget.
+    """
+    with count_queries() as stats:
+        yield stats
+    if stats.statements > max_statements:
+        msg = (
+            f'{stats.statements} SQL statements issued, '
+            f'{max_statements} allowed:\n{_describe(stats)}'
+        )
+        raise QueryBudgetExceededError(msg)
+    if max_repeats is not None and stats.repeated(max_repeats + 1):
+        msg = (
+            f'SQL statements executed more than {max_repeats} times:\n'
+            f'{_describe(stats)}'
+        )
+        raise QueryBudgetExceededError(msg)
+
+
+def _describe(stats: QueryStats) -> str:
+    """Describe the statements issued, for failure messages.
+
+    Args:
+        stats (QueryStats): The statements issued.
+
+    Returns:
+        str: One line per statement, with its executions.
+    """
+    return '\n'.join(
+        f'  {count} x {" ".join(text.split())}'
+        for text, count in stats.texts.most_common()
+    )
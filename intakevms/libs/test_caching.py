@@ -0,0 +1,65 @@
+"""Unit tests for the read caching of service layer managers.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/test_caching.py
+"""
+
+import threading
+from typing import Dict, List, ClassVar
+from concurrent.futures import ThreadPoolExecutor
+
+from intakevms.libs.caching import cached_read, invalidates
+
+CALLERS = 8
+TIMEOUT = 5
+
+
+class Manager:
+    """Manager counting the reads of its items."""
+
+    loads: ClassVar[List[Dict]] = []
+    release = threading.Event()
+
+    @cached_read('items')
+    def get_items(self, data: Dict) -> List[Dict]:
+        """Return the items, once released."""
+        self.release.wait(TIMEOUT)
+        self.loads.append(data)
+        return [{'name': data['name']}]
+
+    @invalidates('items')
+    def create_item(self) -> None:
+        """Pretend to write an item."""
+
+
+def test_concurrent_calls_are_coalesced() -> None:
+    """Identical concurrent calls run the method once."""
+    Manager.loads.clear()
+    Manager.release.clear()
+    with ThreadPoolExecutor(CALLERS) as executor:
+        futures = [
+            executor.submit(Manager().get_items, {'name': 'a'})
+            for _ in range(CALLERS)
+        ]
+        Manager.release.set()
+        results = [future.result() for future in futures]
+
+    assert Manager.loads == [{'name': 'a'}]
+    assert results == [[{'name': 'a'}]] * CALLERS
+    assert len({id(result) for result in results}) == CALLERS
+
+
+def test_write_invalidates() -> None:
+    """A write of the manager clears its cached reads."""
+    Manager.loads.clear()
+    Manager.release.set()
+    manager = Manager()
+
+    manager.get_items({'name': 'b'})
+    manager.get_items({'name': 'b'})[0]['name'] = 'changed'
+    assert manager.get_items({'name': 'b'}) == [{'name': 'b'}]
+    manager.create_item()
+    manager.get_items({'name': 'b'})
+
+    assert Manager.loads == [{'name': 'b'}, {'name': 'b'}]
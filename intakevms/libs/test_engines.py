@@ -0,0 +1,49 @@
+"""Unit tests for the process-wide engine registry.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/test_engines.py
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc as sa_exc
+
+from intakevms.libs.engines import PoolSettings, EngineRegistry
+from intakevms.libs.metrics.registry import REGISTRY
+
+
+def test_engines_are_shared_per_isolation_level(tmp_path: Path) -> None:
+    """Callers share an engine, and its pool, per URL and isolation level."""
+    url = f'sqlite:///{tmp_path / "engines.db"}'
+    registry = EngineRegistry(PoolSettings(size=1, max_overflow=0, timeout=0))
+
+    engine = registry.get('SERIALIZABLE', url)
+
+    assert registry.get('SERIALIZABLE', url) is engine
+    assert registry.get('AUTOCOMMIT', url) is not engine
+    with engine.connect(), pytest.raises(sa_exc.TimeoutError):
+        engine.connect()
+    exposition = REGISTRY.render()
+    assert 'intakevms_db_pool_timeouts_total{engine="serializable"} 1' in (
+        exposition
+    )
+    assert 'intakevms_db_pool_wait_seconds_count{engine="serializable"} 2' in (
+        exposition
+    )
+
+
+def test_read_only_engine_shares_the_default_pool(tmp_path: Path) -> None:
+    """Read-only transactions use the pool of the default engine."""
+    url = f'sqlite:///{tmp_path / "engines.db"}'
+    registry = EngineRegistry(PoolSettings())
+
+    engine = registry.get_read_only(url)
+
+    assert registry.get_read_only(url) is engine
+    assert engine.pool is registry.get(url=url).pool
+    assert engine.get_execution_options() == {
+        'isolation_level': 'READ COMMITTED',
+        'postgresql_readonly': True,
+    }
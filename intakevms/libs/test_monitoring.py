@@ -0,0 +1,40 @@
+"""Unit tests for the change-only writes of the monitoring tasks.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/test_monitoring.py
+"""
+
+from uuid import uuid4
+from typing import Any, Dict, List
+
+from intakevms.libs.monitoring import StateSnapshot
+from intakevms.libs.metrics.registry import REGISTRY
+
+
+def test_only_changed_rows_are_written() -> None:
+    """Rows equal to their known state are skipped, across cycles."""
+    unchanged, resized, failed = uuid4(), uuid4(), uuid4()
+    snapshot = StateSnapshot('test_items', ('size', 'status', 'information'))
+    snapshot.load(
+        {'id': row_id, 'size': 1, 'status': 'available', 'information': ''}
+        for row_id in (unchanged, resized, failed)
+    )
+    observed: List[Dict[str, Any]] = [
+        {'id': str(unchanged), 'size': 1, 'status': 'available'},
+        {'id': str(resized), 'size': 2, 'status': 'available'},
+        {'id': str(failed), 'status': 'error', 'information': 'lost'},
+        {'id': str(uuid4()), 'size': 1, 'status': 'available'},
+    ]
+
+    changed = snapshot.changes(observed)
+    snapshot.report(len(observed), len(changed))
+
+    assert changed == observed[1:]
+    assert snapshot.changes(observed) == []
+    assert not snapshot.differs(failed, {'size': 1, 'information': 'lost'})
+    assert snapshot.differs(failed, {'used': 0})
+    exposition = REGISTRY.render()
+    assert (
+        'intakevms_monitoring_rows_written_total{resource="test_items"} 3'
+    ) in exposition
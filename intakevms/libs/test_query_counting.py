@@ -0,0 +1,46 @@
+"""Unit tests for the counting of SQL statements.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/libs/test_query_counting.py
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text, create_engine
+
+from intakevms.libs.query_counting import (
+    QueryBudgetExceededError,
+    count_queries,
+    observe_queries,
+    assert_query_budget,
+)
+from intakevms.libs.metrics.registry import REGISTRY
+
+
+def test_statements_are_counted_and_budgeted(tmp_path: Path) -> None:
+    """Statements are counted per context, and repeats fail the budget."""
+    engine = create_engine(f'sqlite:///{tmp_path / "queries.db"}')
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+        with count_queries() as stats:
+            for item_id in range(3):
+                connection.execute(text('SELECT :id'), {'id': item_id})
+        observe_queries('test_method', stats)
+
+        with assert_query_budget(1):
+            connection.execute(text('SELECT 1'))
+        with (
+            pytest.raises(QueryBudgetExceededError, match='3 x SELECT'),
+            assert_query_budget(5, max_repeats=2),
+        ):
+            for item_id in range(3):
+                connection.execute(text('SELECT :id'), {'id': item_id})
+    engine.dispose()
+
+    assert stats.statements == 3  # noqa: PLR2004 statements of the loop
+    assert stats.repeated(3) == [('SELECT ?', 3)]
+    assert (
+        'intakevms_rpc_server_sql_statements_count{method="test_method"} 1'
+    ) in REGISTRY.render()
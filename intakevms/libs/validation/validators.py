@@ -9,7 +9,8 @@ Classes:
     Validator: A utility class for performing various validation tasks.
 """
 
-from typing import Any, Dict, List, Type, ClassVar
+import functools
+from typing import Any, Dict, List, Type, TypeVar, ClassVar
 
 from pydantic import (
     BaseModel,
@@ -21,6 +22,21 @@ from intakevms.libs.log import get_logger
 
 LOG = get_logger(__name__)
 
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(pydantic_schema: Type[BaseModel]) -> TypeAdapter:
+    """Get the cached adapter of a list of objects of a schema.
+
+    Args:
+        pydantic_schema (Type[BaseModel]): The schema of the objects.
+
+    Returns:
+        TypeAdapter: The adapter of `List[pydantic_schema]`.
+    """
+    return TypeAdapter(List[pydantic_schema])  # type: ignore[valid-type]
+
 
 class Validator:
     """A collection of validation methods for different types of input data.
@@ -69,10 +85,10 @@ class Validator:
     def validate_objects(
         cls,
         objects: List[Dict[str, Any]],
-        pydantic_schema: Type[BaseModel],
+        pydantic_schema: Type[ModelT],
         *,
         skip_corrupted_object: bool = True,
-    ) -> List[BaseModel]:
+    ) -> List[ModelT]:
         """Validates a list of objects against a Pydantic schema
 
         Ensures that all returned objects are valid instances of the schema.
@@ -87,10 +103,13 @@ class Validator:
         making it suitable for use in scenarios where subsequent processing (e.g.,
         API responses in FastAPI) requires fully valid Pydantic models.
 
+        The whole list is validated in a single pass first; objects are only
+        validated one by one when it fails, to replace the invalid ones.
+
         Args:
             objects (List[Dict[str, Any]]):
                 A list of dictionaries representing objects to be validated.
-            pydantic_schema (Type[BaseModel]):
+            pydantic_schema (Type[ModelT]):
                 The Pydantic schema against which each object will be validated.
             skip_corrupted_object (bool, optional):
                 If True (default), objects that fail validation are replaced with
@@ -99,7 +118,7 @@ class Validator:
                 an invalid object.
 
         Returns:
-            List[BaseModel]:
+            List[ModelT]:
                 A list of validated Pydantic objects, where all elements conform
                 to the specified schema. If `skip_corrupted_object=True`,
                 invalid objects are replaced with valid "corrupted" versions.
@@ -129,7 +148,42 @@ class Validator:
             UserModel(id=3, name='', status='corrupted object') # Replaced invalid entry
 
         """  # noqa: E501
-        result: List[BaseModel] = []
+        try:
+            validated: List[ModelT] = _list_adapter(
+                pydantic_schema
+            ).validate_python(objects)
+        except ValidationError:
+            return cls._validate_each(
+                objects,
+                pydantic_schema,
+                skip_corrupted_object=skip_corrupted_object,
+            )
+        return validated
+
+    @classmethod
+    def _validate_each(
+        cls,
+        objects: List[Dict[str, Any]],
+        pydantic_schema: Type[ModelT],
+        *,
+        skip_corrupted_object: bool,
+    ) -> List[ModelT]:
+        """Validate objects one by one, replacing the invalid ones.
+
+        Args:
+            objects (List[Dict[str, Any]]): The objects to validate.
+            pydantic_schema (Type[ModelT]): The schema of the objects.
+            skip_corrupted_object (bool): If True, invalid objects are
+                replaced with "corrupted objects" instead of raising.
+
+        Returns:
+            List[ModelT]: The validated objects.
+
+        Raises:
+            ValidationError: If `skip_corrupted_object=False` and an object
+                fails validation.
+        """
+        result: List[ModelT] = []
         for _object in objects:
             try:
                 validated_object = pydantic_schema.model_validate(_object)
@@ -142,12 +196,8 @@ class Validator:
                 )
                 LOG.warning(message)
                 if skip_corrupted_object:
-                    corrupted_object: BaseModel = (
-                        pydantic_schema.model_construct(
-                            **cls._create_corrupted_data(
-                                pydantic_schema, _object
-                            )
-                        )
+                    corrupted_object: ModelT = pydantic_schema.model_construct(
+                        **cls._create_corrupted_data(pydantic_schema, _object)
                     )
                     result.append(corrupted_object)
                 else:
@@ -8,8 +8,16 @@ Routes:
     Includes routers for various modules such as user, image, volume, network,
     and more.
 
+Metrics:
+    Every worker process serves its metrics from an internal exporter, on
+    the first free port from the one of `[metrics.queues.web_app]`, see
+    `start_worker_metrics_server`.
+
 Middleware:
-    Adds logging middleware to log each incoming request.
+    Adds logging middleware to log each incoming request, measures the
+    latency and size of the responses by route, logging slow requests with
+    their RPC calls, and compresses the responses the client accepts
+    compressed.
 
 Exception Handlers:
     Defines custom exception handlers for handling RPC call errors,
@@ -17,6 +25,7 @@ Exception Handlers:
 
 Functions:
     log_middleware: Middleware to log HTTP requests.
+    lifespan: Serves the metrics of the worker process while it runs.
     root: The root endpoint that serves the index.html template.
     rpc_call_exception_handler: Handles RpcCallException.
     rpc_call_timeout_exception_handler: Handles RpcCallTimeoutException.
@@ -25,18 +34,30 @@ Functions:
         AssertionError.
 """
 
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, AsyncIterator
 from pathlib import Path
 from datetime import datetime
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.responses import Response, JSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi_pagination import add_pagination
-from fastapi.staticfiles import StaticFiles
 
+from intakevms import config
 from intakevms.libs.log import get_logger
+from intakevms.common.compression import (
+    MINIMUM_SIZE,
+    AssetFiles,
+    CompressionMiddleware,
+)
 from intakevms.libs.client.config import get_routes
+from intakevms.libs.metrics.config import get_metrics_settings
+from intakevms.common.request_timing import (
+    SLOW_REQUEST_SECONDS,
+    TimingMiddleware,
+)
+from intakevms.libs.metrics.exporter import start_worker_metrics_server
 from intakevms.libs.messaging.exceptions import (
     RpcCallException,
     RpcCallTimeoutException,
@@ -45,10 +66,40 @@ from intakevms.libs.messaging.exceptions import (
 
 LOG = get_logger(__name__)
 
+# Worker processes of the web application
+WORKERS = 4
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Serve the metrics of the worker process while it runs.
+
+    The metrics are not served by the application itself: every worker
+    has its own registry, and the exporter only listens on the configured,
+    internal, address.
+
+    Args:
+        _app (FastAPI): The application.
+
+    Yields:
+        None: While the worker runs.
+    """
+    settings = get_metrics_settings('web_app')
+    server = None
+    if settings.enabled and settings.port:
+        server = start_worker_metrics_server(
+            settings.host, settings.port, WORKERS
+        )
+    yield
+    if server is not None:
+        server.shutdown()
+
+
 app = FastAPI(
     routes=get_routes(),
     docs_url='/swagger',
     redoc_url=None,
+    lifespan=lifespan,
 )
 add_pagination(app)
 
@@ -70,7 +121,20 @@ app.add_middleware(
     allow_methods=['*'],
     allow_headers=['*'],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.data.get('web_app', {}).get(
+        'compression_min_size', MINIMUM_SIZE
+    ),
+)
+app.add_middleware(
+    TimingMiddleware,
+    slow_threshold=config.data.get('web_app', {}).get(
+        'slow_request_seconds', SLOW_REQUEST_SECONDS
+    ),
+)
 
+from intakevms.modules.jobs.entrypoints.api import router as jobs_router
 from intakevms.modules.user.entrypoints.api import router as user
 from intakevms.modules.image.entrypoints.api import router as image
 from intakevms.modules.user.entrypoints.auth import router as auth
@@ -81,11 +145,15 @@ from intakevms.modules.storage.entrypoints.api import router as storage
 from intakevms.modules.template.entrypoints.api import router as template_router
 from intakevms.modules.dashboard.entrypoints.api import router as dashboard
 from intakevms.modules.event_store.entrypoints.api import router as event_store
-from intakevms.modules.block_device.entrypoints.api import router as block_router
+from intakevms.modules.block_device.entrypoints.api import (
+    router as block_router,
+)
 from intakevms.modules.notification.entrypoints.api import (
     router as notification_router,
 )
-from intakevms.modules.virtual_network.entrypoints.api import router as vn_router
+from intakevms.modules.virtual_network.entrypoints.api import (
+    router as vn_router,
+)
 from intakevms.modules.virtual_machines.entrypoints.api import (
     router as vm_router,
 )
@@ -105,10 +173,11 @@ app.include_router(block_router)
 app.include_router(vn_router)
 app.include_router(backup_router)
 app.include_router(template_router)
+app.include_router(jobs_router)
 
 project_dir = Path(__file__).parent
 templates = Jinja2Templates(directory=project_dir / 'dist')
-app.mount('/assets', StaticFiles(directory=project_dir / 'dist/assets'))
+app.mount('/assets', AssetFiles(directory=project_dir / 'dist/assets'))
 
 
 @app.middleware('http')
@@ -314,8 +383,6 @@ async def assertion_error_exception_handler(
 if __name__ == '__main__':
     import uvicorn
 
-    from intakevms import config
-
     HOST = config.data['web_app'].get('host')
     PORT = config.data['web_app'].get('port')
 
@@ -323,7 +390,7 @@ if __name__ == '__main__':
         'main:app',
         host=HOST,
         port=PORT,
-        workers=4,
+        workers=WORKERS,
         backlog=65535,
         limit_concurrency=1000,
         limit_max_requests=10000,
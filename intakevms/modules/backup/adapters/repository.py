@@ -3,10 +3,11 @@
 This module implements BaseSqlAlchemyRepository repository pattern.
 """
 
-from sqlalchemy import text, create_engine
+from sqlalchemy import text
 from sqlalchemy.orm import Session, DeclarativeBase
 
 from intakevms.config import database, get_postgres_uri
+from intakevms.libs.engines import EngineRegistry
 from intakevms.common.repositories.base_sqlalchemy import (
     BaseSqlAlchemyRepository,
 )
@@ -30,8 +31,8 @@ class BackupSqlAlchemyRepository(BaseSqlAlchemyRepository[DeclarativeBase]):
         """
         self.session: Session = session
         self.model_cls = DeclarativeBase
-        self.engine = create_engine(
-            get_postgres_uri().replace(
+        self.engine = EngineRegistry.instance().get(
+            url=get_postgres_uri().replace(
                 database['db_name'], 'postgres'
             )  # for connection to 'postgres' db, instead 'intakevms'
         )
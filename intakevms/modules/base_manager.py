@@ -22,9 +22,11 @@ Functions:
 import time
 import types
 import signal
-from typing import Any, Callable, NoReturn, Optional
+from typing import Any, Callable, ClassVar, NoReturn, Optional
 from threading import Event, Thread
 
+from intakevms.libs.messaging.managers import ManagerScope
+
 
 class ServiceExitError(Exception):
     """Custom exception used to signal service shutdown."""
@@ -95,9 +97,13 @@ class Task(Thread):
         self.join()
 
     def run(self) -> None:
-        """Run the task periodically until stopped."""
+        """Run the task periodically until stopped.
+
+        The manager is built once and reused by every run of the task.
+        """
+        manager = self.manager()
         while not self.stopped.wait(self.interval):
-            self.execute(self.manager())
+            self.execute(manager)
 
 
 class MetaBackgroundTasks(type):
@@ -131,10 +137,19 @@ class BackgroundTasks(metaclass=MetaBackgroundTasks):
     This class provides methods to start, stop, and manage background tasks
     that run periodically in separate threads.
 
+    Service layer managers are reused by the worker of the RPC server that
+    built them (unless their RPC clients do not share the connection pool),
+    so their methods must keep the state of a request in local variables or
+    in a unit of work entered by the method.
+
     Attributes:
         _background_tasks (List[Task]): List of registered background tasks.
+        rpc_scope (ManagerScope): Lifetime of the instances executing RPC
+            requests.
     """
 
+    rpc_scope: ClassVar[ManagerScope] = ManagerScope.WORKER
+
     def __init__(self) -> None:
         """Initialize the BackgroundTasks instance."""
         super(BackgroundTasks, self).__init__()
@@ -2,7 +2,8 @@
 
 This module defines the FastAPI router and endpoint for retrieving events.
 It uses the `EventCrud` class for database interactions and includes user
-authentication dependencies.
+authentication dependencies. The stream endpoint pushes the state changes of
+resources as Server-Sent Events.
 
 Attributes:
     LOG (Logger): Logger instance for logging events in the module.
@@ -11,13 +12,16 @@ Attributes:
 
 import io
 import csv
-from typing import List, cast
+from typing import List, Optional
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Query, Depends, Request, APIRouter, status
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params, paginate
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.pagination import PageRequest, page_request
+from intakevms.common.state_stream import STATE_BROKER, sse_events
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.modules.event_store.entrypoints import schemas
 from intakevms.modules.event_store.entrypoints.crud import EventCrud
@@ -30,32 +34,35 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+events_page = page_request('id', direction='desc')
+
 
 @router.get(
     '/',
-    response_model=Page[schemas.Event],
+    response_model=KeysetPage[schemas.Event],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(get_current_user)],
 )
 async def get_events(
+    page: PageRequest = Depends(events_page),
     crud: EventCrud = Depends(EventCrud),
-) -> Page[schemas.Event]:
-    """Retrieve all events from the database.
+) -> KeysetPage[schemas.Event]:
+    """Retrieve a page of events from the database, newest first.
 
-    This endpoint retrieves all events using the EventCrud class and returns
-    them in a paginated format.
+    This endpoint retrieves a page of events using the EventCrud class. The
+    `next_cursor` of the page requests the following one.
 
     Args:
+        page (PageRequest): The requested page.
         crud (EventCrud): Instance of EventCrud for database operations.
 
     Returns:
-        Page[schemas.Event]: A paginated list of events.
+        KeysetPage[schemas.Event]: A page of events.
 
     Raises:
         HTTPException: If any database error occurs or events are not found.
     """
-    result: List = crud.new_get_all_events()
-    return cast(Page, paginate(result))
+    return KeysetPage[schemas.Event](**crud.get_events_page(page))
 
 
 @router.get(
@@ -121,4 +128,44 @@ async def download_events(
         output,
         media_type='text/csv',
         headers={'Content-Disposition': 'attachment; filename=logs.csv'},
-    )
\ No newline at end of file
+    )
+
+
+@router.get(
+    '/stream/',
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(get_current_user)],
+)
+async def stream_state_changes(
+    request: Request,
+    resource: Optional[List[str]] = Query(
+        default=None,
+        description='Types of resources to follow, e.g. `vms`, all if unset.',
+    ),
+    resource_id: Optional[List[str]] = Query(
+        default=None,
+        alias='id',
+        description='IDs of resources to follow, all if unset.',
+    ),
+) -> StreamingResponse:
+    """Stream the state changes of resources as Server-Sent Events.
+
+    Each committed change of a status or power state is sent as a `changed`
+    event, and the creation or deletion of a resource as a `created` or
+    `deleted` event, with the change as JSON data. A `resync` event asks the
+    client to read the resources again, since changes were missed.
+
+    Args:
+        request (Request): The streaming request.
+        resource (Optional[List[str]]): Types of resources to follow.
+        resource_id (Optional[List[str]]): IDs of resources to follow.
+
+    Returns:
+        StreamingResponse: The stream of events.
+    """
+    subscription = STATE_BROKER.subscribe(resource, resource_id)
+    return StreamingResponse(
+        sse_events(STATE_BROKER, subscription, request),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
@@ -11,10 +11,11 @@ Classes:
 """
 
 import uuid
-from typing import List
+from typing import Dict, List, Optional
 from collections import namedtuple
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
 from intakevms.libs.validation.validators import Validator
 from intakevms.modules.event_store.config import API_SERVICE_LAYER_QUEUE_NAME
 from intakevms.libs.messaging.messaging_agents import MessagingClient
@@ -68,6 +69,26 @@ class EventCrud:
 
         return Validator.validate_objects(events, schemas.Event)
 
+    def get_events_page(self, page: PageRequest) -> Dict:
+        """Retrieve a page of events from the database.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Dict: The events of the page, validated against the Event
+                schema, and the cursor of the next page.
+        """
+        LOG.info('Call service layer on getting page of events.')
+        result: Dict = self.service_layer_rpc.call(
+            EventstoreServiceLayerManager.get_events_page.__name__,
+            data_for_method=page.to_dict(),
+        )
+        result['items'] = Validator.validate_objects(
+            result['items'], schemas.Event
+        )
+        return result
+
     def new_get_all_events_by_module(self) -> List:
         """Retrieve all events by module from the database.
 
@@ -171,33 +192,70 @@ class EventCrud:
             event (str): The event description.
             information (str): Additional information about the event.
 
+        Raises:
+            Exception: If an error occurs during the event creation or database
+                transaction.
+        """
+        self.add_events(
+            [
+                {
+                    'object_id': object_id,
+                    'user_id': user_id,
+                    'event': event,
+                    'information': information,
+                }
+            ]
+        )
+
+    def add_events(self, events: List[Dict]) -> None:
+        """Add several events to the database in a single transaction.
+
+        Args:
+            events (List[Dict]): The events, each with the `object_id`,
+                `user_id`, `event` and `information` of `add_event`.
+
         Raises:
             Exception: If an error occurs during the event creation or database
                 transaction.
         """
         try:
-            LOG.info('Starting add event')
-            try:
-                user_uuid = uuid.UUID(user_id)
-            except (ValueError, TypeError):
-                LOG.warning(
-                    f'Invalid user_id for event: {user_id!r}. '
-                    f'Setting user_id to None.'
+            LOG.info('Starting add events')
+            events_info = [
+                CreateEventInfo(
+                    module=self.module_name,
+                    object_id=event['object_id'],
+                    user_id=self._user_uuid(event['user_id']),
+                    event=event['event'],
+                    information=event['information'],
                 )
-                user_uuid = None
-            event_info = CreateEventInfo(
-                module=self.module_name,
-                object_id=object_id,
-                user_id=user_uuid,
-                event=event,
-                information=information,
-            )
-            LOG.info(f'Event info: {event_info}')
+                for event in events
+            ]
+            LOG.info(f'Events info: {events_info}')
             with self.uow() as uow:
-                db_event = DataSerializer.to_db(event_info._asdict())
-                uow.events.add(db_event)
+                for event_info in events_info:
+                    db_event = DataSerializer.to_db(event_info._asdict())
+                    uow.events.add(db_event)
                 uow.commit()
-            LOG.info('Event info was successfully added')
+            LOG.info('Events info was successfully added')
         except Exception as e:
             LOG.exception('An error occurred')
-            LOG.debug(e)
\ No newline at end of file
+            LOG.debug(e)
+
+    @staticmethod
+    def _user_uuid(user_id: Optional[str]) -> Optional[uuid.UUID]:
+        """Parse the ID of the user of an event.
+
+        Args:
+            user_id (Optional[str]): The ID of the user.
+
+        Returns:
+            Optional[uuid.UUID]: The ID, None if it is not a valid UUID.
+        """
+        try:
+            return uuid.UUID(user_id)
+        except (ValueError, TypeError):
+            LOG.warning(
+                f'Invalid user_id for event: {user_id!r}. '
+                f'Setting user_id to None.'
+            )
+            return None
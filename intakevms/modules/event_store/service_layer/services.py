@@ -14,6 +14,7 @@ Dependencies:
 from typing import Dict, List
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest, page_dict
 from intakevms.modules.base_manager import BackgroundTasks
 from intakevms.modules.event_store.config import API_SERVICE_LAYER_QUEUE_NAME
 from intakevms.libs.messaging.messaging_agents import MessagingClient
@@ -54,12 +55,30 @@ class EventstoreServiceLayerManager(BackgroundTasks):
          List: A list of serialized event representations.
       """
       LOG.info('Getting events, service layer')
-      with self.uow() as uow:
+      with self.uow.read_only() as uow:
          return [
             DataSerializer.to_web(event)
             for event in uow.events.get_all()
          ]
 
+   def get_events_page(self, data: Dict) -> Dict:
+      """Retrieve a page of events from the database.
+
+      Args:
+         data (Dict): The page request, see `PageRequest.to_dict`.
+
+      Returns:
+         Dict: The serialized events of the page and the cursor of the
+            next page.
+      """
+      LOG.info('Getting page of events, service layer')
+      page = PageRequest.from_dict(data)
+      with self.uow.read_only() as uow:
+         events, next_cursor = uow.events.get_page(page)
+         return page_dict(
+            [DataSerializer.to_web(event) for event in events], next_cursor
+         )
+
    def get_all_events_by_module(self, data: Dict) -> List:
       """Retrieve all events by module from the database.
 
@@ -67,7 +86,7 @@ class EventstoreServiceLayerManager(BackgroundTasks):
          List: A list of serialized event representations.
       """
       LOG.info(f'Getting events by module {data["module_name"]}, service layer')
-      with self.uow() as uow:
+      with self.uow.read_only() as uow:
          return [
             DataSerializer.to_web(event)
             for event in uow.events.get_all_by_module(data['module_name'])
@@ -80,7 +99,7 @@ class EventstoreServiceLayerManager(BackgroundTasks):
          List: A list of serialized event representations.
       """
       LOG.info('Getting last events, service layer')
-      with self.uow() as uow:
+      with self.uow.read_only() as uow:
          return [
             DataSerializer.to_web(event)
             for event in uow.events.get_last_events(data['limit'])
@@ -27,6 +27,8 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, DeclarativeBase, relationship, mapped_column
 from sqlalchemy.dialects import postgresql
 
+from intakevms.common.state_events import track_states
+
 
 class Base(DeclarativeBase):
     """Base class for inheritance images and attachments tables."""
@@ -85,4 +87,7 @@ class ImageAttachVM(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(), nullable=True)
     target: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
-    image: Mapped[Image] = relationship('Image', back_populates='attachments')
\ No newline at end of file
+    image: Mapped[Image] = relationship('Image', back_populates='attachments')
+
+
+track_states('images', Image, 'status')
@@ -13,11 +13,12 @@ Classes:
 """
 
 from uuid import UUID
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple, Optional
 
 from sqlalchemy import update
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from intakevms.common.pagination import PageRequest
 from intakevms.modules.image.adapters.orm import Image
 from intakevms.common.repositories.base_sqlalchemy import (
     BaseSqlAlchemyRepository,
@@ -33,6 +34,8 @@ class ImageSqlAlchemyRepository(BaseSqlAlchemyRepository[Image]):
     interface using SQLAlchemy for database operations.
     """
 
+    summary_columns = ('name', 'status', 'size', 'storage_id')
+
     def __init__(self, session: 'Session'):
         """Initialize the SqlAlchemyRepository with a database session.
 
@@ -74,6 +77,32 @@ class ImageSqlAlchemyRepository(BaseSqlAlchemyRepository[Image]):
             .all()
         )
 
+    def get_page_by_storage(
+        self,
+        page: PageRequest,
+        storage_id: Optional[UUID] = None,
+        *,
+        summary: bool = False,
+    ) -> Tuple[List[Image], Optional[str]]:
+        """Retrieve a page of images, optionally of a specific storage.
+
+        Args:
+            page (PageRequest): The requested page.
+            storage_id (Optional[UUID]): The storage ID to filter images by.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List[Image], Optional[str]]: The images of the page and the
+                cursor of the next page.
+        """
+        criteria = [Image.storage_id == storage_id] if storage_id else []
+        return self.get_page(
+            page,
+            *criteria,
+            options=[selectinload(Image.attachments)],
+            summary=summary,
+        )
+
     def bulk_update(self, data: List) -> None:
         """Perform a bulk update on images.
 
@@ -17,7 +17,7 @@ Endpoints:
 """
 
 from uuid import UUID
-from typing import Dict, Optional, cast
+from typing import Dict, Union, Optional
 from pathlib import Path
 
 import aiofiles
@@ -31,15 +31,17 @@ from fastapi import (
     status,
 )
 from fastapi.responses import JSONResponse
-from fastapi_pagination import Page, paginate
-from starlette.concurrency import run_in_threadpool
 
 from intakevms.config import TMP_DIR
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.rendering import RenderedJSONResponse, render
+from intakevms.common.pagination import PageRequest, page_request
+from intakevms.common.projections import VIEW_DESCRIPTION, View
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.modules.image.config import CHUNK_SIZE
 from intakevms.modules.image.entrypoints import schemas, exceptions
-from intakevms.modules.image.entrypoints.crud import ImageCrud
+from intakevms.modules.image.entrypoints.crud import AsyncImageCrud
 
 LOG = get_logger(__name__)
 
@@ -49,10 +51,14 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+images_page = page_request('id')
+
 
 @router.get(
     '/',
-    response_model=Page[schemas.Image],
+    response_model=Union[
+        KeysetPage[schemas.ImageSummary], KeysetPage[schemas.Image]
+    ],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(get_current_user)],
 )
@@ -61,29 +67,35 @@ async def get_images(
         default=None,
         description='Storage id (UUID4)',
     ),
-    crud: ImageCrud = Depends(ImageCrud),
-) -> Page[schemas.Image]:
-    """Retrieve a paginated list of images.
-
-    This endpoint allows retrieving all images stored in the database, with
-    an optional filter by a specific storage ID. It uses the `ImageCrud`
+    page: PageRequest = Depends(images_page),
+    view: View = Query(default=View.FULL, description=VIEW_DESCRIPTION),
+    crud: AsyncImageCrud = Depends(AsyncImageCrud),
+) -> RenderedJSONResponse:
+    """Retrieve a page of images.
+
+    This endpoint allows retrieving the images stored in the database, with
+    an optional filter by a specific storage ID. It uses the `AsyncImageCrud`
     service to interact with the storage backend.
 
     Args:
         storage_id (Optional[str]): Storage ID to filter images by.
-        crud (ImageCrud): Dependency injection for CRUD operations.
+        page (PageRequest): The requested page.
+        view (View): The representation of the images.
+        crud (AsyncImageCrud): Dependency injection for CRUD operations.
 
     Dependencies:
         - User authentication via `get_current_user`.
 
     Returns:
-        Page[schemas.Image]: A paginated response containing metadata of
-        images matching the filter criteria, if provided.
+        RenderedJSONResponse: A page of metadata of images matching the
+        filter criteria, if provided, and the cursor of the next page.
     """
-    LOG.info('Api start getting list of images')
-    images = await run_in_threadpool(crud.get_all_images, storage_id)
+    LOG.info('Api start getting page of images')
+    result = await crud.get_images_page(page, storage_id, view)
     LOG.info('Api request was successfully processed.')
-    return cast(Page, paginate(images))
+    if view is View.SUMMARY:
+        return render(KeysetPage[schemas.ImageSummary](**result))
+    return render(KeysetPage[schemas.Image](**result))
 
 
 @router.get(
@@ -94,16 +106,16 @@ async def get_images(
 )
 async def get_image(
     image_id: UUID,
-    crud: ImageCrud = Depends(ImageCrud),
+    crud: AsyncImageCrud = Depends(AsyncImageCrud),
 ) -> schemas.Image:
     """Retrieve metadata of a specific image by its ID.
 
     This endpoint fetches metadata of an image specified by its ID using
-    the `ImageCrud` service.
+    the `AsyncImageCrud` service.
 
     Args:
         image_id (str): ID of the image to retrieve.
-        crud (ImageCrud): Dependency injection for CRUD operations.
+        crud (AsyncImageCrud): Dependency injection for CRUD operations.
 
     Dependencies:
         - User authentication via `get_current_user`.
@@ -112,7 +124,7 @@ async def get_image(
         schemas.Image: Metadata of the specified image.
     """
     LOG.info('Api handle response on get image.')
-    image = await run_in_threadpool(crud.get_image, image_id)
+    image = await crud.get_image(image_id)
     LOG.info('Api request was successfully processed.')
     return schemas.Image(**image)
 
@@ -137,12 +149,12 @@ async def upload_image(  # noqa: PLR0913 It is not possible to pass arguments as
     ),
     image: UploadFile = File(..., description='Upload image.'),
     user_info: Dict = Depends(get_current_user),
-    crud: ImageCrud = Depends(ImageCrud),
+    crud: AsyncImageCrud = Depends(AsyncImageCrud),
 ) -> schemas.Image:
     """Upload a new image to the storage.
 
     This endpoint reads the uploaded image file, saves it temporarily, and
-    uploads it to the specified storage using the `ImageCrud` service.
+    uploads it to the specified storage using the `AsyncImageCrud` service.
 
     Args:
         description (str): Description of the image.
@@ -150,7 +162,7 @@ async def upload_image(  # noqa: PLR0913 It is not possible to pass arguments as
         name (str): Name of the image file.
         image (UploadFile): The uploaded image file.
         user_info (Dict): Authorized user information.
-        crud (ImageCrud): Dependency injection for CRUD operations.
+        crud (AsyncImageCrud): Dependency injection for CRUD operations.
 
     Dependencies:
         - User authentication via `get_current_user`.
@@ -170,8 +182,7 @@ async def upload_image(  # noqa: PLR0913 It is not possible to pass arguments as
                 await f.write(chunk)
         await image.close()
 
-        upload_info = await run_in_threadpool(
-            crud.upload_image,
+        upload_info = await crud.upload_image(
             name,
             storage_id,
             description,
@@ -192,17 +203,17 @@ async def upload_image(  # noqa: PLR0913 It is not possible to pass arguments as
 async def delete_image(
     image_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: ImageCrud = Depends(ImageCrud),
+    crud: AsyncImageCrud = Depends(AsyncImageCrud),
 ) -> JSONResponse:
     """Delete an image by its ID.
 
-    This endpoint deletes an image specified by its ID using the `ImageCrud`
-    service.
+    This endpoint deletes an image specified by its ID using the
+    `AsyncImageCrud` service.
 
     Args:
         image_id (str): ID of the image to delete.
         user_info (Dict): Authorized user information.
-        crud (ImageCrud): Dependency injection for CRUD operations.
+        crud (AsyncImageCrud): Dependency injection for CRUD operations.
 
     Dependencies:
         - User authentication via `get_current_user`.
@@ -211,7 +222,7 @@ async def delete_image(
         JSONResponse: A response confirming successful deletion.
     """
     LOG.info('Api handle response on delete image: %s.' % image_id)
-    result = await run_in_threadpool(crud.delete_image, image_id, user_info)
+    result = await crud.delete_image(image_id, user_info)
     message = f'Image {image_id} successfully deleted.'
     LOG.info(message)
     return JSONResponse(result)
@@ -226,19 +237,19 @@ async def attach_image(
     data: schemas.AttachImage,
     image_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: ImageCrud = Depends(ImageCrud),
+    crud: AsyncImageCrud = Depends(AsyncImageCrud),
 ) -> schemas.AttachImageInfo:
     """Attach an image to a virtual machine (VM).
 
     This endpoint attaches an image specified by its ID to a virtual machine
-    (VM) using the `ImageCrud` service.
+    (VM) using the `AsyncImageCrud` service.
 
     Args:
         data (schemas.AttachImage): Data containing the VM ID to which
         the image will be attached.
         image_id (str): ID of the image to attach.
         user_info (Dict): Authorized user information.
-        crud (ImageCrud): Dependency injection for CRUD operations.
+        crud (AsyncImageCrud): Dependency injection for CRUD operations.
 
     Dependencies:
         - User authentication via `get_current_user`.
@@ -247,8 +258,8 @@ async def attach_image(
         schemas.AttachImageInfo: Metadata of the attached image.
     """
     LOG.info('Api handle response on attach image: %s to vm:' % image_id)
-    attached_image = await run_in_threadpool(
-        crud.attach_image, image_id, data.model_dump(mode='json'), user_info
+    attached_image = await crud.attach_image(
+        image_id, data.model_dump(mode='json'), user_info
     )
     LOG.info('Api request was successfully processed.')
     return schemas.AttachImageInfo(**attached_image)
@@ -263,19 +274,19 @@ async def detach_image(
     detach_info: schemas.DetachImage,
     image_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: ImageCrud = Depends(ImageCrud),
+    crud: AsyncImageCrud = Depends(AsyncImageCrud),
 ) -> schemas.Image:
     """Detach an image from a virtual machine (VM).
 
     This endpoint detaches an image specified by its ID from a virtual
-    machine (VM) using the `ImageCrud` service.
+    machine (VM) using the `AsyncImageCrud` service.
 
     Args:
         detach_info (schemas.DetachImage): Data containing the VM ID from
         which the image will be detached.
         image_id (str): ID of the image to detach.
         user_info (Dict): Authorized user information.
-        crud (ImageCrud): Dependency injection for CRUD operations.
+        crud (AsyncImageCrud): Dependency injection for CRUD operations.
 
     Dependencies:
         - User authentication via `get_current_user`.
@@ -287,8 +298,7 @@ async def detach_image(
         'Api handle response on detach '
         'image: %s from vm: %s' % (image_id, detach_info)
     )
-    detached_image = await run_in_threadpool(
-        crud.detach_image,
+    detached_image = await crud.detach_image(
         image_id,
         detach_info.model_dump(mode='json'),
         user_info,
@@ -1,18 +1,21 @@
 """CRUD module for managing image operations.
 
-This module defines the `ImageCrud` class, which serves as an intermediary
-between the API layer and the service layer. It provides methods for
-performing CRUD operations on images, such as retrieving, uploading,
-deleting, and attaching or detaching images from virtual machines.
+This module defines the `AsyncImageCrud` class, which serves as an
+intermediary between the API layer and the service layer. It provides
+methods for performing CRUD operations on images, such as retrieving,
+uploading, deleting, and attaching or detaching images from virtual
+machines.
 
 Classes:
-    ImageCrud: Class for handling image-related CRUD operations.
+    AsyncImageCrud: Class for handling image-related CRUD operations.
 """
 
 from uuid import UUID
-from typing import Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Dict, List, Type, Optional, cast
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
+from intakevms.common.projections import View
 from intakevms.modules.image.config import (
     PERMITTED_EXTENSIONS,
     API_SERVICE_LAYER_QUEUE_NAME,
@@ -25,11 +28,14 @@ from intakevms.modules.image.entrypoints.exceptions import (
     NotSupportedExtensionError,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 LOG = get_logger(__name__)
 
 
-class ImageCrud:
-    """Class for handling CRUD operations related to images.
+class AsyncImageCrud:
+    """Class for handling image-related CRUD operations.
 
     This class communicates with the service layer using an RPC-based
     messaging client. It provides methods for interacting with images,
@@ -42,7 +48,7 @@ class ImageCrud:
     """
 
     def __init__(self) -> None:
-        """Initialize the ImageCrud instance.
+        """Initialize the AsyncImageCrud instance.
 
         Sets up the messaging client for communication with the service layer.
         """
@@ -71,7 +77,7 @@ class ImageCrud:
             LOG.error(message)
             raise NotSupportedExtensionError(message)
 
-    def get_image(self, image_id: UUID) -> Dict:
+    async def get_image(self, image_id: UUID) -> Dict:
         """Retrieve metadata of a specific image by its ID.
 
         This method sends a request to the service layer to fetch metadata
@@ -84,14 +90,14 @@ class ImageCrud:
             Dict: Metadata of the specified image.
         """
         LOG.info('Call service layer on get image.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.ImageServiceLayerManager.get_image.__name__,
             data_for_method={'image_id': str(image_id)},
         )
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def get_all_images(self, storage_id: Optional[UUID]) -> List:
+    async def get_all_images(self, storage_id: Optional[UUID]) -> List:
         """Retrieve a list of all images, optionally filtered by storage ID.
 
         This method sends a request to the service layer to fetch a list
@@ -106,7 +112,7 @@ class ImageCrud:
         LOG.info('Call service layer on get all images.')
         result: List = cast(
             List,
-            self.service_layer_rpc.call(
+            await self.service_layer_rpc.acall(
                 services.ImageServiceLayerManager.get_all_images.__name__,
                 data_for_method={
                     'storage_id': str(storage_id) if storage_id else None
@@ -116,7 +122,41 @@ class ImageCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return Validator.validate_objects(result, schemas.Image)
 
-    def upload_image(
+    async def get_images_page(
+        self,
+        page: PageRequest,
+        storage_id: Optional[UUID],
+        view: View = View.FULL,
+    ) -> Dict:
+        """Retrieve a page of images, optionally filtered by storage ID.
+
+        Args:
+            page (PageRequest): The requested page.
+            storage_id (Optional[str]): ID of the storage to filter images by.
+            view (View): The representation of the images.
+
+        Returns:
+            Dict: The validated image metadata of the page and the cursor of
+                the next page.
+        """
+        LOG.info('Call service layer on get images page.')
+        data = {
+            **page.to_dict(),
+            'storage_id': str(storage_id) if storage_id else None,
+            'view': view.value,
+        }
+        result: Dict = await self.service_layer_rpc.acall(
+            services.ImageServiceLayerManager.get_images_page.__name__,
+            data_for_method=data,
+        )
+        LOG.debug('Response from service layer: %s.' % result)
+        schema: Type[BaseModel] = schemas.Image
+        if view is View.SUMMARY:
+            schema = schemas.ImageSummary
+        result['items'] = Validator.validate_objects(result['items'], schema)
+        return result
+
+    async def upload_image(
         self,
         name: str,
         storage_id: UUID,
@@ -144,7 +184,7 @@ class ImageCrud:
         """
         LOG.info('Call service layer on upload image.')
         self._check_image_extension(image_name=name)
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.ImageServiceLayerManager.upload_image.__name__,
             data_for_method={
                 'name': name,
@@ -156,7 +196,7 @@ class ImageCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def delete_image(
+    async def delete_image(
         self,
         image_id: UUID,
         user_info: Dict,
@@ -175,14 +215,14 @@ class ImageCrud:
                 deletion.
         """
         LOG.info('Call service layer on delete image.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.ImageServiceLayerManager.delete_image.__name__,
             data_for_method={'image_id': str(image_id), 'user_info': user_info},
         )
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def attach_image(
+    async def attach_image(
         self,
         image_id: UUID,
         data: Dict,
@@ -204,14 +244,14 @@ class ImageCrud:
         """
         data.update({'image_id': str(image_id), 'user_info': user_info})
         LOG.info('Call service layer on attach image.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.ImageServiceLayerManager.attach_image.__name__,
             data_for_method=data,
         )
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def detach_image(
+    async def detach_image(
         self,
         image_id: UUID,
         detach_info: Dict,
@@ -233,7 +273,7 @@ class ImageCrud:
         """
         LOG.info('Call service layer on attach image.')
         detach_info.update({'image_id': str(image_id), 'user_info': user_info})
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.ImageServiceLayerManager.detach_image.__name__,
             data_for_method=detach_info,
         )
@@ -74,6 +74,24 @@ class Image(BaseModel):
     attachments: List[Attachment] = []
 
 
+class ImageSummary(BaseModel):
+    """Represents the summary view of an image.
+
+    Attributes:
+        id (UUID): The unique identifier of the image.
+        name (str): The name of the image.
+        size (Optional[int]): The size of the image in bytes.
+        status (str): The current status of the image.
+        storage_id (UUID): The ID of the storage where the image is located.
+    """
+
+    id: UUID
+    name: str
+    size: Optional[int] = None
+    status: str
+    storage_id: UUID
+
+
 class AttachImage(BaseModel):
     """Represents the data required to attach an image to a virtual machine.
 
@@ -45,6 +45,9 @@ from collections import namedtuple
 
 from intakevms.config import TMP_DIR
 from intakevms.libs.log import get_logger
+from intakevms.libs.monitoring import StateSnapshot
+from intakevms.common.pagination import PageRequest, page_dict
+from intakevms.common.projections import is_summary, to_summary
 from intakevms.modules.base_manager import BackgroundTasks, periodic_task
 from intakevms.modules.image.config import (
     API_SERVICE_LAYER_QUEUE_NAME,
@@ -170,6 +173,9 @@ class ImageServiceLayerManager(BackgroundTasks):
         )
         self.storage_service_client = StorageServiceLayerRPCClient()
         self.event_store: EventCrud = EventCrud('image')
+        self.monitoring_snapshot = StateSnapshot(
+            'images', ('size', 'status', 'information')
+        )
 
     def _call_domain_delete_from_tmp(
         self,
@@ -279,7 +285,7 @@ class ImageServiceLayerManager(BackgroundTasks):
             )
             LOG.error(message)
             raise exceptions.UnexpectedDataArguments(message)
-        with self.uow() as uow:
+        with self.uow.read_only() as uow:
             image = uow.images.get_or_fail(image_id)
             serialized_image = DataSerializer.to_web(image)
             LOG.debug(f'Got image from db: {serialized_image}.')
@@ -302,7 +308,7 @@ class ImageServiceLayerManager(BackgroundTasks):
         """
         LOG.info('Service Layer start handling response on get images.')
         storage_id = data.pop('storage_id', None)
-        with self.uow() as uow:
+        with self.uow.read_only() as uow:
             if storage_id:
                 images = uow.images.get_all_by_storage(storage_id)
             else:
@@ -314,6 +320,30 @@ class ImageServiceLayerManager(BackgroundTasks):
         LOG.info('Service Layer method get images was successfully processed.')
         return serialized_images
 
+    def get_images_page(self, data: Dict) -> Dict:
+        """Retrieve a page of images from the database.
+
+        Args:
+            data (Dict): The page request, see `PageRequest.to_dict`, the
+                optional `view` of the images, and optionally the storage ID
+                for filtering images by storage.
+
+        Returns:
+            Dict: The serialized images of the page and the cursor of the
+                next page.
+        """
+        LOG.info('Service Layer start handling response on get images page.')
+        page = PageRequest.from_dict(data)
+        summary = is_summary(data)
+        with self.uow.read_only() as uow:
+            images, next_cursor = uow.images.get_page_by_storage(
+                page, data.get('storage_id'), summary=summary
+            )
+            serialize = to_summary if summary else DataSerializer.to_web
+            return page_dict(
+                [serialize(image) for image in images], next_cursor
+            )
+
     @staticmethod
     def _check_image_status(
         image_status: Optional[str], available_statuses: List[str]
@@ -913,8 +943,10 @@ class ImageServiceLayerManager(BackgroundTasks):
         - Validate the image status and storage availability.
         - Get updated image information from the domain layer.
         - Update the image information in a list for subsequent database update.
-        - Handle any exceptions that occur during the process.
-        4. Update the image information in the database in bulk.
+        - Handle any exceptions that occur during the process, with an error
+            status in the list.
+        4. Update the images whose information changed in the database in
+            bulk, compared to the state read in step 1.
 
         This method is designed to run periodically using the `@periodic_task`
         decorator, with an interval of 10 seconds.
@@ -945,6 +977,7 @@ class ImageServiceLayerManager(BackgroundTasks):
             LOG.info("Stop monitoring. Images don't exist.")
             return
 
+        self.monitoring_snapshot.load(domain_images)
         storages = self._get_available_storages()
         updated_images = []
         for domain_image in domain_images:
@@ -969,9 +1002,11 @@ class ImageServiceLayerManager(BackgroundTasks):
                 RpcCallException,
                 RpcCallTimeoutException,
             ) as err:
-                self._handle_monitoring_error(domain_image, err)
+                updated_images.append(
+                    self._handle_monitoring_error(domain_image, err)
+                )
             LOG.info(f'{domain_image["name"]} was checked')
-        self._update_images_in_db(updated_images)
+        self._write_monitoring_changes(updated_images)
         LOG.info('Stop monitoring.')
 
     def _get_domain_images(self) -> List[Dict]:
@@ -1034,11 +1069,15 @@ class ImageServiceLayerManager(BackgroundTasks):
 
     def _handle_monitoring_error(
         self, domain_image: Dict, err: Exception
-    ) -> None:
-        """Handle errors during image monitoring."""
+    ) -> Dict:
+        """Get the image information with the error of its monitoring."""
         message = self._get_monitoring_error_message(err)
         LOG.error(message)
-        self._update_image_status_on_error(domain_image, message)
+        return {
+            'id': domain_image.get('id'),
+            'status': ImageStatus.error.name,
+            'information': message,
+        }
 
     def _get_monitoring_error_message(self, err: Exception) -> str:
         """Get the error message for the monitoring error."""
@@ -1056,16 +1095,14 @@ class ImageServiceLayerManager(BackgroundTasks):
             return str(err)
         return str(err)
 
-    def _update_image_status_on_error(
-        self, domain_image: Dict, message: str
-    ) -> None:
-        """Update the image status and information on error."""
-        updated_image = {
-            'id': domain_image.get('id'),
-            'status': ImageStatus.error.name,
-            'information': message,
-        }
-        self._update_images_in_db([updated_image])
+    def _write_monitoring_changes(self, updated_images: List[Dict]) -> None:
+        """Update the images whose information changed in the database."""
+        changed_images = self.monitoring_snapshot.changes(updated_images)
+        if changed_images:
+            self._update_images_in_db(changed_images)
+        self.monitoring_snapshot.report(
+            len(updated_images), len(changed_images)
+        )
 
     def _update_images_in_db(self, updated_images: List[Dict]) -> None:
         """Update the image information in the database."""
@@ -0,0 +1,89 @@
+"""SQLAlchemy ORM models for the jobs module.
+
+Jobs track the long-running operations that service layers run in the
+background, such as the creation of a template: their status, progress and
+error. Status and progress are published as state changes, so clients can
+follow or wait for a job without polling.
+
+Classes:
+    Job: ORM class representing a job.
+"""
+
+import uuid
+import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    UUID,
+    Enum as SAEnum,
+    Text,
+    Float,
+    String,
+    DateTime,
+)
+from sqlalchemy.orm import Mapped, DeclarativeBase, mapped_column
+from sqlalchemy.sql import func
+
+from intakevms.common.state_events import track_states
+from intakevms.modules.jobs.shared.enums import JobStatus
+
+
+class Base(DeclarativeBase):
+    """Base class for ORM mappings in the jobs module."""
+
+    pass
+
+
+class Job(Base):
+    """ORM class representing a job.
+
+    Attributes:
+        id: Unique identifier of the job.
+        kind: Operation of the job, e.g. `create_template`.
+        resource: Type of the resource the job works on, e.g. `templates`.
+        resource_id: Identifier of the resource the job works on.
+        status: Lifecycle status of the job.
+        progress: Percentage of the work done.
+        information: Error of a failed job, or the current step.
+        created_at: Timestamp when the job was queued.
+        started_at: Timestamp when a worker started the job.
+        finished_at: Timestamp when the job reached a final status.
+    """
+
+    __tablename__ = 'jobs'
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    resource: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    resource_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(),
+        nullable=True,
+        index=True,
+    )
+    status: Mapped[JobStatus] = mapped_column(
+        SAEnum(JobStatus, name='job_status'),
+        nullable=False,
+        default=JobStatus.QUEUED,
+    )
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    information: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=func.now(),
+    )
+    started_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+    )
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+    )
+
+
+track_states('jobs', Job, 'status', 'progress')
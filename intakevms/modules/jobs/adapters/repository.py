@@ -0,0 +1,44 @@
+"""SQLAlchemy repository for the jobs module.
+
+This module implements the repository pattern to manage Job entities in the
+database using SQLAlchemy.
+"""
+
+from uuid import UUID
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from intakevms.modules.jobs.adapters.orm import Job
+from intakevms.common.repositories.base_sqlalchemy import (
+    BaseSqlAlchemyRepository,
+)
+
+
+class JobSqlAlchemyRepository(BaseSqlAlchemyRepository[Job]):
+    """Repository for managing job entities.
+
+    This class provides CRUD operations for the Job model using SQLAlchemy.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initializes the repository with a database session.
+
+        Args:
+            session (Session): The SQLAlchemy session for database operations.
+        """
+        super().__init__(session, Job)
+
+    def get_for_update(self, job_id: UUID) -> Optional[Job]:
+        """Retrieve a job and lock it until the end of the transaction.
+
+        Status transitions read the job with this method, so that a job
+        cannot be both cancelled and started.
+
+        Args:
+            job_id (UUID): The ID of the job.
+
+        Returns:
+            Optional[Job]: The locked job, None if not found.
+        """
+        return self.session.get(Job, job_id, with_for_update=True)
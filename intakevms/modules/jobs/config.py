@@ -0,0 +1,11 @@
+from intakevms.config import get_default_session_factory
+
+DEFAULT_SESSION_FACTORY = get_default_session_factory()
+
+# Progress of a job is written at most once per interval, and only once it
+# moved by at least the step, to keep the notification channel quiet.
+PROGRESS_INTERVAL_SECONDS = 1.0
+PROGRESS_MIN_STEP = 1.0
+
+# Longest wait for a job to finish in a single request.
+MAX_WAIT_SECONDS = 60.0
@@ -0,0 +1,105 @@
+"""Module for handling job-related API endpoints.
+
+Jobs track long-running operations queued by other endpoints, such as the
+creation of a template. A client either waits for a job with a single
+request, follows it on the state stream (`/event/stream/?resource=jobs`),
+or cancels it while it is still queued.
+
+Attributes:
+    LOG (Logger): Logger instance for logging events in the module.
+    router (APIRouter): FastAPI router for job-related endpoints.
+"""
+
+from uuid import UUID
+
+from fastapi import Query, Depends, APIRouter, HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from intakevms.libs.log import get_logger
+from intakevms.libs.auth.jwt_utils import get_current_user
+from intakevms.modules.jobs.config import MAX_WAIT_SECONDS
+from intakevms.modules.jobs.entrypoints.crud import JobCrud
+from intakevms.common.repositories.exceptions import EntityNotFoundError
+from intakevms.modules.jobs.entrypoints.schemas import JobResponse
+from intakevms.modules.jobs.shared.base_exceptions import (
+    JobNotCancellableException,
+)
+
+LOG = get_logger(__name__)
+
+router = APIRouter(
+    prefix='/jobs',
+    tags=['jobs'],
+    responses={404: {'description': 'Not found!'}},
+    dependencies=[Depends(get_current_user)],
+)
+
+
+@router.get(
+    '/{job_id}',
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_job(
+    job_id: UUID,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=MAX_WAIT_SECONDS,
+        description='Seconds to wait for the job to finish before answering',
+    ),
+    crud: JobCrud = Depends(JobCrud),
+) -> JobResponse:
+    """Retrieve a job, optionally once it finished.
+
+    With `wait`, the request is answered as soon as the job finishes, or
+    with the running job once `wait` seconds passed.
+
+    Args:
+        job_id (UUID): The ID of the job.
+        wait (float): Seconds to wait for the job to finish.
+        crud (JobCrud): Instance of JobCrud for database operations.
+
+    Returns:
+        JobResponse: The job.
+
+    Raises:
+        HTTPException: If the job does not exist.
+    """
+    try:
+        if wait:
+            return await crud.wait_job(job_id, wait)
+        return await run_in_threadpool(crud.get_job, job_id)
+    except EntityNotFoundError as err:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, str(err)) from err
+
+
+@router.post(
+    '/{job_id}/cancel',
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    responses={409: {'description': 'The job already started'}},
+)
+async def cancel_job(
+    job_id: UUID,
+    crud: JobCrud = Depends(JobCrud),
+) -> JobResponse:
+    """Cancel a queued job.
+
+    Args:
+        job_id (UUID): The ID of the job.
+        crud (JobCrud): Instance of JobCrud for database operations.
+
+    Returns:
+        JobResponse: The cancelled job.
+
+    Raises:
+        HTTPException: If the job does not exist or already started.
+    """
+    LOG.info(f'Api handle request on cancelling job {job_id}')
+    try:
+        return await run_in_threadpool(crud.cancel_job, job_id)
+    except EntityNotFoundError as err:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, str(err)) from err
+    except JobNotCancellableException as err:
+        raise HTTPException(status.HTTP_409_CONFLICT, str(err)) from err
@@ -0,0 +1,299 @@
+"""Module for job CRUD operations.
+
+Service layers create a job when they queue a long-running operation, and
+the worker running it moves the job through its statuses: a worker that
+finds its job cancelled skips the operation. Domain layers report the
+progress of the operation with a `ProgressReporter`, throttled so that a
+fast stream of progress lines costs a write per second at most.
+
+Jobs are written directly through the unit of work, like events, so any
+layer can report on a job without a service of its own.
+
+Usage example:
+    # Service layer, on queueing the operation
+    job_id = self.jobs.create_job('create_template', 'templates', id)
+
+    # Service layer, in the worker
+    if not self.jobs.start_job(job_id):
+        return
+    ...
+    self.jobs.finish_job(job_id, error=str(err))
+
+    # Domain layer
+    adapter.create_copy(source, target, on_progress=ProgressReporter(job_id))
+
+Classes:
+    JobCrud: Class for managing the lifecycle of jobs.
+    ProgressReporter: Reports the progress of a job, throttled.
+"""
+
+import time
+import asyncio
+import datetime
+from uuid import UUID
+from typing import Union, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from intakevms.libs.log import get_logger
+from intakevms.common.state_stream import STATE_BROKER
+from intakevms.modules.jobs.config import (
+    PROGRESS_MIN_STEP,
+    PROGRESS_INTERVAL_SECONDS,
+)
+from intakevms.modules.jobs.adapters.orm import Job
+from intakevms.modules.jobs.shared.enums import JobStatus
+from intakevms.common.repositories.exceptions import EntityNotFoundError
+from intakevms.modules.jobs.entrypoints.schemas import JobResponse
+from intakevms.modules.jobs.shared.base_exceptions import (
+    JobNotCancellableException,
+)
+from intakevms.modules.jobs.service_layer.unit_of_work import (
+    JobSqlAlchemyUnitOfWork,
+)
+
+LOG = get_logger(__name__)
+
+
+class JobCrud:
+    """Class for managing the lifecycle of jobs."""
+
+    def __init__(self) -> None:
+        """Initialize the JobCrud instance."""
+        self.uow = JobSqlAlchemyUnitOfWork
+
+    def create_job(
+        self,
+        kind: str,
+        resource: Optional[str] = None,
+        resource_id: Optional[Union[str, UUID]] = None,
+    ) -> str:
+        """Queue a new job.
+
+        Args:
+            kind (str): Operation of the job, e.g. `create_template`.
+            resource (Optional[str]): Type of the resource the job works on.
+            resource_id (Optional[Union[str, UUID]]): ID of the resource.
+
+        Returns:
+            str: The ID of the job.
+        """
+        job = Job(
+            kind=kind,
+            resource=resource,
+            resource_id=UUID(str(resource_id)) if resource_id else None,
+            status=JobStatus.QUEUED,
+            progress=0,
+        )
+        with self.uow() as uow:
+            uow.jobs.add(job)
+            uow.commit()
+        LOG.info(f'Job {job.id} queued: {kind} of {resource} {resource_id}')
+        return str(job.id)
+
+    def get_job(self, job_id: Union[str, UUID]) -> JobResponse:
+        """Retrieve a job.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+
+        Returns:
+            JobResponse: The job.
+
+        Raises:
+            EntityNotFoundError: If the job does not exist.
+        """
+        with self.uow() as uow:
+            job = uow.jobs.get_or_fail(UUID(str(job_id)))
+            return JobResponse.model_validate(job)
+
+    def start_job(self, job_id: Union[str, UUID]) -> bool:
+        """Mark a queued job as running, unless it was cancelled.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+
+        Returns:
+            bool: False if the job is not queued anymore, the worker must
+                then skip the operation.
+        """
+        with self.uow() as uow:
+            job = uow.jobs.get_for_update(UUID(str(job_id)))
+            if job is None or job.status != JobStatus.QUEUED:
+                LOG.info(f'Job {job_id} is not queued anymore, skipping it')
+                return False
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.datetime.now()
+            uow.commit()
+        return True
+
+    def report_progress(
+        self,
+        job_id: Union[str, UUID],
+        progress: float,
+        information: Optional[str] = None,
+    ) -> None:
+        """Update the progress of a running job.
+
+        Failures are logged rather than raised, progress being informative.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+            progress (float): Percentage of the work done.
+            information (Optional[str]): The current step, if any.
+        """
+        try:
+            with self.uow() as uow:
+                job = uow.jobs.get_for_update(UUID(str(job_id)))
+                if job is None or job.status != JobStatus.RUNNING:
+                    return
+                job.progress = round(min(max(progress, 0), 100), 2)
+                if information is not None:
+                    job.information = information
+                uow.commit()
+        except Exception:
+            LOG.exception(f'Cannot report the progress of job {job_id}')
+
+    def finish_job(
+        self,
+        job_id: Union[str, UUID],
+        error: Optional[str] = None,
+    ) -> None:
+        """Mark a job as succeeded, or as failed with an error.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+            error (Optional[str]): The error of a failed job.
+        """
+        with self.uow() as uow:
+            job = uow.jobs.get_for_update(UUID(str(job_id)))
+            if job is None or JobStatus(job.status).finished:
+                return
+            if error is None:
+                job.status = JobStatus.SUCCEEDED
+                job.progress = 100
+                job.information = None
+            else:
+                job.status = JobStatus.FAILED
+                job.information = error
+            job.finished_at = datetime.datetime.now()
+            uow.commit()
+        LOG.info(f'Job {job_id} finished: {job.status.value}')
+
+    def cancel_job(self, job_id: Union[str, UUID]) -> JobResponse:
+        """Cancel a queued job, its worker will skip the operation.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+
+        Returns:
+            JobResponse: The cancelled job.
+
+        Raises:
+            EntityNotFoundError: If the job does not exist.
+            JobNotCancellableException: If the job already started.
+        """
+        with self.uow() as uow:
+            job = uow.jobs.get_for_update(UUID(str(job_id)))
+            if job is None:
+                msg = f'Job with ID {job_id} not found.'
+                raise EntityNotFoundError(msg)
+            if job.status != JobStatus.QUEUED:
+                msg = f'Job {job_id} is {job.status.value}, not queued.'
+                raise JobNotCancellableException(msg)
+            job.status = JobStatus.CANCELLED
+            job.finished_at = datetime.datetime.now()
+            uow.commit()
+            return JobResponse.model_validate(job)
+
+    async def wait_job(
+        self,
+        job_id: Union[str, UUID],
+        timeout: float,
+    ) -> JobResponse:
+        """Wait for a job to finish, without polling the database.
+
+        The changes of the job are followed on the state stream, the job is
+        read again once finished or once the timeout expires.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            JobResponse: The job, finished unless the timeout expired.
+
+        Raises:
+            EntityNotFoundError: If the job does not exist.
+        """
+        subscription = STATE_BROKER.subscribe(
+            resources=['jobs'], ids=[str(job_id)]
+        )
+        try:
+            # Subscribed first, so that no change is missed after this read.
+            job = await run_in_threadpool(self.get_job, job_id)
+            deadline = time.monotonic() + timeout
+            while not JobStatus(job.status).finished:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                try:
+                    change = await asyncio.wait_for(
+                        subscription.queue.get(), left
+                    )
+                except TimeoutError:
+                    break
+                status = change.state.get('status') if change else None
+                if change is None or JobStatus(status or job.status).finished:
+                    job = await run_in_threadpool(self.get_job, job_id)
+            return job
+        finally:
+            STATE_BROKER.unsubscribe(subscription)
+
+
+class ProgressReporter:
+    """Reports the progress of a job, throttled.
+
+    A reporter is a callable, to be passed wherever progress is reported,
+    e.g. to `QemuImgAdapter.create_copy`.
+
+    Attributes:
+        job_id (str): The ID of the job.
+        jobs (JobCrud): Writes the progress.
+    """
+
+    def __init__(
+        self,
+        job_id: Union[str, UUID],
+        interval: float = PROGRESS_INTERVAL_SECONDS,
+        min_step: float = PROGRESS_MIN_STEP,
+    ) -> None:
+        """Initialize a reporter of a running job.
+
+        Args:
+            job_id (Union[str, UUID]): The ID of the job.
+            interval (float): Minimum seconds between two writes.
+            min_step (float): Minimum progress between two writes.
+        """
+        self.job_id = str(job_id)
+        self.jobs = JobCrud()
+        self._interval = interval
+        self._min_step = min_step
+        self._reported = 0.0
+        self._reported_at = 0.0
+
+    def __call__(self, progress: float) -> None:
+        """Report the progress, unless reported too recently.
+
+        Args:
+            progress (float): Percentage of the work done.
+        """
+        now = time.monotonic()
+        if (
+            progress - self._reported < self._min_step
+            or now - self._reported_at < self._interval
+        ):
+            return
+        self._reported = progress
+        self._reported_at = now
+        self.jobs.report_progress(self.job_id, progress)
@@ -0,0 +1,81 @@
+"""Response models for job API endpoints.
+
+Classes:
+    - JobResponse: Representation of a job in API responses.
+"""
+
+from uuid import UUID
+from typing import Optional
+from datetime import datetime
+
+from pydantic import Field, computed_field
+
+from intakevms.modules.jobs.shared.enums import JobStatus
+from intakevms.common.base_pydantic_models import APIConfigResponseModel
+
+
+class JobResponse(APIConfigResponseModel):
+    """Schema representing a job for API responses.
+
+    Attributes:
+        id (UUID): Unique identifier of the job.
+        kind (str): Operation of the job.
+        resource (Optional[str]): Type of the resource the job works on.
+        resource_id (Optional[UUID]): ID of the resource the job works on.
+        status (JobStatus): Current lifecycle status of the job.
+        progress (float): Percentage of the work done.
+        information (Optional[str]): Error of a failed job.
+        created_at (datetime): Timestamp when the job was queued.
+        started_at (Optional[datetime]): Timestamp when the job started.
+        finished_at (Optional[datetime]): Timestamp when the job finished.
+    """
+
+    id: UUID = Field(
+        ...,
+        examples=['0b9f3c1e-5a52-4d6c-9a0e-3f3b1d8e2c71'],
+        description='Unique identifier of the job',
+    )
+    kind: str = Field(
+        ..., examples=['create_template'], description='Operation of the job'
+    )
+    resource: Optional[str] = Field(
+        None,
+        examples=['templates'],
+        description='Type of the resource the job works on',
+    )
+    resource_id: Optional[UUID] = Field(
+        None,
+        examples=['a73f920b-d282-41e4-8ec1-6e6b89d3a9e7'],
+        description='ID of the resource the job works on',
+    )
+    status: JobStatus = Field(
+        ..., examples=['running'], description='Current status of the job'
+    )
+    progress: float = Field(
+        ..., examples=[42.5], description='Percentage of the work done'
+    )
+    information: Optional[str] = Field(
+        None, description='Error of a failed job, or its current step'
+    )
+    created_at: datetime = Field(..., description='When the job was queued')
+    started_at: Optional[datetime] = Field(
+        None, description='When a worker started the job'
+    )
+    finished_at: Optional[datetime] = Field(
+        None, description='When the job reached a final status'
+    )
+
+    @computed_field(  # type: ignore[prop-decorator]
+        description='Estimated seconds left, extrapolated from the progress',
+    )
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimate the seconds left before a running job finishes."""
+        if (
+            self.status != JobStatus.RUNNING
+            or self.started_at is None
+            or not 0 < self.progress < 100  # noqa: PLR2004 percentage
+        ):
+            return None
+        elapsed = (datetime.now() - self.started_at).total_seconds()
+        return round(elapsed * (100 - self.progress) / self.progress, 1)
@@ -0,0 +1,34 @@
+"""Unit of Work implementation for the jobs module.
+
+Classes:
+    - JobSqlAlchemyUnitOfWork: Unit of Work for the jobs module.
+"""
+
+from sqlalchemy.orm import sessionmaker
+
+from intakevms.modules.jobs.config import DEFAULT_SESSION_FACTORY
+from intakevms.common.uow.base_sqlalchemy import BaseSqlAlchemyUnitOfWork
+from intakevms.modules.jobs.adapters.repository import JobSqlAlchemyRepository
+
+
+class JobSqlAlchemyUnitOfWork(BaseSqlAlchemyUnitOfWork):
+    """Unit of Work for the jobs module.
+
+    Attributes:
+        jobs (JobSqlAlchemyRepository): Repository for job entities.
+    """
+
+    def __init__(
+        self, session_factory: sessionmaker = DEFAULT_SESSION_FACTORY
+    ) -> None:
+        """Initializes the Unit of Work with a session factory.
+
+        Args:
+            session_factory (sessionmaker): SQLAlchemy session factory.
+                Defaults to DEFAULT_SESSION_FACTORY.
+        """
+        super().__init__(session_factory)
+
+    def _init_repositories(self) -> None:
+        """Initializes repositories for the jobs module."""
+        self.jobs = JobSqlAlchemyRepository(self.session)
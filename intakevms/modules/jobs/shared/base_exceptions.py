@@ -0,0 +1,14 @@
+"""Exceptions of the jobs module.
+
+Classes:
+    - JobNotCancellableException: Raised when cancelling a job that already
+        started.
+"""
+
+from intakevms.abstracts.base_exception import BaseCustomException
+
+
+class JobNotCancellableException(BaseCustomException):
+    """Raised when cancelling a job that is no longer queued."""
+
+    ...
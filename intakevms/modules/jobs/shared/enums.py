@@ -0,0 +1,30 @@
+"""Shared enums for job-related logic.
+
+Enums:
+    - JobStatus: Lifecycle states of a job.
+"""
+
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """Represents the lifecycle status of a job.
+
+    Values:
+        - QUEUED: Job is waiting for a worker, it can still be cancelled.
+        - RUNNING: Job is being processed.
+        - SUCCEEDED: Job is done.
+        - FAILED: Job stopped on an error.
+        - CANCELLED: Job was cancelled before it started.
+    """
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a final status."""
+        return self not in {JobStatus.QUEUED, JobStatus.RUNNING}
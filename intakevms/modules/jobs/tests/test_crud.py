@@ -0,0 +1,67 @@
+"""Unit tests for the lifecycle of jobs.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/modules/jobs/tests/test_crud.py
+"""
+
+import functools
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from intakevms.modules.jobs.adapters.orm import Base
+from intakevms.modules.jobs.shared.enums import JobStatus
+from intakevms.modules.jobs.entrypoints.crud import JobCrud, ProgressReporter
+from intakevms.modules.jobs.shared.base_exceptions import (
+    JobNotCancellableException,
+)
+from intakevms.modules.jobs.service_layer.unit_of_work import (
+    JobSqlAlchemyUnitOfWork,
+)
+
+
+@pytest.fixture
+def crud() -> Iterator[JobCrud]:
+    """Job CRUD on an in-memory database."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    jobs = JobCrud()
+    jobs.uow = functools.partial(  # type: ignore[assignment]
+        JobSqlAlchemyUnitOfWork,
+        sessionmaker(bind=engine, expire_on_commit=False),
+    )
+    yield jobs
+    engine.dispose()
+
+
+def test_cancelled_job_is_not_started(crud: JobCrud) -> None:
+    """A job cancelled while queued is skipped by its worker."""
+    job_id = crud.create_job('create_template', 'templates')
+
+    assert crud.cancel_job(job_id).status == JobStatus.CANCELLED
+    assert not crud.start_job(job_id)
+    with pytest.raises(JobNotCancellableException):
+        crud.cancel_job(job_id)
+
+
+def test_running_job_reports_throttled_progress(crud: JobCrud) -> None:
+    """Progress is written once it moved enough, then the job finishes."""
+    job_id = crud.create_job('create_template', 'templates')
+    assert crud.start_job(job_id)
+    reporter = ProgressReporter(job_id, interval=0, min_step=10)
+    reporter.jobs = crud
+
+    for progress in (5.0, 12.5, 15.0):
+        reporter(progress)
+    running = crud.get_job(job_id)
+    crud.finish_job(job_id)
+
+    assert running.status == JobStatus.RUNNING
+    assert running.progress == 12.5  # noqa: PLR2004 last reported progress
+    assert running.eta_seconds is not None
+    with pytest.raises(JobNotCancellableException):
+        crud.cancel_job(job_id)
+    assert crud.get_job(job_id).progress == 100  # noqa: PLR2004 percentage
@@ -14,11 +14,13 @@ Classes:
 
 import abc
 from uuid import UUID
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple, Optional, Sequence
 
+from sqlalchemy import or_, select
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from intakevms.common.pagination import PageRequest, paginate_query
 from intakevms.abstracts.exceptions import DBCannotBeConnectedError
 from intakevms.modules.network.adapters.orm import Interface, InterfaceExtraSpec
 
@@ -83,6 +85,24 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         return self._get_all()
 
+    def get_page(
+        self,
+        page: PageRequest,
+        exclude_names: Sequence[str] = (),
+    ) -> Tuple[List[Interface], Optional[str]]:
+        """Retrieve a page of network interfaces from the repository.
+
+        Args:
+            page (PageRequest): The requested page.
+            exclude_names (Sequence[str]): Names of the interfaces to leave
+                out of the page.
+
+        Returns:
+            Tuple[List[Interface], Optional[str]]: The network interfaces of
+                the page and the cursor of the next page.
+        """
+        return self._get_page(page, exclude_names)
+
     def delete(self, interface_id: UUID) -> None:
         """Delete a network interface by its ID.
 
@@ -150,6 +170,29 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_page(
+        self,
+        page: PageRequest,
+        exclude_names: Sequence[str],
+    ) -> Tuple[List[Interface], Optional[str]]:
+        """Retrieve a page of network interfaces from the repository.
+
+        Args:
+            page (PageRequest): The requested page.
+            exclude_names (Sequence[str]): Names of the interfaces to leave
+                out of the page.
+
+        Returns:
+            Tuple[List[Interface], Optional[str]]: The network interfaces of
+                the page and the cursor of the next page.
+
+        Raises:
+            NotImplementedError: This method should be implemented by
+                subclasses.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _delete(self, interface_id: UUID) -> None:
         """Delete a network interface by its ID.
@@ -276,6 +319,34 @@ class SqlAlchemyRepository(AbstractRepository):
             .all()
         )
 
+    def _get_page(
+        self,
+        page: PageRequest,
+        exclude_names: Sequence[str],
+    ) -> Tuple[List[Interface], Optional[str]]:
+        """Retrieve a page of network interfaces from the repository.
+
+        Args:
+            page (PageRequest): The requested page.
+            exclude_names (Sequence[str]): Names of the interfaces to leave
+                out of the page.
+
+        Returns:
+            Tuple[List[Interface], Optional[str]]: The network interfaces of
+                the page and the cursor of the next page.
+        """
+        stmt = select(Interface).options(selectinload(Interface.extra_specs))
+        if exclude_names:
+            stmt = stmt.where(
+                or_(
+                    Interface.name.is_(None),
+                    Interface.name.not_in(exclude_names),
+                )
+            )
+        return paginate_query(
+            self.session, stmt, page, {'id': Interface.id}, 'id'
+        )
+
     def _delete(self, interface_id: UUID) -> None:
         """Delete a network interface by its ID.
 
@@ -15,14 +15,15 @@ Routes:
 """
 
 from uuid import UUID
-from typing import Dict, List, cast
+from typing import Dict, List
 
 from fastapi import Query, Depends, APIRouter, status
 from fastapi.responses import JSONResponse
-from fastapi_pagination import Page, paginate
 from starlette.concurrency import run_in_threadpool
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.pagination import PageRequest, page_request
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.modules.network.entrypoints import schemas
 from intakevms.modules.network.entrypoints.crud import InterfaceCrud
@@ -35,43 +36,47 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+interfaces_page = page_request('id')
+
 
 @router.get(
     '/',
-    response_model=Page[schemas.Interface],
+    response_model=KeysetPage[schemas.Interface],
     status_code=status.HTTP_200_OK,
     dependencies=[
         Depends(get_current_user),
     ],
 )
 async def get_interfaces(
+    page: PageRequest = Depends(interfaces_page),
     crud: InterfaceCrud = Depends(InterfaceCrud),
     *,
     is_need_filter: bool = Query(
         default=False, description='Flag for filtering interfaces.'
     ),
-) -> Page[schemas.Interface]:
-    """API endpoint for retrieving a list of all interfaces.
+) -> KeysetPage[schemas.Interface]:
+    """API endpoint for retrieving a page of interfaces.
 
     Args:
+        page (PageRequest): The requested page.
         is_need_filter (Optional[bool], optional): Flag indicating whether to
             apply filtering on interfaces. Defaults to False.
         crud (InterfaceCrud, optional): Dependency injection for CRUD operations
             on interfaces.
 
     Returns:
-        Page[schemas.Interface]: A paginated list of interfaces retrieved from
+        KeysetPage[schemas.Interface]: A page of interfaces retrieved from
             the database.
 
     Raises:
         Exception: Any error that occurs during the process.
     """
-    LOG.info('API: Start getting list of interfaces')
-    interfaces = await run_in_threadpool(
-        crud.get_all_interfaces, is_need_filter=is_need_filter
+    LOG.info('API: Start getting page of interfaces')
+    result = await run_in_threadpool(
+        crud.get_interfaces_page, page, is_need_filter=is_need_filter
     )
     LOG.info('API: Request processed successfully.')
-    return cast(Page, paginate(interfaces))
+    return KeysetPage[schemas.Interface](**result)
 
 
 @router.get(
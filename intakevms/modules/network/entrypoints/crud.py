@@ -13,6 +13,7 @@ from uuid import UUID
 from typing import Dict, List
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
 from intakevms.libs.client.config import get_os_type
 from intakevms.modules.network.config import (
     NETWORK_CONFIG_MANAGER,
@@ -73,6 +74,31 @@ class InterfaceCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
+    def get_interfaces_page(
+        self,
+        page: PageRequest,
+        *,
+        is_need_filter: bool = False,
+    ) -> Dict:
+        """Retrieve a page of network interfaces.
+
+        Args:
+            page (PageRequest): The requested page.
+            is_need_filter (Optional[bool], optional): Flag indicating whether
+                to apply filtering on interfaces. Defaults to False.
+
+        Returns:
+            Dict: The interfaces of the page and the cursor of the next page.
+        """
+        LOG.info('Call service layer on getting page of interfaces.')
+        data = {**page.to_dict(), 'is_need_filter': is_need_filter}
+        result: Dict = self.service_layer_rpc.call(
+            services.NetworkServiceLayerManager.get_interfaces_page.__name__,
+            data_for_method=data,
+        )
+        LOG.debug('Response from service layer: %s.' % result)
+        return result
+
     def get_interface(self, iface_id: UUID) -> Dict:
         """Retrieve a specific network interface.
 
@@ -21,6 +21,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from intakevms.libs.log import get_logger
 from intakevms.modules.network import utils
+from intakevms.common.pagination import PageRequest, page_dict
 from intakevms.modules.base_manager import BackgroundTasks, periodic_task
 from intakevms.modules.network.config import (
     API_SERVICE_LAYER_QUEUE_NAME,
@@ -136,6 +137,30 @@ class NetworkServiceLayerManager(BackgroundTasks):
                     web_interfaces.append(web_interface)
         return web_interfaces
 
+    def get_interfaces_page(self, data: Dict) -> Dict:
+        """Retrieve a page of network interfaces from the database.
+
+        Args:
+            data (Dict): The page request, see `PageRequest.to_dict`, and:
+                - is_need_filter (Optional[bool]): Flag indicating whether to
+                    leave the loopback interface out. Defaults to False.
+
+        Returns:
+            Dict: The serialized interfaces of the page and the cursor of
+                the next page.
+        """
+        LOG.info('Start getting page of interfaces from db.')
+        page = PageRequest.from_dict(data)
+        exclude_names = ['lo'] if data.get('is_need_filter') else []
+        with self.uow:
+            db_interfaces, next_cursor = self.uow.interfaces.get_page(
+                page, exclude_names
+            )
+            return page_dict(
+                [DataSerializer.to_web(iface) for iface in db_interfaces],
+                next_cursor,
+            )
+
     def get_interface(self, data: Dict) -> Dict:
         """Retrieve a network interface by its ID.
 
@@ -33,6 +33,9 @@ from sqlalchemy.orm import (
     mapped_column,
 )
 
+from intakevms.common.versions import track_versions
+from intakevms.common.state_events import track_states
+
 
 class Base(DeclarativeBase):
     """Base class for inheritance images and attachments tables."""
@@ -129,3 +132,7 @@ class StorageExtraSpecs(Base):
     storage: Mapped[Storage] = relationship(
         'Storage', back_populates='extra_specs'
     )
+
+
+track_versions('storages', Storage, StorageExtraSpecs)
+track_states('storages', Storage, 'status')
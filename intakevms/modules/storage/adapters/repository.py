@@ -12,18 +12,28 @@ Classes:
 
 import abc
 from uuid import UUID
-from typing import TYPE_CHECKING, Any, List, Union, Optional, cast
+from typing import TYPE_CHECKING, Any, List, Tuple, Union, Optional
 
+from sqlalchemy import select, update
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import joinedload
-from sqlalchemy.orm.mapper import Mapper
+from sqlalchemy.orm import joinedload, selectinload
 
+from intakevms.common.pagination import PageRequest, paginate_query
 from intakevms.abstracts.exceptions import DBCannotBeConnectedError
 from intakevms.modules.storage.adapters.orm import Storage, StorageExtraSpecs
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+# Columns of the summary view of storages, besides the primary key.
+SUMMARY_COLUMNS = (
+    Storage.name,
+    Storage.status,
+    Storage.storage_type,
+    Storage.size,
+    Storage.available,
+)
+
 
 class AbstractRepository(metaclass=abc.ABCMeta):
     """Abstract base class defining the storage repository interface.
@@ -68,6 +78,21 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         return self._get_all()
 
+    def get_page(
+        self, page: PageRequest, *, summary: bool = False
+    ) -> Tuple[List[Storage], Optional[str]]:
+        """Retrieve a page of storage records.
+
+        Args:
+            page (PageRequest): The requested page.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List[Storage], Optional[str]]: The storage records of the
+                page and the cursor of the next page.
+        """
+        return self._get_page(page, summary=summary)
+
     def get_storage_by_name(self, storage_name: str) -> Optional[Storage]:
         """Retrieve a storage record by its name.
 
@@ -134,6 +159,25 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_page(
+        self, page: PageRequest, *, summary: bool
+    ) -> Tuple[List[Storage], Optional[str]]:
+        """Retrieve a page of storage records.
+
+        Args:
+            page (PageRequest): The requested page.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List[Storage], Optional[str]]: The storage records of the
+                page and the cursor of the next page.
+
+        Raises:
+            NotImplementedError: If the method is not implemented.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _get_storage_by_name(self, storage_name: str) -> Optional[Storage]:
         """Retrieve a storage record by its name.
@@ -346,6 +390,31 @@ class SqlAlchemyRepository(AbstractRepository):
             .all()
         )
 
+    def _get_page(
+        self, page: PageRequest, *, summary: bool
+    ) -> Tuple[List[Storage], Optional[str]]:
+        """Retrieve a page of storage records.
+
+        Args:
+            page (PageRequest): The requested page.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List[Storage], Optional[str]]: The storage records of the
+                page and the cursor of the next page.
+        """
+        stmt = select(Storage)
+        if not summary:
+            stmt = stmt.options(selectinload(Storage.extra_specs))
+        return paginate_query(
+            self.session,
+            stmt,
+            page,
+            {'id': Storage.id},
+            'id',
+            projection=SUMMARY_COLUMNS if summary else None,
+        )
+
     def _get_storage_by_name(self, storage_name: str) -> Optional[Storage]:
         """Retrieve a storage record by its name.
 
@@ -436,4 +505,4 @@ class SqlAlchemyRepository(AbstractRepository):
         Args:
             data (List): A list of storage records to update.
         """
-        self.session.bulk_update_mappings(cast(Mapper, Storage), data)
+        self.session.execute(update(Storage), data)
@@ -8,3 +8,5 @@ API_SERVICE_LAYER_QUEUE_NAME: str = RPC_QUEUES.Storage.SERVICE_LAYER
 SERVICE_LAYER_DOMAIN_QUEUE_NAME: str = RPC_QUEUES.Storage.DOMAIN_LAYER
 
 DEFAULT_SESSION_FACTORY = get_default_session_factory()
+# Seconds allowed to the setup of each storage by the monitoring.
+STORAGE_SETUP_SECONDS = 180
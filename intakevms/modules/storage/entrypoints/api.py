@@ -19,17 +19,20 @@ Entrypoints:
 """
 
 from uuid import UUID
-from typing import Dict, Optional, cast
+from typing import Dict, Union, Optional
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Query, Depends, Response, APIRouter, status
 from fastapi.responses import JSONResponse
-from fastapi_pagination import Page, paginate
-from starlette.concurrency import run_in_threadpool
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.versions import etag_dependency
+from intakevms.common.rendering import RenderedJSONResponse, render
+from intakevms.common.pagination import PageRequest, page_request
+from intakevms.common.projections import VIEW_DESCRIPTION, View
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.modules.storage.entrypoints import schemas
-from intakevms.modules.storage.entrypoints.crud import StorageCrud
+from intakevms.modules.storage.entrypoints.crud import AsyncStorageCrud
 
 LOG = get_logger(__name__)
 
@@ -39,28 +42,41 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+storages_page = page_request('id')
+storages_etag = etag_dependency('storages')
+
 
 @router.get(
     '/',
-    response_model=Page[schemas.Storage],
+    response_model=Union[
+        KeysetPage[schemas.StorageSummary], KeysetPage[schemas.Storage]
+    ],
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(storages_etag)],
 )
 async def get_storages(
-    crud: StorageCrud = Depends(StorageCrud),
-) -> Page[schemas.Storage]:
-    """It gets a list of storages from the database
+    response: Response,
+    page: PageRequest = Depends(storages_page),
+    view: View = Query(default=View.FULL, description=VIEW_DESCRIPTION),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
+) -> RenderedJSONResponse:
+    """It gets a page of storages from the database
 
     Args:
-        crud: Depends (StorageCrud) - this is a dependency injection.
+        response: Response - the response, with the ETag to keep.
+        page: Depends (storages_page) - the requested page.
+        view: Query - the representation of the storages.
+        crud: Depends (AsyncStorageCrud) - this is a dependency injection.
 
     Returns:
-        A list of storages.
+        A page of storages and the cursor of the next page.
     """
-    LOG.info('Api start getting list of storages')
-    storages = await run_in_threadpool(crud.get_all_storages)
+    LOG.info('Api start getting page of storages')
+    result = await crud.get_storages_page(page, view)
     LOG.info('Api request was successfully processed.')
-    return cast(Page, paginate(storages))
+    if view is View.SUMMARY:
+        return render(KeysetPage[schemas.StorageSummary](**result), response)
+    return render(KeysetPage[schemas.Storage](**result), response)
 
 
 @router.get(
@@ -71,7 +87,7 @@ async def get_storages(
 )
 async def get_local_disks(
     free_local_disks: Optional[bool] = None,
-    crud: StorageCrud = Depends(StorageCrud),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
 ) -> schemas.ListOfLocalDisks:
     """It gets a list of free local disks
 
@@ -84,7 +100,7 @@ async def get_local_disks(
     """
     LOG.info('Api start getting list of local disks')
     data = {'free_local_disks': free_local_disks}
-    local_disks = await run_in_threadpool(crud.get_local_disks, data)
+    local_disks = await crud.get_local_disks(data)
     LOG.info('Api request was successfully processed.')
     return local_disks
 
@@ -98,7 +114,7 @@ async def get_local_disks(
 async def create_local_partition(
     data: schemas.CreateLocalPartition,
     user_data: Dict = Depends(get_current_user),
-    crud: StorageCrud = Depends(StorageCrud),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
 ) -> schemas.LocalDisk:
     """Create a local disk partition.
 
@@ -107,15 +123,15 @@ async def create_local_partition(
 
     Args:
         data (schemas.CreateLocalPartition): Data for creating the partition.
-        crud (StorageCrud): Dependency for CRUD operations.
+        crud (AsyncStorageCrud): Dependency for CRUD operations.
         user_data (Dict): User data
 
     Returns:
         schemas.LocalDisk: Information about the newly created partition.
     """
     LOG.info('Api start create partition on local disk')
-    result = await run_in_threadpool(
-        crud.create_local_partition, data.model_dump(mode='json'), user_data
+    result = await crud.create_local_partition(
+        data.model_dump(mode='json'), user_data
     )
     LOG.info('Api request was successfully processed.')
     return schemas.LocalDisk(**result)
@@ -127,7 +143,7 @@ async def create_local_partition(
     dependencies=[Depends(get_current_user)],
 )
 async def get_local_disk_partitions_info(
-    disk_path: str, crud: StorageCrud = Depends(StorageCrud)
+    disk_path: str, crud: AsyncStorageCrud = Depends(AsyncStorageCrud)
 ) -> JSONResponse:
     """Get information about local disk partitions.
 
@@ -137,7 +153,7 @@ async def get_local_disk_partitions_info(
     Args:
         disk_path (str): Path to the local disk.
         unit (Optional[str]): unit of values about partitions
-        crud (StorageCrud): Dependency for CRUD operations.
+        crud (AsyncStorageCrud): Dependency for CRUD operations.
 
     Returns:
         Dict: Information about local disk partitions.
@@ -145,8 +161,7 @@ async def get_local_disk_partitions_info(
     LOG.info('Api start getting list of partitions')
     return JSONResponse(
         (
-            await run_in_threadpool(
-                crud.get_local_disk_partitions_info,
+            await crud.get_local_disk_partitions_info(
                 {
                     'disk_path': disk_path,
                 },
@@ -162,7 +177,7 @@ async def get_local_disk_partitions_info(
 async def delete_local_partition(
     data: schemas.DeleteLocalPartition,
     user_data: Dict = Depends(get_current_user),
-    crud: StorageCrud = Depends(StorageCrud),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
 ) -> JSONResponse:
     """Delete a local disk partition.
 
@@ -170,15 +185,15 @@ async def delete_local_partition(
 
     Args:
         data (schemas.DeleteLocalPartition): Data for deleting the partition.
-        crud (StorageCrud): Dependency for CRUD operations.
+        crud (AsyncStorageCrud): Dependency for CRUD operations.
         user_data (Dict): User data
 
     Returns:
         Dict: A message indicating the success of the operation.
     """
     LOG.info('Api start delete partition on local disk')
-    result = await run_in_threadpool(
-        crud.delete_local_partition, data.model_dump(mode='json'), user_data
+    result = await crud.delete_local_partition(
+        data.model_dump(mode='json'), user_data
     )
     LOG.info('Api request was successfully processed.')
     return JSONResponse(result)
@@ -188,23 +203,23 @@ async def delete_local_partition(
     '/{storage_id}/',
     response_model=schemas.Storage,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(storages_etag)],
 )
 async def get_storage(
     storage_id: UUID,
-    crud: StorageCrud = Depends(StorageCrud),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
 ) -> schemas.Storage:
     """It gets a storage by id
 
     Args:
         storage_id (str): str = Query(None, description="Volume id")
-        crud: Depends(StorageCrud) - this is a dependency injection.
+        crud: Depends(AsyncStorageCrud) - this is a dependency injection.
 
     Returns:
         The storage object.
     """
     LOG.info('Api handle response on getting storage.')
-    storage = await run_in_threadpool(crud.get_storage, storage_id)
+    storage = await crud.get_storage(storage_id)
     LOG.info('Api request was successfully processed.')
     return schemas.Storage(**storage)
 
@@ -217,7 +232,7 @@ async def get_storage(
 async def create_storage(
     data: schemas.CreateStorage,
     user_data: Dict = Depends(get_current_user),
-    crud: StorageCrud = Depends(StorageCrud),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
 ) -> schemas.Storage:
     """It creates a storage
 
@@ -225,8 +240,8 @@ async def create_storage(
         data (schemas.CreateStorage): schemas.CreateStorage - this is the data
         that will be passed to the function.
         user_data: The dependency that check user was authorized
-        crud: StorageCrud - this is the dependency that we will inject into the
-        function.
+        crud: AsyncStorageCrud - this is the dependency that we will inject
+        into the function.
 
     Returns:
         The storage object is being returned.
@@ -235,8 +250,8 @@ async def create_storage(
         'Api start creating storage with data: %s.'
         % data.model_dump(mode='json')
     )
-    storage = await run_in_threadpool(
-        crud.create_storage, data.model_dump(mode='json'), user_data
+    storage = await crud.create_storage(
+        data.model_dump(mode='json'), user_data
     )
     LOG.info('Api request was successfully processed.')
     return schemas.Storage(**storage)
@@ -250,21 +265,21 @@ async def create_storage(
 async def delete_storage(
     storage_id: UUID,
     user_data: Dict = Depends(get_current_user),
-    crud: StorageCrud = Depends(StorageCrud),
+    crud: AsyncStorageCrud = Depends(AsyncStorageCrud),
 ) -> schemas.Storage:
     """It deletes a storage
 
     Args:
         storage_id (str): str = Query(None, description="Storage id")
         user_data: The dependency that check user was authorized
-        crud: Depends(StorageCrud)
+        crud: Depends(AsyncStorageCrud)
 
     Returns:
         The storage object.
     """
     LOG.info('Api start deleting storage: %s.' % storage_id)
-    storage = await run_in_threadpool(
-        crud.delete_storage, storage_id, user_data
+    storage = await crud.delete_storage(
+        storage_id, user_data
     )
     LOG.info('Api request was successfully processed.')
     return schemas.Storage(**storage)
@@ -5,37 +5,42 @@ interacting with the service layer that manages storage and local disk
 partitions.
 
 Classes:
-    StorageCrud: Class providing methods to perform CRUD operations on storages
-        and partitions.
+    AsyncStorageCrud: Class providing methods to perform CRUD operations on
+        storages and partitions.
 """
 
 from uuid import UUID
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Type
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
+from intakevms.common.projections import View
 from intakevms.modules.storage.config import API_SERVICE_LAYER_QUEUE_NAME
 from intakevms.libs.validation.validators import Validator
 from intakevms.modules.storage.entrypoints import schemas
 from intakevms.modules.storage.service_layer import services
 from intakevms.libs.messaging.messaging_agents import MessagingClient
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 LOG = get_logger(__name__)
 
 
-class StorageCrud:
-    """CRUD class for managing storage and partition operations.
+class AsyncStorageCrud:
+    """Class providing CRUD operations on storages and partitions.
 
     This class provides methods to create, read, and delete storage objects
     and manage local disk partitions by interacting with the service layer.
     """
 
     def __init__(self) -> None:
-        """Initialize the StorageCrud with service layer RPC."""
+        """Initialize the AsyncStorageCrud with service layer RPC."""
         self.service_layer_rpc = MessagingClient(
             queue_name=API_SERVICE_LAYER_QUEUE_NAME
         )
 
-    def get_storage(self, storage_id: UUID) -> Dict:
+    async def get_storage(self, storage_id: UUID) -> Dict:
         """Retrieve a storage by its ID.
 
         Args:
@@ -45,28 +50,53 @@ class StorageCrud:
             Dict: The storage object data retrieved from the service layer.
         """
         LOG.info('Call service layer on getting storage.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.get_storage.__name__,
             data_for_method={'storage_id': str(storage_id)},
         )
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def get_all_storages(self) -> List[schemas.BaseModel]:
+    async def get_all_storages(self) -> List[schemas.BaseModel]:
         """Retrieve all storages from the database.
 
         Returns:
             Page: A paginated list of all storages.
         """
         LOG.info('Call service layer on getting all storages.')
-        result: List = self.service_layer_rpc.call(
+        result: List = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.get_all_storages.__name__,
             data_for_method={},
         )
         LOG.debug('Response from service layer: %s.' % result)
         return Validator.validate_objects(result, schemas.Storage)
 
-    def create_storage(self, data: Dict, user_data: Dict) -> Dict:
+    async def get_storages_page(
+        self, page: PageRequest, view: View = View.FULL
+    ) -> Dict:
+        """Retrieve a page of storages from the database.
+
+        Args:
+            page (PageRequest): The requested page.
+            view (View): The representation of the storages.
+
+        Returns:
+            Dict: The storages of the page, validated against the Storage
+                or StorageSummary schema, and the cursor of the next page.
+        """
+        LOG.info('Call service layer on getting page of storages.')
+        result: Dict = await self.service_layer_rpc.acall(
+            services.StorageServiceLayerManager.get_storages_page.__name__,
+            data_for_method={**page.to_dict(), 'view': view.value},
+        )
+        LOG.debug('Response from service layer: %s.' % result)
+        schema: Type[BaseModel] = schemas.Storage
+        if view is View.SUMMARY:
+            schema = schemas.StorageSummary
+        result['items'] = Validator.validate_objects(result['items'], schema)
+        return result
+
+    async def create_storage(self, data: Dict, user_data: Dict) -> Dict:
         """Create a new storage.
 
         Args:
@@ -78,7 +108,7 @@ class StorageCrud:
         """
         LOG.info('Call service layer on create storage.')
         data.update({'user_data': user_data})
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.create_storage.__name__,
             data_for_method=data,
             priority=8,
@@ -86,7 +116,7 @@ class StorageCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def delete_storage(self, storage_id: UUID, user_data: Dict) -> Dict:
+    async def delete_storage(self, storage_id: UUID, user_data: Dict) -> Dict:
         """Delete a storage by its ID.
 
         Args:
@@ -97,7 +127,7 @@ class StorageCrud:
             Dict: Confirmation of the deletion operation.
         """
         LOG.info('Call service layer on delete storage.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.delete_storage.__name__,
             data_for_method={
                 'storage_id': str(storage_id),
@@ -108,7 +138,7 @@ class StorageCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def get_local_disks(self, data: Dict) -> schemas.ListOfLocalDisks:
+    async def get_local_disks(self, data: Dict) -> schemas.ListOfLocalDisks:
         """Retrieve a list of local disks.
 
         Args:
@@ -121,7 +151,7 @@ class StorageCrud:
             schemas.ListOfLocalDisks: A list of local disks.
         """
         LOG.info('Call service layer on get free local disks.')
-        result = self.service_layer_rpc.call(
+        result = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.get_local_disks.__name__,
             data_for_method={
                 'free_local_disks': data.get('free_local_disks', False)
@@ -131,7 +161,7 @@ class StorageCrud:
         local_disks = Validator.validate_objects(result, schemas.LocalDisk)
         return schemas.ListOfLocalDisks.model_validate({'disks': local_disks})
 
-    def create_local_partition(self, data: Dict, user_data: Dict) -> Dict:
+    async def create_local_partition(self, data: Dict, user_data: Dict) -> Dict:
         """Create a new partition on a local disk.
 
         Args:
@@ -143,14 +173,14 @@ class StorageCrud:
         """
         LOG.info('Call service layer on creating partition.')
         data['user_data'] = user_data
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.create_local_partition.__name__,
             data_for_method=data,
         )
         LOG.info('Response from service layer successfully completed.')
         return result
 
-    def get_local_disk_partitions_info(self, data: Dict) -> Dict:
+    async def get_local_disk_partitions_info(self, data: Dict) -> Dict:
         """Get information about partitions on a local disk.
 
         Args:
@@ -160,14 +190,14 @@ class StorageCrud:
             Dict: Information about the partitions on the specified disk.
         """
         LOG.info('Call service layer on getting local partitions.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.get_local_disk_partitions_info.__name__,
             data_for_method=data,
         )
         LOG.info('Response from service layer: %s.' % result)
         return result
 
-    def delete_local_partition(self, data: Dict, user_data: Dict) -> Dict:
+    async def delete_local_partition(self, data: Dict, user_data: Dict) -> Dict:
         """Delete a partition from a local disk.
 
         Args:
@@ -179,7 +209,7 @@ class StorageCrud:
         """
         LOG.info('Call service layer on deleting partition.')
         data['user_data'] = user_data
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.StorageServiceLayerManager.delete_local_partition.__name__,
             data_for_method=data,
         )
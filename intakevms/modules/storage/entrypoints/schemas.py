@@ -121,6 +121,26 @@ class Storage(BaseModel):
     ]
 
 
+class StorageSummary(BaseModel):
+    """Schema representing the summary view of a storage.
+
+    Attributes:
+        id (UUID): The unique identifier of the storage.
+        name (str): The name of the storage.
+        storage_type (str): The type of storage (e.g., 'nfs', 'localfs').
+        status (str): The current status of the storage.
+        size (int): The total size of the storage in bytes.
+        available (int): The available size of the storage in bytes.
+    """
+
+    id: UUID
+    name: str
+    storage_type: str
+    status: str
+    size: int
+    available: int
+
+
 class CreateStorage(BaseModel):
     """Schema for creating a new storage.
 
@@ -23,16 +23,23 @@ from __future__ import annotations
 
 import enum
 import uuid
-from typing import Dict, List, cast
+from typing import Dict, List, Tuple, cast
 
 from intakevms.libs.log import get_logger
+from intakevms.libs.caching import cached_read, invalidates
+from intakevms.libs.monitoring import StateSnapshot
+from intakevms.common.pagination import PageRequest, page_dict
+from intakevms.common.projections import is_summary, to_summary
 from intakevms.modules.base_manager import BackgroundTasks, periodic_task
 from intakevms.libs.context_managers import synchronized_session
+from intakevms.libs.messaging.config import get_rpc_server_settings
 from intakevms.modules.storage.config import (
+    STORAGE_SETUP_SECONDS,
     API_SERVICE_LAYER_QUEUE_NAME,
     SERVICE_LAYER_DOMAIN_QUEUE_NAME,
 )
 from intakevms.modules.storage.domain import base
+from intakevms.libs.messaging.rpc.base import RpcCall, batch_time_limit
 from intakevms.modules.storage.adapters import orm
 from intakevms.libs.messaging.exceptions import (
     RpcException,
@@ -146,7 +153,20 @@ class StorageServiceLayerManager(BackgroundTasks):
         self.image_service_client = ImageServiceLayerRPCClient()
         self.template_service_client = TemplateServiceLayerRPCClient()
         self.event_store = EventCrud('storages')
+        self.monitoring_snapshot = StateSnapshot(
+            'storages',
+            (
+                'size',
+                'available',
+                'status',
+                'initialized',
+                'information',
+                'mount_point',
+                'path',
+            ),
+        )
 
+    @cached_read('storages')
     def get_storage(self, data: Dict) -> Dict:
         """Retrieve a specific storage from the database.
 
@@ -174,13 +194,14 @@ class StorageServiceLayerManager(BackgroundTasks):
             )
             LOG.error(message)
             raise exceptions.StorageAttributeError(message)
-        with self.uow:
-            db_storage = self.uow.storages.get(storage_id)
+        with self.uow.read_only() as uow:
+            db_storage = uow.storages.get(storage_id)
             web_storage = DataSerializer.to_web(db_storage)
             LOG.debug('Got storage from db: %s.' % web_storage)
         LOG.info('Service layer method get storage was successfully processed')
         return web_storage
 
+    @cached_read('storages')
     def get_all_storages(self) -> List[Dict]:
         """Retrieve all storages from the database.
 
@@ -192,14 +213,38 @@ class StorageServiceLayerManager(BackgroundTasks):
                 storages with their metadata.
         """
         LOG.info('Start getting storages from db.')
-        with self.uow:
+        with self.uow.read_only() as uow:
             web_storages = []
-            db_storages = self.uow.storages.get_all()
+            db_storages = uow.storages.get_all()
             for db_storage in db_storages:
                 web_storage = DataSerializer.to_web(db_storage)
                 web_storages.append(web_storage)
         return web_storages
 
+    @cached_read('storages')
+    def get_storages_page(self, data: Dict) -> Dict:
+        """Retrieve a page of storages from the database.
+
+        Args:
+            data (Dict): The page request, see `PageRequest.to_dict`, and
+                the optional `view` of the storages.
+
+        Returns:
+            Dict: The serialized storages of the page and the cursor of the
+                next page.
+        """
+        LOG.info('Start getting page of storages from db.')
+        page = PageRequest.from_dict(data)
+        summary = is_summary(data)
+        with self.uow.read_only() as uow:
+            db_storages, next_cursor = uow.storages.get_page(
+                page, summary=summary
+            )
+            serialize = to_summary if summary else DataSerializer.to_web
+            return page_dict(
+                [serialize(storage) for storage in db_storages], next_cursor
+            )
+
     def _check_storage_exists_with_current_name(
         self, storage_name: str
     ) -> None:
@@ -672,6 +717,7 @@ class StorageServiceLayerManager(BackgroundTasks):
             )
             raise exceptions.PartitionHasStorage(message)
 
+    @invalidates('storages')
     def create_storage(self, data: Dict) -> Dict:
         """Create a new storage.
 
@@ -742,6 +788,7 @@ class StorageServiceLayerManager(BackgroundTasks):
         LOG.info('Service layer method create_storage executed successfully.')
         return web_storage
 
+    @invalidates('storages')
     def _create_storage(self, storage_info: Dict) -> None:
         """Create a new storage
 
@@ -837,6 +884,7 @@ class StorageServiceLayerManager(BackgroundTasks):
             'Service layer method _create_storage was ' 'successfully processed'
         )
 
+    @invalidates('storages')
     def delete_storage(self, data: Dict) -> Dict:
         """Deletes a storage from the database and from the system.
 
@@ -883,6 +931,7 @@ class StorageServiceLayerManager(BackgroundTasks):
         )
         return DataSerializer.to_web(db_storage)
 
+    @invalidates('storages')
     def _delete_storage(self, domain_storage: Dict) -> None:
         """Asynchronous method to delete a storage from the system.
 
@@ -981,13 +1030,11 @@ class StorageServiceLayerManager(BackgroundTasks):
         The method performs the following steps:
 
         1. Get all storages from the database and convert them to domain objects
-        2. For each storage:
-        - Validate the storage status and availability.
-        - Get updated storage information from the domain.
-        - Update the storage information in a list for subsequent database
-            update.
-        - Handle any exceptions that may occur during the process.
-        3. Update the storage information in the database.
+        2. Validate the status and availability of each storage.
+        3. Get updated information of the valid storages from the domain in
+            a single batch request, and handle the errors of each storage.
+        4. Update the storages and extra specs whose information changed in
+            the database, compared to the state read in step 1.
 
         This method is designed to run periodically using the `@periodic_task`
         decorator with an interval of 10 seconds.
@@ -997,30 +1044,30 @@ class StorageServiceLayerManager(BackgroundTasks):
         if not domain_storages:
             LOG.info("Stop monitoring. Storages don't exist.")
             return
+        self.monitoring_snapshot.load(domain_storages)
+        domain_storages = self._resolve_local_paths(domain_storages)
 
-        updated_storages = []
+        monitored_storages = []
         for domain_storage in domain_storages:
             try:
                 self._validate_storage_status(domain_storage)
-                updated_storage = self._get_updated_storage_info(domain_storage)
-                updated_storages.append(updated_storage)
+                monitored_storages.append(domain_storage)
             except exceptions.StorageStatusError:
                 LOG.info(
                     f'Monitoring not update status for '
                     f'{domain_storage.get("name")} because has '
                     f'{domain_storage.get("status")}'
                 )
-            except (
-                RpcCallException,
-                RpcCallTimeoutException,
-                exceptions.GetEmptyDomainStorageInfo,
-            ) as err:
-                updated_storage = self._handle_monitoring_error(
-                    domain_storage, err
-                )
-                updated_storages.append(updated_storage)
 
-        self._update_all_storages(updated_storages)
+        updated_storages = self._get_updated_storages_info(monitored_storages)
+        changed_storages, changed_specs = self._get_monitoring_changes(
+            updated_storages
+        )
+        if changed_storages or changed_specs:
+            self._update_all_storages(changed_storages, changed_specs)
+        self.monitoring_snapshot.report(
+            len(updated_storages), len(changed_storages)
+        )
         LOG.info('Stop monitoring.')
 
     def _validate_storage_status(self, domain_storage: Dict) -> None:
@@ -1042,29 +1089,66 @@ class StorageServiceLayerManager(BackgroundTasks):
             domain_storage.get('status', ''), monitoring_statuses
         )
 
-    def _get_updated_storage_info(self, domain_storage: Dict) -> Dict:
+    def _get_updated_storages_info(
+        self, domain_storages: List[Dict]
+    ) -> List[Dict]:
         """Get updated storage information from the domain layer.
 
+        The information of all the storages is requested in a single batch
+        request, set up concurrently by the domain layer. Every setup has its
+        own time limit: a storage whose setup fails or exceeds it is updated
+        with an error status, the other ones with their information.
+
         Args:
-            domain_storage (Dict): A dictionary representing the storage
-                information.
+            domain_storages (List[Dict]): A list of dictionaries representing
+                the storage information.
 
         Returns:
-            Dict: A dictionary containing the updated storage information.
-
-        Raises:
-            RpcCallException: If an error occurs during the RPC call to the
-                domain layer.
-            RpcCallTimeoutException: If the RPC call to the domain layer times
-                out.
+            List[Dict]: A list of dictionaries containing the updated storage
+                information.
         """
-        storage_info = self.domain_rpc.call(
-            base.BaseStorage.do_setup.__name__,
-            data_for_manager=domain_storage,
-            time_limit=180,
-            priority=5,
-        )
-        return self._get_updated_storage_info_for_db(storage_info)
+        if not domain_storages:
+            return []
+        calls = [
+            RpcCall(
+                base.BaseStorage.do_setup.__name__,
+                data_for_manager=domain_storage,
+                time_limit=STORAGE_SETUP_SECONDS,
+            )
+            for domain_storage in domain_storages
+        ]
+        batch_workers = get_rpc_server_settings(
+            SERVICE_LAYER_DOMAIN_QUEUE_NAME
+        ).batch_workers
+        try:
+            results = self.domain_rpc.call_many(
+                calls,
+                parallel=True,
+                time_limit=batch_time_limit(calls, batch_workers),
+                priority=5,
+            )
+        except (RpcCallException, RpcCallTimeoutException) as err:
+            return [
+                self._handle_monitoring_error(domain_storage, err)
+                for domain_storage in domain_storages
+            ]
+
+        updated_storages = []
+        for domain_storage, result in zip(
+            domain_storages, results, strict=True
+        ):
+            try:
+                updated_storages.append(
+                    self._get_updated_storage_info_for_db(result.result())
+                )
+            except (
+                RpcCallException,
+                exceptions.GetEmptyDomainStorageInfo,
+            ) as err:
+                updated_storages.append(
+                    self._handle_monitoring_error(domain_storage, err)
+                )
+        return updated_storages
 
     def _handle_monitoring_error(
         self, domain_storage: Dict, err: Exception
@@ -1137,17 +1221,35 @@ class StorageServiceLayerManager(BackgroundTasks):
         Returns:
             List: A list of dictionaries representing the serialized storages.
         """
-        serialized_storages = []
         with self.uow:
-            for db_storage in self.uow.storages.get_all():
-                domain_storage = DataSerializer.to_domain(db_storage)
-                if db_storage.storage_type == 'localfs':
-                    fs_uuid = domain_storage.get('fs_uuid', '')
-                    disk = self._get_local_disk_by_fs_uuid(fs_uuid)
-                    if disk.get('path', ''):
-                        domain_storage.update({'path': disk.get('path', '')})
-                serialized_storages.append(domain_storage)
-        return serialized_storages
+            return [
+                DataSerializer.to_domain(db_storage)
+                for db_storage in self.uow.storages.get_all()
+            ]
+
+    def _resolve_local_paths(self, domain_storages: List[Dict]) -> List[Dict]:
+        """Set the current path of the disks of the local storages.
+
+        Args:
+            domain_storages (List[Dict]): The serialized storages.
+
+        Returns:
+            List[Dict]: The serialized storages, local storages copied with
+                the path of their disk, found by file system UUID.
+        """
+        resolved_storages = []
+        for domain_storage in domain_storages:
+            resolved_storage = domain_storage
+            if domain_storage.get('storage_type') == 'localfs':
+                fs_uuid = domain_storage.get('fs_uuid', '')
+                disk = self._get_local_disk_by_fs_uuid(fs_uuid)
+                if disk.get('path', ''):
+                    resolved_storage = {
+                        **domain_storage,
+                        'path': disk.get('path', ''),
+                    }
+            resolved_storages.append(resolved_storage)
+        return resolved_storages
 
     @staticmethod
     def _get_updated_storage_info_for_db(storage_info: Dict) -> Dict:
@@ -1192,28 +1294,52 @@ class StorageServiceLayerManager(BackgroundTasks):
 
         return updated_storage
 
-    def _update_all_storages(self, storages: List) -> None:
-        """Update all storages in the database.
+    def _get_monitoring_changes(
+        self, storages: List[Dict]
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Keep the storage information differing from the known state.
 
         Args:
-            storages (List): A list of dictionaries representing the updated
-                storage information.
+            storages (List[Dict]): A list of dictionaries representing the
+                updated storage information, with their extra specs.
+
+        Returns:
+            Tuple[List[Dict], List[Dict]]: The storages, without their extra
+                specs, and the extra specs to write.
         """
         list_of_extra_specs = []
         for storage in storages:
             extra_specs = storage.pop('extra_specs', [])
             for spec in extra_specs:
                 key, value = next(iter(spec.items()))
-                list_of_extra_specs.append(
-                    {
-                        'key': key,
-                        'value': value,
-                        'storage_id': storage.get('id'),
-                    }
-                )
+                if self.monitoring_snapshot.differs(
+                    storage.get('id'), {key: value}
+                ):
+                    list_of_extra_specs.append(
+                        {
+                            'key': key,
+                            'value': value,
+                            'storage_id': storage.get('id'),
+                        }
+                    )
+        return self.monitoring_snapshot.changes(storages), list_of_extra_specs
+
+    @invalidates('storages')
+    def _update_all_storages(
+        self, storages: List, list_of_extra_specs: List
+    ) -> None:
+        """Update storages and their extra specs in the database.
+
+        Args:
+            storages (List): A list of dictionaries representing the updated
+                storage information.
+            list_of_extra_specs (List): The extra specs to update, with
+                their key, value and storage ID.
+        """
         with self.uow:
             with synchronized_session(self.uow.session):
-                self.uow.storages.bulk_update(storages)
+                if storages:
+                    self.uow.storages.bulk_update(storages)
                 for spec in list_of_extra_specs:
                     self.uow.storages.update_spec_by_key_for_storage(**spec)
             self.uow.commit()
\ No newline at end of file
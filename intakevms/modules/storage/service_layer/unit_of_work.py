@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
+from intakevms.common.uow.read_only import ReadOnlyUnitOfWorkMixin
 from intakevms.modules.storage.config import DEFAULT_SESSION_FACTORY
 from intakevms.modules.storage.adapters import repository
 
@@ -71,7 +72,7 @@ class AbstractUnitOfWork(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
 
-class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
+class SqlAlchemyUnitOfWork(ReadOnlyUnitOfWorkMixin, AbstractUnitOfWork):
     """Concrete implementation of the Unit of Work pattern using SQLAlchemy.
 
     This class manages database transactions for storage operations using
@@ -91,7 +92,7 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
             session_factory (sessionmaker): A factory for creating new
                 SQLAlchemy sessions. Defaults to DEFAULT_SESSION_FACTORY.
         """
-        self.session_factory = session_factory
+        super().__init__(session_factory)
         self.session: Session
 
     def __enter__(self) -> Self:
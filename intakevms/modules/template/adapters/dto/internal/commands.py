@@ -34,6 +34,7 @@ class CreateTemplateServiceCommandDTO(BaseDTOModel):
         storage_id (UUID): Storage where the template will be located.
         base_volume_id (UUID): ID of the volume used to create the template.
         is_backing (bool): Whether the template acts as a backing image.
+        user_id (str): ID of the user creating the template.
     """
 
     name: str
@@ -41,6 +42,7 @@ class CreateTemplateServiceCommandDTO(BaseDTOModel):
     storage_id: UUID
     base_volume_id: UUID
     is_backing: bool
+    user_id: str = ''
 
 
 class AsyncCreateTemplateServiceCommandDTO(BaseDTOModel):
@@ -51,10 +53,14 @@ class AsyncCreateTemplateServiceCommandDTO(BaseDTOModel):
     Attributes:
         id (UUID): ID of the template.
         source_disk_path (Path): Filesystem path to the source disk image.
+        job_id (Optional[UUID]): ID of the job tracking the creation.
+        user_id (str): ID of the user creating the template.
     """
 
     id: UUID
     source_disk_path: Path
+    job_id: Optional[UUID] = None
+    user_id: str = ''
 
 
 class CreateTemplateDomainCommandDTO(BaseDTOModel):
@@ -63,9 +69,11 @@ class CreateTemplateDomainCommandDTO(BaseDTOModel):
     Attributes:
         source_disk_path (Path): Path to the disk image used to create the
             template.
+        job_id (Optional[UUID]): ID of the job to report the progress to.
     """
 
     source_disk_path: Path
+    job_id: Optional[UUID] = None
 
 
 class EditTemplateServiceCommandDTO(BaseDTOModel):
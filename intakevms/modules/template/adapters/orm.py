@@ -23,6 +23,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, DeclarativeBase, mapped_column
 
 from intakevms.common.orm_types import PathType
+from intakevms.common.state_events import track_states
 from intakevms.modules.template.shared.enums import TemplateStatus
 
 
@@ -93,3 +94,6 @@ class Template(Base):
         DateTime,
         default=datetime.datetime.now(),
     )
+
+
+track_states('templates', Template, 'status')
@@ -22,6 +22,10 @@ class TemplateSqlAlchemyRepository(BaseSqlAlchemyRepository[Template]):
     This class provides CRUD operations for the Template model using SQLAlchemy.
     """
 
+    sortable = ('id', 'name', 'created_at')
+    default_order = 'name'
+    summary_columns = ('name', 'status', 'size', 'storage_id')
+
     def __init__(self, session: Session) -> None:
         """Initializes the repository with a database session.
 
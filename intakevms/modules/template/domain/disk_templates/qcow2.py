@@ -10,6 +10,7 @@ from pathlib import Path
 from intakevms.libs.log import get_logger
 from intakevms.libs.qemu_img.exceptions import QemuImgError
 from intakevms.modules.template.domain.base import BaseTemplate
+from intakevms.modules.jobs.entrypoints.crud import ProgressReporter
 from intakevms.modules.template.domain.exception import (
     TemplateFileEditingException,
     TemplateFileCreatingException,
@@ -58,7 +59,8 @@ class Qcow2Template(BaseTemplate):
         """Create a QCOW2 template file from an existing volume.
 
         Args:
-            creation_data (Dict): Must contain 'source_disk_path' (str or Path).
+            creation_data (Dict): Must contain 'source_disk_path' (str or Path),
+                and may contain the 'job_id' to report the progress to.
 
         Raises:
             FileNotFoundError: If the source disk does not exist.
@@ -80,8 +82,15 @@ class Qcow2Template(BaseTemplate):
             message = f'Template file already exists at {self.path}'
             raise FileExistsError(message)
 
+        on_progress = (
+            ProgressReporter(create_command.job_id)
+            if create_command.job_id
+            else None
+        )
         try:
-            self.qemu_img_adapter.create_copy(source_disk_path, self.path)
+            self.qemu_img_adapter.create_copy(
+                source_disk_path, self.path, on_progress=on_progress
+            )
         except QemuImgError as err:
             LOG.error(
                 f'Error while creating template file: {self.path} '
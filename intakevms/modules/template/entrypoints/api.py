@@ -4,11 +4,11 @@ This module exposes HTTP API endpoints for managing VM templates.
 It includes operations for listing, retrieving, creating, updating, and deleting
 templates.
 
-All endpoints require user authentication and rely on the TemplateCrud adapter
-for business logic.
+All endpoints require user authentication and rely on the AsyncTemplateCrud
+adapter for business logic.
 
 Endpoints:
-    - GET /templates — list templates (with pagination)
+    - GET /templates — list templates (with keyset pagination)
     - GET /templates/{template_id — get template by ID
     - POST /templates — create template
     - PATCH /templates/{template_id} — update template
@@ -16,25 +16,26 @@ Endpoints:
 
 Dependencies:
     - get_current_user: Ensures request is authenticated
-    - TemplateCrud: RPC adapter between API and service layer
+    - AsyncTemplateCrud: RPC adapter between API and service layer
 """
 
 from uuid import UUID
-from typing import List
+from typing import Dict
 
-from fastapi import Depends, APIRouter, status
-from fastapi_pagination import Page, Params, paginate
-from starlette.concurrency import run_in_threadpool
+from fastapi import Query, Depends, APIRouter, status
 
 from intakevms.libs.log import get_logger
 from intakevms.common.schemas import BaseResponse
+from intakevms.common.pagination import PageRequest, page_request
+from intakevms.common.projections import VIEW_DESCRIPTION, View
 from intakevms.libs.auth.jwt_utils import get_current_user
-from intakevms.modules.template.entrypoints.crud import TemplateCrud
+from intakevms.modules.template.entrypoints.crud import AsyncTemplateCrud
 from intakevms.modules.template.entrypoints.schemas.requests import (
     RequestEditTemplate,
     RequestCreateTemplate,
 )
 from intakevms.modules.template.entrypoints.schemas.responses import (
+    TemplatesPage,
     TemplateResponse,
 )
 
@@ -48,34 +49,36 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+templates_page = page_request('name', 'created_at', 'id')
+
 
 @router.get(
     '/',
-    response_model=BaseResponse[Page[TemplateResponse]],
+    response_model=BaseResponse[TemplatesPage],
     status_code=status.HTTP_200_OK,
 )
 async def get_templates(
-    crud: TemplateCrud = Depends(TemplateCrud),
-    params: Params = Depends(),
+    crud: AsyncTemplateCrud = Depends(AsyncTemplateCrud),
+    page: PageRequest = Depends(templates_page),
+    view: View = Query(default=View.FULL, description=VIEW_DESCRIPTION),
 ) -> BaseResponse:
-    """Retrieve a paginated list of templates.
+    """Retrieve a page of templates.
 
     Args:
-        crud (TemplateCrud): Dependency-injected service for handling template
-            logic.
-        params (Params): Dependency-injected for pagination params
+        crud (AsyncTemplateCrud): Dependency-injected service for handling
+            template logic.
+        page (PageRequest): Dependency-injected page request
+        view (View): Representation of the templates
     Returns:
-        BaseResponse[Page[Template]]: Paginated response containing templates.
+        BaseResponse[TemplatesPage]: Page of templates and the cursor of the
+            next page.
     """
     LOG.info('Api handle request on getting templates')
 
-    templates: List[TemplateResponse] = await run_in_threadpool(
-        crud.get_all_templates
-    )
-    paginated_templates = paginate(templates, params)
+    templates = await crud.get_templates_page(page, view)
 
     LOG.info('Api request on getting templates was successfully processed')
-    return BaseResponse(status='success', data=paginated_templates)
+    return BaseResponse(status='success', data=templates)
 
 
 @router.get(
@@ -85,21 +88,21 @@ async def get_templates(
 )
 async def get_template(
     template_id: UUID,
-    crud: TemplateCrud = Depends(TemplateCrud),
+    crud: AsyncTemplateCrud = Depends(AsyncTemplateCrud),
 ) -> BaseResponse:
     """Retrieve a specific template by its ID.
 
     Args:
         template_id (UUID): The ID of the template to retrieve.
-        crud (TemplateCrud): Dependency-injected service for handling template
-            logic.
+        crud (AsyncTemplateCrud): Dependency-injected service for handling
+            template logic.
 
     Returns:
         BaseResponse[Template]: The retrieved template.
     """
     LOG.info(f'Api handle request on getting template: {template_id}')
 
-    template = await run_in_threadpool(crud.get_template, template_id)
+    template = await crud.get_template(template_id)
 
     LOG.info(
         f'Api request on getting template {template_id} '
@@ -115,21 +118,23 @@ async def get_template(
 )
 async def create_template(
     data: RequestCreateTemplate,
-    crud: TemplateCrud = Depends(TemplateCrud),
+    crud: AsyncTemplateCrud = Depends(AsyncTemplateCrud),
+    user_info: Dict = Depends(get_current_user),
 ) -> BaseResponse:
     """Create a new template.
 
     Args:
         data (CreateTemplate): Template creation payload.
-        crud (TemplateCrud): Dependency-injected service for handling template
-            logic.
+        crud (AsyncTemplateCrud): Dependency-injected service for handling
+            template logic.
+        user_info (Dict): Authorized user information.
 
     Returns:
         BaseResponse[Template]: The created template.
     """
     LOG.info('Api handle request on creating template')
 
-    template = await run_in_threadpool(crud.create_template, data)
+    template = await crud.create_template(data, user_info)
 
     LOG.info('Api request on creating template was successfully processed')
     return BaseResponse(status='success', data=template)
@@ -143,22 +148,22 @@ async def create_template(
 async def edit_template(
     template_id: UUID,
     data: RequestEditTemplate,
-    crud: TemplateCrud = Depends(TemplateCrud),
+    crud: AsyncTemplateCrud = Depends(AsyncTemplateCrud),
 ) -> BaseResponse:
     """Update an existing template.
 
     Args:
         template_id (UUID): The ID of the template to update.
         data (EditTemplate): Fields to update in the template.
-        crud (TemplateCrud): Dependency-injected service for handling template
-            logic.
+        crud (AsyncTemplateCrud): Dependency-injected service for handling
+            template logic.
 
     Returns:
         BaseResponse[Template]: The updated template.
     """
     LOG.info(f'Api handle request on editing template {template_id}')
 
-    template = await run_in_threadpool(crud.edit_template, template_id, data)
+    template = await crud.edit_template(template_id, data)
 
     LOG.info(
         f'Api request on editing template {template_id}'
@@ -174,21 +179,21 @@ async def edit_template(
 )
 async def delete_template(
     template_id: UUID,
-    crud: TemplateCrud = Depends(TemplateCrud),
+    crud: AsyncTemplateCrud = Depends(AsyncTemplateCrud),
 ) -> BaseResponse:
     """Delete a template by ID.
 
     Args:
         template_id (UUID): The ID of the template to delete.
-        crud (TemplateCrud): Dependency-injected service for handling template
-            logic.
+        crud (AsyncTemplateCrud): Dependency-injected service for handling
+            template logic.
 
     Returns:
         BaseResponse[Template]: The deleted template.
     """
     LOG.info(f'Api handle request on deleting template {template_id}')
 
-    template = await run_in_threadpool(crud.delete_template, template_id)
+    template = await crud.delete_template(template_id)
 
     LOG.info(
         f'Api request on deleting template {template_id}'
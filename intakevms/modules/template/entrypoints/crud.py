@@ -1,13 +1,13 @@
 """CRUD adapter for Template API.
 
-This module defines the TemplateCrud class, which mediates between API handlers
-and the service layer using RPC calls.
+This module defines the AsyncTemplateCrud class, which mediates between API
+handlers and the service layer using RPC calls.
 
 The methods of this class are responsible for invoking service-layer logic
 using strongly typed DTOs and returning validated response models.
 
 Classes:
-    - TemplateCrud: Encapsulates all template-related RPC logic.
+    - AsyncTemplateCrud: Encapsulates all template-related RPC logic.
 
 Dependencies:
     - MessagingClient: Generic RPC client for service-to-service communication.
@@ -18,6 +18,9 @@ from uuid import UUID
 from typing import Any, Dict, List
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.pagination import PageRequest
+from intakevms.common.projections import View
 from intakevms.modules.template.config import API_SERVICE_LAYER_QUEUE_NAME
 from intakevms.libs.messaging.messaging_agents import MessagingClient
 from intakevms.modules.template.service_layer.services import (
@@ -28,7 +31,9 @@ from intakevms.modules.template.entrypoints.schemas.requests import (
     RequestCreateTemplate,
 )
 from intakevms.modules.template.entrypoints.schemas.responses import (
+    TemplatesPage,
     TemplateResponse,
+    TemplateSummaryResponse,
 )
 from intakevms.modules.template.adapters.dto.internal.commands import (
     GetTemplateServiceCommandDTO,
@@ -40,8 +45,8 @@ from intakevms.modules.template.adapters.dto.internal.commands import (
 LOG = get_logger(__name__)
 
 
-class TemplateCrud:
-    """Provides RPC-based access to template service operations.
+class AsyncTemplateCrud:
+    """Encapsulates all template-related RPC logic.
 
     This class encapsulates all logic required by the API layer to interact
     with the service layer for template and volume management.
@@ -52,7 +57,7 @@ class TemplateCrud:
     """
 
     def __init__(self) -> None:
-        """Initialize the TemplateCrud instance.
+        """Initialize the AsyncTemplateCrud instance.
 
         Sets up the RPC client for the template service layer.
         """
@@ -60,7 +65,7 @@ class TemplateCrud:
             queue_name=API_SERVICE_LAYER_QUEUE_NAME
         )
 
-    def get_all_templates(self) -> List[TemplateResponse]:
+    async def get_all_templates(self) -> List[TemplateResponse]:
         """Retrieve a list of all templates via RPC.
 
         Returns:
@@ -68,14 +73,38 @@ class TemplateCrud:
         """
         LOG.info('Call service layer on getting templates.')
 
-        result: List[Dict[str, Any]] = self.service_layer_rpc.call(
+        result: List[Dict[str, Any]] = await self.service_layer_rpc.acall(
             TemplateServiceLayerManager.get_all_templates.__name__,
             data_for_method={},
         )
 
         return [TemplateResponse.model_validate(item) for item in result]
 
-    def get_template(self, template_id: UUID) -> TemplateResponse:
+    async def get_templates_page(
+        self, page: PageRequest, view: View = View.FULL
+    ) -> TemplatesPage:
+        """Retrieve a page of templates via RPC.
+
+        Args:
+            page (PageRequest): The requested page.
+            view (View): The representation of the templates.
+
+        Returns:
+            TemplatesPage: The templates of the page and the cursor of the
+                next page.
+        """
+        LOG.info('Call service layer on getting templates page.')
+
+        result: Dict[str, Any] = await self.service_layer_rpc.acall(
+            TemplateServiceLayerManager.get_templates_page.__name__,
+            data_for_method={**page.to_dict(), 'view': view.value},
+        )
+
+        if view is View.SUMMARY:
+            return KeysetPage[TemplateSummaryResponse].model_validate(result)
+        return KeysetPage[TemplateResponse].model_validate(result)
+
+    async def get_template(self, template_id: UUID) -> TemplateResponse:
         """Retrieve a specific template by its ID via RPC.
 
         Args:
@@ -87,20 +116,21 @@ class TemplateCrud:
         LOG.info(f'Call service layer on getting template {template_id}.')
 
         getting_command_dto = GetTemplateServiceCommandDTO(id=template_id)
-        result: Dict[str, Any] = self.service_layer_rpc.call(
+        result: Dict[str, Any] = await self.service_layer_rpc.acall(
             TemplateServiceLayerManager.get_template.__name__,
             data_for_method=getting_command_dto.model_dump(mode='json'),
         )
 
         return TemplateResponse.model_validate(result)
 
-    def create_template(
-        self, creation_data: RequestCreateTemplate
+    async def create_template(
+        self, creation_data: RequestCreateTemplate, user_info: Dict
     ) -> TemplateResponse:
         """Create a new template using provided data via RPC.
 
         Args:
             creation_data (BaseModel): The template creation data.
+            user_info (Dict): Information about the authenticated user.
 
         Returns:
             Template: The created template object.
@@ -109,15 +139,15 @@ class TemplateCrud:
 
         creation_command = CreateTemplateServiceCommandDTO.model_validate(
             creation_data
-        )
-        result: Dict[str, Any] = self.service_layer_rpc.call(
+        ).model_copy(update={'user_id': str(user_info.get('id', ''))})
+        result: Dict[str, Any] = await self.service_layer_rpc.acall(
             TemplateServiceLayerManager.create_template.__name__,
             data_for_method=creation_command.model_dump(mode='json'),
         )
 
         return TemplateResponse.model_validate(result)
 
-    def edit_template(
+    async def edit_template(
         self,
         template_id: UUID,
         edit_data: RequestEditTemplate,
@@ -138,13 +168,13 @@ class TemplateCrud:
             name=edit_data.name,
             description=edit_data.description,
         )
-        result: Dict[str, Any] = self.service_layer_rpc.call(
+        result: Dict[str, Any] = await self.service_layer_rpc.acall(
             TemplateServiceLayerManager.edit_template.__name__,
             data_for_method=editing_command.model_dump(mode='json'),
         )
         return TemplateResponse.model_validate(result)
 
-    def delete_template(self, template_id: UUID) -> TemplateResponse:
+    async def delete_template(self, template_id: UUID) -> TemplateResponse:
         """Delete a template by its ID via RPC.
 
         Args:
@@ -156,8 +186,8 @@ class TemplateCrud:
         LOG.info(f'Call service layer on deleting template {template_id}.')
 
         deleting_command = DeleteTemplateServiceCommandDTO(id=template_id)
-        result: Dict[str, Any] = self.service_layer_rpc.call(
+        result: Dict[str, Any] = await self.service_layer_rpc.acall(
             TemplateServiceLayerManager.delete_template.__name__,
             data_for_method=deleting_command.model_dump(mode='json'),
         )
-        return TemplateResponse.model_validate(result)
\ No newline at end of file
+        return TemplateResponse.model_validate(result)
@@ -4,14 +4,19 @@ Defines schemas used to serialize and return template metadata from the API.
 
 Classes:
     - TemplateResponse: Full representation of a template in API responses.
+    - TemplateSummaryResponse: Summary view of a template in API responses.
+
+Attributes:
+    - TemplatesPage: Page of templates, in either view.
 """
 
 from uuid import UUID
-from typing import Optional
+from typing import Union, Optional
 from datetime import datetime
 
 from pydantic import Field
 
+from intakevms.common.schemas import KeysetPage
 from intakevms.common.base_pydantic_models import APIConfigResponseModel
 from intakevms.modules.template.shared.enums import TemplateStatus
 
@@ -30,6 +35,7 @@ class TemplateResponse(APIConfigResponseModel):
         is_backing (bool): Whether it's a backing image.
         created_at (datetime): Timestamp of creation.
         status (TemplateStatus): Current lifecycle status of the template.
+        job_id (Optional[UUID]): Job of the operation just queued, if any.
     """
 
     id: UUID = Field(
@@ -69,4 +75,51 @@ class TemplateResponse(APIConfigResponseModel):
         ...,
         examples=['available'],
         description='Current lifecycle status of the template',
-    )
\ No newline at end of file
+    )
+    job_id: Optional[UUID] = Field(
+        None,
+        examples=['0b9f3c1e-5a52-4d6c-9a0e-3f3b1d8e2c71'],
+        description='Job of the operation just queued, see /jobs/{job_id}',
+    )
+
+
+class TemplateSummaryResponse(APIConfigResponseModel):
+    """Schema representing the summary view of a template for API responses.
+
+    Extends:
+        APIConfigResponseModel
+
+    Attributes:
+        id (UUID): Unique identifier of the template.
+        name (str): Name of the template.
+        size (int): Size of the template in bytes.
+        storage_id (UUID): Linked storage ID.
+        status (TemplateStatus): Current lifecycle status of the template.
+    """
+
+    id: UUID = Field(
+        ...,
+        examples=['a73f920b-d282-41e4-8ec1-6e6b89d3a9e7'],
+        description='Unique identifier of the template',
+    )
+    name: str = Field(
+        ..., examples=['ubuntu-template'], description='Name of the template'
+    )
+    size: int = Field(
+        ..., examples=[2147483648], description='Size of the template in bytes'
+    )
+    storage_id: UUID = Field(
+        ...,
+        examples=['c2f7b67e-92a3-41ea-b760-ef7785ebfcb9'],
+        description='ID of the storage where the template resides',
+    )
+    status: TemplateStatus = Field(
+        ...,
+        examples=['available'],
+        description='Current lifecycle status of the template',
+    )
+
+
+TemplatesPage = Union[
+    KeysetPage[TemplateSummaryResponse], KeysetPage[TemplateResponse]
+]
\ No newline at end of file
@@ -10,12 +10,16 @@ Dependencies:
     - MessagingClient: Handles message-based communication.
     - TemplateSqlAlchemyUnitOfWork: Unit of Work for template operations.
     - EventCrud: Manages event store interactions.
+    - JobCrud: Tracks the jobs of long-running operations.
 """
 
 from uuid import UUID, uuid4
 from typing import Any, Dict, List, Optional
 
 from intakevms.libs.log import get_logger
+from intakevms.libs.caching import cached_read, invalidates
+from intakevms.common.pagination import PageRequest, page_dict
+from intakevms.common.projections import is_summary, to_summary
 from intakevms.modules.base_manager import BackgroundTasks
 from intakevms.modules.template.config import (
     API_SERVICE_LAYER_QUEUE_NAME,
@@ -23,6 +27,7 @@ from intakevms.modules.template.config import (
 )
 from intakevms.libs.messaging.exceptions import RpcException
 from intakevms.modules.template.domain.base import BaseTemplate
+from intakevms.modules.jobs.entrypoints.crud import JobCrud
 from intakevms.modules.template.adapters.orm import Template
 from intakevms.modules.template.shared.enums import TemplateStatus
 from intakevms.libs.messaging.messaging_agents import MessagingClient
@@ -95,6 +100,7 @@ class TemplateServiceLayerManager(BackgroundTasks):
         storage_service_client (StorageServiceLayerRPCClient): RPC client for
             storage queries.
         event_store (EventCrud): Event logger for template operations.
+        jobs (JobCrud): Tracks the jobs of template creations.
     """
 
     def __init__(self) -> None:
@@ -115,7 +121,9 @@ class TemplateServiceLayerManager(BackgroundTasks):
         self.vm_service_client = VMServiceLayerRPCClient()
         self.storage_service_client = StorageServiceLayerRPCClient()
         self.event_store = EventCrud('templates')
+        self.jobs = JobCrud()
 
+    @cached_read('templates')
     def get_all_templates(self) -> List[Dict[str, Any]]:
         """Retrieve all templates from the database.
 
@@ -138,6 +146,33 @@ class TemplateServiceLayerManager(BackgroundTasks):
         )
         return api_templates
 
+    @cached_read('templates')
+    def get_templates_page(self, page_data: Dict) -> Dict[str, Any]:
+        """Retrieve a page of templates from the database.
+
+        Args:
+            page_data (Dict): The page request, see `PageRequest.to_dict`,
+                and the optional `view` of the templates.
+
+        Returns:
+            Dict[str, Any]: The serialized templates of the page and the
+                cursor of the next page.
+        """
+        LOG.info('Service layer handle request on getting templates page')
+        page = PageRequest.from_dict(page_data)
+        summary = is_summary(page_data)
+
+        with self.uow() as uow:
+            orm_templates, next_cursor = uow.templates.get_page(
+                page, summary=summary
+            )
+            serialize = to_summary if summary else ApiSerializer.to_dict
+            api_templates: List[Dict[str, Any]] = [
+                serialize(orm_template) for orm_template in orm_templates
+            ]
+
+        return page_dict(api_templates, next_cursor)
+
     def get_template(self, getting_data: Dict) -> Dict:
         """Retrieve a single template by its ID.
 
@@ -166,6 +201,7 @@ class TemplateServiceLayerManager(BackgroundTasks):
         )
         return api_template
 
+    @invalidates('templates')
     def create_template(self, creating_data: Dict) -> Dict:
         """Create a new template, persist it in the db, start async creation.
 
@@ -173,7 +209,8 @@ class TemplateServiceLayerManager(BackgroundTasks):
             creating_data (Dict): A dictionary with template creation fields.
 
         Returns:
-            Dict: A serialized representation of the newly created template.
+            Dict: A serialized representation of the newly created template,
+                with the ID of the job tracking its creation.
         """
         LOG.info('Service layer handle request on creating template')
 
@@ -208,9 +245,14 @@ class TemplateServiceLayerManager(BackgroundTasks):
             orm_template, TemplateStatus.NEW, 'TemplateCreationPrepared'
         )
 
+        job_id = self.jobs.create_job(
+            'create_template', 'templates', orm_template.id
+        )
         async_creating_command = AsyncCreateTemplateServiceCommandDTO(
             id=orm_template.id,
             source_disk_path=volume.path / f'volume-{volume.id}',
+            job_id=UUID(job_id),
+            user_id=creating_command.user_id,
         )
         self.service_layer_rpc.cast(
             self._create_template.__name__,
@@ -222,6 +264,7 @@ class TemplateServiceLayerManager(BackgroundTasks):
             'was successfully processed'
         )
         api_template: Dict[str, Any] = ApiSerializer.to_dict(orm_template)
+        api_template['job_id'] = job_id
         return api_template
 
     def edit_template(self, updating_data: Dict) -> Dict:
@@ -282,20 +325,49 @@ class TemplateServiceLayerManager(BackgroundTasks):
         """Perform the async creation of a template file via the domain layer.
 
         This method is invoked via cast-RPC after initial template DB
-        registration.
+        registration. A template whose creation job was cancelled while
+        queued is removed instead. The job is finished whatever the outcome
+        of the creation, unexpected errors included.
 
         Args:
             prepared_create_command_data (Dict): Data containing template ID and
                 source volume path.
-
-        Raises:
-            RpcException: If domain RPC call fails.
         """
         async_creating_command = (
             AsyncCreateTemplateServiceCommandDTO.model_validate(
                 prepared_create_command_data
             )
         )
+        job_id = async_creating_command.job_id
+        if job_id is not None and not self.jobs.start_job(job_id):
+            self._discard_cancelled_template(
+                async_creating_command.id, async_creating_command.user_id
+            )
+            return
+
+        error: Optional[str] = None
+        try:
+            error = self._create_template_file(async_creating_command)
+        except Exception as err:
+            error = str(err)
+            raise
+        finally:
+            if job_id is not None:
+                self.jobs.finish_job(job_id, error=error)
+
+    def _create_template_file(
+        self, async_creating_command: AsyncCreateTemplateServiceCommandDTO
+    ) -> Optional[str]:
+        """Create the file of a registered template via the domain layer.
+
+        Args:
+            async_creating_command (AsyncCreateTemplateServiceCommandDTO):
+                The template ID, source volume path and job ID.
+
+        Returns:
+            Optional[str]: The error of the domain layer if the creation
+                failed, None if the template is available.
+        """
         with self.uow() as uow:
             orm_template = uow.templates.get_or_fail(async_creating_command.id)
 
@@ -306,7 +378,8 @@ class TemplateServiceLayerManager(BackgroundTasks):
         try:
             domain_template = DomainSerializer.to_dto(orm_template)
             creation_domain_command_dto = CreateTemplateDomainCommandDTO(
-                source_disk_path=async_creating_command.source_disk_path
+                source_disk_path=async_creating_command.source_disk_path,
+                job_id=async_creating_command.job_id,
             )
             domain_result: Dict = self.domain_rpc.call(
                 BaseTemplate.create.__name__,
@@ -323,7 +396,7 @@ class TemplateServiceLayerManager(BackgroundTasks):
                 str(err),
             )
             LOG.error('Error while creating template', exc_info=True)
-            return
+            return str(err)
         orm_template = DomainSerializer.update_orm_from_dict(
             orm_template,
             domain_result,
@@ -331,6 +404,28 @@ class TemplateServiceLayerManager(BackgroundTasks):
         self._update_and_log_event(
             orm_template, TemplateStatus.AVAILABLE, 'TemplateCreated'
         )
+        return None
+
+    @invalidates('templates')
+    def _discard_cancelled_template(
+        self, template_id: UUID, user_id: str
+    ) -> None:
+        """Remove a template whose creation was cancelled before it started.
+
+        Args:
+            template_id (UUID): The ID of the template.
+            user_id (str): The ID of the user who requested the creation.
+        """
+        LOG.info(f'Creation of template {template_id} was cancelled')
+        with self.uow() as uow:
+            uow.templates.delete(uow.templates.get_or_fail(template_id))
+            uow.commit()
+        self.event_store.add_event(
+            object_id=str(template_id),
+            user_id=user_id,
+            event='TemplateCreationCancelled',
+            information='Creation cancelled before it started',
+        )
 
     def _edit_template(self, edit_command_data: Dict) -> None:
         """Perform the async renaming/editing of a template via the domain layer
@@ -380,6 +475,7 @@ class TemplateServiceLayerManager(BackgroundTasks):
             orm_template, TemplateStatus.AVAILABLE, 'TemplateEdited'
         )
 
+    @invalidates('templates')
     def _delete_template(self, delete_command_data: Dict) -> None:
         """Delete a template file from the filesystem and remove the DB record.
 
@@ -437,6 +533,7 @@ class TemplateServiceLayerManager(BackgroundTasks):
             data_for_manager=data_for_manager.model_dump(mode='json'),
         )
 
+    @invalidates('templates')
     def _update_and_log_event(
         self,
         orm_template: Template,
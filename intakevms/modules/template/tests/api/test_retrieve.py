@@ -38,19 +38,19 @@ def test_get_templates_empty_response(client: TestClient) -> None:
 
 
 def test_get_templates_with_pagination(client: TestClient) -> None:
-    """Test that pagination metadata is returned correctly."""
-    response = client.get('/templates/?page=1&size=1')
+    """Test that the cursor of the next page is returned."""
+    response = client.get('/templates/?limit=1')
     assert response.status_code == status.HTTP_200_OK
     data = response.json()['data']
     assert 'items' in data
-    assert 'total' in data
-    assert 'page' in data
-    assert 'size' in data
-    assert data['page'] == 1
-    assert data['size'] == 1
+    assert 'next_cursor' in data
+    assert len(data['items']) <= 1
 
 
-@pytest.mark.parametrize('params', ['?page=-1', '?size=0', '?page=abc'])
+@pytest.mark.parametrize(
+    'params',
+    ['?limit=0', '?limit=abc', '?sort=size', '?order=up', '?cursor=abc'],
+)
 def test_get_templates_invalid_pagination(
     client: TestClient, params: str
 ) -> None:
@@ -0,0 +1,145 @@
+"""Unit tests for the job of the asynchronous template creation.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/modules/template/tests/test_create_job.py
+"""
+
+from uuid import UUID, uuid4
+from typing import Any, Set, Dict, List, Tuple, Optional
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+
+from intakevms.common.repositories.exceptions import EntityNotFoundError
+from intakevms.modules.template.adapters.serializer import ApiSerializer
+from intakevms.modules.template.service_layer.services import (
+    TemplateServiceLayerManager,
+)
+
+USER_ID = str(uuid4())
+
+
+class FakeRepository:
+    """Repository of the IDs of the templates of a test."""
+
+    def __init__(self, template_ids: Set[UUID]) -> None:
+        """Initialize the repository with its templates."""
+        self.template_ids = template_ids
+
+    def get_or_fail(self, template_id: UUID) -> UUID:
+        """Get a template, or fail if it does not exist."""
+        if template_id not in self.template_ids:
+            msg = f'Template with ID {template_id} not found.'
+            raise EntityNotFoundError(msg)
+        return template_id
+
+    def get_all(self) -> List[UUID]:
+        """Get every template."""
+        return list(self.template_ids)
+
+    def delete(self, template_id: UUID) -> None:
+        """Delete a template."""
+        self.template_ids.remove(template_id)
+
+
+class FakeUnitOfWork:
+    """Unit of work of the templates of a test."""
+
+    def __init__(self, template_ids: Set[UUID]) -> None:
+        """Initialize the unit of work with its templates."""
+        self.templates = FakeRepository(template_ids)
+
+    def __enter__(self) -> 'FakeUnitOfWork':
+        """Begin the transaction."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:  # noqa: ANN401 test fake
+        """End the transaction."""
+
+    def commit(self) -> None:
+        """Commit the transaction."""
+
+
+class FakeJobs:
+    """Jobs recording how they finish."""
+
+    def __init__(self, *, queued: bool) -> None:
+        """Initialize the jobs, queued or already cancelled."""
+        self.queued = queued
+        self.finished: List[Tuple[UUID, Optional[str]]] = []
+
+    def start_job(self, _job_id: UUID) -> bool:
+        """Start the job unless it was cancelled."""
+        return self.queued
+
+    def finish_job(self, job_id: UUID, error: Optional[str] = None) -> None:
+        """Record the outcome of the job."""
+        self.finished.append((job_id, error))
+
+
+class FakeEvents:
+    """Event store recording the events."""
+
+    def __init__(self) -> None:
+        """Initialize the event store."""
+        self.events: List[Dict] = []
+
+    def add_event(self, **event: str) -> None:
+        """Record an event."""
+        self.events.append(event)
+
+
+class CreateManager(TemplateServiceLayerManager):
+    """Manager without clients, working on fake templates and jobs."""
+
+    def __init__(self, template_ids: Set[UUID], *, queued: bool) -> None:
+        """Initialize the manager with fakes."""
+        self.uow = partial(FakeUnitOfWork, template_ids)  # type: ignore[assignment]
+        self.jobs = FakeJobs(queued=queued)  # type: ignore[assignment]
+        self.event_store = FakeEvents()  # type: ignore[assignment]
+
+
+def _command(template_id: UUID, job_id: UUID) -> Dict:
+    """Build the command of the creation of a template."""
+    return {
+        'id': str(template_id),
+        'source_disk_path': '/tmp/volume',  # noqa: S108 never opened
+        'job_id': str(job_id),
+        'user_id': USER_ID,
+    }
+
+
+def test_job_fails_when_creation_fails_unexpectedly() -> None:
+    """An error before the domain call still finishes the job."""
+    manager = CreateManager(set(), queued=True)
+    job_id = uuid4()
+
+    with pytest.raises(EntityNotFoundError):
+        manager._create_template(_command(uuid4(), job_id))  # noqa: SLF001 cast target
+
+    [(finished_id, error)] = manager.jobs.finished  # type: ignore[attr-defined]
+    assert finished_id == job_id
+    assert error is not None
+    assert 'not found' in error
+
+
+def test_cancelled_creation_is_logged_for_its_user() -> None:
+    """A template cancelled while queued is discarded for its user."""
+    template_ids = {uuid4()}
+    [template_id] = template_ids
+    manager = CreateManager(template_ids, queued=False)
+
+    with patch.object(
+        ApiSerializer, 'to_dict', side_effect=lambda t: {'id': str(t)}
+    ):
+        assert manager.get_all_templates() == [{'id': str(template_id)}]
+        manager._create_template(_command(template_id, uuid4()))  # noqa: SLF001 cast target
+        assert manager.get_all_templates() == []
+
+    assert template_ids == set()
+    [event] = manager.event_store.events  # type: ignore[attr-defined]
+    assert event['user_id'] == USER_ID
+    assert event['event'] == 'TemplateCreationCancelled'
+    assert manager.jobs.finished == []  # type: ignore[attr-defined]
@@ -23,15 +23,19 @@ Methods:
     SqlAlchemyRepository._get_by_name: Retrieves a user by username from
         the database.
     SqlAlchemyRepository._get_all: Retrieves a list of users from the database.
+    SqlAlchemyRepository._get_page: Retrieves a page of users from the
+        database.
     SqlAlchemyRepository._delete: Deletes a user by ID from the database.
 """
 
 import abc
 from uuid import UUID
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple, Optional
 
+from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
 
+from intakevms.common.pagination import PageRequest, paginate_query
 from intakevms.abstracts.exceptions import DBCannotBeConnectedError
 from intakevms.modules.user.adapters.orm import User
 
@@ -103,6 +107,20 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         return self._get_all()
 
+    def get_page(
+        self, page: PageRequest
+    ) -> Tuple[List[User], Optional[str]]:
+        """Retrieve a page of users from the database.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Tuple[List[User], Optional[str]]: The users of the page and the
+                cursor of the next page.
+        """
+        return self._get_page(page)
+
     def delete(self, user_id: UUID) -> None:
         """Delete a user by ID from the repository.
 
@@ -153,6 +171,21 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_page(
+        self, page: PageRequest
+    ) -> Tuple[List[User], Optional[str]]:
+        """Retrieve a page of users from the database.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Tuple[List[User], Optional[str]]: The users of the page and the
+                cursor of the next page.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _delete(self, user_id: UUID) -> None:
         """Delete a user by ID from the repository.
@@ -179,6 +212,7 @@ class SqlAlchemyRepository(AbstractRepository):
         _get: Retrieves a user by ID from the database.
         _get_by_name: Retrieves a user by username from the database.
         _get_all: Retrieves a list of users from the database.
+        _get_page: Retrieves a page of users from the database.
         _delete: Deletes a user by ID from the database.
     """
 
@@ -242,6 +276,22 @@ class SqlAlchemyRepository(AbstractRepository):
         """
         return self.session.query(User).all()
 
+    def _get_page(
+        self, page: PageRequest
+    ) -> Tuple[List[User], Optional[str]]:
+        """Retrieve a page of users from the database.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Tuple[List[User], Optional[str]]: The users of the page and the
+                cursor of the next page.
+        """
+        return paginate_query(
+            self.session, select(User), page, {'id': User.id}, 'id'
+        )
+
     def _delete(self, user_id: UUID) -> None:
         """Delete a user by ID from the database.
 
@@ -20,13 +20,14 @@ Dependencies:
 """
 
 from uuid import UUID
-from typing import Dict, List, cast
+from typing import Dict
 
 from fastapi import Depends, APIRouter, status
 from fastapi.security import HTTPBearer
-from fastapi_pagination import Page, paginate
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.pagination import PageRequest, page_request
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.modules.user.entrypoints import schemas
 from intakevms.modules.user.entrypoints.crud import UserCrud
@@ -42,6 +43,8 @@ router = APIRouter(
     dependencies=[Depends(http_bearer)],
 )
 
+users_page = page_request('id')
+
 
 @router.get(
     '/',
@@ -69,26 +72,28 @@ def get_user(
 
 @router.get(
     '/all/',
-    response_model=Page[schemas.User],
+    response_model=KeysetPage[schemas.User],
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(get_current_user)],
 )
 def get_users(
-        crud: UserCrud = Depends(UserCrud)
-) -> Page[schemas.User]:
-    """Retrieve list of all users.
+        page: PageRequest = Depends(users_page),
+        crud: UserCrud = Depends(UserCrud),
+) -> KeysetPage[schemas.User]:
+    """Retrieve a page of users.
 
     Args:
+        page: The requested page.
         crud: UserCrud instance for performing CRUD operations.
 
     Returns:
-        JSONResponse: A paginated list of information about all users.
+        KeysetPage[schemas.User]: Information about the users of the page
+            and the cursor of the next page.
     """
-    LOG.info('Api start getting all users info.')
-    result: List = crud.get_users()
+    LOG.info('Api start getting page of users info.')
+    result: Dict = crud.get_users_page(page)
     LOG.info('Api request was successfully processed.')
-    users: List[schemas.User] = [schemas.User(**user) for user in result]
-    return cast(Page, paginate(users))
+    return KeysetPage[schemas.User](**result)
 
 
 @router.post(
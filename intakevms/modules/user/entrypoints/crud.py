@@ -12,6 +12,7 @@ Classes:
 Methods:
     - get_user(user_id: str) -> Dict: Retrieves user information by user ID.
     - get_users() -> List: Retrieve list of all users.
+    - get_users_page(page: PageRequest) -> Dict: Retrieve a page of users.
     - create_user(data: Dict, user_id: str, user_data: Dict) -> Dict: Creates
         a new user.
     - change_password(user_id: str, data: Dict) -> Dict: Changes the password
@@ -25,6 +26,7 @@ from uuid import UUID
 from typing import Dict, List
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
 from intakevms.modules.user.config import USER_SERVICE_LAYER_QUEUE_NAME
 from intakevms.modules.user.service_layer import services
 from intakevms.libs.messaging.messaging_agents import MessagingClient
@@ -42,6 +44,7 @@ class UserCrud:
     Methods:
         get_user(user_id: str) -> Dict: Retrieves user information by user ID.
         get_users() -> List: Retrieve list of all users.
+        get_users_page(page: PageRequest) -> Dict: Retrieve a page of users.
         create_user(data: Dict, user_id: str, user_data: Dict) -> Dict: Creates
             a new user.
         change_password(user_id: str, data: Dict) -> Dict: Changes the password
@@ -89,6 +92,23 @@ class UserCrud:
         )
         return users
 
+    def get_users_page(self, page: PageRequest) -> Dict:
+        """Retrieve a page of users.
+
+        Args:
+            page (PageRequest): The requested page.
+
+        Returns:
+            Dict: Information about the users of the page and the cursor of
+                the next page.
+        """
+        LOG.info('Call service layer to get a page of users')
+        result: Dict = self.service_layer_rpc.call(
+            services.UserManager.get_users_page.__name__,
+            data_for_method=page.to_dict(),
+        )
+        return result
+
     def create_user(
         self,
         data: Dict,
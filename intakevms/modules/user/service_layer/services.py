@@ -24,6 +24,7 @@ from sqlalchemy import exc
 from passlib.exc import MissingDigestError
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest, page_dict
 from intakevms.modules.base_manager import BackgroundTasks
 from intakevms.modules.user.service_layer import exceptions, unit_of_work
 from intakevms.modules.user.adapters.serializer import DataSerializer
@@ -117,6 +118,24 @@ class UserManager(BackgroundTasks):
             users = self.uow.users.get_all()
             return [DataSerializer.to_web(user) for user in users]
 
+    def get_users_page(self, data: Dict) -> Dict:
+        """Retrieve a page of users from the database.
+
+        Args:
+            data (Dict): The page request, see `PageRequest.to_dict`.
+
+        Returns:
+            Dict: The serialized users of the page and the cursor of the
+                next page.
+        """
+        LOG.info('Start getting page of users from DB')
+        page = PageRequest.from_dict(data)
+        with self.uow:
+            users, next_cursor = self.uow.users.get_page(page)
+            return page_dict(
+                [DataSerializer.to_web(user) for user in users], next_cursor
+            )
+
     def authenticate_user(self, data: Dict) -> Dict:
         """Authenticate a user based on provided credentials.
 
@@ -50,6 +50,9 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, DeclarativeBase, relationship, mapped_column
 from sqlalchemy.dialects import postgresql
 
+from intakevms.common.versions import track_versions
+from intakevms.common.state_events import track_states
+
 # Metadata instance used for SQLAlchemy table definitions
 metadata = MetaData()
 
@@ -428,4 +431,17 @@ class Snapshots(Base):
         'Snapshots',
         foreign_keys=[parent_id],
         remote_side=[id],
-    )
\ No newline at end of file
+    )
+
+
+track_versions(
+    'vms',
+    VirtualMachines,
+    CpuInfo,
+    Os,
+    Disk,
+    VirtualInterface,
+    ProtocolGraphicInterface,
+    RAM,
+)
+track_states('vms', VirtualMachines, 'status', 'power_state')
@@ -18,12 +18,13 @@ Exceptions:
 """
 
 import abc
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 
-from sqlalchemy import update
+from sqlalchemy import select, update
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from intakevms.common.pagination import PageRequest, paginate_query
 from intakevms.abstracts.exceptions import DBCannotBeConnectedError
 from intakevms.modules.virtual_machines.adapters.orm import (
     Disk,
@@ -35,6 +36,13 @@ from intakevms.modules.virtual_machines.adapters.orm import (
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+# Columns of the summary view of virtual machines, besides the primary key.
+SUMMARY_COLUMNS = (
+    VirtualMachines.name,
+    VirtualMachines.status,
+    VirtualMachines.power_state,
+)
+
 
 class AbstractRepository(metaclass=abc.ABCMeta):
     """Abstract base class for virtual machine repositories.
@@ -78,6 +86,18 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         return self._get(vm_id)
 
+    def get_many(self, vm_ids: List[str]) -> List[VirtualMachines]:
+        """Retrieve the virtual machines with the given IDs in one query.
+
+        Args:
+            vm_ids (List[str]): The IDs of the virtual machines.
+
+        Returns:
+            List[VirtualMachines]: The virtual machine entities found, in no
+                particular order; unknown IDs are skipped.
+        """
+        return self._get_many(vm_ids)
+
     def get_all(self) -> List:
         """Retrieve all virtual machines from the repository.
 
@@ -86,6 +106,39 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         return self._get_all()
 
+    def get_states(self) -> List[Dict]:
+        """Retrieve the state of all virtual machines, without relations.
+
+        Returns:
+            List[Dict]: The ID, name, power state, status and information of
+                every virtual machine.
+        """
+        return self._get_states()
+
+    def bulk_update(self, states: List[Dict]) -> None:
+        """Bulk update virtual machines in the repository.
+
+        Args:
+            states (List[Dict]): The updated columns of the virtual machines,
+                with their ID.
+        """
+        self._bulk_update(states)
+
+    def get_page(
+        self, page: PageRequest, *, summary: bool = False
+    ) -> Tuple[List, Optional[str]]:
+        """Retrieve a page of virtual machines from the repository.
+
+        Args:
+            page (PageRequest): The requested page.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List, Optional[str]]: The virtual machine entities of the
+                page and the cursor of the next page.
+        """
+        return self._get_page(page, summary=summary)
+
     def delete(self, vm: VirtualMachines) -> None:
         """Delete a virtual machine from the repository.
 
@@ -268,6 +321,21 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_many(self, vm_ids: List[str]) -> List[VirtualMachines]:
+        """Retrieve the virtual machines with the given IDs in one query.
+
+        Args:
+            vm_ids (List[str]): The IDs of the virtual machines.
+
+        Returns:
+            List[VirtualMachines]: The virtual machine entities found.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _get_all(self) -> List:
         """Retrieve all virtual machines from the repository.
@@ -280,6 +348,49 @@ class AbstractRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_states(self) -> List[Dict]:
+        """Retrieve the state of all virtual machines, without relations.
+
+        Returns:
+            List[Dict]: The states of the virtual machines.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _bulk_update(self, states: List[Dict]) -> None:
+        """Bulk update virtual machines in the repository.
+
+        Args:
+            states (List[Dict]): The updated columns of the virtual machines.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _get_page(
+        self, page: PageRequest, *, summary: bool
+    ) -> Tuple[List, Optional[str]]:
+        """Retrieve a page of virtual machines from the repository.
+
+        Args:
+            page (PageRequest): The requested page.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List, Optional[str]]: The virtual machine entities of the
+                page and the cursor of the next page.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _delete(self, vm: VirtualMachines) -> None:
         """Delete a virtual machine from the repository.
@@ -564,6 +675,29 @@ class SqlAlchemyRepository(AbstractRepository):
             .one()
         )
 
+    def _get_many(self, vm_ids: List[str]) -> List[VirtualMachines]:
+        """Retrieve the virtual machines with the given IDs in one query.
+
+        Args:
+            vm_ids (List[str]): The IDs of the virtual machines.
+
+        Returns:
+            List[VirtualMachines]: The virtual machine entities found.
+        """
+        stmt = (
+            select(VirtualMachines)
+            .options(
+                joinedload(VirtualMachines.cpu),
+                joinedload(VirtualMachines.os),
+                selectinload(VirtualMachines.disks),
+                selectinload(VirtualMachines.virtual_interfaces),
+                joinedload(VirtualMachines.graphic_interface),
+                joinedload(VirtualMachines.ram),
+            )
+            .where(VirtualMachines.id.in_(vm_ids))
+        )
+        return list(self.session.scalars(stmt).unique())
+
     def _get_all(self) -> List:
         """Retrieve all virtual machines from the repository.
 
@@ -583,6 +717,64 @@ class SqlAlchemyRepository(AbstractRepository):
             .all()
         )
 
+    def _get_states(self) -> List[Dict]:
+        """Retrieve the state of all virtual machines, without relations.
+
+        Returns:
+            List[Dict]: The states of the virtual machines.
+        """
+        stmt = select(
+            VirtualMachines.id,
+            VirtualMachines.name,
+            VirtualMachines.power_state,
+            VirtualMachines.status,
+            VirtualMachines.information,
+        )
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+
+    def _bulk_update(self, states: List[Dict]) -> None:
+        """Bulk update virtual machines in the repository.
+
+        Args:
+            states (List[Dict]): The updated columns of the virtual machines.
+        """
+        self.session.execute(update(VirtualMachines), states)
+
+    def _get_page(
+        self, page: PageRequest, *, summary: bool
+    ) -> Tuple[List, Optional[str]]:
+        """Retrieve a page of virtual machines from the repository.
+
+        Collections are loaded by separate queries, so the limit of the page
+        applies to virtual machines rather than to joined rows.
+
+        Args:
+            page (PageRequest): The requested page.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List, Optional[str]]: The virtual machine entities of the
+                page and the cursor of the next page.
+        """
+        stmt = select(VirtualMachines)
+        if not summary:
+            stmt = stmt.options(
+                joinedload(VirtualMachines.cpu),
+                joinedload(VirtualMachines.os),
+                selectinload(VirtualMachines.disks),
+                selectinload(VirtualMachines.virtual_interfaces),
+                joinedload(VirtualMachines.graphic_interface),
+                joinedload(VirtualMachines.ram),
+            )
+        return paginate_query(
+            self.session,
+            stmt,
+            page,
+            {'id': VirtualMachines.id},
+            'id',
+            projection=SUMMARY_COLUMNS if summary else None,
+        )
+
     def _delete(self, vm: VirtualMachines) -> None:
         """Delete a virtual machine from the repository.
 
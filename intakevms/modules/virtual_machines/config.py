@@ -12,4 +12,8 @@ SNAPSHOTS_PATH = (
 )
 SERVER_IP = config.data.get('web_app', {}).get('host', 'localhost')
 
-DEFAULT_SESSION_FACTORY = get_default_session_factory()
\ No newline at end of file
+DEFAULT_SESSION_FACTORY = get_default_session_factory()
+# Bulk lifecycle actions: maximum number of virtual machines of a request,
+# and seconds allowed for the work of each virtual machine.
+BULK_ACTION_MAX_VMS = 500
+BULK_ACTION_SECONDS_PER_VM = 120
@@ -4,7 +4,7 @@ This module defines the FastAPI endpoints for managing virtual machines.
 It includes operations such as retrieving, creating, deleting, starting,
 shutting off, and editing virtual machines, as well as accessing VNC sessions.
 The module uses dependency injection to manage the business logic through
-the `VMCrud` class and ensures that users are authenticated before
+the `AsyncVMCrud` class and ensures that users are authenticated before
 performing actions.
 
 Classes:
@@ -17,6 +17,8 @@ Endpoints:
         Retrieve a specific virtual machine by ID.
     POST /virtual-machines/create/:
         Create a new virtual machine.
+    POST /virtual-machines/bulk/{action}/:
+        Start, shut off or delete several virtual machines.
     DELETE /virtual-machines/{vm_id}/:
         Delete a virtual machine by ID.
     POST /virtual-machines/{vm_id}/start/:
@@ -40,17 +42,20 @@ Endpoints:
 """
 
 from uuid import UUID
-from typing import Dict, List, cast
+from typing import Dict, List, Union, Literal
 
-from fastapi import Path, Depends, APIRouter, status
+from fastapi import Path, Query, Depends, Response, APIRouter, status
 from fastapi.responses import JSONResponse
-from fastapi_pagination import Page, paginate
-from starlette.concurrency import run_in_threadpool
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.versions import etag_dependency
+from intakevms.common.rendering import RenderedJSONResponse, render
+from intakevms.common.pagination import PageRequest, page_request
+from intakevms.common.projections import VIEW_DESCRIPTION, View
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.modules.virtual_machines.entrypoints import schemas
-from intakevms.modules.virtual_machines.entrypoints.crud import VMCrud
+from intakevms.modules.virtual_machines.entrypoints.crud import AsyncVMCrud
 
 LOG = get_logger(__name__)
 
@@ -60,54 +65,75 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+vms_page = page_request('id')
+vms_etag = etag_dependency('vms')
+
 
 @router.get(
     '/',
-    response_model=Page[schemas.VirtualMachineInfo],
+    response_model=Union[
+        KeysetPage[schemas.VirtualMachineSummary],
+        KeysetPage[schemas.VirtualMachineInfo],
+    ],
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(vms_etag)],
 )
 async def get_vms(
-    crud: VMCrud = Depends(VMCrud),
-) -> Page[schemas.VirtualMachineInfo]:
-    """Retrieve all virtual machines.
+    response: Response,
+    page: PageRequest = Depends(vms_page),
+    view: View = Query(default=View.FULL, description=VIEW_DESCRIPTION),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
+) -> RenderedJSONResponse:
+    """Retrieve a page of virtual machines.
+
+    The items are validated once by the CRUD, and the page is rendered
+    without being validated again against the response model.
 
     Args:
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        response (Response): The response, with the ETag to keep.
+        page (PageRequest): The requested page.
+        view (View): The representation of the virtual machines.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
-        Page[schemas.VirtualMachineInfo]: A paginated list of all virtual
-        machines.
+        RenderedJSONResponse: A page of virtual machines and the cursor of the
+        next page.
     """
-    LOG.info('API handling request to get all virtual machines.')
-    vms = await run_in_threadpool(crud.get_all_vms)
+    LOG.info('API handling request to get a page of virtual machines.')
+    result = await crud.get_vms_page(page, view)
     LOG.info('API request was successfully processed.')
-    return cast(Page, paginate(vms))
+    if view is View.SUMMARY:
+        return render(
+            KeysetPage[schemas.VirtualMachineSummary](**result), response
+        )
+    return render(KeysetPage[schemas.VirtualMachineInfo](**result), response)
 
 
 @router.get(
     '/{vm_id}/',
     response_model=schemas.VirtualMachineInfo,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(vms_etag)],
 )
 async def get_vm(
+    response: Response,
     vm_id: str = Path(description='VM ID'),
-    crud: VMCrud = Depends(VMCrud),
-) -> schemas.VirtualMachineInfo:
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
+) -> RenderedJSONResponse:
     """Retrieve a virtual machine by ID.
 
     Args:
+        response (Response): The response, with the ETag to keep.
         vm_id (str): The ID of the virtual machine to retrieve.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
-        schemas.VirtualMachineInfo: The virtual machine data.
+        RenderedJSONResponse: The virtual machine data.
     """
     LOG.info(f'API handling request to get virtual machine with ID: {vm_id}.')
-    vm = await run_in_threadpool(crud.get_vm, vm_id)
+    vm = await crud.get_vm(vm_id)
     LOG.info('API request was successfully processed.')
-    return schemas.VirtualMachineInfo(**vm)
+    return render(schemas.VirtualMachineInfo.model_validate(vm), response)
 
 
 @router.post(
@@ -118,7 +144,7 @@ async def get_vm(
 async def create_vm(
     data: schemas.CreateVirtualMachine,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.VirtualMachineInfo:
     """Create a new virtual machine.
 
@@ -126,19 +152,59 @@ async def create_vm(
         data (schemas.CreateVirtualMachine): The data required to create a
             new virtual machine.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.VirtualMachineInfo: The created virtual machine data.
     """
     LOG.info('API handling request to create a new virtual machine.')
-    vm = await run_in_threadpool(
-        crud.create_vm, data.model_dump(mode='json'), user_info
+    vm = await crud.create_vm(
+        data.model_dump(mode='json'), user_info
     )
     LOG.info('API request was successfully processed.')
     return schemas.VirtualMachineInfo(**vm)
 
 
+@router.post(
+    '/bulk/{action}/',
+    response_model=schemas.BulkVmActionResults,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def bulk_vm_action(
+    data: schemas.BulkVmAction,
+    action: Literal['start', 'shut-off', 'delete'] = Path(
+        description='Action to apply to the virtual machines'
+    ),
+    user_info: Dict = Depends(get_current_user),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
+) -> schemas.BulkVmActionResults:
+    """Start, shut off or delete several virtual machines.
+
+    The virtual machines are checked at once: those whose status and power
+    state allow the action are accepted and processed in the background,
+    the others are reported as rejected or not found.
+
+    Args:
+        data (schemas.BulkVmAction): The IDs of the virtual machines.
+        action (str): The action to apply to the virtual machines.
+        user_info (Dict): The dependency to ensure the user is authenticated.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
+
+    Returns:
+        schemas.BulkVmActionResults: The result of the action for every
+        virtual machine.
+    """
+    LOG.info(
+        f'API handling request to {action} {len(data.vm_ids)} virtual '
+        f'machines.'
+    )
+    results = await crud.bulk_vm_action(
+        action.replace('-', '_'), data.vm_ids, user_info
+    )
+    LOG.info('API request was successfully processed.')
+    return schemas.BulkVmActionResults.model_validate({'results': results})
+
+
 @router.delete(
     '/{vm_id}/',
     status_code=status.HTTP_201_CREATED,
@@ -146,14 +212,14 @@ async def create_vm(
 async def delete_vm(
     vm_id: str,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> JSONResponse:
     """Delete a virtual machine by ID.
 
     Args:
         vm_id (str): The ID of the virtual machine to delete.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         JSONResponse: The response indicating the result of the deletion.
@@ -161,7 +227,7 @@ async def delete_vm(
     LOG.info(
         f'API handling request to delete virtual machine with ID: {vm_id}.'
     )
-    vm = await run_in_threadpool(crud.delete_vm, vm_id, user_info)
+    vm = await crud.delete_vm(vm_id, user_info)
     LOG.info('API request was successfully processed.')
     return JSONResponse(vm)
 
@@ -174,20 +240,20 @@ async def delete_vm(
 async def start_vm(
     vm_id: str,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.VirtualMachineInfo:
     """Start a virtual machine by ID.
 
     Args:
         vm_id (str): The ID of the virtual machine to start.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.VirtualMachineInfo: The virtual machine data.
     """
     LOG.info(f'API handling request to start virtual machine with ID: {vm_id}.')
-    vm = await run_in_threadpool(crud.start_vm, vm_id, user_info)
+    vm = await crud.start_vm(vm_id, user_info)
     LOG.info('API request was successfully processed.')
     return schemas.VirtualMachineInfo(**vm)
 
@@ -200,14 +266,14 @@ async def start_vm(
 async def shut_off_vm(
     vm_id: str,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.VirtualMachineInfo:
     """Shut off a virtual machine by ID.
 
     Args:
         vm_id (str): The ID of the virtual machine to shut off.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.VirtualMachineInfo: The virtual machine data.
@@ -215,7 +281,7 @@ async def shut_off_vm(
     LOG.info(
         f'API handling request to shut off virtual machine with ID: {vm_id}.'
     )
-    vm = await run_in_threadpool(crud.shut_off_vm, vm_id, user_info)
+    vm = await crud.shut_off_vm(vm_id, user_info)
     LOG.info('API request was successfully processed.')
     return schemas.VirtualMachineInfo(**vm)
 
@@ -229,7 +295,7 @@ async def edit_vm(
     vm_id: str,
     data: schemas.EditVm,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.VirtualMachineInfo:
     """Edit a virtual machine by ID.
 
@@ -237,14 +303,14 @@ async def edit_vm(
         vm_id (str): The ID of the virtual machine to edit.
         data (schemas.EditVm): The data to update the virtual machine.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.VirtualMachineInfo: The updated virtual machine data.
     """
     LOG.info(f'API handling request to edit virtual machine with ID: {vm_id}.')
-    vm = await run_in_threadpool(
-        crud.edit_vm, vm_id, data.model_dump(mode='json'), user_info
+    vm = await crud.edit_vm(
+        vm_id, data.model_dump(mode='json'), user_info
     )
     LOG.info('API request was successfully processed.')
     return schemas.VirtualMachineInfo(**vm)
@@ -258,19 +324,19 @@ async def edit_vm(
 async def vnc_vm(
     vm_id: str,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.Vnc:
     """Access the VNC session of a virtual machine by ID.
 
     Args:
         vm_id (str): The ID of the virtual machine.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.Vnc: The VNC session details.
     """
-    result = await run_in_threadpool(crud.vnc, vm_id, user_info)
+    result = await crud.vnc(vm_id, user_info)
     return schemas.Vnc(**result)
 
 
@@ -284,7 +350,7 @@ async def clone_vm(
     data: schemas.CloneVm,
     vm_id: str = Path(description='Id of vm that will be cloned'),
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> List[schemas.VirtualMachineInfo]:
     """Clone a virtual machine.
 
@@ -292,7 +358,7 @@ async def clone_vm(
         vm_id (str): The ID of the virtual machine to copy.
         data (schemas.CloneVm): The data to clone the virtual machine.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         List[schemas.VirtualMachineInfo]: The list of cloned virtual machine
@@ -301,8 +367,8 @@ async def clone_vm(
         f'API handling request to copy data for VM with ID: {vm_id} '
         f'{data.count} times.'
     )
-    result: List[Dict] = await run_in_threadpool(
-        crud.clone_vm, vm_id, data.count, data.target_storage_id, user_info
+    result: List[Dict] = await crud.clone_vm(
+        vm_id, data.count, data.target_storage_id, user_info
     )
     LOG.info('API request was successfully processed.')
     return [schemas.VirtualMachineInfo(**item) for item in result]
@@ -317,14 +383,14 @@ async def clone_vm(
 async def get_snapshots(
     vm_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.ListOfSnapshots:
     """Retrieve all snapshots of the specific virtual machine.
 
     Args:
         vm_id (UUID): The ID of the virtual machine.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.ListOfSnapshots: A list of all snapshots of the specific
@@ -332,8 +398,8 @@ async def get_snapshots(
     """
     LOG.info(f'API handling request to get snapshots of '
              f'virtual machine with ID: {vm_id}.')
-    snapshots = await run_in_threadpool(
-        crud.get_snapshots, str(vm_id), user_info
+    snapshots = await crud.get_snapshots(
+        str(vm_id), user_info
     )
     LOG.info('API request was successfully processed.')
     return schemas.ListOfSnapshots(snapshots=snapshots)
@@ -349,7 +415,7 @@ async def get_snapshot(
     vm_id: UUID,
     snap_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.SnapshotInfo:
     """Retrieve a snapshot of a specific virtual machine by snapshot ID.
 
@@ -357,15 +423,15 @@ async def get_snapshot(
         vm_id (UUID): The ID of the virtual machine.
         snap_id (UUID): The ID of the snapshot.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.SnapshotInfo: The snapshot data.
     """
     LOG.info(f'API handling request to get a snapshot with ID: {snap_id} '
              f'of virtual machine with ID: {vm_id}.')
-    snapshot = await run_in_threadpool(
-        crud.get_snapshot, str(vm_id), str(snap_id), user_info
+    snapshot = await crud.get_snapshot(
+        str(vm_id), str(snap_id), user_info
     )
     LOG.info('API request was successfully processed.')
     return schemas.SnapshotInfo(**snapshot)
@@ -380,7 +446,7 @@ async def create_snapshot(
     vm_id: UUID,
     data: schemas.CreateSnapshot,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.SnapshotInfo:
     """Create a new snapshot of the virtual machine.
 
@@ -390,15 +456,14 @@ async def create_snapshot(
         data (schemas.CreateSnapshot): The data required to create a new
         snapshot of the virtual machine.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         Dict: The created snapshot data.
     """
     LOG.info(f'API handling request to create a snapshot '
              f'of virtual machine with ID: {vm_id}.')
-    snapshot = await run_in_threadpool(
-        crud.create_snapshot,
+    snapshot = await crud.create_snapshot(
         str(vm_id),
         data.model_dump(mode='json'),
         user_info
@@ -416,7 +481,7 @@ async def revert_snapshot(
     vm_id: UUID,
     snap_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.SnapshotInfo:
     """Revert a virtual machine to a snapshot.
 
@@ -425,15 +490,15 @@ async def revert_snapshot(
         reverted.
         snap_id (UUID): The ID of the snapshot to revert.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.SnapshotInfo: The reverted snapshot data.
     """
     LOG.info(f'API handling request to revert snapshot (ID: {snap_id}) '
              f'of virtual machine with ID: {vm_id}')
-    snapshot = await run_in_threadpool(
-        crud.revert_snapshot, str(vm_id), str(snap_id), user_info
+    snapshot = await crud.revert_snapshot(
+        str(vm_id), str(snap_id), user_info
     )
     LOG.info('API request was successfully processed.')
     return schemas.SnapshotInfo(**snapshot)
@@ -447,7 +512,7 @@ async def delete_snapshot(
     vm_id: UUID,
     snap_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VMCrud = Depends(VMCrud),
+    crud: AsyncVMCrud = Depends(AsyncVMCrud),
 ) -> schemas.SnapshotInfo:
     """Delete a snapshot of virtual machine.
 
@@ -456,7 +521,7 @@ async def delete_snapshot(
         deleted.
         snap_id (UUID): The ID of the snapshot to delete.
         user_info (Dict): The dependency to ensure the user is authenticated.
-        crud (VMCrud): The CRUD dependency for virtual machine operations.
+        crud (AsyncVMCrud): The CRUD dependency for virtual machine operations.
 
     Returns:
         schemas.SnapshotInfo: The deleted snapshot data.
@@ -465,8 +530,8 @@ async def delete_snapshot(
         f'API handling request to delete snapshot (ID: {snap_id}) '
         f'from virtual machine with ID: {vm_id}.'
     )
-    snapshot = await run_in_threadpool(
-        crud.delete_snapshot, str(vm_id), str(snap_id), user_info
+    snapshot = await crud.delete_snapshot(
+        str(vm_id), str(snap_id), user_info
     )
     LOG.info('API request was successfully processed.')
     return schemas.SnapshotInfo(**snapshot)
\ No newline at end of file
@@ -1,18 +1,20 @@
 """Module for virtual machine CRUD operations.
 
-This module provides a class `VMCrud` that contains methods for performing
+This module provides a class `AsyncVMCrud` that contains methods for performing
 CRUD (Create, Read, Update, Delete) operations on virtual machines.
 The operations are executed by calling the service layer via RPC.
 
 Classes:
-    VMCrud: Provides methods to create, retrieve, update, and delete
+    AsyncVMCrud: Provides methods to create, retrieve, update, and delete
         virtual machines by interacting with the service layer.
 """
 
 from uuid import UUID
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Type
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
+from intakevms.common.projections import View
 from intakevms.libs.validation.validators import Validator
 from intakevms.libs.messaging.messaging_agents import MessagingClient
 from intakevms.modules.virtual_machines.config import (
@@ -21,14 +23,17 @@ from intakevms.modules.virtual_machines.config import (
 from intakevms.modules.virtual_machines.entrypoints import schemas
 from intakevms.modules.virtual_machines.service_layer import services
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 LOG = get_logger(__name__)
 
 
-class VMCrud:
-    """Class for virtual machine CRUD operations.
+class AsyncVMCrud:
+    """Class for virtual machine CRUD operations awaited from the event loop.
 
-    This class provides methods to interact with the service layer to
-    perform CRUD operations on virtual machines.
+    The service layer is awaited through `MessagingClient.acall`, so
+    waiting for a reply does not hold a thread of the web server.
 
     Attributes:
         service_layer_rpc (Protocol): An RPC client for communicating with
@@ -36,12 +41,12 @@ class VMCrud:
     """
 
     def __init__(self) -> None:
-        """Initialize VMCrud with an RPC client."""
+        """Initialize AsyncVMCrud with an RPC client."""
         self.service_layer_rpc = MessagingClient(
             queue_name=API_SERVICE_LAYER_QUEUE_NAME
         )
 
-    def get_vm(self, vm_id: str) -> Dict:
+    async def get_vm(self, vm_id: str) -> Dict:
         """Retrieve a virtual machine by its ID.
 
         Args:
@@ -51,28 +56,53 @@ class VMCrud:
             Dict: The virtual machine data.
         """
         LOG.info('Call service layer to get VM by ID: %s.', vm_id)
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.get_vm.__name__,
             data_for_method={'vm_id': vm_id},
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def get_all_vms(self) -> List:
+    async def get_all_vms(self) -> List:
         """Retrieve all virtual machines.
 
         Returns:
             Page: A paginated list of all virtual machines.
         """
         LOG.info('Call service layer to get all VMs.')
-        result = self.service_layer_rpc.call(
+        result = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.get_all_vms.__name__,
             data_for_method={},
         )
         LOG.debug('Response from service layer: %s.', result)
         return Validator.validate_objects(result, schemas.VirtualMachineInfo)
 
-    def create_vm(self, data: Dict, user_info: Dict) -> Dict:
+    async def get_vms_page(
+        self, page: PageRequest, view: View = View.FULL
+    ) -> Dict:
+        """Retrieve a page of virtual machines.
+
+        Args:
+            page (PageRequest): The requested page.
+            view (View): The representation of the virtual machines.
+
+        Returns:
+            Dict: The virtual machines of the page and the cursor of the next
+                page.
+        """
+        LOG.info('Call service layer to get a page of VMs.')
+        result: Dict = await self.service_layer_rpc.acall(
+            services.VMServiceLayerManager.get_vms_page.__name__,
+            data_for_method={**page.to_dict(), 'view': view.value},
+        )
+        LOG.debug('Response from service layer: %s.', result)
+        schema: Type[BaseModel] = schemas.VirtualMachineInfo
+        if view is View.SUMMARY:
+            schema = schemas.VirtualMachineSummary
+        result['items'] = Validator.validate_objects(result['items'], schema)
+        return result
+
+    async def create_vm(self, data: Dict, user_info: Dict) -> Dict:
         """Create a new virtual machine.
 
         Args:
@@ -84,14 +114,14 @@ class VMCrud:
         """
         LOG.info('Call service layer to create VM with data: %s.', data)
         data.update({'user_info': user_info})
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.create_vm.__name__,
             data_for_method=data,
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def delete_vm(self, vm_id: str, user_info: Dict) -> Dict:
+    async def delete_vm(self, vm_id: str, user_info: Dict) -> Dict:
         """Delete a virtual machine by its ID.
 
         Args:
@@ -102,14 +132,14 @@ class VMCrud:
             Dict: The result of the deletion operation.
         """
         LOG.info('Call service layer to delete VM by ID: %s.', vm_id)
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.delete_vm.__name__,
             data_for_method={'vm_id': vm_id, 'user_info': user_info},
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def start_vm(self, vm_id: str, user_info: Dict) -> Dict:
+    async def start_vm(self, vm_id: str, user_info: Dict) -> Dict:
         """Start a virtual machine by its ID.
 
         Args:
@@ -120,14 +150,14 @@ class VMCrud:
             Dict: The result of the start operation.
         """
         LOG.info('Call service layer to start VM by ID: %s.', vm_id)
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.start_vm.__name__,
             data_for_method={'vm_id': vm_id, 'user_info': user_info},
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def shut_off_vm(self, vm_id: str, user_info: Dict) -> Dict:
+    async def shut_off_vm(self, vm_id: str, user_info: Dict) -> Dict:
         """Shut off a virtual machine by its ID.
 
         Args:
@@ -138,14 +168,39 @@ class VMCrud:
             Dict: The result of the shut-off operation.
         """
         LOG.info('Call service layer to shut off VM by ID: %s.', vm_id)
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.shut_off_vm.__name__,
             data_for_method={'vm_id': vm_id, 'user_info': user_info},
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def edit_vm(self, vm_id: str, data: Dict, user_info: Dict) -> Dict:
+    async def bulk_vm_action(
+        self, action: str, vm_ids: List[UUID], user_info: Dict
+    ) -> List[Dict]:
+        """Start, shut off or delete several virtual machines.
+
+        Args:
+            action (str): `start`, `shut_off` or `delete`.
+            vm_ids (List[UUID]): The IDs of the virtual machines.
+            user_info (Dict): The user information for authorization.
+
+        Returns:
+            List[Dict]: The result of the action for every virtual machine.
+        """
+        LOG.info('Call service layer to %s %d VMs.', action, len(vm_ids))
+        result: List[Dict] = await self.service_layer_rpc.acall(
+            services.VMServiceLayerManager.bulk_vm_action.__name__,
+            data_for_method={
+                'action': action,
+                'vm_ids': [str(vm_id) for vm_id in vm_ids],
+                'user_info': user_info,
+            },
+        )
+        LOG.debug('Response from service layer: %s.', result)
+        return result
+
+    async def edit_vm(self, vm_id: str, data: Dict, user_info: Dict) -> Dict:
         """Edit a virtual machine by its ID.
 
         Args:
@@ -158,14 +213,14 @@ class VMCrud:
         """
         LOG.info('Call service layer to edit VM by ID: %s.', vm_id)
         data.update({'vm_id': vm_id, 'user_info': user_info})
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.edit_vm.__name__,
             data_for_method=data,
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def vnc(self, vm_id: str, user_info: Dict) -> Dict:
+    async def vnc(self, vm_id: str, user_info: Dict) -> Dict:
         """Access the VNC session of a virtual machine by its ID.
 
         Args:
@@ -175,13 +230,13 @@ class VMCrud:
         Returns:
             Dict: The VNC session details.
         """
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.vnc.__name__,
             data_for_method={'vm_id': vm_id, 'user_info': user_info},
         )
         return result
 
-    def clone_vm(
+    async def clone_vm(
         self,
         vm_id: str,
         count: int,
@@ -203,7 +258,7 @@ class VMCrud:
         LOG.info(
             f'Call service layer to clone VM by ID: {vm_id} {count} times.'
         )
-        result: List[Dict] = self.service_layer_rpc.call(
+        result: List[Dict] = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.clone_vm.__name__,
             data_for_method={
                 'vm_id': vm_id,
@@ -215,7 +270,7 @@ class VMCrud:
         LOG.debug(f'Response from service layer: {result}')
         return result
 
-    def get_snapshots(self, vm_id: str, user_info: Dict) -> List:
+    async def get_snapshots(self, vm_id: str, user_info: Dict) -> List:
         """Retrieve all snapshots of a virtual machine.
 
         Args:
@@ -226,14 +281,14 @@ class VMCrud:
             List: A list of all snapshots of the specific virtual machine.
         """
         LOG.info(f'Call service layer to get snapshots of VM with ID: {vm_id}')
-        result: List = self.service_layer_rpc.call(
+        result: List = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.get_snapshots.__name__,
             data_for_method={'vm_id': vm_id, 'user_info': user_info},
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def get_snapshot(
+    async def get_snapshot(
             self, vm_id: str, snap_id: str, user_info: Dict
     ) -> Dict:
         """Retrieve a snapshot of a specific virtual machine by snapshot ID.
@@ -248,7 +303,7 @@ class VMCrud:
         """
         LOG.info(f'Call service layer to get snapshot of VM (ID: {vm_id}) '
                  f'by snapshot ID: {snap_id}.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.get_snapshot.__name__,
             data_for_method={
                 'vm_id': vm_id,
@@ -259,7 +314,7 @@ class VMCrud:
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def create_snapshot(
+    async def create_snapshot(
             self, vm_id: str, data: Dict, user_info: Dict
     ) -> Dict:
         """Create a new snapshot of the virtual machine.
@@ -277,14 +332,14 @@ class VMCrud:
         LOG.info(f'Call service layer to create snapshot of VM (ID: {vm_id}) '
                  f'with data: {data}')
         data.update({'vm_id': str(vm_id), 'user_info': user_info})
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.create_snapshot.__name__,
             data_for_method=data,
         )
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def revert_snapshot(
+    async def revert_snapshot(
             self, vm_id: str, snap_id: str, user_info: Dict
     ) -> Dict:
         """Revert a virtual machine to a snapshot.
@@ -300,7 +355,7 @@ class VMCrud:
         """
         LOG.info(f'Call service layer to revert snapshot of VM (ID: {vm_id}) '
                  f'with snapshot ID: {snap_id}')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.revert_snapshot.__name__,
             data_for_method={
                 'vm_id': vm_id,
@@ -311,7 +366,7 @@ class VMCrud:
         LOG.debug('Response from service layer: %s.', result)
         return result
 
-    def delete_snapshot(
+    async def delete_snapshot(
             self, vm_id: str, snap_id: str, user_info: Dict
     ) -> Dict:
         """Delete a snapshot of virtual machine.
@@ -327,11 +382,11 @@ class VMCrud:
         """
         LOG.info(f'Call service layer to delete snapshot of VM (ID: {vm_id}) '
                  f'with snapshot ID: {snap_id}')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VMServiceLayerManager.delete_snapshot.__name__,
             data_for_method={
                 'vm_id': vm_id, 'snap_id': snap_id, 'user_info': user_info
             },
         )
         LOG.debug('Response from service layer: %s.', result)
-        return result
\ No newline at end of file
+        return result
@@ -37,6 +37,10 @@ Classes:
     SnapshotInfo: Schema for detailed snapshot information.
     ListOfSnapshots: Schema for a list of snapshots of specific virtual machine.
     CreateSnapshot: Schema for creating a snapshot of virtual machine.
+    BulkVmAction: Schema for the virtual machines of a bulk action.
+    BulkVmActionResult: Schema for the result of a bulk action on a virtual
+        machine.
+    BulkVmActionResults: Schema for the results of a bulk action.
 """
 
 from uuid import UUID
@@ -44,6 +48,8 @@ from typing import List, Union, Literal, Optional
 
 from pydantic import Field, BaseModel
 
+from intakevms.modules.virtual_machines.config import BULK_ACTION_MAX_VMS
+
 
 class Cpu(BaseModel):
     """Schema for CPU information."""
@@ -207,6 +213,15 @@ class VirtualMachineInfo(BaseModel):
     virtual_interfaces: List[VirtualInterfaceInfo]
 
 
+class VirtualMachineSummary(BaseModel):
+    """Schema for the summary view of a virtual machine."""
+
+    id: str
+    name: str
+    power_state: str
+    status: str
+
+
 class ListOfVirtualMachines(BaseModel):
     """Schema for a list of virtual machines."""
 
@@ -328,4 +343,41 @@ class CreateSnapshot(BaseModel):
     """
 
     name: str
-    description: Optional[str] = None
\ No newline at end of file
+    description: Optional[str] = None
+
+
+class BulkVmAction(BaseModel):
+    """Schema for the virtual machines of a bulk action.
+
+    Attributes:
+        vm_ids (List[UUID]): The IDs of the virtual machines.
+    """
+
+    vm_ids: List[UUID] = Field(min_length=1, max_length=BULK_ACTION_MAX_VMS)
+
+
+class BulkVmActionResult(BaseModel):
+    """Schema for the result of a bulk action on a virtual machine.
+
+    Attributes:
+        id (str): The ID of the virtual machine.
+        result (Literal['accepted', 'rejected', 'not_found']): Whether the
+            action was accepted, rejected because of the status or power
+            state of the virtual machine, or the virtual machine not found.
+        detail (Optional[str]): The reason of a rejection.
+    """
+
+    id: str
+    result: Literal['accepted', 'rejected', 'not_found']
+    detail: Optional[str] = None
+
+
+class BulkVmActionResults(BaseModel):
+    """Schema for the results of a bulk action.
+
+    Attributes:
+        results (List[BulkVmActionResult]): The result of every virtual
+            machine, in the order of the request.
+    """
+
+    results: List[BulkVmActionResult]
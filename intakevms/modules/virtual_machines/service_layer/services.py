@@ -22,6 +22,7 @@ Functions:
     delete_vm: Delete a virtual machine by ID.
     start_vm: Start a virtual machine by ID.
     shut_off_vm: Shut off a virtual machine by ID.
+    bulk_vm_action: Start, shut off or delete several virtual machines.
     edit_vm: Edit a virtual machine by ID.
     vnc: Access the VNC session of a virtual machine.
     get_snapshot: Retrieve a snapshot of a virtual machine.
@@ -37,20 +38,29 @@ from __future__ import annotations
 import enum
 import time
 import string
+import functools
 from copy import deepcopy
 from uuid import UUID, uuid4
 from typing import TYPE_CHECKING, Dict, List, Optional, cast
 from collections import namedtuple
 
 from intakevms.libs.log import get_logger
+from intakevms.libs.caching import cached_read, invalidates
 from intakevms.libs.libvirt.vm import get_vms_state, get_vm_snapshots
+from intakevms.libs.monitoring import StateSnapshot
+from intakevms.common.pagination import PageRequest, page_dict
+from intakevms.common.projections import is_summary, to_summary
 from intakevms.modules.base_manager import BackgroundTasks, periodic_task
 from intakevms.libs.context_managers import synchronized_session
+from intakevms.libs.messaging.config import get_rpc_server_settings
+from intakevms.libs.messaging.managers import ManagerProvider
+from intakevms.libs.messaging.rpc.base import RpcCall, batch_time_limit
 from intakevms.modules.virtual_machines import config
 from intakevms.libs.messaging.exceptions import (
     RpcCallException,
     RpcServerInitializedException,
 )
+from intakevms.libs.messaging.rpc.dispatch import execute_calls
 from intakevms.libs.messaging.messaging_agents import MessagingClient
 from intakevms.modules.virtual_machines.adapters import orm
 from intakevms.libs.data_handlers.json.serializer import serialize_json
@@ -60,7 +70,9 @@ from intakevms.modules.virtual_machines.service_layer import (
     exceptions,
     unit_of_work,
 )
-from intakevms.modules.virtual_machines.adapters.serializer import DataSerializer
+from intakevms.modules.virtual_machines.adapters.serializer import (
+    DataSerializer,
+)
 from intakevms.libs.messaging.clients.rpc_clients.image_rpc_client import (
     ImageServiceLayerRPCClient,
 )
@@ -162,6 +174,49 @@ class SnapshotStatus(enum.Enum):
     deleting = 5
 
 
+BulkActionRule = namedtuple(
+    'BulkActionRule',
+    ['statuses', 'power_states', 'status', 'method'],
+)
+
+# Statuses and power states a virtual machine must be in for each bulk
+# action, the status it is set to, and the method doing the domain work.
+BULK_ACTIONS: Dict[str, BulkActionRule] = {
+    'start': BulkActionRule(
+        [VmStatus.available.name, VmStatus.error.name],
+        [VmPowerState.shut_off.name],
+        VmStatus.starting.name,
+        '_start_vm',
+    ),
+    'shut_off': BulkActionRule(
+        [VmStatus.available.name, VmStatus.error.name],
+        [VmPowerState.running.name],
+        VmStatus.shut_offing.name,
+        '_shut_off_vm',
+    ),
+    'delete': BulkActionRule(
+        [VmStatus.available.name, VmStatus.error.name],
+        [VmPowerState.shut_off.name],
+        VmStatus.deleting.name,
+        '_delete_vm',
+    ),
+}
+
+
+@functools.cache
+def _get_bulk_managers(manager: type) -> ManagerProvider:
+    """Get the provider of the managers doing the work of bulk actions.
+
+    Args:
+        manager (type): The manager class.
+
+    Returns:
+        ManagerProvider: The provider, shared by the bulk actions of the
+            process, so that its threads reuse their manager.
+    """
+    return ManagerProvider(manager)
+
+
 class VMServiceLayerManager(BackgroundTasks):
     """Manager class for handling virtual machine operations in service layer.
 
@@ -202,6 +257,9 @@ class VMServiceLayerManager(BackgroundTasks):
         self.volume_service_client = VolumeServiceLayerRPCClient()
         self.image_service_client = ImageServiceLayerRPCClient()
         self.event_store = EventCrud('virtual_machines')
+        self.monitoring_snapshot = StateSnapshot(
+            'virtual_machines', ('power_state', 'status', 'information')
+        )
 
     def get_vm(self, data: Dict) -> Dict:
         """Retrieve a virtual machine by ID.
@@ -225,13 +283,14 @@ class VMServiceLayerManager(BackgroundTasks):
             )
             LOG.error(message)
             raise exceptions.UnexpectedDataArguments(message)
-        with self.uow:
-            db_virtual_machine = self.uow.virtual_machines.get(vm_id)
+        with self.uow.read_only() as uow:
+            db_virtual_machine = uow.virtual_machines.get(vm_id)
             serialized_vm = DataSerializer.vm_to_web(db_virtual_machine)
             LOG.info(f'Got vm from db: {serialized_vm}.')
         LOG.info('Service layer method get vm was successfully processed.')
         return serialized_vm
 
+    @cached_read('vms')
     def get_all_vms(self) -> List:
         """Retrieve all virtual machines.
 
@@ -239,14 +298,39 @@ class VMServiceLayerManager(BackgroundTasks):
             List: A list of serialized virtual machine data.
         """
         LOG.info('Service layer start handling response on get vms.')
-        with self.uow:
-            db_virtual_machines = self.uow.virtual_machines.get_all()
+        with self.uow.read_only() as uow:
+            db_virtual_machines = uow.virtual_machines.get_all()
             serialized_vms = [
                 DataSerializer.vm_to_web(vm) for vm in db_virtual_machines
             ]
         LOG.info('Service layer method get all vms was successfully processed.')
         return serialized_vms
 
+    @cached_read('vms')
+    def get_vms_page(self, data: Dict) -> Dict:
+        """Retrieve a page of virtual machines.
+
+        Args:
+            data (Dict): The page request, see `PageRequest.to_dict`, and
+                the optional `view` of the virtual machines.
+
+        Returns:
+            Dict: The serialized virtual machines of the page and the cursor
+                of the next page.
+        """
+        LOG.info('Service layer start handling response on get vms page.')
+        page = PageRequest.from_dict(data)
+        summary = is_summary(data)
+        with self.uow.read_only() as uow:
+            db_virtual_machines, next_cursor = (
+                uow.virtual_machines.get_page(page, summary=summary)
+            )
+            serialized_vms = [
+                to_summary(vm) if summary else DataSerializer.vm_to_web(vm)
+                for vm in db_virtual_machines
+            ]
+        return page_dict(serialized_vms, next_cursor)
+
     @staticmethod
     def _prepare_create_vm_info(vm_info: Dict) -> CreateVmInfo:
         """Prepare the information needed to create a virtual machine.
@@ -303,6 +387,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Vm information was successfully prepared for creating.')
         return create_vm_info
 
+    @invalidates('vms')
     def _insert_vm_into_db(self, create_vm_info: CreateVmInfo) -> Dict:
         """Insert virtual machine information into the database.
 
@@ -614,6 +699,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Disk was successfully attached to vm.')
         return disk
 
+    @invalidates('vms')
     def _add_disks_to_vm(self, vm_id: str, disks: List) -> None:
         """Attach a list of disks to a virtual machine.
 
@@ -644,6 +730,7 @@ class VMServiceLayerManager(BackgroundTasks):
             self.uow.commit()
         LOG.info('Disks was successfully attached and inserted into db.')
 
+    @invalidates('vms')
     def _create_vm(self, data: Dict) -> None:
         """Create a virtual machine and attach disks to it.
 
@@ -778,6 +865,7 @@ class VMServiceLayerManager(BackgroundTasks):
             raise exceptions.UnexpectedDataArguments(message)
         LOG.info('Disk was successfully detached from vm.')
 
+    @invalidates('vms')
     def _detach_disks_from_vm(self, disks: List) -> None:
         """Detach and delete disks from a virtual machine.
 
@@ -802,6 +890,7 @@ class VMServiceLayerManager(BackgroundTasks):
             self.uow.commit()
         LOG.info('Disks were successfully detached and deleted from db.')
 
+    @invalidates('vms')
     def delete_vm(self, data: Dict) -> Optional[Dict]:
         """Delete a virtual machine by ID.
 
@@ -862,6 +951,7 @@ class VMServiceLayerManager(BackgroundTasks):
             finally:
                 self.uow.commit()
 
+    @invalidates('vms')
     def _delete_vm(self, data: Dict) -> None:
         """Delete a virtual machine from the database.
 
@@ -898,6 +988,7 @@ class VMServiceLayerManager(BackgroundTasks):
             finally:
                 self.uow.commit()
 
+    @invalidates('vms')
     def start_vm(self, data: Dict) -> Dict:
         """Start a virtual machine by ID.
 
@@ -932,6 +1023,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Response on start_vm was successfully processed.')
         return serialized_vm
 
+    @invalidates('vms')
     def _start_vm(self, data: Dict) -> None:
         """Start a virtual machine and update the database with the new state.
 
@@ -1013,6 +1105,7 @@ class VMServiceLayerManager(BackgroundTasks):
             if db_snap:
                 db_snap.status = SnapshotStatus.creating.name
 
+    @invalidates('vms')
     def shut_off_vm(self, data: Dict) -> Dict:
         """Shut off a virtual machine by ID.
 
@@ -1053,6 +1146,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Response on shut_off_vm was successfully processed.')
         return serialized_vm
 
+    @invalidates('vms')
     def _shut_off_vm(self, data: Dict) -> None:
         """Shut off a virtual machine and update the database.
 
@@ -1088,6 +1182,210 @@ class VMServiceLayerManager(BackgroundTasks):
             finally:
                 self.uow.commit()
 
+    @invalidates('vms')
+    def bulk_vm_action(self, data: Dict) -> List[Dict]:
+        """Start, shut off or delete several virtual machines.
+
+        The virtual machines are read in a single query and checked against
+        the statuses and power states of the action. The accepted ones are
+        set to the status of the action in a single transaction, then their
+        domain work is dispatched as a single cast, see `_bulk_vm_action`.
+        Rejected virtual machines are left as they are.
+
+        Args:
+            data (Dict): The `action` (`start`, `shut_off` or `delete`), the
+                `vm_ids` and the `user_info`.
+
+        Returns:
+            List[Dict]: The `id`, `result` (`accepted`, `rejected` or
+                `not_found`) and `detail` of every virtual machine, in the
+                order of the IDs.
+
+        Raises:
+            UnexpectedDataArguments: If the action is unknown.
+        """
+        LOG.info('Handling response on bulk_vm_action.')
+        action = data.pop('action', '')
+        vm_ids = list(
+            dict.fromkeys(str(vm_id) for vm_id in data.pop('vm_ids', []))
+        )
+        user_info = data.pop('user_info', {})
+        rule = BULK_ACTIONS.get(action)
+        if rule is None:
+            message = f'Unexpected bulk action: {action}.'
+            LOG.error(message)
+            raise exceptions.UnexpectedDataArguments(message)
+
+        results: List[Dict] = []
+        accepted: List[VirtualMachines] = []
+        with self.uow:
+            db_vms = {
+                str(db_vm.id): db_vm
+                for db_vm in self.uow.virtual_machines.get_many(vm_ids)
+            }
+            for vm_id in vm_ids:
+                result = self._accept_bulk_vm_action(
+                    rule, vm_id, db_vms.get(vm_id)
+                )
+                if result['result'] == 'accepted':
+                    accepted.append(db_vms[vm_id])
+                results.append(result)
+            self.uow.commit()
+            calls = [
+                {
+                    'vm_id': str(db_vm.id),
+                    'data': self._bulk_vm_action_data(action, db_vm, user_info),
+                }
+                for db_vm in accepted
+            ]
+        self.event_store.add_events(
+            [
+                {
+                    'object_id': str(db_vm.id),
+                    'user_id': user_info.get('id'),
+                    'event': self.bulk_vm_action.__name__,
+                    'information': (
+                        f'Set {rule.status} status for VM {db_vm.name}.'
+                    ),
+                }
+                for db_vm in accepted
+            ]
+        )
+        if calls:
+            self.service_layer_rpc.cast(
+                self._bulk_vm_action.__name__,
+                data_for_method={'method': rule.method, 'calls': calls},
+            )
+        LOG.info('Response on bulk_vm_action was successfully processed.')
+        return results
+
+    def _accept_bulk_vm_action(
+        self,
+        rule: BulkActionRule,
+        vm_id: str,
+        db_vm: Optional[VirtualMachines],
+    ) -> Dict:
+        """Check a virtual machine of a bulk action and set its status.
+
+        Args:
+            rule (BulkActionRule): The rule of the action.
+            vm_id (str): The requested ID.
+            db_vm (Optional[VirtualMachines]): The virtual machine, None if
+                it does not exist.
+
+        Returns:
+            Dict: The `id`, `result` and `detail` of the virtual machine.
+        """
+        if db_vm is None:
+            return {
+                'id': vm_id,
+                'result': 'not_found',
+                'detail': f'VM {vm_id} not found.',
+            }
+        try:
+            self._check_vm_status(db_vm.status, rule.statuses)
+            self._check_vm_power_state(db_vm.power_state, rule.power_states)
+        except (
+            exceptions.VMStatusException,
+            exceptions.VMPowerStateException,
+        ) as err:
+            return {'id': vm_id, 'result': 'rejected', 'detail': str(err)}
+        db_vm.status = rule.status
+        return {'id': vm_id, 'result': 'accepted', 'detail': None}
+
+    @staticmethod
+    def _bulk_vm_action_data(
+        action: str, db_vm: VirtualMachines, user_info: Dict
+    ) -> Dict:
+        """Build the data of the method doing the work of a bulk action.
+
+        Args:
+            action (str): The bulk action.
+            db_vm (VirtualMachines): The accepted virtual machine.
+            user_info (Dict): The user information.
+
+        Returns:
+            Dict: The data expected by `_start_vm`, `_shut_off_vm` or
+                `_delete_vm`.
+        """
+        if action == 'delete':
+            return {
+                'vm_id': str(db_vm.id),
+                'token': user_info.get('token'),
+                'user_info': user_info,
+            }
+        serialized_vm = DataSerializer.vm_to_web(db_vm)
+        serialized_vm['user_info'] = user_info
+        return serialized_vm
+
+    @invalidates('vms')
+    def _bulk_vm_action(self, data: Dict) -> None:
+        """Do the work of a bulk action with bounded concurrency.
+
+        The work is run in this process by the pool of threads of the batch
+        requests, at most `batch_workers` virtual machines at a time, as
+        configured for the queue in `[messaging.server]`, each with the
+        manager of its thread. The work of every virtual machine has
+        `BULK_ACTION_SECONDS_PER_VM` seconds: virtual machines whose work
+        failed or did not finish in time are set to the error status.
+
+        Args:
+            data (Dict): The `method` doing the work and its `calls`, each
+                with the `vm_id` and the `data` of the method.
+        """
+        LOG.info('Handling response on _bulk_vm_action.')
+        method = data.get('method', '')
+        calls = data.get('calls', [])
+        batch_workers = get_rpc_server_settings(
+            config.API_SERVICE_LAYER_QUEUE_NAME
+        ).batch_workers
+        rpc_calls = [
+            RpcCall(
+                method,
+                call['data'],
+                time_limit=config.BULK_ACTION_SECONDS_PER_VM,
+            )
+            for call in calls
+        ]
+        try:
+            results = execute_calls(
+                _get_bulk_managers(type(self)),
+                [rpc_call._asdict() for rpc_call in rpc_calls],
+                parallel=True,
+                workers=batch_workers,
+                deadline=time.time()
+                + batch_time_limit(rpc_calls, batch_workers),
+            )
+        except RuntimeError as err:  # The pool is shut down with the process
+            results = [{'err': str(err)} for _ in calls]
+        failed = {
+            call['vm_id']: result['err']
+            for call, result in zip(calls, results, strict=True)
+            if result.get('err')
+        }
+        if failed:
+            self._set_bulk_vm_errors(method, failed)
+        LOG.info('Response on _bulk_vm_action was successfully processed.')
+
+    def _set_bulk_vm_errors(self, method: str, failed: Dict[str, str]) -> None:
+        """Set the virtual machines whose work failed to the error status.
+
+        Args:
+            method (str): The method doing the work of the bulk action.
+            failed (Dict[str, str]): The error of every failed virtual
+                machine, by ID.
+        """
+        with self.uow:
+            for db_vm in self.uow.virtual_machines.get_many(list(failed)):
+                message = (
+                    f'Handle error: {failed[str(db_vm.id)]} while running '
+                    f'{method}.'
+                )
+                LOG.error(message)
+                db_vm.status = VmStatus.error.name
+                db_vm.information = message
+            self.uow.commit()
+
     @staticmethod
     def _prepare_vm_info_for_edit(vm_data: Dict) -> EditVmInfo:
         """Prepare the information needed to edit a virtual machine.
@@ -1159,6 +1457,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('VM information was successfully prepared for editing.')
         return edit_vm_info
 
+    @invalidates('vms')
     def _update_db_vm_info(self, vm_id: str, edit_vm_info: EditVmInfo) -> None:
         """Update the database with the new VM information.
 
@@ -1182,6 +1481,7 @@ class VMServiceLayerManager(BackgroundTasks):
             self.uow.commit()
             LOG.info('VM was successfully updated in database.')
 
+    @invalidates('vms')
     def _edit_vm_disks(self, disks: List) -> None:
         """Update disks in the database.
 
@@ -1196,6 +1496,7 @@ class VMServiceLayerManager(BackgroundTasks):
         self.uow.commit()
         LOG.info('Disks were successfully updated in database.')
 
+    @invalidates('vms')
     def _edit_virtual_interfaces(self, virtual_interfaces: List) -> None:
         """Update virtual interfaces in the database.
 
@@ -1210,6 +1511,7 @@ class VMServiceLayerManager(BackgroundTasks):
         self.uow.commit()
         LOG.info('Virtual interfaces were successfully updated in database.')
 
+    @invalidates('vms')
     def _detach_virtual_interfaces_from_vm(self, virt_interfaces: List) -> None:
         """Detach virtual interfaces from a virtual machine.
 
@@ -1221,6 +1523,7 @@ class VMServiceLayerManager(BackgroundTasks):
         self.uow.commit()
         LOG.info('Virtual interfaces were successfully detached from database.')
 
+    @invalidates('vms')
     def _add_virtual_interfaces_to_vm(
         self, vm_id: str, virt_interfaces: List
     ) -> None:
@@ -1247,6 +1550,7 @@ class VMServiceLayerManager(BackgroundTasks):
             'Virtual interfaces were successfully added into database for VM.'
         )
 
+    @invalidates('vms')
     def edit_vm(self, edit_info: Dict) -> Dict:
         """Edit a virtual machine by ID.
 
@@ -1296,6 +1600,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Response on edit VM was successfully processed.')
         return serialized_vm
 
+    @invalidates('vms')
     def _edit_shut_offed_vm(self, data: Dict) -> None:
         """Edit a shut-off virtual machine.
 
@@ -1639,10 +1944,10 @@ class VMServiceLayerManager(BackgroundTasks):
             )
             LOG.error(message)
             raise exceptions.UnexpectedDataArguments(message)
-        with self.uow:
-            db_vm = self.uow.virtual_machines.get(vm_id)
+        with self.uow.read_only() as uow:
+            db_vm = uow.virtual_machines.get(vm_id)
             try:
-                db_snap = self.uow.virtual_machines.get_snapshot(vm_id, snap_id)
+                db_snap = uow.virtual_machines.get_snapshot(vm_id, snap_id)
                 result = DataSerializer.snapshot_to_web(db_snap)
                 result['vm_name'] = db_vm.name
                 if result.get('parent'):
@@ -1677,9 +1982,9 @@ class VMServiceLayerManager(BackgroundTasks):
             )
             LOG.error(message)
             raise exceptions.UnexpectedDataArguments(message)
-        with self.uow:
-            db_vm = self.uow.virtual_machines.get(vm_id)
-            db_snapshots = self.uow.virtual_machines.get_snapshots_by_vm(vm_id)
+        with self.uow.read_only() as uow:
+            db_vm = uow.virtual_machines.get(vm_id)
+            db_snapshots = uow.virtual_machines.get_snapshots_by_vm(vm_id)
             serialized_snapshots = []
             for snap in db_snapshots:
                 snap_data = DataSerializer.snapshot_to_web(snap)
@@ -1692,6 +1997,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Successfully processed get snapshots of VM request.')
         return serialized_snapshots
 
+    @invalidates('vms')
     def create_snapshot(self, data: Dict) -> Dict:
         """Create a new snapshot.
 
@@ -1771,6 +2077,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Snapshot creation process started')
         return result
 
+    @invalidates('vms')
     def _create_snapshot(self, data: Dict) -> None:
         LOG.info('Handling response on _create_snapshot.')
         vm_id = str(data.pop('vm_id'))
@@ -1832,6 +2139,7 @@ class VMServiceLayerManager(BackgroundTasks):
             raise exceptions.SnapshotStatusException(message)
         LOG.info('Snapshot status was successfully checked.')
 
+    @invalidates('vms')
     def revert_snapshot(self, data: Dict) -> Dict:
         """Revert virtual machine to a specific snapshot.
 
@@ -1905,6 +2213,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Snapshot reverting process started')
         return result
 
+    @invalidates('vms')
     def _revert_snapshot(self, data: Dict) -> None:
         """Revert virtual machine to the snapshot and update the database
 
@@ -1950,6 +2259,7 @@ class VMServiceLayerManager(BackgroundTasks):
             finally:
                 self.uow.commit()
 
+    @invalidates('vms')
     def delete_snapshot(self, data: Dict) -> Dict:
         """Delete a snapshot of the virtual machine.
 
@@ -2031,6 +2341,7 @@ class VMServiceLayerManager(BackgroundTasks):
         LOG.info('Snapshot deletion process started')
         return result
 
+    @invalidates('vms')
     def _delete_snapshot(self, data: Dict) -> None:
         """Delete a snapshot of the virtual machine.
 
@@ -2085,6 +2396,7 @@ class VMServiceLayerManager(BackgroundTasks):
             finally:
                 self.uow.commit()
 
+    @invalidates('vms')
     def _delete_snapshot_from_db(
             self,
             vm_id: str,
@@ -2110,6 +2422,7 @@ class VMServiceLayerManager(BackgroundTasks):
             self.uow.virtual_machines.delete_snapshot(db_snap)
             self.uow.commit()
 
+    @invalidates('vms')
     def _delete_all_vm_snapshots(self, vm_id: str, user_info: Dict) -> None:
         """Delete all snapshots of the virtual machine (while deleting VM).
 
@@ -2145,45 +2458,115 @@ class VMServiceLayerManager(BackgroundTasks):
             LOG.info(f'Snapshot {snapshot["name"]} deleted.')
         LOG.info('Snapshots of the VM successfully deleted.')
 
-    def _update_snapshots_statuses(self, db_vm: VirtualMachines) -> None:
+    def _update_snapshots_statuses(self, vm_id: str, vm_name: str) -> bool:
         """Update snapshots statuses for a VM based on Libvirt API.
 
         Args:
-            db_vm: VirtualMachines database object to update snapshots for.
+            vm_id (str): The ID of the virtual machine.
+            vm_name (str): The name of the virtual machine.
+
+        Returns:
+            bool: True if any snapshot was changed.
         """
-        libvirt_snaps, libvirt_current_snap = get_vm_snapshots(db_vm.name)
-        vm_id = str(db_vm.id)
+        libvirt_snaps, libvirt_current_snap = get_vm_snapshots(vm_name)
         db_snaps = self.uow.virtual_machines.get_snapshots_by_vm(vm_id)
+        changed = False
         for db_snap in db_snaps:
+            status = db_snap.status
             if (db_snap.name not in libvirt_snaps and
                     db_snap.status != SnapshotStatus.creating.name):
-                db_snap.status = SnapshotStatus.error.name
+                status = SnapshotStatus.error.name
             elif (db_snap.status == SnapshotStatus.creating.name or
                     (db_snap.status == SnapshotStatus.reverting.name and
                      db_snap.name == libvirt_current_snap)):
-                db_snap.status = SnapshotStatus.running.name
-        self._update_current_snapshot(db_snaps, vm_id, libvirt_current_snap)
+                status = SnapshotStatus.running.name
+            if status != db_snap.status:
+                db_snap.status = status
+                changed = True
+        current_changed = self._update_current_snapshot(
+            db_snaps, vm_id, libvirt_current_snap
+        )
+        return changed or current_changed
 
     def _update_current_snapshot(
             self,
             db_snaps: List,
             vm_id: str,
             libvirt_current_snap: Optional[str]
-    ) -> None:
-        """Update is_current flag for VM snapshots.
+    ) -> bool:
+        """Update is_current flag for VM snapshots, if it changed.
 
         Args:
             db_snaps (List): List of snapshots of VM from the database.
             vm_id (str): The ID of the virtual machine.
             libvirt_current_snap (Optional[str]): The current snapshot from
             libvirt.
+
+        Returns:
+            bool: True if the flags were updated.
         """
         if libvirt_current_snap is None:
+            if not any(db_snap.is_current for db_snap in db_snaps):
+                return False
             self.uow.virtual_machines.unset_current_snapshot(vm_id)
-            return
-        for db_snap in db_snaps:
-            if db_snap.name == libvirt_current_snap:
-                self.uow.virtual_machines.set_current_snapshot(db_snap)
+            return True
+        current_snap = next(
+            (
+                db_snap
+                for db_snap in db_snaps
+                if db_snap.name == libvirt_current_snap
+            ),
+            None,
+        )
+        if current_snap is None or all(
+            db_snap.is_current == (db_snap is current_snap)
+            for db_snap in db_snaps
+        ):
+            return False
+        self.uow.virtual_machines.set_current_snapshot(current_snap)
+        return True
+
+    @staticmethod
+    def _get_observed_vm_state(vm_state: Dict, virsh_list: Dict) -> Dict:
+        """Get the state of a virtual machine observed by libvirt.
+
+        Args:
+            vm_state (Dict): The ID and name of the virtual machine.
+            virsh_list (Dict): Power states of the domains, by name.
+
+        Returns:
+            Dict: The columns of the virtual machine to update, with its ID.
+        """
+        observed_power_state = virsh_list.get(vm_state['name'], '')
+        if not observed_power_state:
+            return {
+                'id': vm_state['id'],
+                'power_state': VmPowerState.shut_off.name,
+            }
+        if observed_power_state == VmPowerState.running.name:
+            return {
+                'id': vm_state['id'],
+                'power_state': VmPowerState.running.name,
+                'status': VmStatus.available.name,
+                'information': '',
+            }
+        return {
+            'id': vm_state['id'],
+            'power_state': VmPowerState[observed_power_state].name,
+        }
+
+    @invalidates('vms')
+    def _write_monitoring_changes(self, vm_states: List[Dict]) -> None:
+        """Write the changes found by the monitoring, and commit them.
+
+        Args:
+            vm_states (List[Dict]): The changed columns of the virtual
+                machines, with their ID.
+        """
+        with synchronized_session(self.uow.session):
+            if vm_states:
+                self.uow.virtual_machines.bulk_update(vm_states)
+        self.uow.commit()
 
     @periodic_task(interval=10)
     def monitoring(self) -> None:
@@ -2193,23 +2576,33 @@ class VMServiceLayerManager(BackgroundTasks):
         and statuses in the database. For running VMs, also updates their
         snapshot statuses and 'is_current' flag.
 
+        Only the columns of the VMs are read, and only the VMs whose state
+        differs from the one read are written, in a single bulk update.
+        Nothing is written, and the caches are kept, when nothing changed.
+
         This method runs as a periodic task every 10 seconds.
         """
         LOG.info('Start monitoring.')
         virsh_list = get_vms_state()
         with self.uow:
-            with synchronized_session(self.uow.session):
-                for db_vm in self.uow.virtual_machines.get_all():
-                    db_vm_power_state = virsh_list.get(db_vm.name, '')
-                    if not db_vm_power_state:
-                        db_vm.power_state = VmPowerState.shut_off.name
-                    elif db_vm_power_state == VmPowerState.running.name:
-                        db_vm.power_state = VmPowerState[db_vm_power_state].name
-                        db_vm.status = VmStatus.available.name
-                        db_vm.information = ''
-                    else:
-                        db_vm.power_state = VmPowerState[db_vm_power_state].name
-                    if db_vm.power_state == VmPowerState.running.name:
-                        self._update_snapshots_statuses(db_vm)
-            self.uow.commit()
+            vm_states = self.uow.virtual_machines.get_states()
+            self.monitoring_snapshot.load(vm_states)
+            observed_states = [
+                self._get_observed_vm_state(vm_state, virsh_list)
+                for vm_state in vm_states
+            ]
+            changed_states = self.monitoring_snapshot.changes(observed_states)
+            snapshots_changed = False
+            for vm_state, observed_state in zip(
+                vm_states, observed_states, strict=True
+            ):
+                if observed_state['power_state'] == VmPowerState.running.name:
+                    snapshots_changed |= self._update_snapshots_statuses(
+                        str(vm_state['id']), vm_state['name']
+                    )
+            if changed_states or snapshots_changed:
+                self._write_monitoring_changes(changed_states)
+        self.monitoring_snapshot.report(
+            len(observed_states), len(changed_states)
+        )
         LOG.info('Stop monitoring.')
\ No newline at end of file
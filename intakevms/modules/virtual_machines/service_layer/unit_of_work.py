@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
+from intakevms.common.uow.read_only import ReadOnlyUnitOfWorkMixin
 from intakevms.modules.virtual_machines.config import DEFAULT_SESSION_FACTORY
 from intakevms.modules.virtual_machines.adapters import repository
 
@@ -67,7 +68,7 @@ class AbstractUnitOfWork(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
 
-class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
+class SqlAlchemyUnitOfWork(ReadOnlyUnitOfWorkMixin, AbstractUnitOfWork):
     """SQLAlchemy-based implementation of the unit of work pattern.
 
     This class provides an implementation of the unit of work pattern using
@@ -86,7 +87,7 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         Args:
             session_factory (sessionmaker): The SQLAlchemy session factory.
         """
-        self.session_factory = session_factory
+        super().__init__(session_factory)
         self.session: Session
 
     def __enter__(self) -> Self:
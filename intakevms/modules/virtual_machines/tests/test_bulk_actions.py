@@ -0,0 +1,149 @@
+"""Unit tests for the bulk lifecycle actions of virtual machines.
+
+Usage:
+Run the tests using pytest:
+    pytest intakevms/modules/virtual_machines/tests/test_bulk_actions.py
+"""
+
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Iterator
+from unittest.mock import patch
+
+import pytest
+
+from intakevms.libs.messaging.config import RpcServerSettings
+from intakevms.modules.virtual_machines import config
+from intakevms.modules.virtual_machines.service_layer.services import (
+    BULK_ACTIONS,
+    VmStatus,
+    VMServiceLayerManager,
+)
+
+TIMEOUT = 5
+SECONDS_PER_VM = 0.1
+
+
+class FakeRepository:
+    """Repository of the virtual machines of a test."""
+
+    def __init__(self, vms: Dict[str, SimpleNamespace]) -> None:
+        """Initialize the repository with its virtual machines."""
+        self.vms = vms
+
+    def get_many(self, vm_ids: List[str]) -> List[SimpleNamespace]:
+        """Get the existing virtual machines among the IDs."""
+        return [self.vms[vm_id] for vm_id in vm_ids if vm_id in self.vms]
+
+
+class FakeUnitOfWork:
+    """Unit of work of the virtual machines of a test."""
+
+    def __init__(self, vms: Dict[str, SimpleNamespace]) -> None:
+        """Initialize the unit of work with its virtual machines."""
+        self.virtual_machines = FakeRepository(vms)
+
+    def __enter__(self) -> 'FakeUnitOfWork':
+        """Begin the transaction."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:  # noqa: ANN401 test fake
+        """End the transaction."""
+
+    def commit(self) -> None:
+        """Commit the transaction."""
+
+
+class BulkManager(VMServiceLayerManager):
+    """Manager whose work succeeds, fails or hangs depending on the VM."""
+
+    vms: Dict[str, SimpleNamespace] = {}  # noqa: RUF012 shared by the threads
+    release = threading.Event()
+
+    def __init__(self) -> None:
+        """Initialize the manager without its clients."""
+        self.uow = FakeUnitOfWork(self.vms)  # type: ignore[assignment]
+
+    def _start_vm(self, data: Dict) -> None:
+        """Start a virtual machine."""
+        if data['id'] == 'failing':
+            msg = 'boom'
+            raise RuntimeError(msg)
+        if data['id'] == 'hung':
+            self.release.wait(TIMEOUT)
+        self.vms[data['id']].status = VmStatus.available.name
+
+
+@pytest.fixture
+def manager() -> Iterator[BulkManager]:
+    """Manager of three starting virtual machines."""
+    BulkManager.vms.update(
+        {
+            vm_id: SimpleNamespace(
+                id=vm_id, status=VmStatus.starting.name, information=''
+            )
+            for vm_id in ('started', 'failing', 'hung')
+        }
+    )
+    with (
+        patch.object(config, 'BULK_ACTION_SECONDS_PER_VM', SECONDS_PER_VM),
+        patch(
+            'intakevms.modules.virtual_machines.service_layer.services.'
+            'get_rpc_server_settings',
+            return_value=RpcServerSettings(batch_workers=3),
+        ),
+    ):
+        yield BulkManager()
+    BulkManager.release.set()
+
+
+@pytest.mark.parametrize(
+    ('action', 'status', 'power_state', 'result'),
+    [
+        ('start', 'available', 'shut_off', 'accepted'),
+        ('start', 'error', 'shut_off', 'accepted'),
+        ('start', 'available', 'running', 'rejected'),
+        ('start', 'starting', 'shut_off', 'rejected'),
+        ('shut_off', 'available', 'running', 'accepted'),
+        ('shut_off', 'error', 'running', 'accepted'),
+        ('shut_off', 'available', 'shut_off', 'rejected'),
+        ('shut_off', 'deleting', 'running', 'rejected'),
+        ('delete', 'available', 'shut_off', 'accepted'),
+        ('delete', 'error', 'shut_off', 'accepted'),
+        ('delete', 'available', 'running', 'rejected'),
+        ('delete', 'shut_offing', 'shut_off', 'rejected'),
+    ],
+)
+def test_bulk_action_rules(
+    action: str, status: str, power_state: str, result: str
+) -> None:
+    """Only VMs in the statuses and power states of the action change."""
+    rule = BULK_ACTIONS[action]
+    db_vm = SimpleNamespace(status=status, power_state=power_state)
+    manager = VMServiceLayerManager.__new__(VMServiceLayerManager)
+
+    reply = manager._accept_bulk_vm_action(rule, 'vm', db_vm)  # type: ignore[arg-type]  # noqa: SLF001 test of the rules
+
+    assert reply['result'] == result
+    assert db_vm.status == (rule.status if result == 'accepted' else status)
+
+
+def test_bulk_action_sets_unfinished_vms_to_error(
+    manager: BulkManager,
+) -> None:
+    """VMs whose work failed or timed out are set to the error status."""
+    manager._bulk_vm_action(  # noqa: SLF001 test of the cast handler
+        {
+            'method': BULK_ACTIONS['start'].method,
+            'calls': [
+                {'vm_id': vm_id, 'data': {'id': vm_id}} for vm_id in manager.vms
+            ],
+        }
+    )
+
+    vms = manager.vms
+    assert vms['started'].status == VmStatus.available.name
+    assert vms['failing'].status == VmStatus.error.name
+    assert 'boom' in vms['failing'].information
+    assert vms['hung'].status == VmStatus.error.name
+    assert 'exceeded its deadline' in vms['hung'].information
@@ -32,6 +32,9 @@ from sqlalchemy.orm import (
     mapped_column,
 )
 
+from intakevms.common.versions import track_versions
+from intakevms.common.state_events import track_states
+
 
 class Base(DeclarativeBase):
     """Base class for inheritance volumes and attachments volumes."""
@@ -139,4 +142,8 @@ class VolumeAttachVM(Base):
     volume: Mapped[Volume] = relationship(
         'Volume',
         back_populates='attachments',
-    )
\ No newline at end of file
+    )
+
+
+track_versions('volumes', Volume, VolumeAttachVM)
+track_states('volumes', Volume, 'status')
@@ -10,10 +10,13 @@ Classes:
         SQLAlchemy.
 """
 
-from typing import TYPE_CHECKING, Dict, List, Optional
+from uuid import UUID
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 
 from sqlalchemy import update
+from sqlalchemy.orm import selectinload
 
+from intakevms.common.pagination import PageRequest
 from intakevms.modules.volume.adapters.orm import Volume
 from intakevms.common.repositories.base_sqlalchemy import (
     BaseSqlAlchemyRepository,
@@ -33,6 +36,8 @@ class VolumeSqlAlchemyRepository(BaseSqlAlchemyRepository[Volume]):
         session (Session): The SQLAlchemy session used for database operations.
     """
 
+    summary_columns = ('name', 'status', 'size', 'storage_id')
+
     def __init__(self, session: 'Session'):
         """Initialize the repository with a SQLAlchemy session.
 
@@ -58,6 +63,39 @@ class VolumeSqlAlchemyRepository(BaseSqlAlchemyRepository[Volume]):
             .all()
         )
 
+    def get_page_filtered(
+        self,
+        page: PageRequest,
+        storage_id: Optional[UUID] = None,
+        *,
+        free_only: bool = False,
+        summary: bool = False,
+    ) -> Tuple[List[Volume], Optional[str]]:
+        """Retrieve a page of volumes, optionally filtered.
+
+        Args:
+            page (PageRequest): The requested page.
+            storage_id (Optional[UUID]): The ID of the storage to filter
+                volumes by.
+            free_only (bool): If True, only volumes without attachments.
+            summary (bool): Whether to load only the summary columns.
+
+        Returns:
+            Tuple[List[Volume], Optional[str]]: The volumes of the page and
+                the cursor of the next page.
+        """
+        criteria = []
+        if storage_id:
+            criteria.append(Volume.storage_id == storage_id)
+        if free_only:
+            criteria.append(~Volume.attachments.any())
+        return self.get_page(
+            page,
+            *criteria,
+            options=[selectinload(Volume.attachments)],
+            summary=summary,
+        )
+
     def get_by_name_and_storage(
         self,
         volume_name: str,
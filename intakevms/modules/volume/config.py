@@ -5,3 +5,5 @@ SERVICE_LAYER_DOMAIN_QUEUE_NAME: str = RPC_QUEUES.Volume.DOMAIN_LAYER
 DEFAULT_VOLUME_FORMAT = 'qcow2'
 
 DEFAULT_SESSION_FACTORY = get_default_session_factory()
+# Seconds allowed to get the information of each volume by the monitoring.
+VOLUME_INFO_SECONDS = 100
@@ -20,18 +20,21 @@ Endpoints:
 """
 
 from uuid import UUID
-from typing import Dict, Optional, cast
+from typing import Dict, Union, Optional
 
-from fastapi import Query, Depends, APIRouter, status
+from fastapi import Query, Depends, Response, APIRouter, status
 from fastapi.responses import JSONResponse
-from fastapi_pagination import Page, paginate
-from starlette.concurrency import run_in_threadpool
 
 from intakevms.libs.log import get_logger
+from intakevms.common.schemas import KeysetPage
+from intakevms.common.versions import etag_dependency
+from intakevms.common.rendering import RenderedJSONResponse, render
+from intakevms.common.pagination import PageRequest, page_request
+from intakevms.common.projections import VIEW_DESCRIPTION, View
 from intakevms.libs.auth.jwt_utils import get_current_user
 from intakevms.libs.validation.validators import Validator
 from intakevms.modules.volume.entrypoints import schemas
-from intakevms.modules.volume.entrypoints.crud import VolumeCrud
+from intakevms.modules.volume.entrypoints.crud import AsyncVolumeCrud
 
 LOG = get_logger(__name__)
 router = APIRouter(
@@ -40,66 +43,91 @@ router = APIRouter(
     responses={404: {'description': 'Not found!'}},
 )
 
+volumes_page = page_request('id')
+volumes_etag = etag_dependency('volumes')
+
 
 @router.get(
     '/',
-    response_model=Page[schemas.Volume],
+    response_model=Union[
+        KeysetPage[schemas.VolumeSummary], KeysetPage[schemas.Volume]
+    ],
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(volumes_etag)],
 )
-async def get_volumes(
+async def get_volumes(  # noqa: PLR0913 query parameters and dependencies
+    response: Response,
     storage_id: Optional[UUID] = Query(default=None, description='Storage ID'),
     *,
     free_volumes: bool = Query(
         default=False,
         description='Flag on getting volumes without attachments.',
     ),
-    crud: VolumeCrud = Depends(VolumeCrud),
-) -> Page:
-    """Retrieve all volumes from the database.
+    page: PageRequest = Depends(volumes_page),
+    view: View = Query(default=View.FULL, description=VIEW_DESCRIPTION),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
+) -> RenderedJSONResponse:
+    """Retrieve a page of volumes from the database.
 
     Args:
+        response (Response): The response, with the ETag to keep.
         storage_id (Optional[str]): The ID of the storage to filter volumes by.
         free_volumes (Optional[bool]): If True, return only volumes without
             attachments.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        page (PageRequest): The requested page.
+        view (View): The representation of the volumes.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
-        JSONResponse: A paginated list of volumes.
+        RenderedJSONResponse: A page of volumes and the cursor of the next
+            page.
     """
     LOG.info('Api handle response on getting volumes.')
-    result = await run_in_threadpool(
-        crud.get_all_volumes, storage_id, free_volumes=free_volumes
+    result = await crud.get_volumes_page(
+        page, storage_id, free_volumes=free_volumes, view=view
     )
-    volumes = Validator.validate_objects(result, schemas.Volume)
+    if view is View.SUMMARY:
+        page_of_summaries = KeysetPage[schemas.VolumeSummary](
+            items=Validator.validate_objects(
+                result['items'], schemas.VolumeSummary
+            ),
+            next_cursor=result['next_cursor'],
+        )
+        return render(page_of_summaries, response)
+    volumes = Validator.validate_objects(result['items'], schemas.Volume)
 
     LOG.info('Api request was successfully processed.')
-    return cast(Page, paginate(volumes))
+    return render(
+        KeysetPage[schemas.Volume](
+            items=volumes, next_cursor=result['next_cursor']
+        ),
+        response,
+    )
 
 
 @router.get(
     '/{volume_id}/',
     response_model=schemas.Volume,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(volumes_etag)],
 )
 async def get_volume(
     volume_id: UUID,
-    crud: VolumeCrud = Depends(VolumeCrud),
-) -> JSONResponse:
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
+) -> schemas.Volume:
     """Retrieve a specific volume by its ID.
 
     Args:
         volume_id (str): The ID of the volume to retrieve.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
-        JSONResponse: The serialized volume object.
+        schemas.Volume: The volume object.
     """
     LOG.info('Api handle response on getting volume.')
-    volume = await run_in_threadpool(crud.get_volume, volume_id)
+    volume = await crud.get_volume(volume_id)
     LOG.info('Api request was successfully processed.')
-    return JSONResponse(volume)
+    return schemas.Volume(**volume)
 
 
 @router.post(
@@ -111,21 +139,21 @@ async def get_volume(
 async def create_volume(
     data: schemas.CreateVolume,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> JSONResponse:
     """Create a new volume.
 
     Args:
         data (schemas.CreateVolume): The data required to create the volume.
         user_info (Dict): Information about the authenticated user.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
         JSONResponse: The created volume object.
     """
     LOG.info('Api handle response on create volume with data: %s' % data)
-    volume = await run_in_threadpool(
-        crud.create_volume, data.model_dump(mode='json'), user_info
+    volume = await crud.create_volume(
+        data.model_dump(mode='json'), user_info
     )
     LOG.info('Api request was successfully processed.')
     return JSONResponse(volume)
@@ -140,20 +168,20 @@ async def create_volume(
 async def delete_volume(
     volume_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> JSONResponse:
     """Delete an existing volume.
 
     Args:
         volume_id (str): The ID of the volume to delete.
         user_info (Dict): Information about the authenticated user.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
         JSONResponse: The deleted volume object.
     """
     LOG.info('Api handle response on delete volume: %s' % volume_id)
-    result = await run_in_threadpool(crud.delete_volume, volume_id, user_info)
+    result = await crud.delete_volume(volume_id, user_info)
     LOG.info('Api request was successfully processed.')
     return JSONResponse(result)
 
@@ -167,7 +195,7 @@ async def extend_volume(
     data: schemas.ExtendVolume,
     volume_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> JSONResponse:
     """Extend an existing volume to a new size.
 
@@ -175,14 +203,14 @@ async def extend_volume(
         volume_id (str): The ID of the volume to extend.
         data (schemas.ExtendVolume): The new size of the volume.
         user_info (Dict): Information about the authenticated user.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
         JSONResponse: The extended volume object.
     """
     LOG.info('Api handle response on extend volume: %s' % volume_id)
-    volume = await run_in_threadpool(
-        crud.extend_volume, volume_id, data.model_dump(), user_info
+    volume = await crud.extend_volume(
+        volume_id, data.model_dump(), user_info
     )
     LOG.info('Api request was successfully processed.')
     return JSONResponse(volume)
@@ -197,7 +225,7 @@ async def edit_volume(
     data: schemas.EditVolume,
     volume_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> JSONResponse:
     """Edit an existing volume's metadata.
 
@@ -205,7 +233,7 @@ async def edit_volume(
         volume_id (str): The ID of the volume to edit.
         data (schemas.EditVolume): The new metadata for the volume.
         user_info (Dict): Information about the authenticated user.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
         JSONResponse: The updated volume object.
@@ -214,8 +242,8 @@ async def edit_volume(
         'Api handle response on edit volume: %s with data:' % volume_id,
         data.model_dump(),
     )
-    volume = await run_in_threadpool(
-        crud.edit_volume, volume_id, data.model_dump(), user_info
+    volume = await crud.edit_volume(
+        volume_id, data.model_dump(), user_info
     )
     LOG.info('Api request was successfully processed.')
     return JSONResponse(volume)
@@ -230,7 +258,7 @@ async def attach_volume(
     data: schemas.AttachVolume,
     volume_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> JSONResponse:
     """Attach a volume to a virtual machine.
 
@@ -238,7 +266,7 @@ async def attach_volume(
         volume_id (str): The ID of the volume to be attached.
         data (schemas.AttachVolume): Information about the attachment.
         user_info (Dict): Information about the authenticated user.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
         JSONResponse: Information about the attached volume.
@@ -247,8 +275,8 @@ async def attach_volume(
         'Api handle response on attach volume: %s with data:' % volume_id,
         data.model_dump(mode='json'),
     )
-    attached_volume = await run_in_threadpool(
-        crud.attach_volume, volume_id, data.model_dump(), user_info
+    attached_volume = await crud.attach_volume(
+        volume_id, data.model_dump(), user_info
     )
     LOG.info('Api request was successfully processed.')
     return JSONResponse(attached_volume)
@@ -263,7 +291,7 @@ async def detach_volume(
     detach_info: schemas.DetachVolume,
     volume_id: UUID,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> JSONResponse:
     """Detach a volume from a virtual machine.
 
@@ -271,7 +299,7 @@ async def detach_volume(
         volume_id (str): The ID of the volume to be detached.
         detach_info (schemas.DetachVolume): Information about the detachment.
         user_info (Dict): Information about the authenticated user.
-        crud (VolumeCrud): Dependency that handles the CRUD operations.
+        crud (AsyncVolumeCrud): Dependency that handles the CRUD operations.
 
     Returns:
         JSONResponse: The detached volume object.
@@ -279,8 +307,8 @@ async def detach_volume(
     LOG.info(
         'Api handle response on detach ' 'volume: %s with data:' % volume_id
     )
-    detached_volume = await run_in_threadpool(
-        crud.detach_volume, volume_id, detach_info.model_dump(), user_info
+    detached_volume = await crud.detach_volume(
+        volume_id, detach_info.model_dump(), user_info
     )
     LOG.info('Api request was successfully processed.')
     return JSONResponse(detached_volume)
@@ -295,9 +323,9 @@ async def detach_volume(
 async def create_from_template(  # noqa: D103
     data: schemas.CreateVolumeFromTemplate,
     user_info: Dict = Depends(get_current_user),
-    crud: VolumeCrud = Depends(VolumeCrud),
+    crud: AsyncVolumeCrud = Depends(AsyncVolumeCrud),
 ) -> schemas.Volume:
     LOG.info('Api handle response on create volume from template')
-    volume = await run_in_threadpool(crud.create_from_template, data, user_info)
+    volume = await crud.create_from_template(data, user_info)
     LOG.info('Api request was successfully processed.')
     return volume
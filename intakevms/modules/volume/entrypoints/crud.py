@@ -5,13 +5,15 @@ The operations include retrieving, creating, updating, and deleting volumes
 through communication with the service layer via RPC.
 
 Classes:
-    VolumeCrud: Class providing CRUD operations for volumes.
+    AsyncVolumeCrud: Class providing CRUD operations for volumes.
 """
 
 from uuid import UUID
 from typing import Dict, List, Optional
 
 from intakevms.libs.log import get_logger
+from intakevms.common.pagination import PageRequest
+from intakevms.common.projections import View
 from intakevms.modules.volume.config import API_SERVICE_LAYER_QUEUE_NAME
 from intakevms.modules.volume.service_layer import services
 from intakevms.libs.messaging.messaging_agents import MessagingClient
@@ -26,7 +28,7 @@ from intakevms.modules.volume.adapters.dto.internal.commands import (
 LOG = get_logger(__name__)
 
 
-class VolumeCrud:
+class AsyncVolumeCrud:
     """Class providing CRUD operations for volumes.
 
     This class handles interactions with the service layer to perform CRUD
@@ -36,12 +38,12 @@ class VolumeCrud:
     """
 
     def __init__(self) -> None:
-        """Initialize the VolumeCrud class and set up the RPC client."""
+        """Initialize the AsyncVolumeCrud class and set up the RPC client."""
         self.service_layer_rpc = MessagingClient(
             queue_name=API_SERVICE_LAYER_QUEUE_NAME
         )
 
-    def get_volume(self, volume_id: UUID) -> Dict:
+    async def get_volume(self, volume_id: UUID) -> Dict:
         """Retrieve a specific volume by its ID.
 
         Args:
@@ -51,7 +53,7 @@ class VolumeCrud:
             Dict: The retrieved volume's data as a dictionary.
         """
         LOG.info('Call service layer on getting volume.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.get_volume.__name__,
             data_for_method={'volume_id': str(volume_id)},
             priority=8,
@@ -59,7 +61,7 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def get_all_volumes(
+    async def get_all_volumes(
         self,
         storage_id: Optional[UUID],
         *,
@@ -79,7 +81,7 @@ class VolumeCrud:
             Page: A paginated list of volumes.
         """
         LOG.info('Call service layer on getting all volumes.')
-        result: List = self.service_layer_rpc.call(
+        result: List = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.get_all_volumes.__name__,
             data_for_method={
                 'storage_id': str(storage_id) if storage_id else None,
@@ -90,7 +92,44 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def create_volume(self, data: Dict, user_info: Dict) -> Dict:
+    async def get_volumes_page(
+        self,
+        page: PageRequest,
+        storage_id: Optional[UUID],
+        *,
+        free_volumes: bool = False,
+        view: View = View.FULL,
+    ) -> Dict:
+        """Retrieve a page of volumes.
+
+        Optionally filtering by storage or attachment status.
+
+        Args:
+            page (PageRequest): The requested page.
+            storage_id (Optional[str]): The ID of the storage to filter volumes
+            by.
+            free_volumes (Optional[bool]): If True, return only volumes without
+                attachments.
+            view (View): The representation of the volumes.
+
+        Returns:
+            Dict: The volumes of the page and the cursor of the next page.
+        """
+        LOG.info('Call service layer on getting page of volumes.')
+        result: Dict = await self.service_layer_rpc.acall(
+            services.VolumeServiceLayerManager.get_volumes_page.__name__,
+            data_for_method={
+                **page.to_dict(),
+                'storage_id': str(storage_id) if storage_id else None,
+                'free_volumes': free_volumes,
+                'view': view.value,
+            },
+            priority=8,
+        )
+        LOG.debug('Response from service layer: %s.' % result)
+        return result
+
+    async def create_volume(self, data: Dict, user_info: Dict) -> Dict:
         """Create a new volume.
 
         Args:
@@ -102,7 +141,7 @@ class VolumeCrud:
         """
         LOG.info('Call service layer on create volume.')
         data.update({'user_info': user_info})
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.create_volume.__name__,
             data_for_method=data,
             priority=8,
@@ -110,7 +149,7 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def delete_volume(self, volume_id: UUID, user_info: Dict) -> Dict:
+    async def delete_volume(self, volume_id: UUID, user_info: Dict) -> Dict:
         """Delete a specific volume by its ID.
 
         Args:
@@ -121,7 +160,7 @@ class VolumeCrud:
             Dict: The deleted volume's data as a dictionary.
         """
         LOG.info('Call service layer on delete volume.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.delete_volume.__name__,
             data_for_method={
                 'volume_id': str(volume_id),
@@ -132,7 +171,7 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def extend_volume(
+    async def extend_volume(
         self,
         volume_id: UUID,
         data: Dict,
@@ -150,7 +189,7 @@ class VolumeCrud:
         """
         data.update({'volume_id': str(volume_id), 'user_info': user_info})
         LOG.info('Call service layer on extend volume.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.extend_volume.__name__,
             data_for_method=data,
             priority=8,
@@ -158,7 +197,9 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def edit_volume(self, volume_id: UUID, data: Dict, user_info: Dict) -> Dict:
+    async def edit_volume(
+        self, volume_id: UUID, data: Dict, user_info: Dict
+    ) -> Dict:
         """Edit an existing volume's metadata.
 
         Args:
@@ -176,7 +217,7 @@ class VolumeCrud:
             }
         )
         LOG.info('Call service layer on edit volume.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.edit_volume.__name__,
             data_for_method=data,
             priority=8,
@@ -184,7 +225,7 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def attach_volume(
+    async def attach_volume(
         self,
         volume_id: UUID,
         data: Dict,
@@ -202,7 +243,7 @@ class VolumeCrud:
         """
         data.update({'volume_id': str(volume_id), 'user_info': user_info})
         LOG.info('Call service layer on attach volume.')
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.attach_volume.__name__,
             data_for_method=data,
             priority=8,
@@ -210,7 +251,7 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def detach_volume(
+    async def detach_volume(
         self,
         volume_id: UUID,
         detach_info: Dict,
@@ -230,7 +271,7 @@ class VolumeCrud:
         detach_info.update(
             {'volume_id': str(volume_id), 'user_info': user_info}
         )
-        result: Dict = self.service_layer_rpc.call(
+        result: Dict = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.detach_volume.__name__,
             data_for_method=detach_info,
             priority=8,
@@ -238,7 +279,7 @@ class VolumeCrud:
         LOG.debug('Response from service layer: %s.' % result)
         return result
 
-    def create_from_template(  # noqa: D102
+    async def create_from_template(  # noqa: D102
         self,
         data: CreateVolumeFromTemplate,
         user_info: Dict,
@@ -247,8 +288,8 @@ class VolumeCrud:
             user_id=user_info['id'],
             **data.model_dump(),
         )
-        volume = self.service_layer_rpc.call(
+        volume = await self.service_layer_rpc.acall(
             services.VolumeServiceLayerManager.create_from_template.__name__,
             data_for_method=command.model_dump(mode='json'),
         )
-        return Volume.model_validate(volume)
\ No newline at end of file
+        return Volume.model_validate(volume)
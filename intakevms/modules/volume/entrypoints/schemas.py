@@ -72,6 +72,25 @@ class Volume(BaseModel):
     template_id: Optional[UUID]
 
 
+class VolumeSummary(BaseModel):
+    """Schema representing the summary view of a volume.
+
+    Attributes:
+        id (UUID): The ID of the volume.
+        name (str): The name of the volume.
+        size (int): The size of the volume in bytes.
+        status (Optional[str]): The status of the volume.
+        storage_id (Optional[UUID]): The ID of the storage the volume belongs
+            to.
+    """
+
+    id: UUID
+    name: str
+    size: int
+    status: Optional[str] = None
+    storage_id: Optional[UUID] = None
+
+
 class CreateVolume(BaseModel):
     """Schema for creating a new volume.
 
@@ -29,17 +29,24 @@ from __future__ import annotations
 
 import enum
 import uuid
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, cast
 from pathlib import Path
 from collections import namedtuple
 
 from intakevms.libs.log import get_logger
+from intakevms.libs.caching import cached_read, invalidates
+from intakevms.libs.monitoring import StateSnapshot
+from intakevms.common.pagination import PageRequest, page_dict
+from intakevms.common.projections import is_summary, to_summary
 from intakevms.modules.base_manager import BackgroundTasks, periodic_task
+from intakevms.libs.messaging.config import get_rpc_server_settings
 from intakevms.modules.volume.config import (
+    VOLUME_INFO_SECONDS,
     DEFAULT_VOLUME_FORMAT,
     API_SERVICE_LAYER_QUEUE_NAME,
     SERVICE_LAYER_DOMAIN_QUEUE_NAME,
 )
+from intakevms.libs.messaging.rpc.base import RpcCall, batch_time_limit
 from intakevms.libs.messaging.exceptions import (
     RpcCallException,
     RpcCallTimeoutException,
@@ -185,6 +192,9 @@ class VolumeServiceLayerManager(BackgroundTasks):
         self.vm_service_client = VMServiceLayerRPCClient()
         self.template_service_client = TemplateServiceLayerRPCClient()
         self.event_store = EventCrud('volumes')
+        self.monitoring_snapshot = StateSnapshot(
+            'volumes', ('size', 'used', 'status', 'information')
+        )
 
     def get_volume(self, data: Dict) -> Dict:
         """Retrieve a specific volume from the database.
@@ -213,13 +223,14 @@ class VolumeServiceLayerManager(BackgroundTasks):
             )
             LOG.error(message)
             raise exceptions.UnexpectedDataArguments(message)
-        with self.uow() as uow:
+        with self.uow.read_only() as uow:
             db_volume = uow.volumes.get_or_fail(volume_id)
             web_volume = DataSerializer.to_web(db_volume)
             LOG.debug('Got volume from db: %s.' % web_volume)
         LOG.info('Service layer method get volume was successfully processed')
         return web_volume
 
+    @cached_read('volumes')
     def get_all_volumes(self, data: Dict) -> List:
         """Retrieve all volumes from the database.
 
@@ -237,7 +248,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
         LOG.info('Service layer start handling response on get volumes.')
         storage_id = data.pop('storage_id', None)
         free_volumes = data.pop('free_volumes', False)
-        with self.uow() as uow:
+        with self.uow.read_only() as uow:
             if storage_id:
                 db_volumes = uow.volumes.get_all_by_storage(storage_id)
             else:
@@ -250,6 +261,34 @@ class VolumeServiceLayerManager(BackgroundTasks):
         LOG.info('Service layer method get volumes was successfully processed')
         return web_volumes
 
+    @cached_read('volumes')
+    def get_volumes_page(self, data: Dict) -> Dict:
+        """Retrieve a page of volumes from the database.
+
+        Args:
+            data (Dict): The page request, see `PageRequest.to_dict`, and
+                optional filter parameters such as storage_id and
+                free_volumes, and the optional `view` of the volumes.
+
+        Returns:
+            Dict: The serialized volumes of the page and the cursor of the
+                next page.
+        """
+        LOG.info('Service layer start handling response on get volumes page.')
+        page = PageRequest.from_dict(data)
+        summary = is_summary(data)
+        with self.uow.read_only() as uow:
+            db_volumes, next_cursor = uow.volumes.get_page_filtered(
+                page,
+                data.get('storage_id'),
+                free_only=bool(data.get('free_volumes')),
+                summary=summary,
+            )
+            serialize = to_summary if summary else DataSerializer.to_web
+            return page_dict(
+                [serialize(volume) for volume in db_volumes], next_cursor
+            )
+
     @staticmethod
     def _prepare_volume_data(volume_info: Dict) -> VolumeData:
         """Prepare volume data for creation.
@@ -438,6 +477,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             LOG.error(message)
             raise exceptions.ValidateArgumentsError(message)
 
+    @invalidates('volumes')
     def create_volume(self, volume_info: Dict) -> Dict:
         """Create a new volume in the system.
 
@@ -506,6 +546,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
         )
         return serialized_volume
 
+    @invalidates('volumes')
     def _create_volume(self, volume_info: Dict) -> None:
         """The function handles the process of creating a volume in the system.
 
@@ -601,6 +642,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             'Service layer method _create_volume was' 'successfully processed'
         )
 
+    @invalidates('volumes')
     def clone_volume(self, clone_volume_info: Dict) -> Dict:
         """Create a new volume by cloning an existing one.
 
@@ -708,6 +750,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             LOG.error(message)
             raise exceptions.VmPowerStateIsNotShutOffException(message)
 
+    @invalidates('volumes')
     def extend_volume(self, data: Dict) -> Dict:
         """Extend the size of an existing volume.
 
@@ -801,6 +844,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             LOG.error(message)
             raise exceptions.ValidateArgumentsError(message)
 
+    @invalidates('volumes')
     def _extend_volume(self, data: Dict) -> None:
         """Extend the size of a volume in the domain layer.
 
@@ -899,6 +943,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             'Service layer method extend_volume' 'was successfully processed'
         )
 
+    @invalidates('volumes')
     def delete_volume(self, data: Dict) -> Dict:
         """Delete a volume from the system.
 
@@ -960,6 +1005,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
                 uow.commit()
         return DataSerializer.to_web(db_volume)
 
+    @invalidates('volumes')
     def _delete_volume(self, volume_info: Dict) -> None:
         """Delete a volume from the system.
 
@@ -1012,6 +1058,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             finally:
                 uow.commit()
 
+    @invalidates('volumes')
     def edit_volume(self, data: Dict) -> Dict:
         """Edit the metadata of an existing volume.
 
@@ -1049,6 +1096,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
         LOG.info('Service layer method edit_volume was successfully processed')
         return serialized_volume
 
+    @invalidates('volumes')
     def attach_volume(self, data: Dict) -> Dict:
         """Attach a volume to a virtual machine.
 
@@ -1103,6 +1151,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             finally:
                 uow.commit()
 
+    @invalidates('volumes')
     def detach_volume(self, data: Dict) -> Dict:
         """Detach a volume from a virtual machine.
 
@@ -1146,6 +1195,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
                 uow.commit()
         return DataSerializer.to_web(db_volume)
 
+    @invalidates('volumes')
     def create_from_template(self, data: Dict) -> Dict:  # noqa: D102
         creation_dto = CreateVolumeFromTemplateServiceCommandDTO.model_validate(
             data
@@ -1198,6 +1248,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
 
         return web_volume
 
+    @invalidates('volumes')
     def _create_from_template(self, creating_from_tmp_data: Dict) -> None:
         volume_id = creating_from_tmp_data.pop('volume_id')
         creating_dto = CreateVolumeFromTemplateModelDTO.model_validate(
@@ -1284,7 +1335,8 @@ class VolumeServiceLayerManager(BackgroundTasks):
         - Update the volume information in a list for subsequent database
             update.
         - Handle any exceptions that occur during the process.
-        4. Update the volume information in the database in bulk.
+        4. Update the volumes whose information changed in the database in
+            bulk, compared to the state read in step 1.
 
         This method is designed to run periodically using the `@periodic_task`
         decorator, with an interval of 10 seconds.
@@ -1296,10 +1348,18 @@ class VolumeServiceLayerManager(BackgroundTasks):
             LOG.info("Stop monitoring. Volumes don't exist.")
             return
 
+        self.monitoring_snapshot.load(domain_volumes)
         storages = self._get_storages_dict()
         updated_db_volumes = self._process_volumes(domain_volumes, storages)
 
-        self._update_volumes_in_db(updated_db_volumes)
+        changed_db_volumes = self.monitoring_snapshot.changes(
+            updated_db_volumes
+        )
+        if changed_db_volumes:
+            self._update_volumes_in_db(changed_db_volumes)
+        self.monitoring_snapshot.report(
+            len(updated_db_volumes), len(changed_db_volumes)
+        )
         LOG.info('Stop monitoring.')
 
     def _get_domain_volumes(self) -> List[Dict]:
@@ -1330,8 +1390,11 @@ class VolumeServiceLayerManager(BackgroundTasks):
     ) -> List[Dict]:
         """Process each volume and prepare updated information.
 
-        This method processes volumes and returns a list of updated information
-        for the database.
+        This method checks the volumes, gets the information of all the
+        checked volumes from the domain in a single batch request and
+        returns a list of updated information for the database. Every call
+        has its own time limit, so a volume whose call fails or exceeds it
+        does not prevent the update of the other ones.
 
         Args:
             domain_volumes (List[Dict]): A list of domain objects representing
@@ -1342,43 +1405,95 @@ class VolumeServiceLayerManager(BackgroundTasks):
         Returns:
             List[Dict]: A list of updated volume data for the database.
         """
+        checked_volumes = self._filter_monitored_volumes(
+            domain_volumes, storages
+        )
+        if not checked_volumes:
+            return []
+
+        calls = [
+            RpcCall(
+                BaseVolume.attach_volume_info.__name__,
+                data_for_manager=domain_volume,
+                time_limit=VOLUME_INFO_SECONDS,
+            )
+            for domain_volume in checked_volumes
+        ]
+        batch_workers = get_rpc_server_settings(
+            SERVICE_LAYER_DOMAIN_QUEUE_NAME
+        ).batch_workers
+        try:
+            results = self.domain_rpc.call_many(
+                calls,
+                parallel=True,
+                time_limit=batch_time_limit(calls, batch_workers),
+            )
+        except (RpcCallException, RpcCallTimeoutException) as error:
+            LOG.error(f'Error processing volumes: {error!s}')
+            return []
+
         updated_db_volumes = []
-        for domain_volume in domain_volumes:
+        for domain_volume, result in zip(checked_volumes, results, strict=True):
             try:
-                updated_volume = self._process_single_volume(
-                    domain_volume, storages
+                updated_db_volumes.append(
+                    self._get_updated_volume_info(
+                        domain_volume, result.result()
+                    )
+                )
+            except RpcCallException as error:
+                LOG.error(
+                    f"Error processing volume {domain_volume.get('id')}: "
+                    f"{error!s}"
                 )
-                if updated_volume:
-                    updated_db_volumes.append(updated_volume)
+        return updated_db_volumes
+
+    def _filter_monitored_volumes(
+        self, domain_volumes: List[Dict], storages: Dict[str, StorageInfo]
+    ) -> List[Dict]:
+        """Get the volumes whose information can be updated.
+
+        Args:
+            domain_volumes (List[Dict]): A list of domain objects representing
+                volumes.
+            storages (Dict[str, StorageInfo]): A dictionary with storage
+                information.
+
+        Returns:
+            List[Dict]: The volumes passing the monitoring checks.
+        """
+        checked_volumes = []
+        for domain_volume in domain_volumes:
+            try:
+                self._check_volume_for_monitoring(domain_volume, storages)
+                checked_volumes.append(domain_volume)
             except (
                 exceptions.VolumeHasNotStorage,
                 exceptions.StorageUnavailableException,
                 exceptions.VolumeStatusException,
-                RpcCallException,
-                RpcCallTimeoutException,
             ) as error:
                 LOG.error(
                     f"Error processing volume {domain_volume.get('id')}: "
                     f"{error!s}"
                 )
-        return updated_db_volumes
+        return checked_volumes
 
-    def _process_single_volume(
+    def _check_volume_for_monitoring(
         self, domain_volume: Dict, storages: Dict[str, StorageInfo]
-    ) -> Optional[Dict]:
-        """Process a single volume and get updated information.
+    ) -> None:
+        """Check that the information of a volume can be updated.
 
-        Checks if the storage for the volume exists, validates the volume
-        status, and calls the domain method to get updated volume data.
+        Checks if the storage for the volume exists and is available, and
+        validates the volume status.
 
         Args:
             domain_volume (Dict): Volume data.
             storages (Dict[str, StorageInfo]): A dictionary with storage
                 information.
 
-        Returns:
-            Optional[Dict]: Updated volume information if available,
-                otherwise None.
+        Raises:
+            VolumeHasNotStorage: If the storage of the volume is unknown.
+            StorageUnavailableException: If the storage is unavailable.
+            VolumeStatusException: If the volume status is not monitored.
         """
         volume_storage = storages.get(domain_volume.get('storage_id', ''))
         if not volume_storage:
@@ -1395,11 +1510,17 @@ class VolumeServiceLayerManager(BackgroundTasks):
             domain_volume.get('status', ''), monitoring_statuses
         )
 
-        result = self.domain_rpc.call(
-            BaseVolume.attach_volume_info.__name__,
-            data_for_manager=domain_volume,
-        )
+    @staticmethod
+    def _get_updated_volume_info(domain_volume: Dict, result: Dict) -> Dict:
+        """Get the updated information of a volume for the database.
+
+        Args:
+            domain_volume (Dict): Volume data.
+            result (Dict): Volume information returned by the domain.
 
+        Returns:
+            Dict: Updated volume information.
+        """
         return {
             'id': domain_volume.get('id'),
             'size': result.get('size', domain_volume['size']),
@@ -1408,6 +1529,7 @@ class VolumeServiceLayerManager(BackgroundTasks):
             'information': '',
         }
 
+    @invalidates('volumes')
     def _update_volumes_in_db(self, updated_db_volumes: List[Dict]) -> None:
         """Update volume information in the database.
 
@@ -54,16 +54,17 @@ def test_get_volumes_with_pagination(
     client: TestClient,
     volume: dict,  # noqa: ARG001
 ) -> None:
-    """Test that pagination metadata is returned correctly."""
-    response = client.get('/volumes/?page=1&size=1')
+    """Test that a limited page returns the cursor of the next page."""
+    response = client.get('/volumes/?limit=1')
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert 'items' in data
-    assert 'total' in data
-    assert 'page' in data
-    assert 'size' in data
-    assert data['page'] == 1
-    assert data['size'] == 1
+    assert 'next_cursor' in data
+    assert len(data['items']) == 1
+    if data['next_cursor'] is not None:
+        response = client.get(f'/volumes/?limit=1&cursor={data["next_cursor"]}')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['items'][0]['id'] != data['items'][0]['id']
 
 
 def test_get_volumes_with_nonexistent_storage(client: TestClient) -> None: